@@ -108,6 +108,9 @@ class UIConfig:
     FONT_CARD_SUBTITLE = ("Segoe UI", 9)
     FONT_CARD_DESCRIPTION = ("Segoe UI", 8)
 
+    # Delay after the last keystroke before a search field filters the table (ms)
+    FILTER_DEBOUNCE_MS = 250
+
     @classmethod
     def update_responsive_fonts(cls, responsive_manager):
         """Update font configurations with responsive scaling."""
@@ -216,6 +219,70 @@ class LoggingConfig:
     MAX_LOG_SIZE = 10 * 1024 * 1024  # 10MB
     BACKUP_COUNT = 5
 
+    # Performance telemetry (utils.performance)
+    PERFORMANCE_SAMPLES = 500            # Most recent durations kept per operation (percentiles)
+    PERFORMANCE_MEMORY_SNAPSHOTS = 200   # Memory snapshots kept
+    PERFORMANCE_DUMP_INTERVAL = 300      # Seconds between JSON dumps in the log directory
+
+
+# Parallel processing configuration
+class ParallelConfig:
+    """Worker pool configuration for CPU-bound batch processing"""
+
+    # Worker processes used to parse commune suivi files (None = CPU count - 1)
+    COMMUNE_EXTRACTION_WORKERS = None
+    MAX_DEFAULT_WORKERS = 8
+
+    # Below this number of files, serial processing is faster than starting a pool
+    MIN_TASKS_FOR_PROCESS_POOL = 4
+
+    # Threads running the quality control criteria of one analysis (None = one per criterion)
+    QC_CRITERIA_WORKERS = None
+
+    # Worker processes of the batch quality control (None = CPU count - 1)
+    QC_BATCH_WORKERS = None
+
+    # Threads running the background tasks of the UI (run_async_task)
+    ASYNC_TASK_WORKERS = 4
+
+    # Interval of the Tk pump delivering the background task callbacks (ms)
+    ASYNC_CALLBACK_PUMP_MS = 50
+
+
+# Persistent cache configuration
+class CacheConfig:
+    """Persistent cache configuration for parsed Excel sheets"""
+
+    ENABLE_SHEET_CACHE = True
+    SHEET_CACHE_FOLDER = "sheet_cache"
+    SHEET_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512MB
+    SHEET_CACHE_INDEX_FILE = "index.json"
+
+    @staticmethod
+    def get_cache_base_path():
+        """
+        Get the local (non-synced) base directory used for Pladria caches.
+
+        Returns:
+            str: Cache base path for current user
+        """
+        import os
+
+        local_app_data = os.environ.get('LOCALAPPDATA')
+        if local_app_data:
+            return os.path.join(local_app_data, "Pladria", "cache")
+
+        return os.path.join(os.path.expanduser("~"), ".cache", "pladria")
+
+
+# Module screen cache configuration
+class ModuleCacheConfig:
+    """Keep-alive cache of the module screens registered with keep_alive"""
+
+    ENABLE_MODULE_CACHE = True
+    MAX_CACHED_MODULES = 3  # module screens kept alive, least recently shown evicted first
+    MEMORY_BUDGET_MB = 1024  # process memory above which hidden module screens are evicted
+
 
 
 # Teams Channel configuration
@@ -5,10 +5,51 @@ This package contains the main business logic components:
 - file_processor: Excel file reading and processing
 - data_validator: Data validation and cleaning
 - excel_generator: Excel file generation and formatting
+- sheet_cache: Persistent on-disk cache of parsed Excel sheets
+- workbook_reader: Single-pass multi-sheet workbook loading
+- workbook_writer: Streaming (write-only) workbook output with column formats
+- commune_manifest: Manifest of aggregated commune files for incremental Suivi Global runs
+- commune_extractor: (Parallel) extraction of commune suivi workbooks
+- suivi_normalizer: Typed date/duration columns of the global suivi sheets
+- team_kpi_engine: Vectorized collaborator KPI computation for Team Statistics
+- anomaly_engine: Vectorized anomaly rules for the global suivi export
+- activity_cube: Daily activity/motif aggregates for the monthly CTJ and motif exports
+- date_range_index: Day-sorted row index for date range queries
+- qc_analysis_context: Load-once QGis/suivi data shared by the quality control criteria
+- criteria_scheduler: Concurrent execution and timing of the quality control criteria
+- qgis_address_index: Vectorized "adresse optimum" and IMB/motif/address grouping of QGis results
+- cell_probe: Targeted cell reads from the sheet XML of xlsx workbooks
+- qc_report_index: Persisted index of the Etat_De_Lieu report header fields of the Contrôle Qualité tree
+- qc_tracking_report: Incremental "Suivi Controle Qualité" tracking workbook
+- data_viewer_index: Display strings and trigram/category/date filter indexes of the Data Viewer sheet
+- qc_batch: Headless batch quality control of commune folders (process pool, run with python -m core.qc_batch)
 """
 
 from .file_processor import FileProcessor
 from .data_validator import DataValidator
 from .excel_generator import ExcelGenerator
+from .sheet_cache import SheetCache, get_sheet_cache, read_excel_cached
+from .workbook_reader import WorkbookReader, read_workbook_sheets
+from .workbook_writer import StreamingWorkbookWriter, ColumnFormat
+from .commune_manifest import CommuneManifest
+from .commune_extractor import extract_commune_workbooks, COMMUNE_SHEET_READ_OPTIONS
+from .suivi_normalizer import NormalizedSuiviData
+from .team_kpi_engine import TeamKpiEngine
+from .anomaly_engine import AnomalyEngine, AnomalyRule
+from .activity_cube import ActivityCube
+from .date_range_index import DateRangeIndex
+from .qc_analysis_context import QcAnalysisContext
+from .criteria_scheduler import CriteriaScheduler
+from .qgis_address_index import QgisAddressIndex, build_adresse_optimum
+from .cell_probe import CellProbe, get_sheet_names
+from .qc_report_index import QcReportIndex, read_report_fields
+from .qc_tracking_report import QcTrackingReport
+from .data_viewer_index import DataViewerIndex
 
-__all__ = ['FileProcessor', 'DataValidator', 'ExcelGenerator']
+__all__ = ['FileProcessor', 'DataValidator', 'ExcelGenerator',
+           'SheetCache', 'get_sheet_cache', 'read_excel_cached',
+           'WorkbookReader', 'read_workbook_sheets', 'StreamingWorkbookWriter', 'ColumnFormat', 'CommuneManifest',
+           'extract_commune_workbooks', 'COMMUNE_SHEET_READ_OPTIONS', 'NormalizedSuiviData', 'TeamKpiEngine',
+           'AnomalyEngine', 'AnomalyRule', 'ActivityCube', 'DateRangeIndex', 'QcAnalysisContext', 'CriteriaScheduler',
+           'QgisAddressIndex', 'build_adresse_optimum', 'CellProbe', 'get_sheet_names',
+           'QcReportIndex', 'read_report_fields', 'QcTrackingReport', 'DataViewerIndex']
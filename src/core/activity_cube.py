@@ -0,0 +1,310 @@
+"""
+Activity cube module.
+Pre-aggregates the treatment sheets of the global suivi into a compact
+(activity, collaborator, day, motif) -> (count, duration) cube so monthly
+CTJ and motif exports slice arrays instead of rescanning the sheets.
+"""
+
+import logging
+import calendar
+from datetime import date, timedelta
+from typing import Optional, Dict, Any, List
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from core.suivi_normalizer import NormalizedSuiviData
+
+logger = logging.getLogger(__name__)
+
+# Activities stored in the cube
+CTJ_PA = 'CTJ_PA'        # PA lines with a positive duration, by 'Date traitement'
+CTJ_CM = 'CTJ_CM'        # CM lines, by treatment date (column G)
+MOTIF_CM = 'MOTIF_CM'    # CM motifs (column D), by treatment date (column G)
+MOTIF_PA = 'MOTIF_PA'    # PA motifs (column D), by treatment date (column G)
+MOTIF_RIP = 'MOTIF_RIP'  # RIP acts (column E), by treatment date (column H)
+
+ACTIVITIES = [CTJ_PA, CTJ_CM, MOTIF_CM, MOTIF_PA, MOTIF_RIP]
+
+# Motif activities: type label -> (activity, sheet, motif position, date position, minimum column count)
+MOTIF_SOURCES = {
+    'CM': (MOTIF_CM, 'Traitement CMS Adr', 3, 6, 8),
+    'PA': (MOTIF_PA, 'Traitement PA', 3, 6, 8),
+    'RIP': (MOTIF_RIP, 'Traitement RIP', 4, 7, 9)
+}
+
+# Position of the CM treatment date column in 'Traitement CMS Adr' (column G, after Motif Voie)
+CM_DATE_COLUMN_INDEX = 6
+
+NO_MOTIF = -1
+EPOCH = date(1970, 1, 1)
+
+
+class ActivityCube:
+    """
+    Daily activity counts and durations per collaborator and motif.
+
+    Cells are stored as parallel NumPy arrays sorted by (activity, day), so a
+    month of one activity is a contiguous slice found with searchsorted.
+    """
+
+    def __init__(self):
+        """Initialize an empty cube (use ActivityCube.build to fill it)."""
+        np = _get_numpy()
+        self.collaborator_labels = []  # collaborator code -> label
+        self.motif_labels = []         # motif code -> label
+        self.source_collaborators = {activity: [] for activity in ACTIVITIES}
+        self.activity = np.empty(0, dtype=np.int8)
+        self.collaborator = np.empty(0, dtype=np.int32)
+        self.day = np.empty(0, dtype=np.int32)  # days since 1970-01-01
+        self.motif = np.empty(0, dtype=np.int32)
+        self.count = np.empty(0, dtype=np.int64)
+        self.duration = np.empty(0, dtype=np.float64)
+
+    @classmethod
+    def build(cls, global_suivi_data: Dict[str, 'pd.DataFrame'],
+              normalized: Optional[NormalizedSuiviData] = None) -> 'ActivityCube':
+        """
+        Build the cube from the global suivi sheets in one pass per activity.
+
+        Args:
+            global_suivi_data: Sheets of the global suivi file keyed by sheet name
+            normalized: Normalized date/duration columns of the same sheets
+
+        Returns:
+            ActivityCube
+        """
+        pd = get_pandas()
+        np = _get_numpy()
+        cube = cls()
+        normalized = normalized or NormalizedSuiviData(global_suivi_data)
+        data = global_suivi_data or {}
+
+        frames = []
+        for activity, facts in (
+            (CTJ_PA, cls._ctj_pa_facts(data, normalized, cube)),
+            (CTJ_CM, cls._ctj_cm_facts(data, normalized, cube)),
+            *((MOTIF_SOURCES[motif_type][0], cls._motif_facts(data, normalized, motif_type))
+              for motif_type in MOTIF_SOURCES)
+        ):
+            if facts is not None and not facts.empty:
+                facts = facts.assign(activity=ACTIVITIES.index(activity))
+                frames.append(facts)
+
+        if not frames:
+            return cube
+
+        facts = pd.concat(frames, ignore_index=True)
+        collaborator_codes, cube.collaborator_labels = pd.factorize(facts['collaborator'])
+        motif_codes, motif_labels = pd.factorize(facts['motif'])
+        cube.motif_labels = list(motif_labels)
+        cube.collaborator_labels = list(cube.collaborator_labels)
+
+        facts = pd.DataFrame({
+            'activity': facts['activity'].to_numpy(dtype=np.int8),
+            'day': facts['day'].to_numpy(dtype=np.int32),
+            'collaborator': collaborator_codes.astype(np.int32),
+            'motif': motif_codes.astype(np.int32),  # -1 for activities without motif
+            'duration': facts['duration'].to_numpy(dtype=np.float64)
+        })
+        cells = facts.groupby(['activity', 'day', 'collaborator', 'motif'], sort=True).agg(
+            count=('duration', 'size'), duration=('duration', 'sum')
+        ).reset_index()
+
+        cube.activity = cells['activity'].to_numpy(dtype=np.int8)
+        cube.day = cells['day'].to_numpy(dtype=np.int32)
+        cube.collaborator = cells['collaborator'].to_numpy(dtype=np.int32)
+        cube.motif = cells['motif'].to_numpy(dtype=np.int32)
+        cube.count = cells['count'].to_numpy(dtype=np.int64)
+        cube.duration = cells['duration'].to_numpy(dtype=np.float64)
+
+        logger.info(f"Activity cube built: {len(cells)} cells from {len(facts)} lines")
+        return cube
+
+    @staticmethod
+    def _days(dates) -> 'pd.Series':
+        """Convert datetime64 values to day numbers since 1970-01-01 (NaN for NaT)."""
+        np = _get_numpy()
+        days = dates.dt.normalize().to_numpy(dtype='datetime64[D]').astype(np.int64).astype(np.float64)
+        days[dates.isna().to_numpy()] = np.nan
+        return days
+
+    @staticmethod
+    def _duration_minutes(normalized: NormalizedSuiviData, sheet_name: str, index) -> 'pd.Series':
+        """Get the 'Durée' minutes of a sheet restricted to index (0 when missing)."""
+        pd = get_pandas()
+        minutes = normalized.minutes(sheet_name, 'Durée')
+        if minutes is None:
+            return pd.Series(0.0, index=index)
+        return minutes[index].fillna(0)
+
+    @classmethod
+    def _ctj_pa_facts(cls, data, normalized, cube) -> Optional['pd.DataFrame']:
+        """PA lines counted by CTJ PA: positive duration and a readable treatment date."""
+        pd = get_pandas()
+        df = data.get('Traitement PA')
+        if df is None or df.empty or 'Collaborateur' not in df.columns or 'Date traitement' not in df.columns:
+            return None
+
+        cube.source_collaborators[CTJ_PA] = list(df['Collaborateur'].dropna().unique())
+
+        if 'Durée' in df.columns:
+            durations = pd.to_numeric(df['Durée'].astype(str).str.replace(',', '.', regex=False), errors='coerce')
+        else:
+            durations = pd.Series(float('nan'), index=df.index)
+
+        days = pd.Series(cls._days(normalized.dates('Traitement PA', 'Date traitement')), index=df.index)
+        keep = (durations > 0) & days.notna() & df['Collaborateur'].notna()
+        return pd.DataFrame({
+            'collaborator': df.loc[keep, 'Collaborateur'],
+            'day': days[keep],
+            'motif': None,
+            'duration': cls._duration_minutes(normalized, 'Traitement PA', df.index[keep])
+        })
+
+    @classmethod
+    def _ctj_cm_facts(cls, data, normalized, cube) -> Optional['pd.DataFrame']:
+        """CM lines counted by CTJ CM: a readable treatment date in column G."""
+        pd = get_pandas()
+        df = data.get('Traitement CMS Adr')
+        if df is None or df.empty or 'Collaborateur' not in df.columns or len(df.columns) <= CM_DATE_COLUMN_INDEX:
+            return None
+
+        cube.source_collaborators[CTJ_CM] = list(df['Collaborateur'].dropna().unique())
+
+        date_column = df.columns[CM_DATE_COLUMN_INDEX]
+        days = pd.Series(cls._days(normalized.dates('Traitement CMS Adr', date_column)), index=df.index)
+        keep = days.notna() & df['Collaborateur'].notna()
+        return pd.DataFrame({
+            'collaborator': df.loc[keep, 'Collaborateur'],
+            'day': days[keep],
+            'motif': None,
+            'duration': cls._duration_minutes(normalized, 'Traitement CMS Adr', df.index[keep])
+        })
+
+    @classmethod
+    def _motif_facts(cls, data, normalized, motif_type) -> Optional['pd.DataFrame']:
+        """Motif lines of a treatment sheet: non-empty motif and a readable treatment date."""
+        pd = get_pandas()
+        _, sheet_name, motif_index, date_index, min_columns = MOTIF_SOURCES[motif_type]
+        df = data.get(sheet_name)
+        if df is None or df.empty:
+            return None
+        if len(df.columns) < min_columns:
+            logger.warning(f"{motif_type} sheet: Not enough columns (found {len(df.columns)}, need at least {min_columns})")
+            return None
+
+        motif_column = df.columns[motif_index]
+        motifs = df[motif_column].astype(str).str.strip()
+        has_motif = df[motif_column].astype(bool) & (motifs != '') & (motifs.str.lower() != 'nan')
+
+        days = pd.Series(cls._days(normalized.dates(sheet_name, df.columns[date_index])), index=df.index)
+        keep = has_motif & days.notna()
+
+        if 'Collaborateur' in df.columns:
+            collaborators = df.loc[keep, 'Collaborateur'].astype(str).str.strip()
+        else:
+            collaborators = pd.Series('Non spécifié', index=df.index[keep])
+
+        return pd.DataFrame({
+            'collaborator': collaborators,
+            'day': days[keep],
+            'motif': motifs[keep].str.upper(),
+            'duration': cls._duration_minutes(normalized, sheet_name, df.index[keep])
+        })
+
+    def get_source_collaborators(self, activity: str) -> List[Any]:
+        """
+        Get the collaborators found in the source sheet of a CTJ activity.
+
+        Args:
+            activity: CTJ_PA or CTJ_CM
+
+        Returns:
+            Raw collaborator values, in sheet order (including those without
+            any counted line)
+        """
+        return list(self.source_collaborators.get(activity, []))
+
+    def _month_slice(self, activity: str, year: int, month: int) -> slice:
+        """Get the cell range of one activity and month."""
+        np = _get_numpy()
+        code = ACTIVITIES.index(activity)
+        start, end = np.searchsorted(self.activity, [code, code + 1])
+
+        first_day = (date(year, month, 1) - EPOCH).days
+        last_day = first_day + calendar.monthrange(year, month)[1]
+        day_start, day_end = np.searchsorted(self.day[start:end], [first_day, last_day])
+        return slice(start + day_start, start + day_end)
+
+    def daily_counts(self, activity: str, year: int, month: int) -> Dict[Any, List[int]]:
+        """
+        Get the daily line counts of a month per collaborator.
+
+        Args:
+            activity: Activity name (e.g. CTJ_PA)
+            year: Year
+            month: Month number
+
+        Returns:
+            Dictionary collaborator label -> list of counts (index 0 = day 1).
+            Collaborators without any line in the month are not included.
+        """
+        np = _get_numpy()
+        cells = self._month_slice(activity, year, month)
+        days_in_month = calendar.monthrange(year, month)[1]
+        first_day = (date(year, month, 1) - EPOCH).days
+
+        result = {}
+        collaborators = self.collaborator[cells]
+        if len(collaborators) == 0:
+            return result
+
+        day_offsets = self.day[cells] - first_day
+        counts = self.count[cells]
+        for code in np.unique(collaborators):
+            selected = collaborators == code
+            daily = np.zeros(days_in_month, dtype=np.int64)
+            np.add.at(daily, day_offsets[selected], counts[selected])
+            result[self.collaborator_labels[code]] = [int(value) for value in daily]
+        return result
+
+    def motif_records(self, motif_type: str, year: int, month: int) -> List[Dict[str, Any]]:
+        """
+        Get one record per motif line of a month, as used by the motifs statistics sheet.
+
+        Args:
+            motif_type: 'CM', 'PA' or 'RIP'
+            year: Year
+            month: Month number
+
+        Returns:
+            List of records with Type, Motif, Date, Collaborateur, Mois and Année
+        """
+        activity = MOTIF_SOURCES[motif_type][0]
+        cells = self._month_slice(activity, year, month)
+
+        records = []
+        for day, collaborator, motif, count in zip(self.day[cells], self.collaborator[cells],
+                                                   self.motif[cells], self.count[cells]):
+            record = {
+                'Type': motif_type,
+                'Motif': self.motif_labels[motif],
+                'Date': (EPOCH + timedelta(days=int(day))).strftime('%Y-%m-%d'),
+                'Collaborateur': self.collaborator_labels[collaborator],
+                'Mois': month,
+                'Année': year
+            }
+            records.extend(dict(record) for _ in range(int(count)))
+        return records
+
+
+def _get_numpy():
+    """Get numpy (imported with pandas)."""
+    import numpy
+    return numpy
@@ -0,0 +1,340 @@
+"""
+Anomaly detection engine module.
+Evaluates declarative anomaly rules over the global suivi sheets as
+vectorized masks and only builds anomaly records for the flagged rows.
+"""
+
+import logging
+from datetime import datetime, date
+from typing import Optional, Dict, Any, List, Callable
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from core.suivi_normalizer import NormalizedSuiviData
+
+logger = logging.getLogger(__name__)
+
+
+class SheetView:
+    """
+    One sheet as seen by the anomaly rules.
+
+    Column-level results (emptiness, stripped text, parsed dates) are computed
+    once and shared by every rule of the sheet.
+    """
+
+    def __init__(self, sheet_name: str, df, normalized: NormalizedSuiviData, today: date):
+        """
+        Initialize the sheet view.
+
+        Args:
+            sheet_name: Sheet name
+            df: Sheet DataFrame
+            normalized: Normalized date/duration columns holding this sheet
+            today: Reference date for date rules
+        """
+        self.sheet_name = sheet_name
+        self.df = df
+        self.normalized = normalized
+        self.today = today
+        self._text = {}
+        self._empty = {}
+
+    def column(self, position: int):
+        """Get the column name at a position (Excel column A = 0), or None."""
+        return self.df.columns[position] if len(self.df.columns) > position else None
+
+    def text(self, column) -> 'pd.Series':
+        """Get a column as stripped strings (NaN as 'nan', like str())."""
+        if column not in self._text:
+            self._text[column] = self.df[column].astype(str).str.strip()
+        return self._text[column]
+
+    def empty(self, column) -> 'pd.Series':
+        """Get the mask of empty cells (NaN, '' or whitespace) of a column."""
+        if column not in self._empty:
+            self._empty[column] = self.df[column].isna() | (self.text(column) == '')
+        return self._empty[column]
+
+    def dates(self, column) -> 'pd.Series':
+        """Get a column as datetime64 (NaT for empty/unreadable cells)."""
+        return self.normalized.dates(self.sheet_name, column)
+
+    def value(self, index, column):
+        """Get a raw cell value."""
+        return self.df.at[index, column]
+
+    def insee(self, index, position: int) -> str:
+        """Get the INSEE code of a row as exported ('' if the column doesn't exist)."""
+        column = self.column(position)
+        return str(self.df.at[index, column]) if column is not None else ''
+
+
+class AnomalyRule:
+    """
+    A declarative anomaly rule.
+
+    The mask function returns a boolean Series (one flag per row) or a boolean
+    DataFrame (one flag per cell, columns = checked columns). The build function
+    turns a flagged row and its flagged columns into anomaly records.
+    """
+
+    def __init__(self, name: str, sheet_name: str,
+                 mask: Callable[[SheetView], Any],
+                 build: Callable[[SheetView, Any, List[Any]], List[Dict[str, Any]]]):
+        """
+        Initialize the rule.
+
+        Args:
+            name: Rule name (used in logs)
+            sheet_name: Sheet the rule applies to
+            mask: Function(view) returning the flags, or None if the rule doesn't apply
+            build: Function(view, index, columns) returning the records of a flagged row
+        """
+        self.name = name
+        self.sheet_name = sheet_name
+        self.mask = mask
+        self.build = build
+
+
+class AnomalyEngine:
+    """Runs anomaly rules sheet by sheet and materializes the anomaly records."""
+
+    def __init__(self, rules: Optional[List[AnomalyRule]] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            rules: Rules to evaluate, in output order (defaults to the suivi rules)
+        """
+        self.rules = list(rules) if rules is not None else build_suivi_anomaly_rules()
+
+    def add_rule(self, rule: AnomalyRule) -> None:
+        """Add a rule, evaluated after the existing rules of its sheet."""
+        self.rules.append(rule)
+
+    def detect(self, global_suivi_data: Dict[str, 'pd.DataFrame'],
+               normalized: Optional[NormalizedSuiviData] = None,
+               today: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Detect anomalies in the global suivi sheets.
+
+        Args:
+            global_suivi_data: Sheets of the global suivi file keyed by sheet name
+            normalized: Normalized date/duration columns of the same sheets
+            today: Reference date for date rules (defaults to the current date)
+
+        Returns:
+            List of anomaly records, grouped by sheet then rule, in row order
+        """
+        pd = get_pandas()
+        normalized = normalized or NormalizedSuiviData(global_suivi_data)
+        today = today or datetime.now().date()
+        anomalies = []
+
+        for sheet_name, df in (global_suivi_data or {}).items():
+            if df is None or df.empty:
+                continue
+
+            rules = [rule for rule in self.rules if rule.sheet_name == sheet_name]
+            if not rules:
+                continue
+
+            logger.info(f"Checking anomalies in sheet: {sheet_name}")
+            view = SheetView(sheet_name, df, normalized, today)
+
+            # Evaluate every rule mask first, then build the records of flagged rows only
+            flags = []
+            for rule in rules:
+                try:
+                    flags.append((rule, rule.mask(view)))
+                except Exception as e:
+                    logger.error(f"Error evaluating anomaly rule '{rule.name}': {e}")
+
+            for rule, mask in flags:
+                if mask is None:
+                    continue
+                records = []
+                try:
+                    if isinstance(mask, pd.DataFrame):
+                        cells = mask.to_numpy(dtype=bool, na_value=False)
+                        for row_position in cells.any(axis=1).nonzero()[0]:
+                            columns = [mask.columns[i] for i in cells[row_position].nonzero()[0]]
+                            records.extend(rule.build(view, df.index[row_position], columns))
+                    else:
+                        for index in df.index[mask.to_numpy(dtype=bool, na_value=False)]:
+                            records.extend(rule.build(view, index, []))
+                except Exception as e:
+                    logger.error(f"Error building anomalies for rule '{rule.name}': {e}")
+                    continue
+
+                logger.info(f"Rule '{rule.name}' ({sheet_name}): {len(records)} anomalies")
+                anomalies.extend(records)
+
+        logger.info(f"Total anomalies detected: {len(anomalies)}")
+        return anomalies
+
+
+# ---------------------------------------------------------------------------
+# Global suivi rules
+# ---------------------------------------------------------------------------
+
+# Sheet 1 columns checked for empty cells: A to U except O, Q, R, T
+EMPTY_CELL_COLUMNS = [chr(code) for code in range(ord('A'), ord('U') + 1) if chr(code) not in 'OQRT']
+
+# Position of the INSEE column per sheet (C in Suivi Tickets, B in the treatment sheets)
+INSEE_COLUMN_POSITION = {'Suivi Tickets': 2, 'Traitement CMS Adr': 1, 'Traitement PA': 1}
+
+
+def _row_number(index):
+    """Excel row number of a DataFrame row (+2: Excel starts at 1 and there is a header)."""
+    return index + 2
+
+
+def _empty_cells_mask(view: SheetView):
+    """Empty cells in the required columns of sheet 1."""
+    pd = get_pandas()
+    columns = [col for position, col in enumerate(view.df.columns)
+               if position < 26 and chr(ord('A') + position) in EMPTY_CELL_COLUMNS]
+    logger.info(f"Checking empty cells in columns: {columns}")
+    return pd.DataFrame({col: view.empty(col) for col in columns}, index=view.df.index)
+
+
+def _empty_cells_records(view: SheetView, index, columns):
+    return [{
+        'type': 'Cases vides',
+        'feuille': view.sheet_name,
+        'ligne': _row_number(index),
+        'code_insee': view.insee(index, INSEE_COLUMN_POSITION[view.sheet_name]),
+        'colonnes_vides': ', '.join(str(col) for col in columns),
+        'commentaire': f'Cases vides dans colonnes: {", ".join(str(col) for col in columns)}'
+    }]
+
+
+def _future_dates_mask(view: SheetView):
+    """Dates after today in every date column of the sheet."""
+    pd = get_pandas()
+    date_columns = [col for col in view.df.columns if 'date' in str(col).lower()]
+    logger.info(f"Checking future dates in '{view.sheet_name}' columns: {date_columns}")
+    today = pd.Timestamp(view.today)
+    return pd.DataFrame({col: view.dates(col).dt.normalize() > today for col in date_columns},
+                        index=view.df.index)
+
+
+def _future_dates_records(view: SheetView, index, columns):
+    return [{
+        'type': 'Date future',
+        'feuille': view.sheet_name,
+        'ligne': _row_number(index),
+        'code_insee': view.insee(index, INSEE_COLUMN_POSITION[view.sheet_name]),
+        'colonne': col,
+        'date': str(view.value(index, col)),
+        'commentaire': 'Incohérence date'
+    } for col in columns]
+
+
+def _assignment_after_delivery_mask(view: SheetView):
+    """Assignment date (column I) after the delivery date (column O)."""
+    assignment_col, delivery_col = view.column(8), view.column(14)
+    if assignment_col is None or delivery_col is None:
+        logger.warning("Assignment or delivery columns not found in sheet 1")
+        return None
+    return view.dates(assignment_col).dt.normalize() > view.dates(delivery_col).dt.normalize()
+
+
+def _assignment_after_delivery_records(view: SheetView, index, columns):
+    assignment_col, delivery_col = view.column(8), view.column(14)
+    assignment_value = view.value(index, assignment_col)
+    delivery_value = view.value(index, delivery_col)
+    return [{
+        'type': 'Incohérence dates affectation/livraison',
+        'feuille': view.sheet_name,
+        'ligne': _row_number(index),
+        'code_insee': view.insee(index, 2),
+        'colonnes_concernees': f'{assignment_col}, {delivery_col}',
+        'valeurs_problematiques': f'Affectation: {assignment_value}, Livraison: {delivery_value}',
+        'commentaire': f'Date d\'affectation ({assignment_value}) postérieure à la date de livraison ({delivery_value})'
+    }]
+
+
+def _cm_treated_without_motif_mask(view: SheetView):
+    """CM tickets treated (column I filled) without motif voie (column D empty)."""
+    motif_col, treatment_col = view.column(3), view.column(8)
+    if motif_col is None or treatment_col is None:
+        logger.warning("Motif or treatment columns not found in sheet 2")
+        return None
+    return ~view.empty(treatment_col) & view.empty(motif_col)
+
+
+def _cm_treated_without_motif_records(view: SheetView, index, columns):
+    motif_col, treatment_col = view.column(3), view.column(8)
+    motif_value = view.value(index, motif_col)
+    treatment_value = view.value(index, treatment_col)
+    return [{
+        'type': 'Ticket CM traité sans motif voie',
+        'feuille': view.sheet_name,
+        'ligne': _row_number(index),
+        'code_insee': view.insee(index, 1),
+        'colonnes_concernees': f'{motif_col}, {treatment_col}',
+        'valeurs_problematiques': f'Motif: {motif_value}, Traitement: {treatment_value}',
+        'commentaire': f'Ticket marqué comme traité (colonne {treatment_col}: {treatment_value}) mais motif voie vide (colonne {motif_col})'
+    }]
+
+
+def _unjoined_address_with_time_mask(view: SheetView):
+    """Address not joined (column D 'Non' or empty) with a processing time > 0 (column H)."""
+    pd = get_pandas()
+    status_col, time_col = view.column(3), view.column(7)
+    if status_col is None or time_col is None:
+        logger.warning("Address status or processing time columns not found in sheet 3")
+        return None
+
+    not_joined = view.empty(status_col) | view.text(status_col).str.lower().isin(['non', 'no'])
+    processing_time = pd.to_numeric(view.text(time_col).str.replace(',', '.', regex=False), errors='coerce')
+    processing_time = processing_time.where(~view.df[time_col].isna())
+    return not_joined & (processing_time > 0)
+
+
+def _unjoined_address_with_time_records(view: SheetView, index, columns):
+    status_col, time_col = view.column(3), view.column(7)
+    status_value = view.value(index, status_col)
+    time_value = view.value(index, time_col)
+    return [{
+        'type': 'Adresse non jointe avec temps de traitement',
+        'feuille': view.sheet_name,
+        'ligne': _row_number(index),
+        'code_insee': view.insee(index, 1),
+        'colonnes_concernees': f'{status_col}, {time_col}',
+        'valeurs_problematiques': f'Statut adresse: {status_value}, Temps: {time_value}',
+        'commentaire': f'Adresse non jointe (colonne {status_col}: {status_value}) mais temps de traitement > 0 (colonne {time_col}: {time_value})'
+    }]
+
+
+def build_suivi_anomaly_rules() -> List[AnomalyRule]:
+    """
+    Build the anomaly rules of the "Exporter anomalies" action.
+
+    Returns:
+        Rules in output order
+    """
+    return [
+        # Feuille 1: cases vides, dates futures, incohérence affectation/livraison
+        AnomalyRule('Cases vides', 'Suivi Tickets', _empty_cells_mask, _empty_cells_records),
+        AnomalyRule('Date future', 'Suivi Tickets', _future_dates_mask, _future_dates_records),
+        AnomalyRule('Incohérence dates affectation/livraison', 'Suivi Tickets',
+                    _assignment_after_delivery_mask, _assignment_after_delivery_records),
+        # Feuille 2: dates futures, tickets CM traités sans motif voie
+        AnomalyRule('Date future', 'Traitement CMS Adr', _future_dates_mask, _future_dates_records),
+        AnomalyRule('Ticket CM traité sans motif voie', 'Traitement CMS Adr',
+                    _cm_treated_without_motif_mask, _cm_treated_without_motif_records),
+        # Feuille 3: dates futures, adresses non jointes avec temps de traitement
+        AnomalyRule('Date future', 'Traitement PA', _future_dates_mask, _future_dates_records),
+        AnomalyRule('Adresse non jointe avec temps de traitement', 'Traitement PA',
+                    _unjoined_address_with_time_mask, _unjoined_address_with_time_records)
+    ]
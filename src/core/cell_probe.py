@@ -0,0 +1,313 @@
+"""
+Cell probe module.
+Reads a few cells of an xlsx workbook straight from the sheet XML, parsing
+rows only up to the last one needed, without building a DataFrame. Used for
+the fixed header cells of generated reports and for sheet listings.
+"""
+
+import os
+import zipfile
+import logging
+import posixpath
+from datetime import datetime
+from xml.etree import ElementTree
+from typing import Optional, Dict, Any, List, Iterable, Tuple, Union
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+
+logger = logging.getLogger(__name__)
+
+_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+
+def _local_name(tag: str) -> str:
+    """Get an XML tag without its namespace (transitional and strict OOXML)."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def split_cell_reference(reference: str) -> Tuple[int, int]:
+    """
+    Split an A1 cell reference.
+
+    Args:
+        reference: Cell reference such as 'B3' (absolute '$B$3' accepted)
+
+    Returns:
+        Tuple (row number starting at 1, column position starting at 0)
+
+    Raises:
+        ValueError: If the reference is not a cell reference
+    """
+    text = reference.replace('$', '').upper()
+    letters = text.rstrip('0123456789')
+    digits = text[len(letters):]
+    if not letters or not digits or not letters.isalpha():
+        raise ValueError(f"Référence de cellule invalide: {reference}")
+
+    column = 0
+    for letter in letters:
+        column = column * 26 + ord(letter) - ord('A') + 1
+    return int(digits), column - 1
+
+
+class CellProbe:
+    """
+    Read-only access to individual cells of an xlsx workbook.
+
+    Cells keep their stored value: numbers as int/float, text as str,
+    booleans, cached results for formulas, None for empty and error cells.
+    Number formats are not applied (dates stored as serials stay numbers).
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the probe.
+
+        Args:
+            file_path: Path to the xlsx/xlsm workbook
+        """
+        self.file_path = file_path
+        self._sheets: Optional[List[Tuple[str, str]]] = None  # (name, part path) in workbook order
+
+    def sheet_names(self) -> List[str]:
+        """
+        Get the worksheet names in workbook order.
+
+        Returns:
+            List of sheet names
+
+        Raises:
+            zipfile.BadZipFile: If the file is not an xlsx workbook
+        """
+        with zipfile.ZipFile(self.file_path) as archive:
+            return [name for name, _ in self._get_sheets(archive)]
+
+    def read_rows(self, rows: Iterable[int], sheet: Union[int, str] = 0) -> Dict[int, List[Any]]:
+        """
+        Read whole rows of a sheet.
+
+        Parsing stops at the last requested row, so the cost does not depend
+        on the sheet size.
+
+        Args:
+            rows: Row numbers (1 = first row)
+            sheet: Sheet index or name
+
+        Returns:
+            Cell values of each requested row, column A first, up to the last
+            filled cell ([] for empty rows)
+
+        Raises:
+            zipfile.BadZipFile: If the file is not an xlsx workbook
+            KeyError: If the sheet does not exist
+        """
+        wanted = set(rows)
+        if not wanted:
+            return {}
+
+        found = {row: {} for row in wanted}
+        with zipfile.ZipFile(self.file_path) as archive:
+            shared_refs = self._scan_sheet(archive, self._get_sheet_part(archive, sheet), wanted, found)
+            if shared_refs:
+                self._resolve_shared_strings(archive, found)
+
+        return {row: [cells.get(position) for position in range(max(cells) + 1)] if cells else []
+                for row, cells in found.items()}
+
+    def read_cells(self, references: Iterable[str], sheet: Union[int, str] = 0) -> Dict[str, Any]:
+        """
+        Read individual cells of a sheet.
+
+        Args:
+            references: A1 references (e.g. ['B3', 'J11'])
+            sheet: Sheet index or name
+
+        Returns:
+            Value of each reference (None for empty cells)
+        """
+        positions = {reference: split_cell_reference(reference) for reference in references}
+        values = self.read_rows({row for row, _ in positions.values()}, sheet)
+        return {reference: (values[row][column] if column < len(values[row]) else None)
+                for reference, (row, column) in positions.items()}
+
+    def _get_sheets(self, archive: zipfile.ZipFile) -> List[Tuple[str, str]]:
+        """Get the (name, part path) of each worksheet from the workbook part."""
+        if self._sheets is None:
+            targets = {}
+            rels_path = 'xl/_rels/workbook.xml.rels'
+            if rels_path in archive.namelist():
+                for element in ElementTree.fromstring(archive.read(rels_path)):
+                    target = element.get('Target', '')
+                    if target.startswith('/'):
+                        target = target[1:]
+                    else:
+                        target = posixpath.normpath(posixpath.join('xl', target))
+                    targets[element.get('Id')] = target
+
+            sheets = []
+            for element in ElementTree.fromstring(archive.read('xl/workbook.xml')).iter():
+                if _local_name(element.tag) == 'sheet':
+                    target = targets.get(element.get(f'{_REL_NS}id'))
+                    if target and 'worksheets/' in target:
+                        sheets.append((element.get('name'), target))
+            self._sheets = sheets
+        return self._sheets
+
+    def _get_sheet_part(self, archive: zipfile.ZipFile, sheet: Union[int, str]) -> str:
+        """Get the part path of a sheet given by index or name."""
+        sheets = self._get_sheets(archive)
+        if isinstance(sheet, int):
+            if 0 <= sheet < len(sheets):
+                return sheets[sheet][1]
+        else:
+            for name, part in sheets:
+                if name == sheet:
+                    return part
+        raise KeyError(f"Feuille {sheet} introuvable dans {os.path.basename(self.file_path)}")
+
+    @staticmethod
+    def _scan_sheet(archive: zipfile.ZipFile, part: str, wanted: set, found: Dict[int, Dict[int, Any]]) -> bool:
+        """
+        Parse the sheet XML up to the last wanted row and fill found[row][column].
+
+        Shared strings are left as ('s', index) markers.
+
+        Returns:
+            True if some shared strings must be resolved
+        """
+        last_row = max(wanted)
+        row_number = 0
+        column = -1
+        shared_refs = False
+
+        with archive.open(part) as stream:
+            for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+                tag = _local_name(element.tag)
+
+                if event == 'start':
+                    if tag == 'row':
+                        row_number = int(element.get('r') or row_number + 1)
+                        column = -1
+                        if row_number > last_row:
+                            break
+                    continue
+
+                if tag == 'c':
+                    reference = element.get('r')
+                    column = split_cell_reference(reference)[1] if reference else column + 1
+                    if row_number in wanted:
+                        value = _read_cell_value(element)
+                        if value is not None:
+                            found[row_number][column] = value
+                            shared_refs = shared_refs or isinstance(value, tuple)
+                    element.clear()
+                elif tag == 'row':
+                    element.clear()
+                    if row_number >= last_row:
+                        break
+
+        return shared_refs
+
+    @staticmethod
+    def _resolve_shared_strings(archive: zipfile.ZipFile, found: Dict[int, Dict[int, Any]]) -> None:
+        """Replace the shared string markers, parsing the string table only up to the last index needed."""
+        needed = {value[1] for cells in found.values() for value in cells.values() if isinstance(value, tuple)}
+        last_index = max(needed)
+        strings = {}
+
+        if 'xl/sharedStrings.xml' in archive.namelist():
+            with archive.open('xl/sharedStrings.xml') as stream:
+                index = 0
+                for _, element in ElementTree.iterparse(stream, events=('end',)):
+                    if _local_name(element.tag) != 'si':
+                        continue
+                    if index in needed:
+                        strings[index] = _read_rich_text(element)
+                    element.clear()
+                    index += 1
+                    if index > last_index:
+                        break
+
+        for cells in found.values():
+            for column, value in list(cells.items()):
+                if isinstance(value, tuple):
+                    text = strings.get(value[1])
+                    if text:
+                        cells[column] = text
+                    else:
+                        del cells[column]
+
+
+def _read_rich_text(element) -> str:
+    """Concatenate the text runs of a string item (phonetic runs excluded)."""
+    parts = []
+    for child in element:
+        name = _local_name(child.tag)
+        if name == 't':
+            parts.append(child.text or '')
+        elif name == 'r':
+            parts.extend(run.text or '' for run in child if _local_name(run.tag) == 't')
+    return ''.join(parts)
+
+
+def _read_cell_value(element) -> Any:
+    """Get the value of a <c> element (('s', index) for shared strings, None for empty/error cells)."""
+    cell_type = element.get('t', 'n')
+    raw = None
+    inline = None
+    for child in element:
+        name = _local_name(child.tag)
+        if name == 'v':
+            raw = child.text
+        elif name == 'is':
+            inline = _read_rich_text(child)
+
+    if cell_type == 'inlineStr':
+        return inline or None
+    if raw is None or cell_type == 'e':
+        return None
+    if cell_type == 's':
+        return ('s', int(raw))
+    if cell_type == 'str':
+        return raw or None
+    if cell_type == 'b':
+        return raw == '1'
+    if cell_type == 'd':
+        try:
+            return datetime.fromisoformat(raw.rstrip('Z'))
+        except ValueError:
+            return raw
+
+    # Integral numbers as int, like pandas does for the openpyxl cells
+    try:
+        if raw.lstrip('-').isdigit():
+            return int(raw)
+        number = float(raw)
+    except ValueError:
+        return raw
+    return int(number) if number.is_integer() else number
+
+
+def get_sheet_names(file_path: str) -> List[str]:
+    """
+    Get the sheet names of a workbook, reading only the workbook part of xlsx files.
+
+    Args:
+        file_path: Path to the Excel file (.xls files go through pandas)
+
+    Returns:
+        List of sheet names
+    """
+    if zipfile.is_zipfile(file_path):
+        return CellProbe(file_path).sheet_names()
+
+    pd = get_pandas()
+    with pd.ExcelFile(file_path) as excel_file:
+        return list(excel_file.sheet_names)
@@ -0,0 +1,300 @@
+"""
+Commune suivi extraction module.
+Parses commune suivi workbooks for the Suivi Global aggregation. The
+extraction functions are module-level so they can run in worker processes.
+"""
+
+import os
+import logging
+from typing import Optional, Dict, Any, List, Callable
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from config.constants import ParallelConfig
+from core.workbook_reader import WorkbookReader
+from core.sheet_cache import get_sheet_cache, read_excel_cached
+from utils.performance import timed_operation
+
+logger = logging.getLogger(__name__)
+
+# Read options shared by every commune sheet read (scan, page writers, cache keys)
+COMMUNE_SHEET_READ_OPTIONS = {
+    'dtype': {'Insee': str, 'insee': str, 'Code INSEE': str},
+    'date_format': None  # CRITICAL: Prevent automatic date parsing
+}
+
+# Suivi pages: 0 = CM Adresse, 1 = Plan Adressage, 2 = Informations Commune, 3 = RIP
+COMMUNE_SHEETS = [0, 1, 2, 3]
+
+
+def read_commune_sheet(file_path: str, sheet_index: int) -> 'pd.DataFrame':
+    """
+    Read a page of a commune suivi file through the sheet cache.
+
+    Uses the engine and options of the extraction, so the pages parsed by
+    extract_commune_workbooks are cache hits.
+
+    Args:
+        file_path: Path to the commune suivi file
+        sheet_index: Page index (see COMMUNE_SHEETS)
+
+    Returns:
+        Page DataFrame
+
+    Raises:
+        Exception: If the page cannot be read
+    """
+    return read_excel_cached(file_path, sheet_name=sheet_index, engine=WorkbookReader.get_default_engine(),
+                             **COMMUNE_SHEET_READ_OPTIONS)
+
+
+def check_if_rip_commune(df) -> bool:
+    """Check if this is a RIP commune by looking at the Domaine field."""
+    try:
+        # Look for Domaine column in page 3 data
+        domaine_columns = ['Domaine', 'domaine', 'DOMAINE']
+        for col in domaine_columns:
+            if col in df.columns and not df[col].empty:
+                domaine_value = df[col].iloc[0]
+                if domaine_value is not None:
+                    domaine_str = str(domaine_value).strip().upper()
+                    return domaine_str == 'RIP'
+        return False
+    except Exception:
+        return False
+
+
+def extract_insee_from_data(df) -> Optional[str]:
+    """Extract INSEE code from the dataframe."""
+    try:
+        # Look for INSEE code in common column names
+        insee_columns = ['insee', 'code_insee', 'INSEE', 'Code INSEE', 'Insee']
+        for col in insee_columns:
+            if col in df.columns and not df[col].empty:
+                insee_value = df[col].iloc[0]
+                if insee_value is not None:
+                    # Format INSEE code to preserve leading zeros (5 digits)
+                    insee_str = str(insee_value).strip()
+                    if insee_str.isdigit() and len(insee_str) <= 5:
+                        return insee_str.zfill(5)  # Pad with leading zeros to 5 digits
+                    return insee_str
+        return None
+    except Exception:
+        return None
+
+
+def summarize_page3_data(df) -> Dict[str, Any]:
+    """Summarize the data from page 3."""
+    try:
+        return {
+            'total_rows': len(df),
+            'columns': list(df.columns),
+            'non_empty_rows': len(df.dropna(how='all'))
+        }
+    except Exception:
+        return {'total_rows': 0, 'columns': [], 'non_empty_rows': 0}
+
+
+def summarize_rip_sheet(rip_df, excel_file_path: str) -> Optional[Dict[str, Any]]:
+    """Summarize the RIP sheet (4th page) data."""
+    pd = get_pandas()
+
+    if rip_df is None or rip_df.empty:
+        logger.warning(f"RIP sheet (page 4) is empty in {excel_file_path}")
+        return None
+
+    rip_summary = {
+        'total_rows': len(rip_df),
+        'columns': list(rip_df.columns),
+        'has_duration_data': 'Durée' in rip_df.columns,
+        'total_duration': 0
+    }
+
+    # Calculate total duration if duration column exists
+    if 'Durée' in rip_df.columns:
+        try:
+            # Convert duration values to numeric, handling empty/invalid values
+            duration_values = pd.to_numeric(rip_df['Durée'], errors='coerce').fillna(0)
+            rip_summary['total_duration'] = float(duration_values.sum())
+        except Exception:
+            rip_summary['total_duration'] = 0
+
+    logger.info(f"RIP sheet processed: {rip_summary['total_rows']} rows, total duration: {rip_summary['total_duration']}")
+    return rip_summary
+
+
+def build_commune_data(page3_df, rip_df, excel_file_path: str, folder_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Build the commune summary used by the Suivi Global module.
+
+    Args:
+        page3_df: Page 3 (Informations Commune) DataFrame
+        rip_df: Page 4 (RIP) DataFrame, or None if the sheet doesn't exist
+        excel_file_path: Path to the commune suivi file
+        folder_path: Path to the commune folder
+
+    Returns:
+        Commune data dictionary, or None if page 3 is empty
+    """
+    if page3_df is None or page3_df.empty:
+        logger.warning(f"Page 3 is empty in {excel_file_path}")
+        return None
+
+    # Check if this is a RIP commune by looking at the Domaine field
+    is_rip_commune = check_if_rip_commune(page3_df)
+
+    # Extract commune information from the first row or filename
+    folder_name = os.path.basename(folder_path)
+    parts = folder_name.split('_')
+
+    commune_data = {
+        'nom_commune': parts[0] if len(parts) > 0 else 'Unknown',
+        'id_tache': parts[1] if len(parts) > 1 else 'Unknown',
+        'insee_code': extract_insee_from_data(page3_df) or 'Unknown',
+        'file_path': excel_file_path,
+        'folder_path': folder_path,
+        'last_modified': os.path.getmtime(excel_file_path),
+        'data_summary': summarize_page3_data(page3_df),
+        'is_rip_commune': is_rip_commune,
+        'has_rip_sheet': False,
+        'rip_data_summary': None
+    }
+
+    # If this is a RIP commune, summarize the RIP sheet (4th page)
+    if is_rip_commune and rip_df is not None:
+        rip_data = summarize_rip_sheet(rip_df, excel_file_path)
+        if rip_data:
+            commune_data['has_rip_sheet'] = True
+            commune_data['rip_data_summary'] = rip_data
+            logger.info(f"RIP sheet detected and processed for {commune_data['nom_commune']}")
+
+    return commune_data
+
+
+def extract_commune_workbook(excel_file_path: str, folder_path: str) -> Dict[str, Any]:
+    """
+    Parse pages 1-4 of a commune suivi file in one pass.
+
+    Runs in worker processes: failures are reported in the result instead of
+    raised so that one broken file does not abort the whole aggregation.
+
+    Args:
+        excel_file_path: Path to the commune suivi file
+        folder_path: Path to the commune folder
+
+    Returns:
+        Dictionary with 'file_path', 'folder_path', 'commune_data',
+        'sheets' (page index -> DataFrame), 'source_stat' (file state
+        before the parse) and 'engine' (both part of the sheet cache key) and 'error'
+    """
+    result = {
+        'file_path': excel_file_path,
+        'folder_path': folder_path,
+        'commune_data': None,
+        'sheets': {},
+        'source_stat': None,
+        'engine': None,
+        'error': None
+    }
+
+    try:
+        result['source_stat'] = os.stat(excel_file_path)
+        reader = WorkbookReader(excel_file_path, use_cache=False)
+        result['engine'] = reader.engine
+        sheets = reader.read_sheets(COMMUNE_SHEETS, warn_missing=False, **COMMUNE_SHEET_READ_OPTIONS)
+        result['sheets'] = sheets
+        result['commune_data'] = build_commune_data(sheets.get(2), sheets.get(3), excel_file_path, folder_path)
+    except Exception as e:
+        result['error'] = str(e)
+
+    return result
+
+
+def get_worker_count(task_count: int) -> int:
+    """
+    Get the number of worker processes to use for a batch of files.
+
+    Args:
+        task_count: Number of files to process
+
+    Returns:
+        Worker count (1 means serial processing)
+    """
+    if task_count < ParallelConfig.MIN_TASKS_FOR_PROCESS_POOL:
+        return 1
+
+    workers = ParallelConfig.COMMUNE_EXTRACTION_WORKERS
+    if not workers:
+        workers = max(1, min((os.cpu_count() or 2) - 1, ParallelConfig.MAX_DEFAULT_WORKERS))
+
+    return max(1, min(workers, task_count))
+
+
+@timed_operation('suivi_global.extract_communes', threshold=10.0)
+def extract_commune_workbooks(tasks: List[tuple],
+                              on_result: Optional[Callable[[Dict[str, Any], int, int], None]] = None,
+                              max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Extract many commune suivi files, in a process pool when worthwhile.
+
+    Parsed sheets are stored in the persistent sheet cache by the calling
+    process, so the Suivi Global page writers read them without re-parsing.
+
+    Args:
+        tasks: List of (excel_file_path, folder_path) tuples
+        on_result: Callback(result, done_count, total_count) called as results arrive
+        max_workers: Worker count override (defaults to get_worker_count)
+
+    Returns:
+        List of extraction results in task order (on_result sees them in completion order)
+    """
+    total = len(tasks)
+    workers = max_workers or get_worker_count(total)
+    sheet_cache = get_sheet_cache()
+    results = {}  # task index -> result
+
+    def handle(index, result):
+        for sheet_index, df in result['sheets'].items():
+            sheet_cache.store(result['file_path'], sheet_index, df, source_stat=result.get('source_stat'),
+                              engine=result.get('engine'), **COMMUNE_SHEET_READ_OPTIONS)
+        result['sheets'] = {}  # Keep results light once cached
+        results[index] = result
+        if on_result:
+            on_result(result, len(results), total)
+
+    def ordered_results():
+        return [results[index] for index in sorted(results)]
+
+    if workers > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            logger.info(f"Extracting {total} commune files with {workers} worker processes")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(extract_commune_workbook, file_path, folder_path): index
+                           for index, (file_path, folder_path) in enumerate(tasks)}
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        handle(index, future.result())
+                    except Exception as e:
+                        file_path, folder_path = tasks[index]
+                        handle(index, {'file_path': file_path, 'folder_path': folder_path,
+                                       'commune_data': None, 'sheets': {}, 'error': str(e)})
+            return ordered_results()
+
+        except Exception as e:
+            # Pool could not start (frozen app without freeze_support, restricted env...)
+            logger.warning(f"Process pool unavailable, falling back to serial extraction: {e}")
+
+    for index, (file_path, folder_path) in enumerate(tasks):
+        if index not in results:
+            handle(index, extract_commune_workbook(file_path, folder_path))
+
+    return ordered_results()
@@ -0,0 +1,226 @@
+"""
+Commune manifest module.
+Persists what was extracted from each commune suivi file during the last
+Suivi Global generation so that later runs only re-parse changed files.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+
+class CommuneManifest:
+    """
+    Persisted manifest of commune suivi files aggregated into the global workbook.
+
+    Each entry maps a commune file path to its signature (size, mtime, content
+    hash) and to the commune data extracted from it. The manifest also records
+    the signature of the global workbook it was written with, so a workbook
+    replaced or edited outside of Pladria triggers a full rebuild.
+    """
+
+    VERSION = 1
+
+    def __init__(self, manifest_path: str):
+        """
+        Initialize the manifest.
+
+        Args:
+            manifest_path: Path to the JSON manifest file
+        """
+        self.logger = logging.getLogger(__name__)
+        self.manifest_path = manifest_path
+        self._lock = threading.Lock()
+        self.entries = {}  # file path -> {'size', 'mtime_ns', 'sha1', 'commune_data'}
+        self.workbook_signature = None
+
+    def load(self) -> bool:
+        """
+        Load the manifest from disk.
+
+        Returns:
+            True if a valid manifest was loaded, False otherwise
+        """
+        self.entries = {}
+        self.workbook_signature = None
+
+        if not os.path.exists(self.manifest_path):
+            self.logger.info("No Suivi Global manifest found - full scan required")
+            return False
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get('version') != self.VERSION:
+                self.logger.info("Suivi Global manifest version changed - full scan required")
+                return False
+
+            self.entries = data.get('entries', {})
+            self.workbook_signature = data.get('workbook_signature')
+            self.logger.info(f"Loaded Suivi Global manifest with {len(self.entries)} communes")
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"Could not read Suivi Global manifest: {e}")
+            return False
+
+    def save(self) -> bool:
+        """
+        Save the manifest to disk atomically.
+
+        Returns:
+            True if saved, False otherwise
+        """
+        data = {
+            'version': self.VERSION,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'workbook_signature': self.workbook_signature,
+            'entries': self.entries
+        }
+        tmp_path = self.manifest_path + ".tmp"
+        try:
+            with self._lock:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, default=str)
+                os.replace(tmp_path, self.manifest_path)
+            self.logger.info(f"Suivi Global manifest saved: {len(self.entries)} communes")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not save Suivi Global manifest: {e}")
+            return False
+
+    @staticmethod
+    def get_file_signature(file_path: str) -> Dict[str, Any]:
+        """
+        Get the cheap (stat based) signature of a file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Dictionary with size and mtime_ns
+        """
+        stat = os.stat(file_path)
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    @staticmethod
+    def compute_file_hash(file_path: str) -> str:
+        """
+        Compute the SHA-1 of a file's content.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.sha1()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get_unchanged_data(self, file_path: str, signature: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored commune data if the file did not change since the last run.
+
+        Files whose size/mtime differ are hashed; a matching hash (e.g. a file
+        only touched by the Teams sync) still counts as unchanged.
+
+        Args:
+            file_path: Path to the commune suivi file
+            signature: Current signature from get_file_signature
+
+        Returns:
+            Stored commune data, or None if the file is new or changed
+        """
+        entry = self.entries.get(file_path)
+        if not entry or 'commune_data' not in entry:
+            return None
+
+        if entry.get('size') == signature['size'] and entry.get('mtime_ns') == signature['mtime_ns']:
+            return dict(entry['commune_data'])
+
+        if entry.get('size') != signature['size'] or not entry.get('sha1'):
+            return None
+
+        try:
+            if self.compute_file_hash(file_path) == entry['sha1']:
+                entry['mtime_ns'] = signature['mtime_ns']
+                return dict(entry['commune_data'])
+        except OSError as e:
+            self.logger.debug(f"Could not hash {file_path}: {e}")
+
+        return None
+
+    def record(self, file_path: str, commune_data: Dict[str, Any]) -> None:
+        """
+        Record the current state of a commune file and its extracted data.
+
+        Args:
+            file_path: Path to the commune suivi file
+            commune_data: Commune data extracted from the file
+        """
+        try:
+            signature = self.get_file_signature(file_path)
+            previous = self.entries.get(file_path, {})
+            if previous.get('size') == signature['size'] and previous.get('mtime_ns') == signature['mtime_ns']:
+                sha1 = previous.get('sha1')
+            else:
+                sha1 = self.compute_file_hash(file_path)
+        except OSError as e:
+            self.logger.debug(f"Could not record {file_path} in manifest: {e}")
+            return
+
+        stored_data = {key: value for key, value in commune_data.items() if key != 'changed'}
+        self.entries[file_path] = {
+            'size': signature['size'],
+            'mtime_ns': signature['mtime_ns'],
+            'sha1': sha1,
+            'commune_data': stored_data
+        }
+
+    def forget(self, file_path: str) -> None:
+        """
+        Remove a commune file from the manifest, so that it counts as new on the next run.
+
+        Args:
+            file_path: Path to the commune suivi file
+        """
+        self.entries.pop(file_path, None)
+
+    def is_in_sync_with(self, workbook_path: str) -> bool:
+        """
+        Check whether the global workbook is the one this manifest was written with.
+
+        Args:
+            workbook_path: Path to the global workbook
+
+        Returns:
+            True if the workbook exists and matches the recorded signature
+        """
+        if not self.workbook_signature or not os.path.exists(workbook_path):
+            return False
+        try:
+            signature = self.get_file_signature(workbook_path)
+        except OSError:
+            return False
+        return (signature['size'] == self.workbook_signature.get('size')
+                and signature['mtime_ns'] == self.workbook_signature.get('mtime_ns'))
+
+    def mark_workbook_written(self, workbook_path: str) -> None:
+        """
+        Record the signature of the global workbook after a successful write.
+
+        Args:
+            workbook_path: Path to the global workbook
+        """
+        try:
+            self.workbook_signature = self.get_file_signature(workbook_path)
+        except OSError:
+            self.workbook_signature = None
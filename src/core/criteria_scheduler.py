@@ -0,0 +1,101 @@
+"""
+Criteria scheduling module.
+Runs independent quality control criteria concurrently over shared
+in-memory data and records how long each one took.
+"""
+
+import os
+import time
+import logging
+from typing import Optional, Dict, Any, Callable, Tuple
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from config.constants import ParallelConfig
+from utils.performance import performance_monitor
+
+logger = logging.getLogger(__name__)
+
+
+class CriteriaScheduler:
+    """
+    Runs a set of criteria in a thread pool.
+
+    Criteria read the same DataFrames (no copy to worker processes) and are
+    expected to catch their own errors; an exception escaping a criterion is
+    turned into an ERROR result so the other criteria still complete.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Worker thread count (defaults to ParallelConfig.QC_CRITERIA_WORKERS,
+                then one thread per criterion)
+        """
+        self.max_workers = max_workers or ParallelConfig.QC_CRITERIA_WORKERS
+
+    def get_worker_count(self, criteria_count: int) -> int:
+        """
+        Get the number of worker threads for a run.
+
+        Args:
+            criteria_count: Number of criteria to run
+
+        Returns:
+            Worker count (1 means serial execution)
+        """
+        workers = self.max_workers or min(criteria_count, ParallelConfig.MAX_DEFAULT_WORKERS, (os.cpu_count() or 2))
+        return max(1, min(workers, criteria_count))
+
+    def run(self, criteria: Dict[str, Callable[[], Dict[str, Any]]]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Run the criteria and gather their results.
+
+        Args:
+            criteria: Criterion functions keyed by result name (e.g. 'critere_0')
+
+        Returns:
+            Tuple (results keyed like criteria and in the same order,
+            durations in seconds keyed by criterion)
+        """
+        timings = {}
+        results = {}
+        workers = self.get_worker_count(len(criteria))
+        start = time.perf_counter()
+
+        def run_criterion(name, func):
+            criterion_start = time.perf_counter()
+            failed = False
+            try:
+                result = func()
+            except Exception as e:
+                logger.error(f"Criterion {name} failed: {e}")
+                result = {'status': 'ERROR', 'error': str(e)}
+                failed = True
+            timings[name] = time.perf_counter() - criterion_start
+            performance_monitor.record(f"qc.{name}", timings[name], failed=failed)
+            return result
+
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='qc-criteria') as executor:
+                futures = {name: executor.submit(run_criterion, name, func) for name, func in criteria.items()}
+                for name, future in futures.items():
+                    results[name] = future.result()
+        else:
+            for name, func in criteria.items():
+                results[name] = run_criterion(name, func)
+
+        total = time.perf_counter() - start
+        details = ', '.join(f"{name}: {duration:.2f}s" for name, duration in timings.items())
+        logger.info(f"{len(criteria)} criteria run in {total:.2f}s with {workers} worker(s) ({details})")
+
+        return results, {name: timings[name] for name in criteria}
@@ -0,0 +1,387 @@
+"""
+Data viewer index module.
+Prepares the global tickets sheet once for the Data Viewer: display strings
+of the table columns, trigram indexes of the searched text columns,
+category codes of the drop-down filters and the parsed delivery dates, so
+that a filter change combines row masks instead of scanning the sheet.
+"""
+
+import logging
+from datetime import date
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Callable, Sequence, Tuple
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from utils.performance import timed_operation
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from utils.performance import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+# Length of the substrings indexed for the text searches
+NGRAM_SIZE = 3
+
+# Table columns searched by substring (commune, ID tâche, code INSEE)
+SEARCH_COLUMNS = ('A', 'B', 'C')
+
+# Table columns filtered by exact value (domaine, état, collaborateur)
+CATEGORY_COLUMNS = ('D', 'P', 'U')
+
+# Table column filtered by date range (date de livraison)
+DATE_COLUMN = 'O'
+
+
+def display_sort_key(value: str) -> Tuple[int, Any]:
+    """
+    Get the sort key of a display value: empty values first, then numbers,
+    dates (YYYY-MM-DD or DD/MM/YYYY) and text (case-insensitive).
+
+    Args:
+        value: Display text of a cell
+
+    Returns:
+        Tuple (group, comparable value)
+    """
+    value_str = str(value).strip() if value else ''
+    if not value_str:
+        return (0, '')
+
+    # Numbers (decimal comma accepted)
+    try:
+        return (1, float(value_str.replace(',', '.')))
+    except ValueError:
+        pass
+
+    pd = get_pandas()
+    if '-' in value_str and len(value_str.split('-')) == 3:
+        if len(value_str.split('-')[0]) == 4:
+            date_obj = pd.to_datetime(value_str, format='%Y-%m-%d', errors='coerce')
+            if pd.notna(date_obj):
+                return (2, date_obj.timestamp())
+    elif '/' in value_str and len(value_str.split('/')) == 3:
+        date_obj = pd.to_datetime(value_str, format='%d/%m/%Y', errors='coerce')
+        if pd.notna(date_obj):
+            return (2, date_obj.timestamp())
+
+    return (3, value_str.lower())
+
+
+class SubstringIndex:
+    """
+    Case-insensitive substring search over a text column.
+
+    The distinct lower-cased values are indexed by trigram: a query keeps
+    the values holding all of its trigrams, checks them with a plain
+    substring test and maps them back to the rows.
+    """
+
+    def __init__(self, values: 'pd.Series'):
+        """
+        Build the index.
+
+        Args:
+            values: Column values (searched as their str() text, like astype(str))
+        """
+        np = _get_numpy()
+        pd = get_pandas()
+
+        codes, uniques = pd.factorize(values.astype(str).str.lower())
+        self.codes = codes
+        self.texts = [str(text) for text in uniques]
+
+        postings = {}
+        for position, text in enumerate(self.texts):
+            for ngram in {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}:
+                postings.setdefault(ngram, []).append(position)
+        self.postings = {ngram: np.array(ids, dtype=np.int64) for ngram, ids in postings.items()}
+
+        self._last = (None, None)  # (query, matching value ids), replaced as a whole for concurrent filters
+
+    def match(self, text: str) -> 'np.ndarray':
+        """
+        Get the rows containing a text.
+
+        Args:
+            text: Searched text (any case, matched literally)
+
+        Returns:
+            Boolean row mask
+        """
+        np = _get_numpy()
+        query = text.lower()
+
+        # A refined query only needs to check the values matching the previous one
+        last_query, last_matches = self._last
+        if last_query is not None and last_query in query:
+            candidates = last_matches
+        elif len(query) >= NGRAM_SIZE:
+            candidates = self._get_ngram_candidates(query)
+        else:
+            candidates = np.arange(len(self.texts))
+
+        matches = np.array([position for position in candidates.tolist() if query in self.texts[position]],
+                           dtype=np.int64)
+        self._last = (query, matches)
+
+        selected = np.zeros(len(self.texts) + 1, dtype=bool)
+        selected[matches] = True
+        return selected[self.codes]
+
+    def _get_ngram_candidates(self, query: str) -> 'np.ndarray':
+        """Get the values holding every trigram of a query."""
+        np = _get_numpy()
+
+        lists = []
+        for ngram in {query[i:i + NGRAM_SIZE] for i in range(len(query) - NGRAM_SIZE + 1)}:
+            ids = self.postings.get(ngram)
+            if ids is None:
+                return np.array([], dtype=np.int64)
+            lists.append(ids)
+
+        lists.sort(key=len)
+        candidates = lists[0]
+        for ids in lists[1:]:
+            candidates = np.intersect1d(candidates, ids, assume_unique=True)
+            if not len(candidates):
+                break
+        return candidates
+
+
+class CategoryIndex:
+    """Exact-value filter over a column through its category codes."""
+
+    def __init__(self, values: 'pd.Series'):
+        """
+        Build the index.
+
+        Args:
+            values: Column values (empty cells never match)
+        """
+        pd = get_pandas()
+
+        self.codes, self.categories = pd.factorize(values)
+        self.categories = list(self.categories)
+
+    def match(self, value: Any) -> 'np.ndarray':
+        """
+        Get the rows equal to a value.
+
+        Args:
+            value: Filter value
+
+        Returns:
+            Boolean row mask
+        """
+        np = _get_numpy()
+
+        selected = np.zeros(len(self.categories) + 1, dtype=bool)
+        for position, category in enumerate(self.categories):
+            if category == value:
+                selected[position] = True
+        return selected[self.codes]
+
+
+class DataViewerIndex:
+    """
+    Filter and display data of the global tickets sheet.
+
+    Columns are addressed by their table key (A = commune, B = ID tâche, ...);
+    rows by their position in the sheet.
+    """
+
+    @timed_operation('data_viewer.prepare', threshold=2.0)
+    def __init__(self, data: 'pd.DataFrame', column_mapping: Dict[str, str],
+                 display_columns: Sequence[str], formatter: Callable[[str, Any], str]):
+        """
+        Prepare the sheet.
+
+        Args:
+            data: Global tickets sheet
+            column_mapping: Data column of each table key (empty if the sheet lacks columns)
+            display_columns: Table keys in display order
+            formatter: Callable(table key, value) giving the display text of a cell
+        """
+        np = _get_numpy()
+        pd = get_pandas()
+
+        self.row_count = len(data)
+        self.display_columns = list(display_columns)
+
+        # Display strings, each distinct value formatted once
+        self.display = {}
+        for key in self.display_columns:
+            column = column_mapping.get(key)
+            if column and column in data.columns:
+                self.display[key] = _format_column(data[column], key, formatter)
+            else:
+                self.display[key] = np.full(self.row_count, "", dtype=object)
+
+        self.search = {key: SubstringIndex(data[column_mapping[key]])
+                       for key in SEARCH_COLUMNS if column_mapping.get(key)}
+        self.categories = {key: CategoryIndex(data[column_mapping[key]])
+                           for key in CATEGORY_COLUMNS if column_mapping.get(key)}
+
+        self._sort_ranks = {}  # table key -> sort rank of each row, computed on first sort
+
+        self.dates = None
+        if column_mapping.get(DATE_COLUMN):
+            try:
+                parsed = pd.to_datetime(data[column_mapping[DATE_COLUMN]], errors='coerce')
+                self.dates = parsed.to_numpy(dtype='datetime64[ns]')
+            except Exception as e:
+                logger.warning(f"Could not parse the delivery dates for filtering: {e}")
+
+    def filter(self, texts: Optional[Dict[str, str]] = None, values: Optional[Dict[str, Any]] = None,
+               date_from: Optional[date] = None, date_to: Optional[date] = None,
+               cancellation_token: Optional['CancellationToken'] = None) -> 'np.ndarray':
+        """
+        Get the rows matching the filters.
+
+        Args:
+            texts: Substring searched in each SEARCH_COLUMNS key (empty texts ignored)
+            values: Exact value of each CATEGORY_COLUMNS key (empty values ignored)
+            date_from: First delivery date (included)
+            date_to: Last delivery date (included)
+            cancellation_token: Token checked between the filters (stops a superseded query)
+
+        Returns:
+            Row positions in sheet order
+
+        Raises:
+            TaskCancelledError: If the token was cancelled
+        """
+        np = _get_numpy()
+        pd = get_pandas()
+
+        mask = np.ones(self.row_count, dtype=bool)
+
+        for key, text in (texts or {}).items():
+            if text and key in self.search:
+                if cancellation_token:
+                    cancellation_token.raise_if_cancelled()
+                mask &= self.search[key].match(text)
+
+        for key, value in (values or {}).items():
+            if value and key in self.categories:
+                mask &= self.categories[key].match(value)
+
+        if self.dates is not None:
+            if date_from:
+                mask &= self.dates >= pd.to_datetime(date_from).to_datetime64()
+            if date_to:
+                mask &= self.dates <= pd.to_datetime(date_to).to_datetime64()
+
+        if cancellation_token:
+            cancellation_token.raise_if_cancelled()
+        return np.flatnonzero(mask)
+
+    def get_sort_ranks(self, key: str) -> 'np.ndarray':
+        """
+        Get the rank of each row in the display_sort_key order of a column.
+
+        Rows with equal keys share a rank. Each distinct display value is
+        keyed once; the ranks are kept for the next sorts.
+
+        Args:
+            key: Table key of the column
+
+        Returns:
+            Integer rank of each row
+        """
+        ranks = self._sort_ranks.get(key)
+        if ranks is None:
+            np = _get_numpy()
+            pd = get_pandas()
+
+            codes, uniques = pd.factorize(self.display[key])
+            sort_keys = [display_sort_key(value) for value in uniques]
+            order = sorted(range(len(uniques)), key=sort_keys.__getitem__)
+
+            unique_ranks = np.empty(len(uniques), dtype=np.int64)
+            rank = -1
+            previous = None
+            for position in order:
+                if rank < 0 or sort_keys[position] != previous:
+                    rank += 1
+                    previous = sort_keys[position]
+                unique_ranks[position] = rank
+
+            ranks = unique_ranks[codes]
+            self._sort_ranks[key] = ranks
+        return ranks
+
+    def sort_rows(self, positions: 'np.ndarray', sort_keys: Sequence[Tuple[str, bool]]) -> 'np.ndarray':
+        """
+        Sort rows on one or more columns (stable: rows equal on every column keep their order).
+
+        Successive stable sorts of a table, last one first, give the same
+        order as a single sort on these columns.
+
+        Args:
+            positions: Row positions
+            sort_keys: (table key, descending) of each column, primary column first
+
+        Returns:
+            Sorted row positions
+        """
+        np = _get_numpy()
+
+        if not sort_keys:
+            return positions
+
+        keys = []
+        for key, reverse in sort_keys:
+            ranks = self.get_sort_ranks(key)[positions]
+            keys.append(-ranks if reverse else ranks)
+
+        # lexsort sorts on its last key first
+        order = np.lexsort(keys[::-1])
+        return positions[order]
+
+    def rows(self, positions: 'np.ndarray') -> List[tuple]:
+        """
+        Get the display values of rows.
+
+        Args:
+            positions: Row positions
+
+        Returns:
+            Value tuples in display column order
+        """
+        return list(zip(*(self.display[key][positions] for key in self.display_columns)))
+
+
+def _format_column(values: 'pd.Series', key: str, formatter: Callable[[str, Any], str]) -> 'np.ndarray':
+    """Format a column, calling the formatter once per distinct value."""
+    np = _get_numpy()
+
+    formatted = {}
+    result = np.empty(len(values), dtype=object)
+    for position, value in enumerate(values.tolist()):
+        # Keyed by type too: 1 and 1.0 are equal but display differently
+        cache_key = (type(value), value)
+        try:
+            result[position] = formatted[cache_key]
+        except KeyError:
+            text = formatter(key, value)
+            formatted[cache_key] = text
+            result[position] = text
+        except TypeError:
+            # Unhashable cell value
+            result[position] = formatter(key, value)
+    return result
+
+
+def _get_numpy():
+    """Get numpy (imported with pandas)."""
+    import numpy
+    return numpy
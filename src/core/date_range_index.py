@@ -0,0 +1,85 @@
+"""
+Date range index module.
+Keeps the rows of a date column sorted by day so that a date range filter
+is two binary searches instead of a scan of the whole sheet.
+"""
+
+import logging
+from datetime import date
+from typing import Dict, List
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+
+logger = logging.getLogger(__name__)
+
+# Date columns filtered by the dashboard injection extracts (Excel column A = 0)
+DASHBOARD_DATE_COLUMNS: Dict[str, List[int]] = {
+    'Suivi Tickets': [14, 17],      # O (Date Livraison), R (Date Dépose Ticket 501/511)
+    'Traitement CMS Adr': [7],      # H (date de livraison)
+    'Traitement PA': [6],           # G (Date traitement)
+    'Traitement RIP': [8]           # I (Date de livraison)
+}
+
+
+class DateRangeIndex:
+    """
+    Row positions of a date column sorted by day.
+
+    Rows without a readable date are left out, so they never match a range.
+    """
+
+    def __init__(self, dates: 'pd.Series'):
+        """
+        Build the index.
+
+        Args:
+            dates: datetime64 Series (NaT for empty/invalid cells)
+        """
+        np = _get_numpy()
+
+        days = dates.dt.normalize().to_numpy(dtype='datetime64[ns]')
+        valid = ~np.isnat(days)
+        positions = np.flatnonzero(valid)
+        order = np.argsort(days[valid], kind='stable')
+
+        self.days = days[valid][order]
+        self.positions = positions[order]
+        self.size = len(days)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def slice(self, date_from: date, date_to: date) -> 'np.ndarray':
+        """
+        Get the rows whose day is within a range (bounds included).
+
+        Args:
+            date_from: First day of the range
+            date_to: Last day of the range
+
+        Returns:
+            Row positions in sheet order
+        """
+        np = _get_numpy()
+        pd = get_pandas()
+
+        start = np.datetime64(pd.Timestamp(date_from).normalize().to_datetime64(), 'ns')
+        end = np.datetime64(pd.Timestamp(date_to).normalize().to_datetime64(), 'ns')
+        left = self.days.searchsorted(start, side='left')
+        right = self.days.searchsorted(end, side='right')
+
+        # Sheet order keeps first-seen ordering of the counted motifs
+        return np.sort(self.positions[left:right])
+
+
+def _get_numpy():
+    """Get numpy (imported with pandas)."""
+    import numpy
+    return numpy
@@ -16,6 +16,8 @@ if str(src_path) not in sys.path:
 
 from utils.lazy_imports import get_pandas
 from config.constants import VALIDATION_LISTS
+from core.workbook_writer import HEADER_FILL_COLOR, HEADER_FONT_COLOR, estimate_column_width
+from utils.performance import timed_operation
 
 
 class ExcelGenerator:
@@ -25,6 +27,7 @@ class ExcelGenerator:
         """Initialize the Excel generator."""
         self.logger = logging.getLogger(__name__)
     
+    @timed_operation('suivi_generator.write_excel', threshold=5.0)
     def generate_excel_file(self,
                           moai_data: Dict[str, Any],
                           plan_df: 'pd.DataFrame',
@@ -78,13 +81,13 @@ class ExcelGenerator:
                     df_rip.to_excel(writer, sheet_name=sheet_names['rip'], index=False)
 
                 # Apply styling to all sheets
-                self._apply_sheet_styling(writer, sheet_names['cm'])
-                self._apply_sheet_styling(writer, sheet_names['plan'])
-                self._apply_sheet_styling(writer, sheet_names['commune'])
+                self._apply_sheet_styling(writer, sheet_names['cm'], df_cm)
+                self._apply_sheet_styling(writer, sheet_names['plan'], df_plan)
+                self._apply_sheet_styling(writer, sheet_names['commune'], df_commune)
 
                 # Apply styling to RIP sheet if applicable
                 if is_rip_commune and 'rip' in sheet_names:
-                    self._apply_sheet_styling(writer, sheet_names['rip'])
+                    self._apply_sheet_styling(writer, sheet_names['rip'], df_rip)
 
                 # Apply special styling to Plan Adressage sheet (page 2)
                 self._apply_plan_adressage_special_styling(writer, sheet_names['plan'], df_plan)
@@ -274,16 +277,21 @@ class ExcelGenerator:
 
         return df_rip
 
-    def _apply_sheet_styling(self, writer, sheet_name: str):
+    def _apply_sheet_styling(self, writer, sheet_name: str, df: 'pd.DataFrame'):
         """
         Apply default styling to a sheet: center alignment, freeze first row, blue header.
 
+        Date columns and column widths are computed up front (widths from the
+        DataFrame values), so each cell is visited once.
+
         Args:
             writer: Excel writer object
             sheet_name: Name of the sheet to style
+            df: DataFrame written to the sheet
         """
         try:
             from openpyxl.styles import Alignment, PatternFill, Font
+            from openpyxl.utils import column_index_from_string
 
             worksheet = writer.sheets[sheet_name]
 
@@ -292,13 +300,8 @@ class ExcelGenerator:
 
             # Define styles
             center_alignment = Alignment(horizontal='center', vertical='center', wrap_text=False)
-            header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')  # Blue froid
-            header_font = Font(color='FFFFFF', bold=True)  # White text, bold
-
-            # Apply center alignment to all cells
-            for row in worksheet.iter_rows():
-                for cell in row:
-                    cell.alignment = center_alignment
+            header_fill = PatternFill(start_color=HEADER_FILL_COLOR, end_color=HEADER_FILL_COLOR, fill_type='solid')  # Blue froid
+            header_font = Font(color=HEADER_FONT_COLOR, bold=True)  # White text, bold
 
             # Apply header styling to first row
             for cell in worksheet[1]:
@@ -306,21 +309,22 @@ class ExcelGenerator:
                 cell.font = header_font
                 cell.alignment = center_alignment
 
-            # Apply date formatting to date columns
-            self._apply_date_formatting(worksheet, sheet_name)
-
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 30)  # Max width of 30
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+            # Center all data cells, with date format (YYYY-MM-DD) on filled date cells
+            date_columns = self._get_date_columns(worksheet, sheet_name)
+            date_positions = {column_index_from_string(col_letter) - 1 for col_letter in date_columns}
+            for row in worksheet.iter_rows(min_row=2):
+                for position, cell in enumerate(row):
+                    cell.alignment = center_alignment
+                    if position in date_positions and cell.value is not None and str(cell.value).strip() != '':
+                        cell.number_format = 'YYYY-MM-DD'
+
+            if date_columns:
+                self.logger.info(f"Date formatting applied to columns {date_columns} in sheet: {sheet_name}")
+
+            # Auto-adjust column widths (max width of 30)
+            for position, column in enumerate(df.columns, start=1):
+                worksheet.column_dimensions[self._get_column_letter(position)].width = \
+                    estimate_column_width(df[column], column, max_width=30)
 
             self.logger.info(f"Styling applied to sheet: {sheet_name}")
 
@@ -429,8 +433,8 @@ class ExcelGenerator:
         except Exception as e:
             self.logger.error(f"Error highlighting oui/non values in column {col_num}: {e}")
 
-    def _apply_date_formatting(self, worksheet, sheet_name: str):
-        """Apply date formatting to date columns (format as date only, no time)."""
+    def _get_date_columns(self, worksheet, sheet_name: str):
+        """Get the letters of the date columns of a sheet (formatted as date only, no time)."""
         try:
             # Define specific date columns for each sheet type (by position)
             date_columns = {
@@ -451,20 +455,11 @@ class ExcelGenerator:
             if not sheet_date_columns:
                 sheet_date_columns = self._detect_date_columns_by_header(worksheet)
 
-            # Apply date formatting to identified columns
-            if sheet_date_columns:
-                for col_letter in sheet_date_columns:
-                    # Apply to all rows in the column (starting from row 2 to skip header)
-                    for row in range(2, worksheet.max_row + 1):
-                        cell = worksheet[f'{col_letter}{row}']
-                        if cell.value is not None and str(cell.value).strip() != '':
-                            # Set date format (YYYY-MM-DD)
-                            cell.number_format = 'YYYY-MM-DD'
-
-                self.logger.info(f"Date formatting applied to columns {sheet_date_columns} in sheet: {sheet_name}")
+            return sheet_date_columns
 
         except Exception as e:
-            self.logger.error(f"Error applying date formatting to sheet {sheet_name}: {e}")
+            self.logger.error(f"Error detecting date columns of sheet {sheet_name}: {e}")
+            return []
 
     def _detect_date_columns_by_header(self, worksheet):
         """Detect date columns by analyzing header names, excluding duration columns."""
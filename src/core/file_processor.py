@@ -15,9 +15,9 @@ src_path = Path(__file__).parent.parent
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
-from utils.lazy_imports import get_pandas
 from config.constants import FileConfig
 from utils.performance import timed_operation, optimize_dataframe_memory
+from core.sheet_cache import get_sheet_cache
 
 
 class FileProcessor:
@@ -28,8 +28,9 @@ class FileProcessor:
         self.logger = logging.getLogger(__name__)
         self._file_cache = {}  # Cache for file metadata
         self._data_cache = {}  # Cache for processed data
+        self._sheet_cache = get_sheet_cache()  # Persistent cache shared across sessions
     
-    @timed_operation('file_read')
+    @timed_operation('suivi_generator.read_moai', threshold=2.0)
     def read_moai_file(self, file_path: str) -> 'pd.DataFrame':
         """
         Read and process MOAI Excel file with caching.
@@ -54,9 +55,8 @@ class FileProcessor:
         self._validate_file_access(file_path)
 
         try:
-            pd = get_pandas()
-            # Optimize reading - only read necessary columns if file is large
-            df = pd.read_excel(file_path, engine='openpyxl', date_format=None)
+            # Read through the persistent sheet cache (warm starts skip openpyxl parsing)
+            df = self._sheet_cache.read_excel(file_path, engine='openpyxl', date_format=None)
 
             # Optimize memory usage
             df = optimize_dataframe_memory(df)
@@ -70,6 +70,7 @@ class FileProcessor:
             self.logger.error(f"Error reading MOAI file: {e}")
             raise
     
+    @timed_operation('suivi_generator.read_qgis', threshold=2.0)
     def read_qgis_file(self, file_path: str) -> Tuple['pd.DataFrame', bool]:
         """
         Read and process QGis Excel file with column U detection.
@@ -88,18 +89,20 @@ class FileProcessor:
         self._validate_file_access(file_path)
         
         try:
-            pd = get_pandas()
-            
+            source_stat = self._sheet_cache.get_source_stat(file_path)
+
             # Try to read with column U first
             try:
-                df = pd.read_excel(file_path, usecols=FileConfig.QGIS_COLUMNS_WITH_U, date_format=None)
-                has_column_u = True
-                self.logger.info("QGis file loaded with column U")
+                df = self._sheet_cache.read_excel(file_path, usecols=FileConfig.QGIS_COLUMNS_WITH_U, date_format=None)
             except Exception:
-                # Fallback to reading without column U
-                df = pd.read_excel(file_path, usecols=FileConfig.QGIS_COLUMNS, date_format=None)
-                has_column_u = False
-                self.logger.info("QGis file loaded without column U")
+                # Fallback to reading without column U, also cached under the column U read
+                # so that warm reads don't repeat the failing parse
+                df = self._sheet_cache.read_excel(file_path, usecols=FileConfig.QGIS_COLUMNS, date_format=None)
+                self._sheet_cache.store(file_path, 0, df, source_stat=source_stat,
+                                        usecols=FileConfig.QGIS_COLUMNS_WITH_U, date_format=None)
+
+            has_column_u = len(df.columns) == len(FileConfig.QGIS_COLUMNS_WITH_U.split(','))
+            self.logger.info(f"QGis file loaded {'with' if has_column_u else 'without'} column U")
             
             self.logger.info(f"QGis file loaded successfully: {os.path.basename(file_path)}")
             return df, has_column_u
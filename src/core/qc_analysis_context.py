@@ -0,0 +1,235 @@
+"""
+Quality control analysis context module.
+Holds the QGis results sheet and every page of a commune suivi workbook,
+parsed once, with the stripped/upper-cased text columns the quality
+control criteria and the report builder compare.
+"""
+
+import os
+import logging
+import threading
+from typing import Optional, Dict, Any, Union
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from core.workbook_reader import WorkbookReader
+from core.qgis_address_index import QgisAddressIndex
+
+logger = logging.getLogger(__name__)
+
+# Pages of the commune suivi workbook used by the quality control
+# (Page 1 = voies, Page 2 = adresses/IMB, Page 3 = informations et tickets)
+SUIVI_PAGES = [0, 1, 2]
+
+# Source name of the QGis results sheet in the column accessors
+QGIS_SOURCE = 'qgis'
+
+
+class QcAnalysisContext:
+    """
+    Data shared by the quality control criteria of one commune.
+
+    The suivi pages are parsed once when the workbook is loaded; normalized
+    columns are computed on first use and kept for the other criteria and
+    the report.
+    """
+
+    def __init__(self, qgis_data: 'pd.DataFrame', suivi_pages: Dict[int, 'pd.DataFrame'],
+                 suivi_file_path: Optional[str] = None):
+        """
+        Initialize the context.
+
+        Args:
+            qgis_data: QGis results sheet
+            suivi_pages: Suivi workbook pages keyed by sheet index (missing pages left out)
+            suivi_file_path: Path of the suivi workbook
+        """
+        self.qgis_data = qgis_data
+        self.suivi_pages = suivi_pages
+        self.suivi_file_path = suivi_file_path
+        self.suivi_mtime = _get_mtime(suivi_file_path)
+        self._columns: Dict[Any, 'pd.Series'] = {}
+        self._address_index: Optional[QgisAddressIndex] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def read_suivi_pages(suivi_file_path: str, use_cache: bool = True) -> Dict[int, 'pd.DataFrame']:
+        """
+        Read the pages of a suivi workbook in one pass.
+
+        Args:
+            suivi_file_path: Path of the suivi workbook
+            use_cache: Whether to go through the persistent sheet cache
+
+        Returns:
+            Pages keyed by sheet index (missing pages left out)
+        """
+        return WorkbookReader(suivi_file_path, use_cache=use_cache).read_sheets(SUIVI_PAGES, date_format=None)
+
+    @classmethod
+    def from_files(cls, qgis_file_path: str, suivi_file_path: str, use_cache: bool = True,
+                   suivi_pages: Optional[Dict[int, 'pd.DataFrame']] = None) -> 'QcAnalysisContext':
+        """
+        Load a context from the QGis results file and the suivi workbook.
+
+        Args:
+            qgis_file_path: Path of the QGis results file (first sheet)
+            suivi_file_path: Path of the suivi workbook
+            use_cache: Whether to go through the persistent sheet cache (disable in worker processes)
+            suivi_pages: Suivi pages already read with read_suivi_pages (read from the file if None)
+
+        Returns:
+            Analysis context
+
+        Raises:
+            ValueError: If the QGis sheet or the suivi page 3 cannot be read
+        """
+        qgis_sheets = WorkbookReader(qgis_file_path, use_cache=use_cache).read_sheets([0], date_format=None)
+        if 0 not in qgis_sheets:
+            raise ValueError(f"Impossible de lire le fichier QGis: {os.path.basename(qgis_file_path)}")
+
+        if suivi_pages is None:
+            suivi_pages = cls.read_suivi_pages(suivi_file_path, use_cache=use_cache)
+        if 2 not in suivi_pages:
+            raise ValueError(f"Page 3 introuvable dans le fichier suivi: {os.path.basename(suivi_file_path)}")
+
+        return cls(qgis_sheets[0], suivi_pages, suivi_file_path)
+
+    def is_current(self, qgis_data: 'pd.DataFrame', suivi_file_path: Optional[str]) -> bool:
+        """
+        Check whether the context still matches the loaded files.
+
+        Args:
+            qgis_data: Currently loaded QGis sheet
+            suivi_file_path: Currently loaded suivi workbook path
+
+        Returns:
+            True if the same QGis sheet and an unmodified suivi workbook are loaded
+        """
+        return (self.qgis_data is qgis_data
+                and self.suivi_file_path == suivi_file_path
+                and self.suivi_mtime == _get_mtime(suivi_file_path))
+
+    @property
+    def suivi_data(self) -> Optional['pd.DataFrame']:
+        """Page 3 of the suivi workbook."""
+        return self.suivi_pages.get(2)
+
+    def page(self, index: int) -> Optional['pd.DataFrame']:
+        """
+        Get a page of the suivi workbook.
+
+        Args:
+            index: Sheet index (0 = Page 1)
+
+        Returns:
+            Page DataFrame, or None if the workbook has no such page
+        """
+        return self.suivi_pages.get(index)
+
+    def has_column(self, source: Union[str, int], position: int) -> bool:
+        """
+        Check whether a sheet has a column.
+
+        Args:
+            source: QGIS_SOURCE or suivi page index
+            position: Column position (Excel column A = 0)
+
+        Returns:
+            True if the sheet is loaded and has the column
+        """
+        df = self._get_source(source)
+        return df is not None and len(df.columns) > position
+
+    def text_column(self, source: Union[str, int], position: int, upper: bool = False) -> 'pd.Series':
+        """
+        Get a column as stripped text ('' for empty cells).
+
+        Values go through str() like the cell-by-cell comparisons they replace,
+        so numbers keep their pandas text form (e.g. '12.0').
+
+        Args:
+            source: QGIS_SOURCE or suivi page index
+            position: Column position (Excel column A = 0)
+            upper: Whether the text is upper-cased (motifs)
+
+        Returns:
+            Text Series aligned with the sheet rows
+
+        Raises:
+            KeyError: If the sheet or the column is not loaded
+        """
+        key = (source, position, upper)
+        column = self._columns.get(key)
+        if column is None:
+            if not self.has_column(source, position):
+                raise KeyError(f"Colonne {position} absente de la source {source}")
+
+            pd = get_pandas()
+            values = self._get_source(source).iloc[:, position]
+            column = pd.Series('', index=values.index, dtype=object)
+            filled = values.notna()
+            if filled.any():
+                text = values[filled].map(str).str.strip()
+                column[filled] = text.str.upper() if upper else text
+
+            self._columns[key] = column
+        return column
+
+    def qgis_imb_codes(self) -> 'pd.Series':
+        """IMB codes of the QGis sheet (column A), stripped."""
+        return self.text_column(QGIS_SOURCE, 0)
+
+    def qgis_motifs(self) -> 'pd.Series':
+        """Motifs of the QGis sheet (column J), stripped and upper-cased."""
+        return self.text_column(QGIS_SOURCE, 9, upper=True)
+
+    def suivi_imb_codes(self) -> 'pd.Series':
+        """IMB codes of the suivi Page 2 (column C), stripped."""
+        return self.text_column(1, 2)
+
+    def suivi_motifs(self) -> 'pd.Series':
+        """Motifs of the suivi Page 2 (column I), stripped and upper-cased."""
+        return self.text_column(1, 8, upper=True)
+
+    def voie_motifs(self) -> 'pd.Series':
+        """Motifs voie of the suivi Page 1 (column E), stripped."""
+        return self.text_column(0, 4)
+
+    def address_index(self) -> QgisAddressIndex:
+        """
+        Get the address index of the QGis sheet (built once, shared by critères 3, 4 and 5).
+
+        Returns:
+            QGis address index
+
+        Raises:
+            ValueError: If the QGis sheet has less than 21 columns (A-U)
+        """
+        # Criteria run concurrently: build the index only once
+        with self._lock:
+            if self._address_index is None:
+                if not self.has_column(QGIS_SOURCE, 20):
+                    raise ValueError("Le fichier QGis ne contient pas assez de colonnes (minimum A-U requis)")
+                self._address_index = QgisAddressIndex(self.qgis_data)
+        return self._address_index
+
+    def _get_source(self, source: Union[str, int]) -> Optional['pd.DataFrame']:
+        """Get the DataFrame of a column source."""
+        if source == QGIS_SOURCE:
+            return self.qgis_data
+        return self.suivi_pages.get(source)
+
+
+def _get_mtime(file_path: Optional[str]) -> Optional[float]:
+    """Get the modification time of a file (None if unavailable)."""
+    try:
+        return os.path.getmtime(file_path) if file_path else None
+    except OSError:
+        return None
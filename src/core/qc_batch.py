@@ -0,0 +1,273 @@
+"""
+Batch quality control module.
+Runs the quality control analysis (critères 0-5) and writes the Etat_De_Lieu
+report for many commune folders without the Tk interface, in worker
+processes. Reports go to the usual Contrôle Qualité Teams layout.
+
+Usage (from the src directory):
+    python -m core.qc_batch "C:/.../Suivi/*_*" [--workers 4] [--skip-existing]
+"""
+
+import os
+import glob
+import time
+import logging
+import argparse
+from typing import Optional, Dict, Any, List, Callable, Iterable, Tuple
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from config.constants import ParallelConfig
+
+logger = logging.getLogger(__name__)
+
+# Excel files of a commune folder: the suivi file contains 'suivi' in its name,
+# the QGis results file one of these keywords
+QGIS_FILE_KEYWORDS = ('qgis', 'resultat', 'résultat')
+REPORT_FILE_PREFIX = 'Etat_De_Lieu_'
+
+
+def find_commune_files(folder_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the QGis results file and the suivi file of a commune folder.
+
+    The most recent matching file is used when there are several.
+
+    Args:
+        folder_path: Commune folder
+
+    Returns:
+        Tuple (QGis file path or None, suivi file path or None)
+    """
+    qgis_files = []
+    suivi_files = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            if not entry.is_file() or not name.endswith(('.xlsx', '.xls')) or name.startswith('~$'):
+                continue
+            if entry.name.startswith(REPORT_FILE_PREFIX):
+                continue
+            if 'suivi' in name:
+                suivi_files.append(entry.path)
+            elif any(keyword in name for keyword in QGIS_FILE_KEYWORDS):
+                qgis_files.append(entry.path)
+
+    qgis_file = max(qgis_files, key=os.path.getmtime) if qgis_files else None
+    suivi_file = max(suivi_files, key=os.path.getmtime) if suivi_files else None
+    return qgis_file, suivi_file
+
+
+def expand_commune_folders(sources: Iterable[str]) -> List[str]:
+    """
+    Expand folder paths and glob patterns into a list of commune folders.
+
+    Args:
+        sources: Folder paths or glob patterns (e.g. "Suivi/*_*")
+
+    Returns:
+        Sorted list of distinct existing folders
+    """
+    folders = set()
+    for source in sources:
+        matches = glob.glob(source) if glob.has_magic(source) else [source]
+        folders.update(os.path.abspath(path) for path in matches if os.path.isdir(path))
+    return sorted(folders)
+
+
+def run_commune_quality_control(folder_path: str, skip_existing: bool = False) -> Dict[str, Any]:
+    """
+    Analyze one commune folder and write its Etat_De_Lieu report.
+
+    Runs in worker processes: failures are reported in the result instead of
+    raised so that one broken commune does not abort the batch.
+
+    Args:
+        folder_path: Commune folder holding the QGis results and suivi files
+        skip_existing: Don't analyze again a commune whose report already exists
+
+    Returns:
+        Dictionary with 'folder_path', 'qgis_file', 'suivi_file', 'report_path',
+        'statut' (OK/KO), 'total_errors', 'skipped', 'duration', 'timings' and 'error'
+    """
+    result = {
+        'folder_path': folder_path,
+        'qgis_file': None,
+        'suivi_file': None,
+        'report_path': None,
+        'statut': None,
+        'total_errors': 0,
+        'skipped': False,
+        'duration': 0.0,
+        'timings': {},
+        'error': None
+    }
+    start = time.perf_counter()
+
+    try:
+        qgis_file, suivi_file = find_commune_files(folder_path)
+        result['qgis_file'] = qgis_file
+        result['suivi_file'] = suivi_file
+        if not qgis_file or not suivi_file:
+            missing = 'QGis' if not qgis_file else 'suivi'
+            raise FileNotFoundError(f"Fichier {missing} introuvable dans {os.path.basename(folder_path)}")
+
+        # Imported here so that only the worker processes load the module
+        from ui.modules.quality_control_module import QualityControlModule
+
+        from core.qc_analysis_context import QcAnalysisContext
+
+        module = QualityControlModule.create_headless()
+        suivi_pages = QcAnalysisContext.read_suivi_pages(suivi_file, use_cache=False)
+
+        if skip_existing and 2 in suivi_pages:
+            # The report name only depends on the suivi: check it before running the criteria
+            from utils.file_utils import get_quality_control_file_path
+
+            module.detected_info = module._detect_info_from_suivi(suivi_pages[2], suivi_file)
+            commune, id_tache, insee, collaborateur, filename = module._get_report_naming()
+            existing_path = get_quality_control_file_path(commune, id_tache, insee, collaborateur, filename)
+            if os.path.exists(existing_path):
+                result['report_path'] = existing_path
+                result['skipped'] = True
+                return result
+
+        # Workers already run in parallel: criteria run one after the other in each process
+        results = module.analyze_files(qgis_file, suivi_file, criteria_workers=1, use_cache=False,
+                                       suivi_pages=suivi_pages)
+        result['timings'] = results.get('timings', {})
+        result['total_errors'] = results.get('summary', {}).get('total_errors', 0)
+        result['statut'] = module._evaluate_commune_status().get('statut')
+
+        result['report_path'] = module.export_report_to_teams()
+
+    except Exception as e:
+        result['error'] = str(e)
+
+    finally:
+        result['duration'] = time.perf_counter() - start
+
+    return result
+
+
+def get_worker_count(task_count: int) -> int:
+    """
+    Get the number of worker processes for a batch of communes.
+
+    Args:
+        task_count: Number of commune folders
+
+    Returns:
+        Worker count (1 means serial processing)
+    """
+    if task_count < ParallelConfig.MIN_TASKS_FOR_PROCESS_POOL:
+        return 1
+
+    workers = ParallelConfig.QC_BATCH_WORKERS
+    if not workers:
+        workers = max(1, min((os.cpu_count() or 2) - 1, ParallelConfig.MAX_DEFAULT_WORKERS))
+
+    return max(1, min(workers, task_count))
+
+
+def run_quality_control_batch(sources: Iterable[str],
+                              on_result: Optional[Callable[[Dict[str, Any], int, int], None]] = None,
+                              max_workers: Optional[int] = None,
+                              skip_existing: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run the quality control of many commune folders, in a process pool when worthwhile.
+
+    Args:
+        sources: Commune folders or glob patterns
+        on_result: Callback(result, done_count, total_count) called as communes complete
+        max_workers: Worker count override (defaults to get_worker_count)
+        skip_existing: Don't analyze again communes whose report already exists
+
+    Returns:
+        List of commune results (see run_commune_quality_control) in completion order
+    """
+    folders = expand_commune_folders(sources)
+    total = len(folders)
+    workers = max_workers or get_worker_count(total)
+    results = []
+
+    def handle(result):
+        results.append(result)
+        if result['error']:
+            logger.warning(f"QC {os.path.basename(result['folder_path'])}: {result['error']}")
+        if on_result:
+            on_result(result, len(results), total)
+
+    if workers > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            logger.info(f"Quality control of {total} communes with {workers} worker processes")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(run_commune_quality_control, folder, skip_existing): folder
+                           for folder in folders}
+                for future in as_completed(futures):
+                    try:
+                        handle(future.result())
+                    except Exception as e:
+                        handle({'folder_path': futures[future], 'qgis_file': None, 'suivi_file': None,
+                                'report_path': None, 'statut': None, 'total_errors': 0, 'skipped': False,
+                                'duration': 0.0, 'timings': {}, 'error': str(e)})
+            return results
+
+        except Exception as e:
+            # Pool could not start (frozen app without freeze_support, restricted env...)
+            logger.warning(f"Process pool unavailable, falling back to serial quality control: {e}")
+            done = {result['folder_path'] for result in results}
+            folders = [folder for folder in folders if folder not in done]
+
+    for folder in folders:
+        handle(run_commune_quality_control(folder, skip_existing))
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Args:
+        argv: Arguments (defaults to sys.argv)
+
+    Returns:
+        Exit code (0 if every commune was processed)
+    """
+    parser = argparse.ArgumentParser(description="Contrôle qualité en lot des dossiers commune")
+    parser.add_argument('sources', nargs='+', help="Dossiers commune ou motifs glob")
+    parser.add_argument('--workers', type=int, default=None, help="Nombre de processus")
+    parser.add_argument('--skip-existing', action='store_true', help="Ignorer les communes déjà contrôlées")
+    args = parser.parse_args(argv)
+
+    from utils.logging_config import setup_logging
+    setup_logging()
+
+    def print_progress(result, done, total):
+        name = os.path.basename(result['folder_path'])
+        if result['error']:
+            status = f"ERREUR: {result['error']}"
+        elif result['skipped']:
+            status = "déjà contrôlée"
+        else:
+            status = f"{result['statut']} ({result['total_errors']} erreurs, {result['duration']:.1f}s)"
+        print(f"[{done}/{total}] {name}: {status}")
+
+    start = time.perf_counter()
+    results = run_quality_control_batch(args.sources, on_result=print_progress,
+                                        max_workers=args.workers, skip_existing=args.skip_existing)
+    failed = [result for result in results if result['error']]
+    print(f"{len(results) - len(failed)}/{len(results)} communes traitées en {time.perf_counter() - start:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""
+Quality control report index module.
+Keeps the header fields of every Etat_De_Lieu report of the Contrôle Qualité
+tree in a JSON index stored next to the tree, so that rescans only open the
+reports added or modified since the previous scan.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Sequence
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from core.cell_probe import CellProbe
+from utils.performance import timed_operation
+
+logger = logging.getLogger(__name__)
+
+REPORT_FILE_PREFIX = 'Etat_De_Lieu_'
+REPORT_FILE_EXTENSION = '.xlsx'
+INDEX_FILE_NAME = '.qc_report_index.json'
+
+# Header fields of a report, in viewer column order
+REPORT_FIELDS = ['commune', 'id_tache', 'insee', 'domaine', 'affectation',
+                 'controleur', 'score_total', 'statut_commune']
+
+COMMUNE_STATUSES = ['OK', 'KO', 'NOK']
+
+
+def _is_empty(value: Any) -> bool:
+    """Check whether a cell value is empty (None, '', NaN or NaT)."""
+    if value is None or (isinstance(value, str) and value == ''):
+        return True
+    try:
+        return bool(value != value)
+    except Exception:
+        return False
+
+
+def _cell(row: Sequence[Any], position: int) -> Optional[Any]:
+    """Get a cell of a row, None if the row is too short or the cell empty."""
+    if len(row) > position and not _is_empty(row[position]):
+        return row[position]
+    return None
+
+
+def _text(value: Any) -> Optional[str]:
+    """Get the stripped text of a cell value (None for empty cells)."""
+    return None if value is None else str(value).strip()
+
+
+def parse_report_rows(row_3: Sequence[Any], row_11: Sequence[Any]) -> Dict[str, str]:
+    """
+    Extract the header fields from rows 3 and 11 of an Etat_De_Lieu report.
+
+    Each field falls back on the next cell to the right for reports whose
+    row 3 is shifted by one column.
+
+    Args:
+        row_3: Cell values of row 3 (INFORMATIONS GÉNÉRALES), column A first
+        row_11: Cell values of row 11 (score total and statut commune), column A first
+
+    Returns:
+        Dictionary of REPORT_FIELDS ('N/A' for fields not found)
+    """
+    fields = {name: 'N/A' for name in REPORT_FIELDS}
+    values_3 = [_text(_cell(row_3, position)) for position in range(7)]
+
+    # Nom de commune (A3), unless A3 still holds the section title
+    if values_3[0] is not None and values_3[0] != 'INFORMATIONS GÉNÉRALES':
+        fields['commune'] = values_3[0]
+    elif values_3[1] is not None:
+        fields['commune'] = values_3[1]
+
+    # ID tâche Plan Adressage (B3) and code INSEE (C3) are numeric
+    if values_3[1] is not None and values_3[1].isdigit():
+        fields['id_tache'] = values_3[1]
+    elif values_3[2] is not None:
+        fields['id_tache'] = values_3[2]
+
+    if values_3[2] is not None and values_3[2].isdigit():
+        fields['insee'] = values_3[2]
+    elif values_3[3] is not None:
+        fields['insee'] = values_3[3]
+
+    # Domaine (D3), affectation (E3) and contrôleur (F3)
+    for name, position in (('domaine', 3), ('affectation', 4), ('controleur', 5)):
+        if values_3[position] is not None:
+            fields[name] = values_3[position]
+        elif values_3[position + 1] is not None:
+            fields[name] = values_3[position + 1]
+
+    # Score total (J11-L11): ratios are displayed as percentages
+    for position in (9, 10, 11):
+        val = _text(_cell(row_11, position))
+        if val is None:
+            continue
+        try:
+            float_val = float(val)
+            fields['score_total'] = f"{float_val * 100:.2f}%" if 0 <= float_val <= 1 else val
+            break
+        except ValueError:
+            if val.isdigit():
+                fields['score_total'] = val
+                break
+
+    # Statut commune (K11-M11)
+    for position in (10, 11, 12):
+        val = _text(_cell(row_11, position))
+        if val is not None and val.upper() in COMMUNE_STATUSES:
+            fields['statut_commune'] = val.upper()
+            break
+
+    return fields
+
+
+def read_report_fields(file_path: str) -> Dict[str, str]:
+    """
+    Read the header fields of an Etat_De_Lieu report (first sheet).
+
+    Only rows 1 to 11 of the sheet XML are parsed.
+
+    Args:
+        file_path: Path of the report
+
+    Returns:
+        Dictionary of REPORT_FIELDS
+
+    Raises:
+        Exception: If the workbook cannot be read
+    """
+    rows = CellProbe(file_path).read_rows([3, 11])
+    return parse_report_rows(rows[3], rows[11])
+
+
+class QcReportIndex:
+    """
+    Persisted index of the Etat_De_Lieu reports of the Contrôle Qualité tree.
+
+    The tree is laid out as <base>/<collaborateur>/<commune>/Etat_De_Lieu_*.xlsx.
+    Entries are keyed on the path relative to the base folder (the synced
+    Teams folder is mounted under a different root for each user) and hold
+    the report size, modification time and header fields.
+    """
+
+    VERSION = 2
+
+    def __init__(self, base_path: str, index_path: Optional[str] = None):
+        """
+        Initialize the index.
+
+        Args:
+            base_path: Contrôle Qualité base folder
+            index_path: Path of the JSON index (defaults to INDEX_FILE_NAME in the base folder)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.base_path = base_path
+        self.index_path = index_path or os.path.join(base_path, INDEX_FILE_NAME)
+        self._lock = threading.Lock()
+        self.entries = {}  # relative path -> {'size', 'mtime_ns', 'fields'}
+        self.last_scan_stats = {}
+        self._loaded = False
+
+    def load(self) -> bool:
+        """
+        Load the index from disk.
+
+        Returns:
+            True if a valid index was loaded, False otherwise
+        """
+        self.entries = {}
+        self._loaded = True
+
+        if not os.path.exists(self.index_path):
+            return False
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get('version') != self.VERSION:
+                self.logger.info("Quality control report index version changed - full scan required")
+                return False
+
+            self.entries = data.get('entries', {})
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"Could not read quality control report index: {e}")
+            return False
+
+    def save(self) -> bool:
+        """
+        Save the index to disk atomically.
+
+        Returns:
+            True if saved, False otherwise
+        """
+        data = {
+            'version': self.VERSION,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'entries': self.entries
+        }
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with self._lock:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.index_path)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not save quality control report index: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    @timed_operation('qc.scan_reports', threshold=2.0)
+    def scan(self) -> List[Dict[str, Any]]:
+        """
+        Scan the tree and get the header fields of every report.
+
+        Only reports that are new or whose size/modification time changed are
+        opened; entries of deleted reports are dropped. Reports that cannot be
+        read are listed with 'N/A' fields and retried on the next scan.
+
+        Returns:
+            List of report fields plus 'chemin' (absolute path), in directory order
+        """
+        if not self._loaded:
+            self.load()
+
+        start = time.perf_counter()
+        stats = {'base_entries': 0, 'reports': 0, 'extracted': 0, 'reused': 0, 'failed': 0, 'removed': 0}
+        files_data = []
+        seen = set()
+        changed = False
+
+        for file_path, relative_path, stat in self._iter_reports(stats):
+            seen.add(relative_path)
+            entry = self.entries.get(relative_path)
+
+            if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+                fields = entry['fields']
+                stats['reused'] += 1
+            else:
+                try:
+                    fields = read_report_fields(file_path)
+                    self.entries[relative_path] = {
+                        'size': stat.st_size,
+                        'mtime_ns': stat.st_mtime_ns,
+                        'fields': fields
+                    }
+                    stats['extracted'] += 1
+                except Exception as e:
+                    # Not indexed: a report still being synced is read again next time
+                    self.logger.warning(f"Erreur lecture fichier Excel {os.path.basename(file_path)}: {e}")
+                    fields = {name: 'N/A' for name in REPORT_FIELDS}
+                    self.entries.pop(relative_path, None)
+                    stats['failed'] += 1
+                changed = True
+
+            file_info = dict(fields)
+            file_info['chemin'] = file_path
+            files_data.append(file_info)
+
+        for relative_path in [path for path in self.entries if path not in seen]:
+            del self.entries[relative_path]
+            stats['removed'] += 1
+            changed = True
+
+        stats['reports'] = len(files_data)
+        stats['duration'] = time.perf_counter() - start
+        self.last_scan_stats = stats
+
+        if changed:
+            self.save()
+
+        self.logger.info(f"Quality control reports scanned in {stats['duration']:.2f}s: "
+                         f"{stats['reports']} reports, {stats['extracted']} read, {stats['reused']} from index, "
+                         f"{stats['failed']} failed, {stats['removed']} removed")
+        return files_data
+
+    def _iter_reports(self, stats: Dict[str, int]):
+        """Yield (path, relative path, stat) of each report of the tree."""
+        index_names = {os.path.basename(self.index_path), os.path.basename(self.index_path) + ".tmp"}
+
+        with os.scandir(self.base_path) as collaborateurs:
+            collaborateur_entries = [entry for entry in collaborateurs if entry.name not in index_names]
+        stats['base_entries'] = len(collaborateur_entries)
+
+        for collaborateur in collaborateur_entries:
+            if not collaborateur.is_dir():
+                continue
+            try:
+                with os.scandir(collaborateur.path) as communes:
+                    commune_entries = [entry for entry in communes if entry.is_dir()]
+            except OSError as e:
+                self.logger.warning(f"Dossier collaborateur illisible {collaborateur.name}: {e}")
+                continue
+
+            for commune in commune_entries:
+                try:
+                    with os.scandir(commune.path) as files:
+                        for entry in files:
+                            if (entry.name.startswith(REPORT_FILE_PREFIX)
+                                    and entry.name.endswith(REPORT_FILE_EXTENSION)):
+                                relative_path = '/'.join((collaborateur.name, commune.name, entry.name))
+                                yield entry.path, relative_path, entry.stat()
+                except OSError as e:
+                    self.logger.warning(f"Dossier commune illisible {commune.name}: {e}")
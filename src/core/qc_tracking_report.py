@@ -0,0 +1,260 @@
+"""
+Quality control tracking report module.
+Maintains the "Suivi Controle Qualité" workbook listing the header fields of
+every Etat_De_Lieu report: rows are upserted by (commune, ID tâche) with
+shared named styles, and the workbook is only saved when its content changes.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from typing import Optional, Dict, Any, List, Tuple
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from core.qc_report_index import REPORT_FIELDS
+from core.workbook_writer import HEADER_FILL_COLOR, HEADER_FONT_COLOR, get_column_letter
+from utils.performance import timed_operation
+
+logger = logging.getLogger(__name__)
+
+# Location of the tracking workbook in the Contrôle Qualité folder
+TRACKING_FOLDER_NAME = "ZZZ_Suivi_Controle_Qualité"
+TRACKING_FILE_NAME = "Suivi Controle Qualité.xlsx"
+TRACKING_SHEET_TITLE = "Suivi Contrôle Qualité"
+
+# Delay before writing, so that successive viewer refreshes write the synced file once
+TRACKING_REPORT_DEBOUNCE_SECONDS = 2.0
+
+TRACKING_HEADERS = ["Commune", "ID Tâche PA", "Code INSEE", "Domaine", "Affectation",
+                    "Contrôleur", "Score Total", "Statut Commune"]
+TRACKING_COLUMN_WIDTHS = [18, 14, 12, 12, 16, 14, 12, 16]
+
+# Named styles registered once per workbook
+HEADER_STYLE = "Suivi QC En-tête"
+CELL_STYLE = "Suivi QC Cellule"
+STATUS_OK_STYLE = "Suivi QC Statut OK"
+STATUS_NOK_STYLE = "Suivi QC Statut NOK"
+
+STATUS_OK_VALUES = ["OK"]
+STATUS_NOK_VALUES = ["NOK", "NON CONFORME"]
+
+
+def get_tracking_rows(files_data: List[Dict[str, Any]]) -> Dict[Tuple[str, str], List[str]]:
+    """
+    Get the tracking rows of the scanned reports, keyed by (commune, ID tâche).
+
+    Args:
+        files_data: Report fields as returned by the report index scan
+
+    Returns:
+        Row values in TRACKING_HEADERS order, in scan order (the last report
+        of a duplicated key wins)
+    """
+    rows = {}
+    for file_info in files_data:
+        values = [str(file_info.get(field, 'N/A')) for field in REPORT_FIELDS]
+        rows[(values[0], values[1])] = values
+    return rows
+
+
+def _register_named_styles(wb) -> None:
+    """Add the tracking report named styles to a workbook that lacks them."""
+    from openpyxl.styles import NamedStyle, Font, PatternFill, Alignment, Border, Side
+
+    side = Side(style="thin", color="000000")
+    border = Border(left=side, right=side, top=side, bottom=side)
+    alignment = Alignment(horizontal="center", vertical="center")
+
+    styles = [
+        NamedStyle(name=HEADER_STYLE, font=Font(bold=True, color=HEADER_FONT_COLOR, size=11),
+                   fill=PatternFill(start_color=HEADER_FILL_COLOR, end_color=HEADER_FILL_COLOR, fill_type="solid"),
+                   alignment=alignment, border=border),
+        NamedStyle(name=CELL_STYLE, font=Font(size=10), alignment=alignment, border=border),
+        NamedStyle(name=STATUS_OK_STYLE, font=Font(bold=True, color="FFFFFF", size=10),
+                   fill=PatternFill(start_color="92D050", end_color="92D050", fill_type="solid"),
+                   alignment=alignment, border=border),
+        NamedStyle(name=STATUS_NOK_STYLE, font=Font(bold=True, color="FFFFFF", size=10),
+                   fill=PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid"),
+                   alignment=alignment, border=border)
+    ]
+    for style in styles:
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+
+
+def _get_cell_style(column: int, value: str) -> str:
+    """Get the named style of a data cell (the status column is colored)."""
+    if column == len(TRACKING_HEADERS):
+        if value in STATUS_OK_VALUES:
+            return STATUS_OK_STYLE
+        if value in STATUS_NOK_VALUES:
+            return STATUS_NOK_STYLE
+    return CELL_STYLE
+
+
+class QcTrackingReport:
+    """
+    Tracking workbook of the quality control reports.
+
+    The rows already in the workbook are updated in place, new reports are
+    appended and reports no longer found are removed; a scan that changes
+    nothing leaves the file untouched.
+    """
+
+    def __init__(self, report_path: str):
+        """
+        Initialize the tracking report.
+
+        Args:
+            report_path: Path of the tracking workbook
+        """
+        self.logger = logging.getLogger(__name__)
+        self.report_path = report_path
+        self._lock = threading.Lock()
+        self._last_signature = None  # (rows digest, file mtime_ns) of the last synchronized state
+
+    @classmethod
+    def for_quality_control_folder(cls, qc_base_path: str) -> 'QcTrackingReport':
+        """
+        Get the tracking report of a Contrôle Qualité folder.
+
+        Args:
+            qc_base_path: Contrôle Qualité base folder
+
+        Returns:
+            Tracking report stored in its TRACKING_FOLDER_NAME subfolder
+        """
+        return cls(os.path.join(qc_base_path, TRACKING_FOLDER_NAME, TRACKING_FILE_NAME))
+
+    @timed_operation('qc.write_tracking_report', threshold=5.0)
+    def update(self, files_data: List[Dict[str, Any]]) -> bool:
+        """
+        Synchronize the workbook with the scanned reports.
+
+        Args:
+            files_data: Report fields as returned by the report index scan
+
+        Returns:
+            True if the workbook was written, False if it was already up to date
+        """
+        rows = get_tracking_rows(files_data)
+        digest = hashlib.sha1(repr(list(rows.values())).encode('utf-8')).hexdigest()
+
+        with self._lock:
+            # Same rows as the last synchronization and file not modified since
+            if self._last_signature == (digest, self._get_mtime_ns()):
+                return False
+
+            wb, ws = self._open_workbook()
+            changed_cells = self._upsert_rows(ws, rows)
+
+            if changed_cells:
+                self._save(wb)
+                self.logger.info(f"📊 Rapport de suivi mis à jour ({changed_cells} cellules, "
+                                 f"{len(rows)} communes): {self.report_path}")
+            else:
+                self.logger.debug("Rapport de suivi déjà à jour")
+
+            self._last_signature = (digest, self._get_mtime_ns())
+            return bool(changed_cells)
+
+    def _open_workbook(self):
+        """Load the existing workbook, or create it with its header row."""
+        from openpyxl import Workbook, load_workbook
+
+        if os.path.exists(self.report_path):
+            try:
+                wb = load_workbook(self.report_path)
+                ws = wb[TRACKING_SHEET_TITLE] if TRACKING_SHEET_TITLE in wb.sheetnames else wb.active
+                _register_named_styles(wb)
+                return wb, ws
+            except Exception as e:
+                self.logger.warning(f"Rapport de suivi illisible, recréé: {e}")
+
+        wb = Workbook()
+        ws = wb.active
+        ws.title = TRACKING_SHEET_TITLE
+        _register_named_styles(wb)
+
+        for column, header in enumerate(TRACKING_HEADERS, 1):
+            cell = ws.cell(row=1, column=column, value=header)
+            cell.style = HEADER_STYLE
+        for column, width in enumerate(TRACKING_COLUMN_WIDTHS, 1):
+            ws.column_dimensions[get_column_letter(column)].width = width
+
+        return wb, ws
+
+    def _upsert_rows(self, ws, rows: Dict[Tuple[str, str], List[str]]) -> int:
+        """
+        Update the sheet rows to match the scanned reports.
+
+        Returns:
+            Number of cells written plus rows removed (0 if the sheet was up to date)
+        """
+        column_count = len(TRACKING_HEADERS)
+        existing = {}  # key -> (row number, values)
+        obsolete_rows = []
+
+        for row_number, values in enumerate(ws.iter_rows(min_row=2, max_col=column_count, values_only=True), 2):
+            values = ['' if value is None else str(value) for value in values]
+            if not any(values):
+                obsolete_rows.append(row_number)
+                continue
+            key = (values[0], values[1])
+            if key in rows and key not in existing:
+                existing[key] = (row_number, values)
+            else:
+                obsolete_rows.append(row_number)
+
+        changes = 0
+        next_row = ws.max_row + 1
+        for key, values in rows.items():
+            if key in existing:
+                row_number, current = existing[key]
+            else:
+                row_number, current = next_row, [None] * column_count
+                next_row += 1
+
+            for column, value in enumerate(values, 1):
+                if current[column - 1] != value:
+                    cell = ws.cell(row=row_number, column=column, value=value)
+                    cell.style = _get_cell_style(column, value)
+                    changes += 1
+
+        # Bottom-up so that the row numbers still to delete don't move
+        for row_number in sorted(obsolete_rows, reverse=True):
+            ws.delete_rows(row_number)
+            changes += 1
+
+        return changes
+
+    def _save(self, wb) -> None:
+        """Save the workbook through a temporary file so readers never see a partial file."""
+        folder = os.path.dirname(self.report_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        tmp_path = self.report_path + ".tmp"
+        try:
+            wb.save(tmp_path)
+            os.replace(tmp_path, self.report_path)
+        finally:
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _get_mtime_ns(self) -> Optional[int]:
+        """Get the modification time of the workbook (None if missing)."""
+        try:
+            return os.stat(self.report_path).st_mtime_ns
+        except OSError:
+            return None
@@ -0,0 +1,165 @@
+"""
+QGis address index module.
+Builds the "adresse optimum" of every QGis results row with column-wise
+string operations and groups the rows by IMB code, motif and address for
+the duplicate and motif quality control criteria.
+"""
+
+import logging
+from typing import Dict, Tuple
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+
+logger = logging.getLogger(__name__)
+
+# QGis results columns used by the address checks (Excel column A = 0)
+QGIS_ADDRESS_COLUMNS = {
+    'imb_code': 0,        # A - Num Dossier Site
+    'numero_voie': 1,     # B - Numero Voie Site
+    'repondant_voie': 2,  # C - Repondant Voie Site
+    'libelle_voie': 3,    # D - Libelle Voie Site
+    'motif': 9,           # J - Import Fantome
+    'adresse_ban': 20     # U - Adresse BAN
+}
+
+
+def _to_text(values: 'pd.Series') -> 'pd.Series':
+    """Convert cells to stripped text, '' for empty cells."""
+    pd = get_pandas()
+
+    text = pd.Series('', index=values.index, dtype=object)
+    filled = values.notna()
+    if filled.any():
+        text[filled] = values[filled].map(str).str.strip()
+    return text
+
+
+def _clean_numero(numero: 'pd.Series') -> 'pd.Series':
+    """Drop the decimal part of numbers read as floats ('12.0' -> '12')."""
+    numeric = (numero.str.contains('.', regex=False)
+               & numero.str.replace('.', '', regex=False).str.replace('-', '', regex=False).str.isdigit())
+    if not numeric.any():
+        return numero
+
+    def to_integer_text(value):
+        try:
+            return str(int(float(value)))
+        except Exception:
+            return value
+
+    # Few distinct house numbers: convert each distinct value once
+    converted = {value: to_integer_text(value) for value in numero[numeric].unique()}
+    numero = numero.copy()
+    numero[numeric] = numero[numeric].map(converted)
+    return numero
+
+
+def build_adresse_optimum(numero_voie: 'pd.Series', repondant_voie: 'pd.Series',
+                          libelle_voie: 'pd.Series') -> 'pd.Series':
+    """
+    Build the "adresse optimum" (B + C + D) of each row.
+
+    Empty and 'nan' parts are skipped, so a row without répondant gives
+    "numéro libellé", and a row without numéro and répondant gives the libellé.
+
+    Args:
+        numero_voie: Numero Voie Site (column B)
+        repondant_voie: Repondant Voie Site (column C)
+        libelle_voie: Libelle Voie Site (column D)
+
+    Returns:
+        Address text Series aligned with the inputs ('' when every part is empty)
+    """
+    pd = get_pandas()
+    np = _get_numpy()
+
+    parts = [_clean_numero(_to_text(numero_voie)), _to_text(repondant_voie), _to_text(libelle_voie)]
+
+    address = pd.Series('', index=numero_voie.index, dtype=object)
+    for part in parts:
+        valid = part.ne('') & part.ne('nan')
+        joined = valid & address.ne('')
+        address = pd.Series(np.where(joined, address + ' ' + part, np.where(valid, part, address)),
+                            index=address.index, dtype=object)
+    return address
+
+
+class QgisAddressIndex:
+    """
+    Normalized address columns of a QGis results sheet and their groupings.
+
+    The frame keeps every row: 'has_imb' flags the rows whose IMB cell is
+    filled, for the criteria that leave the others out.
+    """
+
+    def __init__(self, qgis_data: 'pd.DataFrame'):
+        """
+        Build the index.
+
+        Args:
+            qgis_data: QGis results sheet (at least 21 columns, A-U)
+        """
+        pd = get_pandas()
+
+        columns = {name: qgis_data.iloc[:, position] for name, position in QGIS_ADDRESS_COLUMNS.items()}
+
+        # Same text forms as the cell-by-cell checks ('nan' / 'NAN' for empty cells)
+        self.frame = pd.DataFrame({
+            'imb_code': columns['imb_code'].astype(str).str.strip(),
+            'motif': columns['motif'].astype(str).str.strip().str.upper(),
+            'adresse_ban': columns['adresse_ban'].astype(str).str.strip(),
+            'adresse_optimum': build_adresse_optimum(columns['numero_voie'], columns['repondant_voie'],
+                                                     columns['libelle_voie']),
+            'has_imb': columns['imb_code'].notna()
+        })
+        self.frame.index = pd.RangeIndex(len(self.frame))
+        self._group_codes: Dict[Tuple[str, ...], 'np.ndarray'] = {}
+
+        logger.debug(f"QGis address index built: {len(self.frame)} rows")
+
+    def rows(self, with_imb_only: bool = False) -> 'pd.DataFrame':
+        """
+        Get the normalized rows.
+
+        Args:
+            with_imb_only: Leave out the rows without IMB code
+
+        Returns:
+            DataFrame with imb_code, motif, adresse_ban, adresse_optimum, has_imb
+        """
+        if with_imb_only:
+            return self.frame[self.frame['has_imb']]
+        return self.frame
+
+    def group_codes(self, *columns: str) -> 'np.ndarray':
+        """
+        Get the group number of each row for a combination of columns.
+
+        Rows with the same values in all the columns share a number (hash
+        grouping); numbers follow the first appearance of each combination.
+
+        Args:
+            *columns: Frame columns, e.g. ('imb_code', 'motif', 'adresse_optimum')
+
+        Returns:
+            Group number per row (aligned with the full frame)
+        """
+        key = tuple(columns)
+        codes = self._group_codes.get(key)
+        if codes is None:
+            codes = self.frame.groupby(list(columns), sort=False).ngroup().to_numpy()
+            self._group_codes[key] = codes
+        return codes
+
+
+def _get_numpy():
+    """Get numpy (imported with pandas)."""
+    import numpy
+    return numpy
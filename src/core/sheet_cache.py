@@ -0,0 +1,385 @@
+"""
+Persistent sheet cache module.
+Stores parsed Excel sheets on disk so that unchanged workbooks are not re-parsed
+through openpyxl on every application start.
+"""
+
+import os
+import json
+import time
+import atexit
+import pickle
+import hashlib
+import logging
+import threading
+from typing import Optional, Dict, Any
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from config.constants import CacheConfig
+from utils.performance import increment_counter
+
+
+class SheetCache:
+    """
+    On-disk cache of parsed Excel sheets with LRU eviction by total size.
+
+    Entries are keyed on the source file path, size and modification time
+    plus the sheet, the Excel engine and the read options, so any change to
+    the workbook (or to the way it is read) produces a new key and the stale
+    entry ages out.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the sheet cache.
+
+        Args:
+            cache_dir: Directory holding cached sheets (defaults to CacheConfig location)
+            max_bytes: Maximum total size of cached entries before LRU eviction
+        """
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir or os.path.join(CacheConfig.get_cache_base_path(),
+                                                   CacheConfig.SHEET_CACHE_FOLDER)
+        self.max_bytes = max_bytes if max_bytes is not None else CacheConfig.SHEET_CACHE_MAX_BYTES
+        self.enabled = CacheConfig.ENABLE_SHEET_CACHE
+
+        self._lock = threading.RLock()
+        self._index = {}  # key -> {'file', 'bytes', 'last_access', 'source'}
+        self._index_dirty = False  # access times updated by hits, saved with the next write or at exit
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'errors': 0}
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._load_index()
+        except Exception as e:
+            self.logger.warning(f"Sheet cache disabled, cannot use {self.cache_dir}: {e}")
+            self.enabled = False
+
+        atexit.register(self.flush)
+
+    def read_excel(self, file_path: str, sheet_name=0, **read_kwargs) -> 'pd.DataFrame':
+        """
+        Read an Excel sheet through the cache.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Sheet name or index (as accepted by pandas.read_excel)
+            **read_kwargs: Additional pandas.read_excel arguments (usecols, dtype, ...)
+
+        Returns:
+            DataFrame containing the sheet data
+
+        Raises:
+            Exception: Any error raised by pandas.read_excel on a cache miss
+        """
+        pd = get_pandas()
+
+        # File state before the parse: the sheet is stored under it (or not at all if the file changes meanwhile)
+        source_stat = self.get_source_stat(file_path)
+        df = self.lookup(file_path, sheet_name, **read_kwargs)
+        if df is not None:
+            return df
+
+        df = pd.read_excel(file_path, sheet_name=sheet_name, **read_kwargs)
+        self.store(file_path, sheet_name, df, source_stat=source_stat, **read_kwargs)
+
+        return df
+
+    @staticmethod
+    def get_source_stat(file_path: str) -> Optional[os.stat_result]:
+        """
+        Get the state of a source file, to be taken before parsing it and passed to store.
+
+        Args:
+            file_path: Path to the Excel file
+
+        Returns:
+            os.stat result, or None if the file cannot be accessed
+        """
+        try:
+            return os.stat(file_path)
+        except OSError:
+            return None
+
+    def lookup(self, file_path: str, sheet_name=0, **read_kwargs) -> Optional['pd.DataFrame']:
+        """
+        Get a cached sheet without falling back to parsing the workbook.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Sheet name or index
+            **read_kwargs: Read options the sheet was stored with (including engine if not the pandas default)
+
+        Returns:
+            Cached DataFrame, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        key = self._make_key(file_path, sheet_name, read_kwargs, self.get_source_stat(file_path))
+        if key is None:
+            return None
+
+        df = self._get(key)
+        if df is not None:
+            self.logger.debug(f"Sheet cache hit: {os.path.basename(file_path)} [{sheet_name}]")
+        return df
+
+    def store(self, file_path: str, sheet_name, df, source_stat: Optional[os.stat_result] = None,
+              **read_kwargs) -> None:
+        """
+        Store a parsed sheet in the cache.
+
+        Args:
+            file_path: Path to the Excel file the sheet was read from
+            sheet_name: Sheet name or index
+            df: Parsed DataFrame
+            source_stat: State of the file taken before parsing (get_source_stat); the sheet
+                is not stored if the file changed since. Defaults to the current state.
+            **read_kwargs: Read options used to parse the sheet (including engine if not the pandas default)
+        """
+        if not self.enabled:
+            return
+
+        current_stat = self.get_source_stat(file_path)
+        if source_stat is None:
+            source_stat = current_stat
+        elif not _same_file_state(source_stat, current_stat):
+            # Saved or synced during the parse: the parsed content may be neither version
+            self.logger.debug(f"Not caching {os.path.basename(file_path)} [{sheet_name}]: modified while parsed")
+            return
+
+        key = self._make_key(file_path, sheet_name, read_kwargs, source_stat)
+        if key is not None:
+            self._put(key, df, file_path, source_stat.st_mtime)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, evictions, entry count and total bytes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._index)
+            stats['bytes'] = sum(entry['bytes'] for entry in self._index.values())
+            stats['max_bytes'] = self.max_bytes
+            total = stats['hits'] + stats['misses']
+            stats['hit_rate'] = stats['hits'] / total if total else 0.0
+            return stats
+
+    def invalidate(self, file_path: str) -> int:
+        """
+        Remove all cached sheets of a given source file.
+
+        Args:
+            file_path: Path to the Excel file
+
+        Returns:
+            Number of removed entries
+        """
+        source = os.path.abspath(file_path)
+        with self._lock:
+            keys = [key for key, entry in self._index.items() if entry.get('source') == source]
+            for key in keys:
+                self._remove_entry(key)
+            if keys:
+                self._save_index()
+            return len(keys)
+
+    def flush(self) -> None:
+        """Save the access times recorded by cache hits since the last index write."""
+        with self._lock:
+            if self._index_dirty:
+                self._save_index()
+
+    def clear(self) -> None:
+        """Remove every cached sheet."""
+        with self._lock:
+            for key in list(self._index.keys()):
+                self._remove_entry(key)
+            self._save_index()
+            self.logger.info("Sheet cache cleared")
+
+    def _make_key(self, file_path: str, sheet_name, read_kwargs: Dict[str, Any],
+                  stat: Optional[os.stat_result]) -> Optional[str]:
+        """Build the cache key from file identity (stat taken by the caller) and read options."""
+        if stat is None:
+            return None
+
+        # Engines differ on dtypes (e.g. dates and integers as floats): entries are per engine
+        engine = read_kwargs.get('engine') or _get_pandas_default_engine(file_path)
+        options = sorted((name, repr(value)) for name, value in read_kwargs.items() if name != 'engine')
+        raw = "|".join([
+            os.path.abspath(file_path),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            repr(sheet_name),
+            engine,
+            repr(options)
+        ])
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _get(self, key: str):
+        """Load a cached DataFrame, or None on miss."""
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                increment_counter('sheet_cache.misses')
+                return None
+            entry_path = os.path.join(self.cache_dir, entry['file'])
+
+        # Unpickled outside the lock so that concurrent readers don't wait on each other
+        try:
+            with open(entry_path, 'rb') as f:
+                df = pickle.load(f)
+        except Exception as e:
+            with self._lock:
+                self._stats['misses'] += 1
+                if self._index.get(key) is entry:
+                    self.logger.warning(f"Dropping unreadable sheet cache entry {entry['file']}: {e}")
+                    self._stats['errors'] += 1
+                    self._remove_entry(key)
+                    self._save_index()
+            return None
+
+        # The new access time is saved with the next index write (or at exit)
+        with self._lock:
+            entry['last_access'] = time.time()
+            self._index_dirty = True
+            self._stats['hits'] += 1
+        increment_counter('sheet_cache.hits')
+        return df
+
+    def _put(self, key: str, df, file_path: str, source_mtime: float) -> None:
+        """Store a DataFrame in the cache and evict older entries if needed."""
+        with self._lock:
+            file_name = f"{key}.pkl"
+            entry_path = os.path.join(self.cache_dir, file_name)
+            tmp_path = entry_path + ".tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, entry_path)
+            except Exception as e:
+                self.logger.warning(f"Could not write sheet cache entry: {e}")
+                self._stats['errors'] += 1
+                if os.path.exists(tmp_path):
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+                return
+
+            # Drop previous versions of the same source so stale entries don't linger
+            source = os.path.abspath(file_path)
+            self._index[key] = {
+                'file': file_name,
+                'bytes': os.path.getsize(entry_path),
+                'last_access': time.time(),
+                'source': source,
+                'source_mtime': source_mtime
+            }
+            for other_key, entry in list(self._index.items()):
+                if (other_key != key and entry.get('source') == source
+                        and entry.get('source_mtime') != self._index[key]['source_mtime']):
+                    self._remove_entry(other_key)
+
+            self._evict()
+            self._save_index()
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until total size fits the budget."""
+        total = sum(entry['bytes'] for entry in self._index.values())
+        if total <= self.max_bytes:
+            return
+
+        for key in sorted(self._index, key=lambda k: self._index[k]['last_access']):
+            if total <= self.max_bytes:
+                break
+            total -= self._index[key]['bytes']
+            self._remove_entry(key)
+            self._stats['evictions'] += 1
+
+    def _remove_entry(self, key: str) -> None:
+        """Remove an entry and its file (caller holds the lock)."""
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return
+        try:
+            os.remove(os.path.join(self.cache_dir, entry['file']))
+        except OSError:
+            pass
+
+    def _load_index(self) -> None:
+        """Load the cache index, dropping entries whose file is missing."""
+        index_path = os.path.join(self.cache_dir, CacheConfig.SHEET_CACHE_INDEX_FILE)
+        if not os.path.exists(index_path):
+            return
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            self._index = {
+                key: entry for key, entry in index.items()
+                if os.path.exists(os.path.join(self.cache_dir, entry.get('file', '')))
+            }
+        except Exception as e:
+            self.logger.warning(f"Sheet cache index unreadable, starting empty: {e}")
+            self._index = {}
+
+    def _save_index(self) -> None:
+        """Persist the cache index atomically."""
+        index_path = os.path.join(self.cache_dir, CacheConfig.SHEET_CACHE_INDEX_FILE)
+        tmp_path = index_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, index_path)
+            self._index_dirty = False
+        except Exception as e:
+            self.logger.debug(f"Could not save sheet cache index: {e}")
+
+
+def _get_pandas_default_engine(file_path: str) -> str:
+    """Get the engine pandas.read_excel picks for a file when none is given."""
+    extension = os.path.splitext(file_path)[1].lower()
+    return {'.xls': 'xlrd', '.xlsb': 'pyxlsb', '.ods': 'odf'}.get(extension, 'openpyxl')
+
+
+def _same_file_state(before: os.stat_result, after: Optional[os.stat_result]) -> bool:
+    """Check whether a file kept the same size and modification time."""
+    return (after is not None and before.st_size == after.st_size
+            and before.st_mtime_ns == after.st_mtime_ns)
+
+
+_sheet_cache = None
+_sheet_cache_lock = threading.Lock()
+
+
+def get_sheet_cache() -> SheetCache:
+    """
+    Get the shared sheet cache instance.
+
+    Returns:
+        SheetCache singleton
+    """
+    global _sheet_cache
+    if _sheet_cache is None:
+        with _sheet_cache_lock:
+            if _sheet_cache is None:
+                _sheet_cache = SheetCache()
+    return _sheet_cache
+
+
+def read_excel_cached(file_path: str, sheet_name=0, **read_kwargs) -> 'pd.DataFrame':
+    """Read an Excel sheet through the shared persistent sheet cache."""
+    return get_sheet_cache().read_excel(file_path, sheet_name=sheet_name, **read_kwargs)
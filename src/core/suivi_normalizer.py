@@ -0,0 +1,330 @@
+"""
+Suivi data normalization module.
+Parses the date and duration columns of the global suivi sheets once, with
+per-column format inference, so statistics, exports and anomaly checks read
+typed columns instead of re-parsing every cell with strptime.
+"""
+
+import logging
+import numbers
+from typing import Optional, Dict, Any, List, Tuple
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from core.date_range_index import DateRangeIndex
+
+logger = logging.getLogger(__name__)
+
+# Every date layout found in the suivi sheets. None of these formats can match
+# the same string, so their order only matters for speed (see infer_date_formats).
+DATE_FORMATS = [
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%d-%m-%Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+    '%d-%m-%Y %H:%M:%S',
+    '%Y/%m/%d',
+    '%Y.%m.%d'
+]
+
+# Duration columns (minutes or 'HH:MM') of the global suivi sheets
+DURATION_COLUMNS = ['Durée', 'Durée Finale', 'Temps préparation QGis', 'Traitement Optimum']
+
+# Number of string values sampled to rank the formats of a column
+FORMAT_SAMPLE_SIZE = 200
+
+# Number of rejected values kept per column in the report
+REJECTED_SAMPLE_SIZE = 5
+
+
+def parse_duration_minutes(series) -> 'pd.Series':
+    """
+    Convert a duration column to float minutes.
+
+    Numbers are taken as minutes, 'HH:MM' strings are converted and other
+    strings are parsed as numbers. Unparseable values become NaN.
+
+    Args:
+        series: Duration column
+
+    Returns:
+        Float Series aligned on the input index
+    """
+    pd = get_pandas()
+
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+
+    values = series.astype(object)
+    result = pd.Series(float('nan'), index=series.index)
+
+    # Plain numbers (ints, floats and numpy scalars) are already minutes
+    numeric_mask = values.map(lambda v: isinstance(v, numbers.Real))
+    if numeric_mask.any():
+        result[numeric_mask] = pd.to_numeric(values[numeric_mask], errors='coerce')
+
+    # Strings: 'HH:MM' or plain numbers
+    str_mask = values.map(lambda v: isinstance(v, str))
+    if str_mask.any():
+        stripped = values[str_mask].str.strip()
+        hh_mm = stripped.str.extract(r'^([+-]?\d+)\s*:\s*([+-]?\d+)$')
+        has_colon = stripped.str.contains(':', regex=False)
+        clock_minutes = hh_mm[0].astype(float) * 60 + hh_mm[1].astype(float)
+        plain_minutes = pd.to_numeric(stripped.where(~has_colon), errors='coerce')
+        result[str_mask] = clock_minutes.where(has_colon, plain_minutes)
+
+    return result
+
+
+def infer_date_formats(values, formats: Optional[List[str]] = None,
+                       sample_size: int = FORMAT_SAMPLE_SIZE) -> List[str]:
+    """
+    Rank date formats by how many sampled values they match.
+
+    Args:
+        values: String values of a date column
+        formats: Candidate strptime formats (defaults to DATE_FORMATS)
+        sample_size: Number of values sampled
+
+    Returns:
+        Formats matching the sample, most frequent first
+    """
+    pd = get_pandas()
+    formats = formats or DATE_FORMATS
+
+    sample = values.head(sample_size)
+    if sample.empty:
+        return []
+
+    hits = []
+    for position, date_format in enumerate(formats):
+        matched = int(pd.to_datetime(sample, format=date_format, errors='coerce').notna().sum())
+        if matched:
+            hits.append((-matched, position, date_format))
+
+    return [date_format for _, _, date_format in sorted(hits)]
+
+
+def parse_dates(series, formats: Optional[List[str]] = None, fallback: bool = False,
+                format_order: Optional[List[str]] = None) -> 'pd.Series':
+    """
+    Parse a date column once, trying each format on the remaining string values.
+
+    Non-string values (datetimes, Excel timestamps) go through pd.to_datetime.
+
+    Args:
+        series: Date column
+        formats: strptime formats accepted for string values (defaults to DATE_FORMATS)
+        fallback: Whether unmatched strings get a last free-form parse
+        format_order: Formats to try first (e.g. from infer_date_formats)
+
+    Returns:
+        datetime64 Series (NaT where the value could not be parsed)
+    """
+    pd = get_pandas()
+    formats = formats or DATE_FORMATS
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    values = series.astype(object)
+    result = pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
+
+    str_mask = values.map(lambda v: isinstance(v, str))
+    other_mask = ~str_mask & values.notna()
+
+    if other_mask.any():
+        result[other_mask] = pd.to_datetime(values[other_mask], errors='coerce')
+
+    remaining = values[str_mask]
+    ordered = [f for f in (format_order or []) if f in formats] + \
+        [f for f in formats if f not in (format_order or [])]
+    for date_format in ordered:
+        if remaining.empty:
+            break
+        parsed = pd.to_datetime(remaining, format=date_format, errors='coerce')
+        matched = parsed.notna()
+        result[parsed.index[matched]] = parsed[matched]
+        remaining = remaining[~matched]
+
+    if fallback and not remaining.empty:
+        non_empty = remaining[remaining.str.strip() != '']
+        if not non_empty.empty:
+            try:
+                parsed = pd.to_datetime(non_empty, format='mixed', errors='coerce')
+            except (TypeError, ValueError):
+                parsed = non_empty.map(lambda v: pd.to_datetime(v, errors='coerce'))
+            result[parsed.index] = parsed
+
+    return result
+
+
+def is_date_column(column_name) -> bool:
+    """Check whether a column holds dates, based on its header."""
+    return 'date' in str(column_name).lower()
+
+
+class NormalizedSuiviData:
+    """
+    Typed date and duration columns of the global suivi sheets.
+
+    Columns are parsed on first access (or all at once with normalize_all)
+    and cached per (sheet, column). The source DataFrames are not modified,
+    so positional column access and exports keep working on the raw sheets.
+    """
+
+    def __init__(self, global_suivi_data: Dict[str, 'pd.DataFrame']):
+        """
+        Initialize the normalized view.
+
+        Args:
+            global_suivi_data: Sheets of the global suivi file keyed by sheet name
+        """
+        self.data = global_suivi_data or {}
+        self._dates = {}
+        self._minutes = {}
+        self._date_formats = {}
+        self._date_indexes = {}
+        self._rejected = {}
+
+    def _column(self, sheet_name: str, column):
+        """Get a raw column, or None if the sheet or column is missing."""
+        df = self.data.get(sheet_name)
+        if df is None or column not in df.columns:
+            return None
+        return df[column]
+
+    def dates(self, sheet_name: str, column, fallback: bool = False) -> Optional['pd.Series']:
+        """
+        Get a date column as datetime64.
+
+        Args:
+            sheet_name: Sheet name
+            column: Column name
+            fallback: Whether strings matching no known format get a free-form parse
+
+        Returns:
+            datetime64 Series aligned on the sheet (NaT for empty/invalid cells),
+            or None if the column doesn't exist
+        """
+        key = (sheet_name, column, fallback)
+        if key in self._dates:
+            return self._dates[key]
+
+        raw = self._column(sheet_name, column)
+        if raw is None:
+            return None
+
+        format_key = (sheet_name, column)
+        if format_key not in self._date_formats:
+            strings = raw[raw.map(lambda v: isinstance(v, str))]
+            self._date_formats[format_key] = infer_date_formats(strings)
+
+        parsed = parse_dates(raw, fallback=fallback, format_order=self._date_formats[format_key])
+        self._dates[key] = parsed
+        if not fallback:
+            self._record_rejected(sheet_name, column, raw, parsed)
+        return parsed
+
+    def date_index(self, sheet_name: str, column) -> Optional[DateRangeIndex]:
+        """
+        Get the rows of a date column sorted by day, for date range queries.
+
+        Args:
+            sheet_name: Sheet name
+            column: Column name
+
+        Returns:
+            DateRangeIndex of the column, or None if the column doesn't exist
+        """
+        key = (sheet_name, column)
+        if key not in self._date_indexes:
+            dates = self.dates(sheet_name, column)
+            if dates is None:
+                return None
+            self._date_indexes[key] = DateRangeIndex(dates)
+        return self._date_indexes[key]
+
+    def minutes(self, sheet_name: str, column) -> Optional['pd.Series']:
+        """
+        Get a duration column as float minutes.
+
+        Args:
+            sheet_name: Sheet name
+            column: Column name
+
+        Returns:
+            Float Series aligned on the sheet (NaN for empty/invalid cells),
+            or None if the column doesn't exist
+        """
+        key = (sheet_name, column)
+        if key in self._minutes:
+            return self._minutes[key]
+
+        raw = self._column(sheet_name, column)
+        if raw is None:
+            return None
+
+        parsed = parse_duration_minutes(raw)
+        self._minutes[key] = parsed
+        self._record_rejected(sheet_name, column, raw, parsed)
+        return parsed
+
+    def normalize_all(self) -> None:
+        """Parse every date and duration column of the loaded sheets."""
+        for sheet_name, df in self.data.items():
+            if df is None or df.empty:
+                continue
+            for column in df.columns:
+                if is_date_column(column):
+                    self.dates(sheet_name, column)
+                elif column in DURATION_COLUMNS:
+                    self.minutes(sheet_name, column)
+
+        rejected_total = sum(entry['count'] for entry in self._rejected.values())
+        logger.info(f"Normalized {len(self._dates)} date and {len(self._minutes)} duration columns "
+                    f"({rejected_total} rejected values)")
+
+    def _record_rejected(self, sheet_name: str, column, raw, parsed) -> None:
+        """Keep track of non-empty values that could not be parsed."""
+        non_empty = raw.notna() & (raw.astype(str).str.strip() != '')
+        rejected = raw[non_empty & parsed.isna()]
+        if rejected.empty:
+            self._rejected.pop((sheet_name, column), None)
+            return
+
+        self._rejected[(sheet_name, column)] = {
+            'count': len(rejected),
+            'samples': [str(value) for value in rejected.head(REJECTED_SAMPLE_SIZE)],
+            'rows': [int(index) + 2 if isinstance(index, numbers.Integral) else index  # Excel row numbers
+                     for index in rejected.index[:REJECTED_SAMPLE_SIZE]]
+        }
+
+    def get_rejected_report(self) -> Dict[Tuple[str, Any], Dict[str, Any]]:
+        """
+        Get the values that could not be parsed.
+
+        Returns:
+            Dictionary keyed by (sheet, column) with 'count', 'samples' and 'rows'
+        """
+        return dict(self._rejected)
+
+    def get_date_formats(self, sheet_name: str, column) -> List[str]:
+        """
+        Get the formats inferred for a date column, most frequent first.
+
+        Args:
+            sheet_name: Sheet name
+            column: Column name
+
+        Returns:
+            List of strptime formats (empty if the column has no string dates)
+        """
+        return list(self._date_formats.get((sheet_name, column), []))
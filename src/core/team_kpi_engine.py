@@ -0,0 +1,262 @@
+"""
+Team KPI engine module.
+Computes the per-collaborator statistics of the Team Statistics dashboard
+with column operations instead of per-collaborator filtering and iterrows.
+"""
+
+import logging
+from datetime import datetime, date
+from typing import Optional, Dict, Any
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from core.suivi_normalizer import NormalizedSuiviData, parse_duration_minutes
+
+logger = logging.getLogger(__name__)
+
+# Position of the CM treatment date column in 'Traitement CMS Adr' (column G, after Motif Voie)
+CM_DATE_COLUMN_INDEX = 6
+
+
+def find_status_column(df, strict: bool = False) -> Optional[str]:
+    """
+    Find the 'Etat Ticket PA' column, handling name variations.
+
+    Args:
+        df: Suivi Tickets DataFrame
+        strict: Only accept 'etat ticket pa' (no generic etat/statut/status fallback)
+
+    Returns:
+        Column name or None
+    """
+    for col in df.columns:
+        if 'etat ticket pa' in str(col).lower().strip():
+            return col
+
+    if not strict:
+        for col in df.columns:
+            if any(keyword in str(col).lower() for keyword in ['etat', 'statut', 'status']):
+                return col
+
+    return None
+
+
+class TeamKpiEngine:
+    """Computes collaborator KPIs (DMT, CTJ PA/CM, durations) for all collaborators at once."""
+
+    def __init__(self, global_suivi_data: Dict[str, 'pd.DataFrame'], today: Optional[date] = None,
+                 normalized: Optional[NormalizedSuiviData] = None):
+        """
+        Initialize the KPI engine.
+
+        Args:
+            global_suivi_data: Sheets of the global suivi file keyed by sheet name
+            today: Reference day for CTJ (defaults to the current date)
+            normalized: Normalized date/duration columns of the same sheets
+        """
+        self.data = global_suivi_data or {}
+        self.today = today or datetime.now().date()
+        self.normalized = normalized or NormalizedSuiviData(self.data)
+
+    def _sheet(self, sheet_name: str):
+        """Get a sheet, or None if missing/empty."""
+        df = self.data.get(sheet_name)
+        if df is None or df.empty:
+            return None
+        return df
+
+    def compute_collaborator_stats(self) -> Dict[Any, Dict[str, Any]]:
+        """
+        Compute the collaborator statistics of the Team Statistics module.
+
+        Returns:
+            Dictionary keyed by collaborator, with the same fields the module
+            has always exposed (tickets_count, dmt, ctj_today, cms_duration...)
+        """
+        pd = get_pandas()
+
+        df_tickets = self._sheet('Suivi Tickets')
+        if df_tickets is None or 'Collaborateur' not in df_tickets.columns:
+            return {}
+
+        collab_column = df_tickets['Collaborateur']
+        collaborators = collab_column.dropna().unique()
+
+        tickets_count = collab_column.value_counts()
+
+        if 'Nom Commune' in df_tickets.columns:
+            communes_by_collab = df_tickets.dropna(subset=['Collaborateur', 'Nom Commune']) \
+                .groupby('Collaborateur', sort=False)['Nom Commune'].agg(lambda s: set(s.unique()))
+        else:
+            communes_by_collab = pd.Series(dtype=object)
+
+        dmt_by_collab = self._compute_dmt(df_tickets)
+        ctj_pa_by_collab = self._compute_ctj_pa()
+        ctj_cm_by_collab = self._compute_ctj_cm()
+
+        collaborator_stats = {}
+        for collaborator in collaborators:
+            communes = communes_by_collab.get(collaborator, set())
+            dmt = float(dmt_by_collab.get(collaborator, 0))
+            ctj_today = int(ctj_pa_by_collab.get(collaborator, 0))
+
+            collaborator_stats[collaborator] = {
+                'tickets_count': int(tickets_count.get(collaborator, 0)),
+                'cms_records': 0,
+                'pa_records': 0,
+                'cms_duration': 0,
+                'pa_duration': 0,
+                'avg_cms_duration': 0,
+                'avg_pa_duration': 0,
+                'avg_finale_duration': dmt,  # This is now the DMT
+                'communes': communes,
+                'commune_count': len(communes),
+                'dmt': dmt,  # DMT - Average Treatment Duration
+                'ctj_today': ctj_today,  # CTJ PA - Daily Treatment Capacity for today (PA)
+                'ctj_cm_today': int(ctj_cm_by_collab.get(collaborator, 0)),  # CTJ CM for today
+                'elements_today': ctj_today  # Elements processed today (same as CTJ for now)
+            }
+
+        self._add_sheet_durations(collaborator_stats, 'Traitement CMS Adr', 'cms_records', 'cms_duration', 'avg_cms_duration')
+        self._add_sheet_durations(collaborator_stats, 'Traitement PA', 'pa_records', 'pa_duration', 'avg_pa_duration')
+
+        logger.info(f"KPI engine computed statistics for {len(collaborator_stats)} collaborators")
+        return collaborator_stats
+
+    def _compute_dmt(self, df_tickets) -> 'pd.Series':
+        """DMT per collaborator: mean 'Durée Finale' over tickets with status 'Traité'."""
+        pd = get_pandas()
+
+        status_column = find_status_column(df_tickets)
+        if status_column is None or 'Durée Finale' not in df_tickets.columns:
+            logger.warning(f"Status column or Durée Finale not found. Available columns: {list(df_tickets.columns)}")
+            return pd.Series(dtype=float)
+
+        treated = df_tickets[df_tickets[status_column].astype(str).str.strip() == 'Traité']
+        if treated.empty:
+            return pd.Series(dtype=float)
+
+        durations = self.normalized.minutes('Suivi Tickets', 'Durée Finale')[treated.index].fillna(0)
+        grouped = durations.groupby(treated['Collaborateur'], sort=False)
+        return grouped.sum() / grouped.size()
+
+    def _compute_ctj_pa(self) -> 'pd.Series':
+        """CTJ PA per collaborator: PA lines treated today with a positive duration."""
+        pd = get_pandas()
+
+        df_pa = self._sheet('Traitement PA')
+        if df_pa is None or 'Collaborateur' not in df_pa.columns or 'Date traitement' not in df_pa.columns:
+            return pd.Series(dtype=int)
+
+        if 'Durée' in df_pa.columns:
+            durations = pd.to_numeric(
+                df_pa['Durée'].astype(str).str.replace(',', '.', regex=False), errors='coerce'
+            )
+        else:
+            durations = pd.Series(float('nan'), index=df_pa.index)
+
+        dates = self.normalized.dates('Traitement PA', 'Date traitement')
+        mask = (durations > 0) & (dates.dt.date == self.today)
+
+        return df_pa.loc[mask, 'Collaborateur'].value_counts()
+
+    def _compute_ctj_cm(self) -> 'pd.Series':
+        """CTJ CM per collaborator: CM lines whose treatment date (column G) is today."""
+        pd = get_pandas()
+
+        df_cms = self._sheet('Traitement CMS Adr')
+        if df_cms is None or 'Collaborateur' not in df_cms.columns:
+            return pd.Series(dtype=int)
+
+        if len(df_cms.columns) <= CM_DATE_COLUMN_INDEX:
+            logger.warning(f"CTJ CM: Not enough columns in Traitement CMS Adr sheet "
+                           f"(found {len(df_cms.columns)}, need at least {CM_DATE_COLUMN_INDEX + 1})")
+            return pd.Series(dtype=int)
+
+        dates = self.normalized.dates('Traitement CMS Adr', df_cms.columns[CM_DATE_COLUMN_INDEX])
+        mask = dates.dt.date == self.today
+
+        return df_cms.loc[mask, 'Collaborateur'].value_counts()
+
+    def _add_sheet_durations(self, collaborator_stats, sheet_name, records_key, duration_key, avg_key):
+        """Add record counts, duration totals and per-commune averages from a treatment sheet."""
+        df = self._sheet(sheet_name)
+        if df is None or 'Collaborateur' not in df.columns:
+            return
+
+        known = df['Collaborateur'].isin(list(collaborator_stats.keys()))
+        df = df[known]
+        if df.empty:
+            return
+
+        counts = df['Collaborateur'].value_counts()
+        durations = None
+        if 'Durée' in df.columns:
+            minutes = self.normalized.minutes(sheet_name, 'Durée')[df.index]
+            durations = minutes.fillna(0).groupby(df['Collaborateur'], sort=False).sum()
+
+        for collaborator, count in counts.items():
+            stats = collaborator_stats[collaborator]
+            stats[records_key] = int(count)
+            if durations is not None:
+                duration_sum = float(durations.get(collaborator, 0))
+                stats[duration_key] = duration_sum
+                if stats['commune_count'] > 0:
+                    stats[avg_key] = duration_sum / stats['commune_count']
+
+    def compute_commune_status(self, reference: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Count communes treated in the current month and the other ticket statuses.
+
+        Args:
+            reference: Reference date for the current month (defaults to now)
+
+        Returns:
+            Dictionary with 'communes_traitees_mois_courant' and
+            'communes_autres_statuts', or None if the status column is missing
+        """
+        pd = get_pandas()
+
+        df_tickets = self._sheet('Suivi Tickets')
+        if df_tickets is None:
+            return None
+
+        status_column = find_status_column(df_tickets, strict=True)
+        if status_column is None:
+            return None
+
+        reference = reference or datetime.now()
+        status = df_tickets[status_column]
+        valid = status.notna() & (status.astype(str) != '')
+        status = status[valid].astype(str)
+
+        treated_this_month = 0
+        treated_mask = status == 'Traité'
+        if 'Date Livraison' in df_tickets.columns:
+            delivery = df_tickets.loc[status.index, 'Date Livraison']
+            treated_mask = treated_mask & delivery.notna()
+            dates = self.normalized.dates('Suivi Tickets', 'Date Livraison', fallback=True)[treated_mask[treated_mask].index]
+            treated_this_month = int(((dates.dt.month == reference.month) & (dates.dt.year == reference.year)).sum())
+        else:
+            treated_mask = pd.Series(False, index=status.index)
+
+        stripped = status[~treated_mask].str.strip()
+        other_statuses = stripped[stripped != 'Traité'].value_counts(sort=False)
+
+        return {
+            'communes_traitees_mois_courant': treated_this_month,
+            'communes_autres_statuts': {key: int(value) for key, value in other_statuses.items()}
+        }
+
+
+def calculate_duration_sum(series) -> float:
+    """Sum a duration column in minutes, ignoring unparseable values."""
+    if series is None or len(series) == 0:
+        return 0
+    return float(parse_duration_minutes(series).fillna(0).sum())
@@ -0,0 +1,138 @@
+"""
+Workbook reading module.
+Loads several sheets of one Excel workbook in a single pass instead of
+re-opening and decompressing the same file once per pd.read_excel call.
+"""
+
+import os
+import logging
+from typing import Optional, Dict, Any, List, Union
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from core.sheet_cache import get_sheet_cache
+from utils.performance import timed_operation
+
+
+SheetKey = Union[str, int]
+
+
+class WorkbookReader:
+    """Reads multiple sheets from one workbook with a single file open."""
+
+    def __init__(self, file_path: str, engine: Optional[str] = None, use_cache: bool = True):
+        """
+        Initialize the workbook reader.
+
+        Args:
+            file_path: Path to the Excel workbook
+            engine: pandas Excel engine (defaults to the fastest available one)
+            use_cache: Whether to go through the persistent sheet cache
+        """
+        self.logger = logging.getLogger(__name__)
+        self.file_path = file_path
+        self.engine = engine or self.get_default_engine()
+        self.use_cache = use_cache
+
+    @staticmethod
+    def get_default_engine() -> str:
+        """
+        Get the fastest available Excel engine.
+
+        Returns:
+            'calamine' when python-calamine is installed, 'openpyxl' otherwise
+        """
+        try:
+            import python_calamine  # noqa: F401
+            pd = get_pandas()
+            major, minor = (int(part) for part in pd.__version__.split('.')[:2])
+            if (major, minor) >= (2, 2):
+                return 'calamine'
+        except Exception:
+            pass
+        return 'openpyxl'
+
+    @timed_operation('workbook.read', threshold=2.0)
+    def read_sheets(self,
+                    sheet_names: List[SheetKey],
+                    dtype: Optional[Dict[str, Any]] = None,
+                    warn_missing: bool = True,
+                    **read_kwargs) -> Dict[SheetKey, 'pd.DataFrame']:
+        """
+        Read the requested sheets in one pass over the workbook.
+
+        Args:
+            sheet_names: Sheet names or indexes to read
+            dtype: Column dtype overrides applied to every sheet (e.g. {'Code INSEE': str})
+            warn_missing: Log missing sheets as warnings (debug level otherwise)
+            **read_kwargs: Additional parse arguments (date_format, usecols, ...)
+
+        Returns:
+            Dictionary mapping each found sheet to its DataFrame. Sheets that
+            do not exist or fail to parse are left out and logged.
+
+        Raises:
+            FileNotFoundError: If the workbook doesn't exist
+        """
+        if not os.path.exists(self.file_path):
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+
+        pd = get_pandas()
+        if dtype is not None:
+            read_kwargs['dtype'] = dtype
+
+        sheet_cache = get_sheet_cache() if self.use_cache else None
+        sheets = {}
+        pending = []
+
+        # Serve what we can from the persistent cache before opening the file
+        for sheet_name in sheet_names:
+            df = sheet_cache.lookup(self.file_path, sheet_name, engine=self.engine, **read_kwargs) if sheet_cache else None
+            if df is not None:
+                sheets[sheet_name] = df
+            else:
+                pending.append(sheet_name)
+
+        if not pending:
+            return sheets
+
+        log_missing = self.logger.warning if warn_missing else self.logger.debug
+        source_stat = sheet_cache.get_source_stat(self.file_path) if sheet_cache else None
+
+        with pd.ExcelFile(self.file_path, engine=self.engine) as workbook:
+            available = workbook.sheet_names
+            for sheet_name in pending:
+                if isinstance(sheet_name, str) and sheet_name not in available:
+                    log_missing(f"Sheet '{sheet_name}' not found in {os.path.basename(self.file_path)}")
+                    continue
+                if isinstance(sheet_name, int) and sheet_name >= len(available):
+                    log_missing(f"Sheet index {sheet_name} not found in {os.path.basename(self.file_path)}")
+                    continue
+
+                try:
+                    df = workbook.parse(sheet_name=sheet_name, **read_kwargs)
+                except Exception as e:
+                    self.logger.warning(f"Could not load sheet '{sheet_name}': {e}")
+                    continue
+
+                sheets[sheet_name] = df
+                if sheet_cache:
+                    sheet_cache.store(self.file_path, sheet_name, df, source_stat=source_stat, engine=self.engine,
+                                      **read_kwargs)
+                self.logger.info(f"Loaded sheet '{sheet_name}' with {len(df)} rows")
+
+        return sheets
+
+
+def read_workbook_sheets(file_path: str,
+                         sheet_names: List[SheetKey],
+                         dtype: Optional[Dict[str, Any]] = None,
+                         **read_kwargs) -> Dict[SheetKey, 'pd.DataFrame']:
+    """Read several sheets of a workbook in one pass (see WorkbookReader.read_sheets)."""
+    return WorkbookReader(file_path).read_sheets(sheet_names, dtype=dtype, **read_kwargs)
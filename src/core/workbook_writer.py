@@ -0,0 +1,230 @@
+"""
+Workbook writing module.
+Streams DataFrames into an Excel workbook with openpyxl write-only mode,
+applying header styles, number formats and column widths from column
+metadata as the rows are written instead of re-visiting every cell afterwards.
+"""
+
+import os
+import logging
+import tempfile
+from typing import Optional, Dict, Any, Iterable
+import sys
+from pathlib import Path
+
+# Ensure src directory is in path
+src_path = Path(__file__).parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from utils.lazy_imports import get_pandas
+from utils.performance import timed_operation
+
+# Header style shared by the generated workbooks (bleu froid, white bold text)
+HEADER_FILL_COLOR = '4472C4'
+HEADER_FONT_COLOR = 'FFFFFF'
+
+
+def get_column_letter(col_num: int) -> str:
+    """Convert a 1-based column number to an Excel column letter."""
+    result = ""
+    while col_num > 0:
+        col_num -= 1
+        result = chr(col_num % 26 + ord('A')) + result
+        col_num //= 26
+    return result
+
+
+def estimate_column_width(values, header, padding: int = 2, max_width: Optional[int] = None) -> int:
+    """
+    Estimate the width of a column from its longest value.
+
+    Args:
+        values: Column values (empty cells are ignored)
+        header: Column header
+        padding: Characters added to the longest value
+        max_width: Upper bound of the width
+
+    Returns:
+        Column width in characters
+    """
+    pd = get_pandas()
+
+    series = pd.Series(values, dtype=object)
+    series = series[series.notna()]
+    longest = len(str(header)) if header is not None else 0
+    if not series.empty:
+        longest = max(longest, int(series.astype(str).str.len().max()))
+
+    width = longest + padding
+    return min(width, max_width) if max_width else width
+
+
+class ColumnFormat:
+    """Output format of one column, applied while its cells are streamed."""
+
+    def __init__(self, number_format: Optional[str] = None, empty_number_format: Optional[str] = None,
+                 header_number_format: Optional[str] = None, width: Optional[float] = None):
+        """
+        Initialize the column format.
+
+        Args:
+            number_format: Number format of the data cells holding a value ('@', 'YYYY-MM-DD'...)
+            empty_number_format: Number format of the empty data cells (e.g. '@' so that
+                values typed in later stay text)
+            header_number_format: Number format of the header cell
+            width: Column width in characters
+        """
+        self.number_format = number_format
+        self.empty_number_format = empty_number_format
+        self.header_number_format = header_number_format
+        self.width = width
+
+
+class StreamingWorkbookWriter:
+    """
+    Writes a workbook sheet by sheet in openpyxl write-only mode.
+
+    Rows are serialized as they are appended, so memory stays flat whatever
+    the sheet size. The file is written next to the target and moved into
+    place on save, so a failed write never leaves a truncated workbook.
+    """
+
+    def __init__(self, file_path: str, center_cells: bool = True, freeze_header: bool = True):
+        """
+        Initialize the writer.
+
+        Args:
+            file_path: Path of the workbook to write
+            center_cells: Whether cells holding a value are centered
+            freeze_header: Whether the header row is frozen
+        """
+        from openpyxl import Workbook
+        from openpyxl.styles import Alignment, PatternFill, Font, Border, Side
+
+        self.logger = logging.getLogger(__name__)
+        self.file_path = file_path
+        self.center_cells = center_cells
+        self.freeze_header = freeze_header
+        self.workbook = Workbook(write_only=True)
+
+        self.header_fill = PatternFill(start_color=HEADER_FILL_COLOR, end_color=HEADER_FILL_COLOR, fill_type='solid')
+        self.header_font = Font(color=HEADER_FONT_COLOR, bold=True)
+        thin = Side(style='thin')
+        self.header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        self.center_alignment = Alignment(horizontal='center', vertical='center')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.save()
+        return False
+
+    def write_sheet(self, sheet_name: str, df: 'pd.DataFrame',
+                    column_formats: Optional[Dict[Any, ColumnFormat]] = None):
+        """
+        Stream a DataFrame into a new sheet (header row + one row per record).
+
+        Args:
+            sheet_name: Name of the sheet
+            df: Data to write (index not written)
+            column_formats: Formats keyed by column name
+
+        Returns:
+            The write-only worksheet (for data validations)
+        """
+        from openpyxl.cell import WriteOnlyCell
+
+        column_formats = column_formats or {}
+        ws = self.workbook.create_sheet(title=sheet_name)
+
+        columns = list(df.columns)
+        formats = [column_formats.get(col) for col in columns]
+
+        # Widths and freeze panes must be set before the first row is written
+        for position, column_format in enumerate(formats, start=1):
+            if column_format is not None and column_format.width:
+                ws.column_dimensions[get_column_letter(position)].width = column_format.width
+        if self.freeze_header:
+            ws.freeze_panes = 'A2'
+
+        header = []
+        for col, column_format in zip(columns, formats):
+            cell = WriteOnlyCell(ws, value=col)
+            cell.fill = self.header_fill
+            cell.font = self.header_font
+            cell.border = self.header_border
+            cell.alignment = self.center_alignment
+            if column_format is not None and column_format.header_number_format:
+                cell.number_format = column_format.header_number_format
+            header.append(cell)
+        ws.append(header)
+
+        # One styled cell per column is reused for every row: write-only rows are
+        # serialized on append, so only the value changes from one row to the next.
+        # Empty cells (NaN/NaT/None/'') are written blank, with their column's empty number format.
+        value_cells = []
+        empty_cells = []
+        for column_format in formats:
+            cell = WriteOnlyCell(ws)
+            if self.center_cells:
+                cell.alignment = self.center_alignment
+            if column_format is not None and column_format.number_format:
+                cell.number_format = column_format.number_format
+            value_cells.append(cell if cell.has_style else None)
+
+            empty_cell = None
+            if column_format is not None and column_format.empty_number_format:
+                empty_cell = WriteOnlyCell(ws)
+                empty_cell.number_format = column_format.empty_number_format
+            empty_cells.append(empty_cell)
+
+        values = df.astype(object).where(df.notna(), None)
+        for record in values.itertuples(index=False, name=None):
+            row = []
+            for value, value_cell, empty_cell in zip(record, value_cells, empty_cells):
+                if value is None or (isinstance(value, str) and value == ''):
+                    row.append(empty_cell)
+                elif value_cell is None:
+                    row.append(value)
+                else:
+                    value_cell.value = value
+                    row.append(value_cell)
+            ws.append(row)
+
+        self.logger.info(f"Streamed sheet '{sheet_name}': {len(df)} rows, {len(columns)} columns")
+        return ws
+
+    def write_rows(self, sheet_name: str, rows: Iterable[Iterable[Any]]):
+        """
+        Stream raw rows (e.g. values of a sheet carried over from a previous file).
+
+        Args:
+            sheet_name: Name of the sheet
+            rows: Row values
+
+        Returns:
+            The write-only worksheet
+        """
+        ws = self.workbook.create_sheet(title=sheet_name)
+        for row in rows:
+            ws.append(list(row))
+        return ws
+
+    @timed_operation('workbook.write', threshold=5.0)
+    def save(self) -> None:
+        """Write the workbook to its final path."""
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, temp_path = tempfile.mkstemp(suffix='.xlsx', prefix='.~', dir=directory)
+        os.close(fd)
+        try:
+            self.workbook.save(temp_path)
+            os.replace(temp_path, self.file_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.logger.info(f"Workbook written: {self.file_path}")
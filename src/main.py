@@ -6,6 +6,7 @@ Système de contrôle qualité développé par Sofrecom
 
 import sys
 import os
+import multiprocessing
 import tkinter as tk
 from pathlib import Path
 
@@ -93,4 +94,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Required for worker process pools in the frozen (PyInstaller) executable
+    multiprocessing.freeze_support()
     main()
@@ -7,6 +7,8 @@ This package contains reusable UI components:
 - generation: Generation section
 - header_footer: Header and footer components
 - password_dialog: Password dialog for secure access
+- performance_panel: Performance telemetry window
+- virtual_treeview: Treeview materializing only the visible rows
 """
 
 from .file_import import FileImportSection
@@ -14,6 +16,8 @@ from .project_info import ProjectInfoSection
 from .generation import GenerationSection
 from .header_footer import HeaderSection, FooterSection
 from .password_dialog import PasswordDialog, show_password_dialog
+from .performance_panel import PerformancePanel, show_performance_panel
+from .virtual_treeview import VirtualTreeview
 
 __all__ = [
     'FileImportSection',
@@ -22,5 +26,8 @@ __all__ = [
     'HeaderSection',
     'FooterSection',
     'PasswordDialog',
-    'show_password_dialog'
+    'show_password_dialog',
+    'PerformancePanel',
+    'show_performance_panel',
+    'VirtualTreeview'
 ]
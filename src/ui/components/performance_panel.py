@@ -0,0 +1,202 @@
+"""
+Performance panel component.
+Shows the operation timings, counters and memory collected by the performance monitor.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+import logging
+from typing import Optional
+
+from config.constants import COLORS, UIConfig
+from utils.performance import performance_monitor, get_process_memory_mb
+
+logger = logging.getLogger(__name__)
+
+# Auto-refresh interval of the open panel (ms)
+REFRESH_INTERVAL_MS = 2000
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    """Format a duration for the table ('-' when unknown)."""
+    if value is None:
+        return "-"
+    if value < 1:
+        return f"{value * 1000:.0f} ms"
+    return f"{value:.2f} s"
+
+
+def _format_megabytes(value: Optional[float]) -> str:
+    """Format a memory size for the table ('-' when unknown)."""
+    return "-" if value is None else f"{value:.0f} Mo"
+
+
+class PerformancePanel:
+    """Window listing the performance telemetry of the session."""
+
+    COLUMNS = [
+        ('operation', "Opération", 220, tk.W),
+        ('count', "Appels", 60, tk.CENTER),
+        ('errors', "Erreurs", 60, tk.CENTER),
+        ('average', "Moy.", 80, tk.E),
+        ('p50', "p50", 80, tk.E),
+        ('p95', "p95", 80, tk.E),
+        ('p99', "p99", 80, tk.E),
+        ('max', "Max", 80, tk.E),
+        ('memory', "Mémoire", 90, tk.E)
+    ]
+
+    def __init__(self, parent: tk.Widget):
+        """
+        Initialize the performance panel.
+
+        Args:
+            parent: Parent window
+        """
+        self.parent = parent
+        self.window = None
+        self.tree = None
+        self.counters_label = None
+        self.memory_label = None
+        self._refresh_job = None
+        self.logger = logging.getLogger(__name__)
+
+    def show(self):
+        """Show the panel (brought to the front if already open)."""
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            self.window.focus_force()
+            return
+
+        self._create_window()
+        self.refresh()
+
+    def _create_window(self):
+        """Create the panel UI."""
+        self.window = tk.Toplevel(self.parent)
+        self.window.title("Performance")
+        self.window.geometry("900x480")
+        self.window.configure(bg=COLORS['BG'])
+        self.window.transient(self.parent)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        main_frame = tk.Frame(self.window, bg=COLORS['BG'])
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
+
+        tk.Label(
+            main_frame,
+            text="📈 Performance de la session",
+            font=UIConfig.FONT_SUBHEADER,
+            fg=COLORS['PRIMARY'],
+            bg=COLORS['BG']
+        ).pack(anchor=tk.W)
+
+        self.memory_label = tk.Label(main_frame, text="", font=UIConfig.FONT_SMALL,
+                                     fg=COLORS['INFO'], bg=COLORS['BG'])
+        self.memory_label.pack(anchor=tk.W, pady=(5, 10))
+
+        # Operations table
+        table_frame = tk.Frame(main_frame, bg=COLORS['BG'])
+        table_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(table_frame, columns=[column[0] for column in self.COLUMNS],
+                                 show='headings', height=12)
+        for name, heading, width, anchor in self.COLUMNS:
+            self.tree.heading(name, text=heading)
+            self.tree.column(name, width=width, anchor=anchor, stretch=(name == 'operation'))
+
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.counters_label = tk.Label(main_frame, text="", font=UIConfig.FONT_SMALL, fg=COLORS['TEXT_SECONDARY'],
+                                       bg=COLORS['BG'], justify=tk.LEFT, anchor=tk.W, wraplength=850)
+        self.counters_label.pack(fill=tk.X, pady=(10, 0))
+
+        # Buttons
+        button_frame = tk.Frame(main_frame, bg=COLORS['BG'])
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+
+        ttk.Button(button_frame, text="🔄 Actualiser", command=self.refresh,
+                   style='Secondary.TButton').pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="💾 Exporter JSON", command=self._export_json,
+                   style='Secondary.TButton').pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Button(button_frame, text="Fermer", command=self.close,
+                   style='Primary.TButton').pack(side=tk.RIGHT)
+
+    def refresh(self):
+        """Reload the telemetry into the panel and schedule the next refresh."""
+        if self.window is None or not self.window.winfo_exists():
+            return
+
+        try:
+            report = performance_monitor.get_report()
+
+            self.tree.delete(*self.tree.get_children())
+            for name, stats in report['operations'].items():
+                self.tree.insert('', tk.END, values=(
+                    name,
+                    stats['count'],
+                    stats['errors'],
+                    _format_seconds(stats['average']),
+                    _format_seconds(stats['p50']),
+                    _format_seconds(stats['p95']),
+                    _format_seconds(stats['p99']),
+                    _format_seconds(stats['max']),
+                    _format_megabytes(stats['memory_mb'])
+                ))
+
+            memory_text = f"Mémoire du processus: {_format_megabytes(get_process_memory_mb())}"
+            if report['memory_snapshots']:
+                last = report['memory_snapshots'][-1]
+                memory_text += f"  •  Dernier relevé ({last['label']}): {_format_megabytes(last['memory_mb'])}"
+            self.memory_label.config(text=memory_text)
+
+            counters = ", ".join(f"{name}: {value}" for name, value in report['counters'].items())
+            self.counters_label.config(text=f"Compteurs: {counters or 'aucun'}")
+
+        except Exception as e:
+            self.logger.error(f"Error refreshing performance panel: {e}")
+
+        if self._refresh_job is not None:
+            self.window.after_cancel(self._refresh_job)
+        self._refresh_job = self.window.after(REFRESH_INTERVAL_MS, self.refresh)
+
+    def _export_json(self):
+        """Write the telemetry dump and show its path."""
+        file_path = performance_monitor.dump_json()
+        if file_path:
+            messagebox.showinfo("Export réussi", f"Données de performance exportées:\n{file_path}",
+                                parent=self.window)
+        else:
+            messagebox.showerror("Erreur", "Impossible d'exporter les données de performance.",
+                                 parent=self.window)
+
+    def close(self):
+        """Close the panel."""
+        if self.window is not None:
+            if self._refresh_job is not None:
+                try:
+                    self.window.after_cancel(self._refresh_job)
+                except tk.TclError:
+                    pass
+                self._refresh_job = None
+            self.window.destroy()
+            self.window = None
+
+
+_panel: Optional[PerformancePanel] = None
+
+
+def show_performance_panel(parent: tk.Widget):
+    """
+    Show the performance panel, reusing the open one.
+
+    Args:
+        parent: Parent window
+    """
+    global _panel
+    if _panel is None or _panel.parent is not parent:
+        _panel = PerformancePanel(parent)
+    _panel.show()
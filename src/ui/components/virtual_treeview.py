@@ -0,0 +1,247 @@
+"""
+Virtual treeview component.
+Displays a large row set in a ttk.Treeview holding only the visible rows:
+a fixed pool of items is refilled from a row provider as the view scrolls,
+so the Tk cost does not depend on the number of rows.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+import logging
+from typing import Optional, Callable, List, Sequence
+
+# Rows formatted beyond each side of the visible window, reused by small scrolls
+DEFAULT_OVERSCAN_ROWS = 20
+
+# Fallbacks until the treeview has been drawn once
+DEFAULT_ROW_HEIGHT = 20
+DEFAULT_HEADING_HEIGHT = 25
+
+
+class VirtualTreeview(tk.Frame):
+    """
+    Treeview with scrollbars showing a window of a virtual row list.
+
+    Rows are given as a count plus a provider returning the display values of
+    rows [start, stop). The visible items are reused when scrolling; the data
+    row of an item is given by get_row_index, and the selection follows the
+    data row rather than the item.
+    """
+
+    def __init__(self, parent, columns: Sequence[str],
+                 row_provider: Optional[Callable[[int, int], List[Sequence]]] = None,
+                 overscan: int = DEFAULT_OVERSCAN_ROWS, **kwargs):
+        """
+        Initialize the virtual treeview.
+
+        Args:
+            parent: Parent widget
+            columns: Column identifiers of the treeview
+            row_provider: Callable(start, stop) returning the value tuples of rows [start, stop)
+            overscan: Rows fetched before and after the visible window
+            **kwargs: Additional frame options
+        """
+        super().__init__(parent, **kwargs)
+
+        self.logger = logging.getLogger(__name__)
+        self.row_provider = row_provider
+        self.overscan = overscan
+
+        self.row_count = 0
+        self.first_row = 0
+        self.selected_row = None
+        self._items = []  # pooled item ids, top to bottom
+        self._visible_rows = 1
+        self._cache_start = 0
+        self._cache_rows = []
+
+        self.tree = ttk.Treeview(self, columns=columns, show='headings')
+        self.v_scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.h_scrollbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(xscrollcommand=self.h_scrollbar.set)
+
+        self.tree.grid(row=0, column=0, sticky=tk.NSEW)
+        self.v_scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.h_scrollbar.grid(row=1, column=0, sticky=tk.EW)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<<TreeviewSelect>>', self._on_select, add='+')
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda event: self._scroll_by(-3))
+        self.tree.bind('<Button-5>', lambda event: self._scroll_by(3))
+        self.tree.bind('<Up>', lambda event: self._move_selection(-1))
+        self.tree.bind('<Down>', lambda event: self._move_selection(1))
+        self.tree.bind('<Prior>', lambda event: self._move_selection(-self._visible_rows))
+        self.tree.bind('<Next>', lambda event: self._move_selection(self._visible_rows))
+        self.tree.bind('<Home>', lambda event: self._move_selection(-self.row_count))
+        self.tree.bind('<End>', lambda event: self._move_selection(self.row_count))
+
+    def set_rows(self, row_count: int, row_provider: Optional[Callable[[int, int], List[Sequence]]] = None,
+                 keep_position: bool = False):
+        """
+        Show a new row set.
+
+        Args:
+            row_count: Number of rows
+            row_provider: New row provider (defaults to the current one)
+            keep_position: Keep the scroll position and selection (e.g. same rows reordered)
+        """
+        if row_provider is not None:
+            self.row_provider = row_provider
+        self.row_count = max(0, row_count)
+
+        if not keep_position:
+            self.first_row = 0
+            self.selected_row = None
+        elif self.selected_row is not None and self.selected_row >= self.row_count:
+            self.selected_row = None
+
+        self.refresh()
+
+    def refresh(self):
+        """Fetch the visible rows again from the provider and redraw them."""
+        self._cache_start = 0
+        self._cache_rows = []
+        self._render()
+
+    def get_row_index(self, item: str) -> Optional[int]:
+        """
+        Get the data row shown by a treeview item.
+
+        Args:
+            item: Item id (e.g. from identify_row or selection)
+
+        Returns:
+            Row index, or None if the item is not a displayed row
+        """
+        try:
+            position = self._items.index(item)
+        except ValueError:
+            return None
+        row = self.first_row + position
+        return row if row < self.row_count else None
+
+    def see(self, row: int):
+        """
+        Scroll so that a data row is visible.
+
+        Args:
+            row: Row index
+        """
+        if row < self.first_row:
+            self.first_row = row
+        elif row >= self.first_row + self._visible_rows:
+            self.first_row = row - self._visible_rows + 1
+        self._render()
+
+    def _get_rows(self, start: int, stop: int) -> List[Sequence]:
+        """Get the values of rows [start, stop), fetching the window plus overscan when not cached."""
+        cache_stop = self._cache_start + len(self._cache_rows)
+        if start < self._cache_start or stop > cache_stop:
+            self._cache_start = max(0, start - self.overscan)
+            fetch_stop = min(self.row_count, stop + self.overscan)
+            self._cache_rows = list(self.row_provider(self._cache_start, fetch_stop)) if self.row_provider else []
+        offset = start - self._cache_start
+        return self._cache_rows[offset:offset + stop - start]
+
+    def _render(self):
+        """Fill the item pool with the rows of the current window."""
+        try:
+            self.first_row = max(0, min(self.first_row, self.row_count - self._visible_rows))
+            stop = min(self.row_count, self.first_row + self._visible_rows)
+            rows = self._get_rows(self.first_row, stop) if stop > self.first_row else []
+
+            # Grow or shrink the pool to the number of rows shown
+            while len(self._items) < len(rows):
+                self._items.append(self.tree.insert('', tk.END, values=()))
+            if len(self._items) > len(rows):
+                self.tree.delete(*self._items[len(rows):])
+                del self._items[len(rows):]
+
+            for item, values in zip(self._items, rows):
+                self.tree.item(item, values=tuple(values))
+
+            if self.selected_row is not None and self.first_row <= self.selected_row < stop:
+                item = self._items[self.selected_row - self.first_row]
+                if self.tree.selection() != (item,):
+                    self.tree.selection_set(item)
+                self.tree.focus(item)
+            elif self.tree.selection():
+                self.tree.selection_remove(*self.tree.selection())
+
+            self._update_scrollbar()
+
+        except tk.TclError as e:
+            self.logger.debug(f"Virtual treeview render skipped: {e}")
+
+    def _update_scrollbar(self):
+        """Set the scrollbar slider to the visible window."""
+        if self.row_count:
+            self.v_scrollbar.set(self.first_row / self.row_count,
+                                 min(1.0, (self.first_row + self._visible_rows) / self.row_count))
+        else:
+            self.v_scrollbar.set(0.0, 1.0)
+
+    def _measure_visible_rows(self) -> int:
+        """Get the number of rows that fit in the treeview."""
+        row_height = DEFAULT_ROW_HEIGHT
+        heading_height = DEFAULT_HEADING_HEIGHT
+        try:
+            style_height = ttk.Style().lookup(self.tree.cget('style') or 'Treeview', 'rowheight')
+            if style_height:
+                row_height = int(style_height)
+            if self._items:
+                bbox = self.tree.bbox(self._items[0])
+                if bbox:
+                    heading_height, row_height = bbox[1], bbox[3]
+        except (tk.TclError, ValueError):
+            pass
+        return max(1, (self.tree.winfo_height() - heading_height) // max(1, row_height))
+
+    def _on_configure(self, event=None):
+        """Adapt the pool size to the treeview height."""
+        visible_rows = self._measure_visible_rows()
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._render()
+
+    def _on_scrollbar(self, *args):
+        """Handle the vertical scrollbar commands (moveto / scroll units|pages)."""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self.first_row = int(float(args[1]) * self.row_count)
+            self._render()
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            self._scroll_by(amount * self._visible_rows if args[2] == 'pages' else amount)
+
+    def _scroll_by(self, rows: int):
+        """Scroll the window by a number of rows."""
+        self.first_row += rows
+        self._render()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch."""
+        notches = -int(event.delta / 120) if abs(event.delta) >= 120 else (-1 if event.delta > 0 else 1)
+        return self._scroll_by(notches * 3)
+
+    def _on_select(self, event=None):
+        """Remember the data row of the selected item."""
+        selection = self.tree.selection()
+        if selection:
+            row = self.get_row_index(selection[0])
+            if row is not None:
+                self.selected_row = row
+
+    def _move_selection(self, rows: int):
+        """Move the selection with the keyboard, scrolling past the window edges."""
+        if not self.row_count:
+            return "break"
+        current = self.selected_row if self.selected_row is not None else self.first_row - (1 if rows > 0 else 0)
+        self.selected_row = max(0, min(self.row_count - 1, current + rows))
+        self.see(self.selected_row)
+        return "break"
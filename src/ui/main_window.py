@@ -20,6 +20,7 @@ if str(src_path) not in sys.path:
 from config.constants import COLORS, UIConfig
 from utils.file_utils import get_icon_path
 from utils.lazy_imports import get_PIL
+from utils.performance import async_task_manager, performance_monitor
 from .styles import StyleManager
 from .responsive_utils import get_responsive_manager
 from .navigation import NavigationManager, NavigationState
@@ -28,6 +29,7 @@ from .settings_screen import SettingsScreen
 from .modules import SuiviGeneratorModule, SuiviGlobalModule, TeamStatsModule, DataViewerModule, QualityControlModule
 from core.update_manager import UpdateManager, UpdateScheduler
 from ui.components.update_dialog import UpdateNotification
+from ui.components.performance_panel import show_performance_panel
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,12 @@ class MainWindow:
         # UI components
         self.style_manager = None
 
+        # Background task callbacks are delivered on the Tk thread
+        async_task_manager.attach_tk(root)
+
+        # Performance telemetry written to the logs folder during the session
+        performance_monitor.start_periodic_dump()
+
         # Update system
         self.update_manager = UpdateManager()
         self.update_scheduler = UpdateScheduler(self.update_manager)
@@ -79,6 +87,7 @@ class MainWindow:
 
         # Bind window resize events for responsive updates
         self.root.bind('<Configure>', self._on_window_configure)
+        self.root.bind('<Control-Shift-P>', lambda event: show_performance_panel(self.root))
 
         # Lancer en plein écran (maximisé) - improved state management
         try:
@@ -135,14 +144,16 @@ class MainWindow:
             NavigationState.TEAM_STATS,
             TeamStatsModule,
             "Statistiques Équipe",
-            "Tableau de bord des performances de l'équipe"
+            "Tableau de bord des performances de l'équipe",
+            keep_alive=True
         )
 
         self.navigation_manager.register_module(
             NavigationState.DATA_VIEWER,
             DataViewerModule,
             "Visualiseur de Données",
-            "Visualisation des données global tickets"
+            "Visualisation des données global tickets",
+            keep_alive=True
         )
 
         self.navigation_manager.register_module(
@@ -160,18 +160,24 @@ except ImportError:
     Calendar = None
 
 from config.constants import COLORS, UIConfig, TeamsConfig
-from utils.file_utils import get_icon_path
+from utils.file_utils import get_icon_path, FileChangeTracker
 from utils.lazy_imports import get_pandas
-from utils.performance import run_async_task
+from utils.performance import (run_async_task, cancel_async_task, current_cancellation_token, timed_operation,
+                               PRIORITY_HIGH)
 
 from ui.styles import StyleManager, create_card_frame, create_section_header
 from ui.keyboard_shortcuts import KeyboardShortcutManager
+from ui.components.virtual_treeview import VirtualTreeview
+from core.data_viewer_index import DataViewerIndex
 
 logger = logging.getLogger(__name__)
 
 
 class DataViewerModule:
     """Data Viewer module for visualizing global tickets data."""
+
+    # Table columns, in display order
+    DISPLAY_COLUMNS = ('A', 'B', 'C', 'D', 'E', 'F', 'I', 'O', 'N', 'P', 'U')
     
     def __init__(self, parent, navigation_manager=None):
         """
@@ -187,15 +193,26 @@ class DataViewerModule:
         
         # Module data
         self.data_df = None
-        self.filtered_data = None
+        self.view_index = None  # display strings and filter indexes of data_df
+        self.filtered_rows = None  # positions in data_df of the rows shown, in display order
+        self._unsorted_rows = None  # rows of the current filters, in sheet order
+        self._sort_keys = []  # (column, reverse) of the clicked columns, last clicked first
+        self._sort_cache = {}  # sort keys -> sorted rows of the current filters
+
+        # Filter pipeline: debounced search fields, only the latest query is displayed
+        self._filter_job = None
+        self._filter_task_id = None
+        self._filter_generation = 0
         self.global_excel_path = None
         
         # Get Teams path
         self.teams_folder_path = TeamsConfig.get_global_teams_path()
         self.global_excel_filename = "Suivis Global Tickets CMS Adr_PA.xlsx"
+        self.global_file_tracker = FileChangeTracker(os.path.join(self.teams_folder_path, self.global_excel_filename))
         
         # UI components
         self.main_frame = None
+        self.virtual_tree = None
         self.tree = None
         self.filter_frame = None
         self.commune_search_var = None  # Added Commune search variable
@@ -532,12 +549,8 @@ class DataViewerModule:
         )
         table_header_label.pack(side=tk.LEFT)
 
-        # Treeview container - Ultra minimal
-        tree_container = tk.Frame(table_frame, bg=COLORS['CARD'])
-        tree_container.pack(fill=tk.BOTH, expand=True, padx=3, pady=(0, 3))  # Ultra minimal padding
-        
         # Define columns (A, B, C, D, E, F, I, O, N, P, U) - Added columns E and F, swapped N and O positions
-        columns = ('A', 'B', 'C', 'D', 'E', 'F', 'I', 'O', 'N', 'P', 'U')
+        columns = self.DISPLAY_COLUMNS
         column_names = {
             'A': '🏘️ Commune',
             'B': '🆔 ID Tâche',
@@ -552,8 +565,11 @@ class DataViewerModule:
             'U': '👤 Collaborateur'
         }
         
-        # Create Treeview
-        self.tree = ttk.Treeview(tree_container, columns=columns, show='headings', height=15)
+        # Virtual treeview: only the visible rows of the filtered data are materialized
+        self.virtual_tree = VirtualTreeview(table_frame, columns=columns, row_provider=self._get_display_rows,
+                                            bg=COLORS['CARD'])
+        self.virtual_tree.pack(fill=tk.BOTH, expand=True, padx=3, pady=(0, 3))  # Ultra minimal padding
+        self.tree = self.virtual_tree.tree
         
         # Configure columns with sorting
         self.sort_column = None
@@ -575,20 +591,6 @@ class DataViewerModule:
             else:
                 self.tree.column(col, width=100, minwidth=80)
         
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(tree_container, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Pack treeview and scrollbars
-        self.tree.grid(row=0, column=0, sticky=tk.NSEW)
-        v_scrollbar.grid(row=0, column=1, sticky=tk.NS)
-        h_scrollbar.grid(row=1, column=0, sticky=tk.EW)
-
-        # Configure grid weights
-        tree_container.grid_rowconfigure(0, weight=1)
-        tree_container.grid_columnconfigure(0, weight=1)
-
         # Bind double-click event to open Excel file
         self.tree.bind("<Double-1>", self._on_double_click)
 
@@ -695,6 +697,7 @@ class DataViewerModule:
         except Exception as e:
             self.logger.error(f"Error focusing search: {e}")
     
+    @timed_operation('data_viewer.load', threshold=3.0)
     def _load_data(self):
         """Load data from the global Excel file."""
         try:
@@ -722,6 +725,7 @@ class DataViewerModule:
                 dtype={'Code INSEE': str, 'ID tâche Plan Adressage': str},
                 date_format=None  # CRITICAL: Prevent automatic date parsing to avoid date inversion
             )
+            self.global_file_tracker.mark_loaded()
 
             # Format all date columns for better display
             date_columns = []
@@ -747,6 +751,10 @@ class DataViewerModule:
             if self.data_df is None or self.data_df.empty:
                 self._update_status("Aucune donnée trouvée")
                 return
+
+            # Format the table once and index the filtered columns
+            self.view_index = DataViewerIndex(self.data_df, self._get_column_mapping(),
+                                              self.DISPLAY_COLUMNS, self._format_cell)
             
             # Update filter options
             self._update_filter_options()
@@ -814,173 +822,149 @@ class DataViewerModule:
             self.logger.error(f"Error updating filter options: {e}")
     
     def _apply_filters(self):
-        """Apply current filters to the data."""
+        """
+        Apply current filters to the data.
+
+        The rows are selected on a worker thread; a newer call cancels the
+        running one and the result of a superseded query is never displayed.
+        """
         try:
-            if self.data_df is None or self.data_df.empty:
-                return
-            
-            # Start with all data
-            filtered_df = self.data_df.copy()
-            
-            # Get column mappings
-            columns = list(self.data_df.columns)
-            
-            # Map to expected columns (A, B, C, D, E, F, I, N, O, P, U)
-            col_mapping = {}
-            if len(columns) >= 21:  # Ensure we have enough columns
-                col_mapping = {
-                    'A': columns[0],   # Nom Commune
-                    'B': columns[1],   # ID Tâche
-                    'C': columns[2] if len(columns) > 2 else None,   # Code INSEE
-                    'D': columns[3] if len(columns) > 3 else None,   # Domaine
-                    'E': columns[6] if len(columns) > 6 else None,   # Nbr des voies CM
-                    'F': columns[7] if len(columns) > 7 else None,   # Nbr des IMB PA
-                    'I': columns[8] if len(columns) > 8 else None,   # Date Affectation
-                    'N': columns[13] if len(columns) > 13 else None, # Durée Finale
-                    'O': columns[14] if len(columns) > 14 else None, # Date Livraison
-                    'P': columns[15] if len(columns) > 15 else None, # État Ticket
-                    'U': columns[20] if len(columns) > 20 else None  # Collaborateur
-                }
-            
-            # Apply commune search filter (Nom Commune - Column A)
-            commune_text = self.commune_search_var.get().strip()
-            if commune_text and col_mapping.get('A'):
-                filtered_df = filtered_df[
-                    filtered_df[col_mapping['A']].astype(str).str.contains(commune_text, case=False, na=False)
-                ]
-
-            # Apply search filter (ID Commune - Column B)
-            search_text = self.search_var.get().strip()
-            if search_text and col_mapping.get('B'):
-                filtered_df = filtered_df[
-                    filtered_df[col_mapping['B']].astype(str).str.contains(search_text, case=False, na=False)
-                ]
-
-            # Apply INSEE search filter (Code INSEE - Column C)
-            insee_text = self.insee_search_var.get().strip()
-            if insee_text and col_mapping.get('C'):
-                filtered_df = filtered_df[
-                    filtered_df[col_mapping['C']].astype(str).str.contains(insee_text, case=False, na=False)
-                ]
-
-            # Apply domaine filter (Column D)
-            domaine_text = self.domaine_filter_var.get().strip()
-            if domaine_text and col_mapping.get('D'):
-                filtered_df = filtered_df[filtered_df[col_mapping['D']] == domaine_text]
-
-            # Apply date range filter (Column O) using selected dates
-            date_from_obj = self.date_from_selected
-            date_to_obj = self.date_to_selected
-
-            if (date_from_obj or date_to_obj) and col_mapping.get('O'):
-                date_col = col_mapping['O']
-
-                # Convert date column to datetime for proper comparison
-                try:
-                    pd = get_pandas()
-                    filtered_df[date_col] = pd.to_datetime(filtered_df[date_col], errors='coerce')
+            self._cancel_pending_filter()
 
-                    if date_from_obj:
-                        # Convert date object to pandas datetime
-                        date_from_dt = pd.to_datetime(date_from_obj)
-                        filtered_df = filtered_df[filtered_df[date_col] >= date_from_dt]
+            if self.data_df is None or self.data_df.empty or self.view_index is None:
+                return
 
-                    if date_to_obj:
-                        # Convert date object to pandas datetime
-                        date_to_dt = pd.to_datetime(date_to_obj)
-                        filtered_df = filtered_df[filtered_df[date_col] <= date_to_dt]
+            # Commune (A), ID tâche (B) and code INSEE (C) are searched as text,
+            # domaine (D), état (P) and collaborateur (U) must be equal,
+            # and the date de livraison (O) within the selected range
+            texts = {
+                'A': self.commune_search_var.get().strip(),
+                'B': self.search_var.get().strip(),
+                'C': self.insee_search_var.get().strip()
+            }
+            values = {
+                'D': self.domaine_filter_var.get().strip(),
+                'P': self.etat_filter_var.get().strip(),
+                'U': self.collaborateur_filter_var.get().strip()
+            }
+            date_from = self.date_from_selected
+            date_to = self.date_to_selected
+
+            self._filter_generation += 1
+            generation = self._filter_generation
+            view_index = self.view_index
+
+            def select_rows():
+                return view_index.filter(texts, values, date_from, date_to,
+                                         cancellation_token=current_cancellation_token())
+
+            def on_success(rows):
+                # A newer query or a reload happened meanwhile
+                if generation != self._filter_generation or view_index is not self.view_index:
+                    return
+                self._filter_task_id = None
+                self._unsorted_rows = rows
+                self._sort_cache = {}
+                self.filtered_rows = self._get_sorted_rows()
+                self._update_table_display()
+
+            def on_error(error):
+                if generation != self._filter_generation:
+                    return
+                self._filter_task_id = None
+                self.logger.error(f"Error applying filters: {error}")
+                self._update_status("Erreur lors du filtrage")
+
+            self._filter_task_id = run_async_task(select_rows, on_success, on_error, "Data viewer filter",
+                                                  priority=PRIORITY_HIGH)
 
-                except Exception as e:
-                    self.logger.error(f"Error filtering by date range: {e}")
-                    # If filtering fails, show all data
-                    pass
-            
-            # Apply collaborateur filter (Column U)
-            collab_text = self.collaborateur_filter_var.get().strip()
-            if collab_text and col_mapping.get('U'):
-                filtered_df = filtered_df[filtered_df[col_mapping['U']] == collab_text]
-            
-            # Apply état filter (Column P)
-            etat_text = self.etat_filter_var.get().strip()
-            if etat_text and col_mapping.get('P'):
-                filtered_df = filtered_df[filtered_df[col_mapping['P']] == etat_text]
-            
-            # Store filtered data
-            self.filtered_data = filtered_df
-            
-            # Update display
-            self._update_table_display()
-            
         except Exception as e:
             self.logger.error(f"Error applying filters: {e}")
             self._update_status("Erreur lors du filtrage")
+
+    def _cancel_pending_filter(self):
+        """Cancel the scheduled and the running filter queries."""
+        if self._filter_job is not None:
+            try:
+                self.parent.after_cancel(self._filter_job)
+            except tk.TclError:
+                pass
+            self._filter_job = None
+
+        if self._filter_task_id is not None:
+            cancel_async_task(self._filter_task_id)
+            self._filter_task_id = None
     
+    def _get_column_mapping(self) -> Dict[str, str]:
+        """Map the displayed columns (A, B, C, D, E, F, I, N, O, P, U) to the data columns."""
+        columns = list(self.data_df.columns) if self.data_df is not None else []
+        if len(columns) < 21:
+            return {}
+        return {
+            'A': columns[0],   # Nom Commune
+            'B': columns[1],   # ID Tâche
+            'C': columns[2],   # Code INSEE
+            'D': columns[3],   # Domaine
+            'E': columns[6],   # Nbr des voies CM
+            'F': columns[7],   # Nbr des IMB PA
+            'I': columns[8],   # Date Affectation
+            'N': columns[13],  # Durée Finale
+            'O': columns[14],  # Date Livraison
+            'P': columns[15],  # État Ticket
+            'U': columns[20]   # Collaborateur
+        }
+
+    def _format_cell(self, col_key: str, raw_value) -> str:
+        """Format a data value for its table column."""
+        pd = get_pandas()
+        value = str(raw_value) if pd.notna(raw_value) else ""
+
+        # Format numbers without decimals for Nbr voies CM and Nbr IMB PA
+        if col_key in ['E', 'F'] and value:
+            try:
+                value = str(int(float(value)))
+            except (ValueError, OverflowError):
+                pass  # Keep original value if parsing fails
+
+        # Format dates to YYYY-MM-DD (ISO format) if it's a date column
+        elif col_key in ['I', 'O'] and value:
+            try:
+                date_obj = pd.to_datetime(value, errors='coerce')
+                if pd.notna(date_obj):
+                    value = date_obj.strftime("%Y-%m-%d")
+            except Exception:
+                pass  # Keep original value if parsing fails
+
+        return value
+
+    def _get_display_rows(self, start: int, stop: int) -> List[tuple]:
+        """
+        Get the table values of filtered rows [start, stop) (row provider of the virtual treeview).
+
+        Args:
+            start: First row position in the filtered data
+            stop: Position after the last row
+
+        Returns:
+            List of value tuples in table column order
+        """
+        if self.filtered_rows is None or self.view_index is None:
+            return []
+        return self.view_index.rows(self.filtered_rows[start:stop])
+
     def _update_table_display(self):
         """Update the table display with filtered data."""
         try:
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
-            if self.filtered_data is None or self.filtered_data.empty:
+            row_count = 0 if self.filtered_rows is None else len(self.filtered_rows)
+            self.virtual_tree.set_rows(row_count)
+
+            if not row_count:
                 self._update_status("Aucune donnée à afficher")
                 return
-            
-            # Get column mappings
-            columns = list(self.data_df.columns)
-            col_mapping = {}
-            if len(columns) >= 21:
-                col_mapping = {
-                    'A': columns[0],   # Nom Commune
-                    'B': columns[1],   # ID Tâche
-                    'C': columns[2] if len(columns) > 2 else None,   # Code INSEE
-                    'D': columns[3] if len(columns) > 3 else None,   # Domaine
-                    'E': columns[6] if len(columns) > 6 else None,   # Nbr des voies CM
-                    'F': columns[7] if len(columns) > 7 else None,   # Nbr des IMB PA
-                    'I': columns[8] if len(columns) > 8 else None,   # Date Affectation
-                    'N': columns[13] if len(columns) > 13 else None, # Durée Finale
-                    'O': columns[14] if len(columns) > 14 else None, # Date Livraison
-                    'P': columns[15] if len(columns) > 15 else None, # État Ticket
-                    'U': columns[20] if len(columns) > 20 else None  # Collaborateur
-                }
-            
-            # Add filtered data to tree
-            for index, row in self.filtered_data.iterrows():
-                values = []
-                for col_key in ['A', 'B', 'C', 'D', 'E', 'F', 'I', 'O', 'N', 'P', 'U']:
-                    col_name = col_mapping.get(col_key)
-                    if col_name and col_name in row:
-                        pd = get_pandas()
-                        value = str(row[col_name]) if pd.notna(row[col_name]) else ""
-
-                        # Format numbers without decimals for Nbr voies CM and Nbr IMB PA
-                        if col_key in ['E', 'F'] and value and value != "":
-                            try:
-                                # Convert to float first, then to int to remove decimals
-                                numeric_value = float(value)
-                                if pd.notna(numeric_value):
-                                    value = str(int(numeric_value))
-                            except:
-                                pass  # Keep original value if parsing fails
-
-                        # Format dates to YYYY-MM-DD (ISO format) if it's a date column
-                        elif col_key in ['I', 'O'] and value and value != "":
-                            try:
-                                # Try to parse and format the date
-                                date_obj = pd.to_datetime(value, errors='coerce')
-                                if pd.notna(date_obj):
-                                    value = date_obj.strftime("%Y-%m-%d")
-                            except:
-                                pass  # Keep original value if parsing fails
-                    else:
-                        value = ""
-                    values.append(value)
-
-                self.tree.insert('', 'end', values=values)
-            
+
             # Update status with enhanced information
             total_rows = len(self.data_df) if self.data_df is not None else 0
-            filtered_rows = len(self.filtered_data)
+            filtered_rows = row_count
 
             if filtered_rows == total_rows:
                 self._update_status(f"📊 {filtered_rows} ligne(s) affichée(s)")
@@ -995,7 +979,17 @@ class DataViewerModule:
             self._update_data_info("")
     
     def _on_filter_change(self, *args):
-        """Handle filter changes."""
+        """Handle filter changes: filter once typing pauses for UIConfig.FILTER_DEBOUNCE_MS."""
+        if self._filter_job is not None:
+            try:
+                self.parent.after_cancel(self._filter_job)
+            except tk.TclError:
+                pass
+        self._filter_job = self.parent.after(UIConfig.FILTER_DEBOUNCE_MS, self._run_scheduled_filter)
+
+    def _run_scheduled_filter(self):
+        """Apply the filters scheduled by the last filter change."""
+        self._filter_job = None
         self._apply_filters()
 
     def _show_date_from_picker(self):
@@ -1098,66 +1092,41 @@ class DataViewerModule:
         except Exception as e:
             self.logger.error(f"Error handling date change: {e}")
 
+    def _get_sorted_rows(self):
+        """
+        Get the rows of the current filters in the current sort order.
+
+        Each column click sorts the displayed order, so ties keep the order of
+        the previously clicked columns; the result is cached per sort keys.
+        """
+        if not self._sort_keys or self._unsorted_rows is None:
+            return self._unsorted_rows
+
+        key = tuple(self._sort_keys)
+        rows = self._sort_cache.get(key)
+        if rows is None:
+            rows = self.view_index.sort_rows(self._unsorted_rows, self._sort_keys)
+            self._sort_cache[key] = rows
+        return rows
+
     def _sort_treeview(self, col):
         """Sort treeview by column."""
         try:
-            # Get all items
-            items = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
-
             # Determine if we need to reverse the sort
             if self.sort_column == col:
                 self.sort_reverse = not self.sort_reverse
             else:
                 self.sort_reverse = False
                 self.sort_column = col
+            self._sort_keys = [(col, self.sort_reverse)] + [key for key in self._sort_keys if key[0] != col]
 
-            # Sort items with consistent type handling
-            def sort_key(item):
-                value = item[0]
-
-                # Handle empty values first
-                if not value or str(value).strip() == '':
-                    return (0, '')  # Empty values sort first
-
-                value_str = str(value).strip()
-
-                # Try to convert to number for numeric sorting
-                try:
-                    numeric_value = float(value_str.replace(',', '.'))
-                    return (1, numeric_value)  # Numbers sort second
-                except:
-                    pass
-
-                # For dates, try to parse them (both ISO and dd/mm/yyyy formats)
-                if ('-' in value_str and len(value_str.split('-')) == 3) or ('/' in value_str and len(value_str.split('/')) == 3):
-                    try:
-                        pd = get_pandas()
-                        # Try ISO format first (YYYY-MM-DD)
-                        if '-' in value_str and len(value_str.split('-')) == 3:
-                            parts = value_str.split('-')
-                            if len(parts[0]) == 4:  # YYYY-MM-DD format
-                                date_obj = pd.to_datetime(value_str, format='%Y-%m-%d', errors='coerce')
-                                if pd.notna(date_obj):
-                                    return (2, date_obj.timestamp())  # Dates sort third
-                        # Try dd/mm/yyyy format
-                        elif '/' in value_str and len(value_str.split('/')) == 3:
-                            date_obj = pd.to_datetime(value_str, format='%d/%m/%Y', errors='coerce')
-                            if pd.notna(date_obj):
-                                return (2, date_obj.timestamp())  # Dates sort third
-                    except:
-                        pass
-
-                # Default to string sorting
-                return (3, value_str.lower())  # Strings sort last
-
-            items.sort(key=sort_key, reverse=self.sort_reverse)
-
-            # Rearrange items in sorted positions
-            for index, (val, child) in enumerate(items):
-                self.tree.move(child, '', index)
+            # Sort the filtered rows and redraw the visible window
+            if self._unsorted_rows is not None and self.view_index is not None:
+                self.filtered_rows = self._get_sorted_rows()
+                self.virtual_tree.set_rows(len(self.filtered_rows))
 
             # Update column headers to show sort direction
-            columns = ('A', 'B', 'C', 'D', 'E', 'F', 'I', 'O', 'N', 'P', 'U')
+            columns = self.DISPLAY_COLUMNS
             column_names = {
                 'A': '🏘️ Commune',
                 'B': '🆔 ID Tâche',
@@ -1449,9 +1418,16 @@ class DataViewerModule:
         if hasattr(self, 'data_info_label') and self.data_info_label:
             self.data_info_label.config(text=message)
     
+    def refresh(self, **kwargs):
+        """Rebind the viewer shortcuts and reload the table if the global file changed."""
+        if self.keyboard_manager:
+            self._setup_module_shortcuts()
+        self.global_file_tracker.reload_if_changed(self._load_data)
+
     def cleanup(self):
         """Clean up resources when module is closed."""
         try:
+            self._cancel_pending_filter()
             self.logger.info("Data Viewer module cleaned up")
 
         except Exception as e:
@@ -8,7 +8,6 @@ from tkinter import ttk, messagebox, filedialog
 import logging
 import os
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, Dict, List, Any, Tuple
 import threading
 
@@ -33,14 +32,16 @@ except ImportError as e:
 
 # Imports pour la génération de rapports Excel
 try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
     from openpyxl.utils.dataframe import dataframe_to_rows
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
-from utils.performance import run_async_task
+from utils.performance import run_async_task, timed_operation
 from utils.file_utils import check_file_access
+from core.qc_analysis_context import QcAnalysisContext, QGIS_SOURCE
+from core.criteria_scheduler import CriteriaScheduler
+from core.qc_report_index import QcReportIndex, read_report_fields, REPORT_FIELDS
+from core.qc_tracking_report import QcTrackingReport, TRACKING_REPORT_DEBOUNCE_SECONDS
 
 
 class QualityControlModule:
@@ -59,11 +60,7 @@ class QualityControlModule:
         self.logger = logging.getLogger(__name__)
 
         # Variables de données
-        self.qgis_data = None  # Données du fichier résultats QGis
-        self.suivi_data = None  # Données du fichier suivi commune
-        self.qc_results = None  # Résultats de l'analyse qualité
-        self.current_qgis_file_path = None
-        self.current_suivi_file_path = None
+        self._init_analysis_state()
 
         # Variables d'interface
         self.main_frame = None
@@ -94,6 +91,9 @@ class QualityControlModule:
         self.viewer_filters = {}
         self.viewer_status_label = None
         self.viewer_access_granted = False  # Flag pour l'accès au visualiseur
+        self._report_index = None  # Index persistant des fichiers état de lieu
+        self._tracking_report = None  # Rapport Excel de suivi (mis à jour de façon incrémentale)
+        self._tracking_report_timer = None  # Mise à jour différée du rapport de suivi
 
         # Indicateurs de statut
         self.files_status = None
@@ -109,9 +109,6 @@ class QualityControlModule:
         self.insee_var = tk.StringVar()
         self.id_tache_var = tk.StringVar()
 
-        # Données détectées
-        self.detected_info = {}
-
         # Configuration Teams
         self.teams_folder_path = TeamsConfig.get_teams_base_path()
 
@@ -120,6 +117,67 @@ class QualityControlModule:
 
         self.logger.info("Module Contrôle Qualité initialisé")
     
+    def _init_analysis_state(self):
+        """Initialise les données d'analyse (fichiers chargés, résultats, informations détectées)."""
+        self.qgis_data = None  # Données du fichier résultats QGis
+        self.suivi_data = None  # Données du fichier suivi commune
+        self.suivi_pages = None  # Pages du fichier suivi commune (lues une seule fois)
+        self.qc_results = None  # Résultats de l'analyse qualité
+        self._qc_context = None  # Contexte d'analyse partagé par les critères et le rapport
+        self.current_qgis_file_path = None
+        self.current_suivi_file_path = None
+        self.detected_info = {}  # Données détectées
+
+    @classmethod
+    def create_headless(cls) -> 'QualityControlModule':
+        """
+        Crée une instance sans interface, pour l'analyse et le rapport en lot.
+
+        Returns:
+            Module sans widgets (mode Contrôle Qualité)
+        """
+        module = cls.__new__(cls)
+        module.parent = None
+        module.navigation_manager = None
+        module.logger = logging.getLogger(__name__)
+        module._init_analysis_state()
+        return module
+
+    def analyze_files(self, qgis_file_path: str, suivi_file_path: str,
+                      criteria_workers: Optional[int] = None, use_cache: bool = True,
+                      suivi_pages: Optional[Dict[int, Any]] = None) -> Dict[str, Any]:
+        """
+        Charge un couple QGis / suivi commune et lance les critères 0 à 5 sans interface.
+
+        Args:
+            qgis_file_path: Fichier résultats QGis
+            suivi_file_path: Fichier suivi commune
+            criteria_workers: Nombre de threads pour les critères (None = un par critère)
+            use_cache: Passer par le cache persistant des feuilles (désactivé dans les processus de lot)
+            suivi_pages: Pages du suivi déjà lues (QcAnalysisContext.read_suivi_pages), relues si None
+
+        Returns:
+            Résultats de l'analyse (également stockés dans qc_results)
+
+        Raises:
+            ValueError: Si un des fichiers est illisible ou incomplet
+        """
+        context = QcAnalysisContext.from_files(qgis_file_path, suivi_file_path, use_cache=use_cache,
+                                               suivi_pages=suivi_pages)
+        if len(context.qgis_data.columns) < 10:  # Au moins 10 colonnes (A-J)
+            raise ValueError("Le fichier QGis ne contient pas assez de colonnes (minimum A-J requis)")
+
+        self.qgis_data = context.qgis_data
+        self.suivi_data = context.suivi_data
+        self.suivi_pages = context.suivi_pages
+        self.current_qgis_file_path = qgis_file_path
+        self.current_suivi_file_path = suivi_file_path
+        self._qc_context = context
+        self.detected_info = self._detect_info_from_suivi(self.suivi_data, suivi_file_path)
+
+        self.qc_results = self._compute_qc_results(criteria_workers)
+        return self.qc_results
+
     def setup_ui(self):
         """Configure l'interface utilisateur avec onglets pour analyse et visualiseur."""
         try:
@@ -572,64 +630,19 @@ class QualityControlModule:
                                      f"Veuillez créer au moins un fichier état de lieu d'abord.")
                 return files_data
 
-            # Lister le contenu du dossier base
-            base_contents = os.listdir(qc_base_path)
-            self.logger.info(f"📁 Contenu dossier base: {base_contents}")
+            # Index des fichiers déjà lus: seuls les fichiers nouveaux ou modifiés sont ouverts
+            if self._report_index is None or self._report_index.base_path != qc_base_path:
+                self._report_index = QcReportIndex(qc_base_path)
+
+            files_data = self._report_index.scan()
 
-            if not base_contents:
+            if self._report_index.last_scan_stats.get('base_entries', 0) == 0:
                 self.logger.info("📂 Dossier base vide")
                 messagebox.showinfo("Aucun fichier",
                                   f"Le dossier Contrôle Qualité est vide.\n"
                                   f"Générez d'abord des fichiers état de lieu.")
                 return files_data
 
-            # Scanner chaque dossier collaborateur
-            for collaborateur_folder in base_contents:
-                collaborateur_path = os.path.join(qc_base_path, collaborateur_folder)
-
-                self.logger.info(f"👤 Vérification collaborateur: {collaborateur_folder}")
-
-                if not os.path.isdir(collaborateur_path):
-                    self.logger.info(f"⚠️ Ignoré (pas un dossier): {collaborateur_folder}")
-                    continue
-
-                # Lister le contenu du dossier collaborateur
-                collab_contents = os.listdir(collaborateur_path)
-                self.logger.info(f"📁 Contenu {collaborateur_folder}: {collab_contents}")
-
-                # Scanner chaque dossier commune du collaborateur
-                for commune_folder in collab_contents:
-                    commune_path = os.path.join(collaborateur_path, commune_folder)
-
-                    self.logger.info(f"🏘️ Vérification commune: {commune_folder}")
-
-                    if not os.path.isdir(commune_path):
-                        self.logger.info(f"⚠️ Ignoré (pas un dossier): {commune_folder}")
-                        continue
-
-                    # Lister le contenu du dossier commune
-                    commune_contents = os.listdir(commune_path)
-                    self.logger.info(f"📁 Contenu {commune_folder}: {commune_contents}")
-
-                    # Chercher les fichiers Excel état de lieu
-                    for file_name in commune_contents:
-                        self.logger.info(f"📄 Vérification fichier: {file_name}")
-
-                        if file_name.startswith("Etat_De_Lieu_") and file_name.endswith(".xlsx"):
-                            file_path = os.path.join(commune_path, file_name)
-                            self.logger.info(f"✅ Fichier état de lieu trouvé: {file_path}")
-
-                            # Extraire les données depuis le fichier Excel
-                            file_info = self._extract_file_data(file_path)
-
-                            if file_info:
-                                files_data.append(file_info)
-                                self.logger.info(f"✅ Fichier ajouté: {file_info}")
-                            else:
-                                self.logger.warning(f"❌ Échec extraction info: {file_name}")
-                        else:
-                            self.logger.info(f"⚠️ Fichier ignoré (ne correspond pas au pattern): {file_name}")
-
             self.logger.info(f"🎯 Scan terminé: {len(files_data)} fichiers trouvés")
 
             if len(files_data) == 0:
@@ -687,128 +700,13 @@ class QualityControlModule:
     def _extract_file_data(self, file_path: str) -> Dict[str, Any]:
         """Extrait les données depuis un fichier Excel état de lieu."""
         try:
-            pd = get_pandas()
-
-            # Données par défaut
-            file_data = {
-                'commune': 'N/A',
-                'id_tache': 'N/A',
-                'insee': 'N/A',
-                'domaine': 'N/A',
-                'affectation': 'N/A',
-                'controleur': 'N/A',
-                'score_total': 'N/A',
-                'statut_commune': 'N/A',
-                'chemin': file_path
-            }
-
-            # Lire la première feuille (index 0) qui contient INFORMATIONS GÉNÉRALES
-            try:
-                df = pd.read_excel(file_path, sheet_name=0, header=None)
-
-                # Extraire les données selon les positions exactes
-                # Section INFORMATIONS GÉNÉRALES (ligne 3, index 2)
-                if len(df) > 2:  # Vérifier qu'on a au moins 3 lignes
-                    row_3 = df.iloc[2]  # Ligne 3 (index 2)
-
-                    # Debug temporaire pour voir le contenu exact
-                    self.logger.info(f"🔍 Contenu ligne 3: {row_3.tolist()}")
-
-                    # Nom de commune (B3 = colonne 1, mais vérifions si c'est A3 = colonne 0)
-                    if len(row_3) > 0 and not pd.isna(row_3.iloc[0]) and str(row_3.iloc[0]).strip() != 'INFORMATIONS GÉNÉRALES':
-                        file_data['commune'] = str(row_3.iloc[0]).strip()
-                    elif len(row_3) > 1 and not pd.isna(row_3.iloc[1]):
-                        file_data['commune'] = str(row_3.iloc[1]).strip()
-
-                    # ID tâche Plan Adressage (C3 = colonne 2, mais peut-être B3 = colonne 1)
-                    if len(row_3) > 1 and not pd.isna(row_3.iloc[1]) and str(row_3.iloc[1]).strip().isdigit():
-                        file_data['id_tache'] = str(row_3.iloc[1]).strip()
-                    elif len(row_3) > 2 and not pd.isna(row_3.iloc[2]):
-                        file_data['id_tache'] = str(row_3.iloc[2]).strip()
-
-                    # Code INSEE (D3 = colonne 3, mais peut-être C3 = colonne 2)
-                    if len(row_3) > 2 and not pd.isna(row_3.iloc[2]) and str(row_3.iloc[2]).strip().isdigit():
-                        file_data['insee'] = str(row_3.iloc[2]).strip()
-                    elif len(row_3) > 3 and not pd.isna(row_3.iloc[3]):
-                        file_data['insee'] = str(row_3.iloc[3]).strip()
-
-                    # Domaine (E3 = colonne 4, mais peut-être D3 = colonne 3)
-                    if len(row_3) > 3 and not pd.isna(row_3.iloc[3]):
-                        file_data['domaine'] = str(row_3.iloc[3]).strip()
-                    elif len(row_3) > 4 and not pd.isna(row_3.iloc[4]):
-                        file_data['domaine'] = str(row_3.iloc[4]).strip()
-
-                    # AFFECTATION (F3 = colonne 5, mais peut-être E3 = colonne 4)
-                    if len(row_3) > 4 and not pd.isna(row_3.iloc[4]):
-                        file_data['affectation'] = str(row_3.iloc[4]).strip()
-                    elif len(row_3) > 5 and not pd.isna(row_3.iloc[5]):
-                        file_data['affectation'] = str(row_3.iloc[5]).strip()
-
-                    # Contrôleur (G3 = colonne 6, mais peut-être F3 = colonne 5)
-                    if len(row_3) > 5 and not pd.isna(row_3.iloc[5]):
-                        file_data['controleur'] = str(row_3.iloc[5]).strip()
-                    elif len(row_3) > 6 and not pd.isna(row_3.iloc[6]):
-                        file_data['controleur'] = str(row_3.iloc[6]).strip()
-
-                # Section SCORE TOTAL (ligne 11, index 10)
-                if len(df) > 10:  # Vérifier qu'on a au moins 11 lignes
-                    row_11 = df.iloc[10]  # Ligne 11 (index 10)
-
-                    # Debug temporaire pour voir le contenu exact
-                    self.logger.info(f"🔍 Contenu ligne 11: {row_11.tolist()}")
-
-                    # Score Total - chercher dans les colonnes J, K, L (indices 9, 10, 11)
-                    score_found = False
-                    for col_idx in [9, 10, 11]:
-                        if len(row_11) > col_idx and not pd.isna(row_11.iloc[col_idx]):
-                            val = str(row_11.iloc[col_idx]).strip()
-                            try:
-                                # Convertir en float pour vérifier si c'est un nombre
-                                float_val = float(val)
-                                # Si c'est un nombre décimal entre 0 et 1, le convertir en pourcentage
-                                if 0 <= float_val <= 1:
-                                    percentage = float_val * 100
-                                    file_data['score_total'] = f"{percentage:.2f}%"
-                                else:
-                                    # Si c'est déjà un nombre entier (comme 1, 2, etc.), le garder tel quel
-                                    file_data['score_total'] = val
-                                score_found = True
-                                break
-                            except ValueError:
-                                # Si ce n'est pas un nombre, le garder tel quel
-                                if val.isdigit():
-                                    file_data['score_total'] = val
-                                    score_found = True
-                                    break
-
-                    # Statut Commune - chercher dans les colonnes K, L, M (indices 10, 11, 12)
-                    statut_found = False
-                    for col_idx in [10, 11, 12]:
-                        if len(row_11) > col_idx and not pd.isna(row_11.iloc[col_idx]):
-                            val = str(row_11.iloc[col_idx]).strip()
-                            if val.upper() in ['OK', 'KO', 'NOK']:
-                                file_data['statut_commune'] = val.upper()  # Normaliser en majuscules
-                                statut_found = True
-                                break
-
-            except Exception as e:
-                self.logger.warning(f"Erreur lecture fichier Excel: {e}")
-
-            return file_data
-
+            file_data = read_report_fields(file_path)
         except Exception as e:
-            self.logger.error(f"Erreur extraction données fichier {file_path}: {e}")
-            return {
-                'commune': 'Erreur',
-                'id_tache': 'Erreur',
-                'insee': 'Erreur',
-                'domaine': 'Erreur',
-                'affectation': 'Erreur',
-                'controleur': 'Erreur',
-                'score_total': 'Erreur',
-                'statut_commune': 'Erreur',
-                'chemin': file_path
-            }
+            self.logger.warning(f"Erreur lecture fichier Excel: {e}")
+            file_data = {name: 'N/A' for name in REPORT_FIELDS}
+
+        file_data['chemin'] = file_path
+        return file_data
 
     def _apply_viewer_filters(self):
         """Applique les filtres au tableau du visualiseur."""
@@ -2014,6 +1912,7 @@ class QualityControlModule:
                 if hasattr(self, 'progress_var') and self.progress_var:
                     self.progress_var.set(10)
 
+            @timed_operation('qc.load_qgis', threshold=2.0)
             def load_qgis():
                 pd = get_pandas()
 
@@ -2100,7 +1999,8 @@ class QualityControlModule:
                     update_ui()
 
             # Charger de manière asynchrone
-            run_async_task(load_qgis, on_success, on_error, "Chargement QGis")
+            run_async_task(load_qgis, on_success, on_error, "Chargement QGis",
+                           dedup_key=(id(self), "qgis", file_path))
 
         except Exception as e:
             self.logger.error(f"Erreur lors de la sélection du fichier QGis: {e}")
@@ -2131,22 +2031,26 @@ class QualityControlModule:
                 if hasattr(self, 'progress_var') and self.progress_var:
                     self.progress_var.set(10)
 
+            @timed_operation('qc.load_suivi', threshold=2.0)
             def load_suivi():
-                pd = get_pandas()
-
-                # Lire la feuille 3 (index 2) du fichier de suivi
-                df = pd.read_excel(file_path, sheet_name=2, date_format=None)
+                # Lire en une seule passe les pages 1 à 3 (la page 3 porte les informations commune)
+                pages = QcAnalysisContext.read_suivi_pages(file_path)
+                if 2 not in pages:
+                    raise ValueError("La page 3 du fichier suivi est introuvable")
+                df = pages[2]
 
                 # Détecter automatiquement les informations
                 detected_info = self._detect_info_from_suivi(df, file_path)
 
-                return df, detected_info
+                return pages, detected_info
 
             def on_success(result):
                 # S'assurer que les mises à jour UI se font dans le thread principal
                 def update_ui():
-                    df, detected_info = result
+                    pages, detected_info = result
+                    df = pages[2]
                     self.suivi_data = df
+                    self.suivi_pages = pages
                     self.current_suivi_file_path = file_path
                     self.detected_info = detected_info
 
@@ -2216,7 +2120,8 @@ class QualityControlModule:
                     update_ui()
 
             # Charger de manière asynchrone
-            run_async_task(load_suivi, on_success, on_error, "Chargement suivi")
+            run_async_task(load_suivi, on_success, on_error, "Chargement suivi",
+                           dedup_key=(id(self), "suivi", file_path))
 
         except Exception as e:
             self.logger.error(f"Erreur lors de la sélection du fichier suivi: {e}")
@@ -2774,6 +2679,35 @@ class QualityControlModule:
             # Réinitialiser le flag après un délai
             self.parent.after(100, lambda: setattr(self, '_updating_results', False))
 
+    def _get_analysis_context(self) -> QcAnalysisContext:
+        """
+        Récupère le contexte d'analyse des fichiers chargés.
+
+        Le contexte est reconstruit seulement si le fichier QGis ou le fichier
+        suivi a changé depuis la dernière analyse.
+
+        Returns:
+            Contexte partagé par les critères et le rapport
+        """
+        context = self._qc_context
+        suivi_pages = self.suivi_pages
+        if (context is not None and context.suivi_pages is suivi_pages
+                and context.is_current(self.qgis_data, self.current_suivi_file_path)):
+            return context
+
+        suivi_modified = (context is not None and context.suivi_pages is suivi_pages
+                          and not context.is_current(context.qgis_data, self.current_suivi_file_path))
+        if suivi_pages is None or suivi_modified:
+            # Pages absentes ou fichier suivi modifié depuis son chargement
+            suivi_pages = {}
+            if self.current_suivi_file_path:
+                suivi_pages = QcAnalysisContext.read_suivi_pages(self.current_suivi_file_path)
+            self.suivi_pages = suivi_pages
+
+        self._qc_context = QcAnalysisContext(self.qgis_data, suivi_pages, self.current_suivi_file_path)
+        self.logger.info(f"Contexte d'analyse créé: pages suivi {sorted(suivi_pages)}")
+        return self._qc_context
+
     def _run_quality_analysis(self):
         """Lance l'analyse de contrôle qualité."""
         # Log du mode utilisé
@@ -2794,19 +2728,7 @@ class QualityControlModule:
                     self.progress_var.set(10)
 
             def run_analysis():
-                results = {
-                    'critere_0': self._analyze_critere_0(),
-                    'critere_2': self._analyze_critere_2(),
-                    'critere_3': self._analyze_critere_3(),
-                    'critere_4': self._analyze_critere_4(),
-                    'critere_5': self._analyze_critere_5(),
-                    'summary': {}
-                }
-
-                # Calculer le résumé
-                results['summary'] = self._calculate_summary(results)
-
-                return results
+                return self._compute_qc_results()
 
             def on_success(results):
                 # S'assurer que les mises à jour UI se font dans le thread principal
@@ -2865,12 +2787,42 @@ class QualityControlModule:
                     update_ui()
 
             # Lancer l'analyse de manière asynchrone
-            run_async_task(run_analysis, on_success, on_error, "Analyse qualité")
+            run_async_task(run_analysis, on_success, on_error, "Analyse qualité",
+                           dedup_key=(id(self), "analyse"))
 
         except Exception as e:
             self.logger.error(f"Erreur lors du lancement de l'analyse: {e}")
             messagebox.showerror("Erreur", f"Erreur lors du lancement:\n{e}")
 
+    @timed_operation('qc.analyze', threshold=5.0)
+    def _compute_qc_results(self, criteria_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Exécute les critères sur les fichiers chargés et calcule le résumé.
+
+        Args:
+            criteria_workers: Nombre de threads pour les critères (None = configuration par défaut)
+
+        Returns:
+            Résultats par critère, durées ('timings') et résumé ('summary')
+        """
+        # Charger une seule fois les données partagées par tous les critères
+        self._get_analysis_context()
+
+        # Les critères sont indépendants: ils s'exécutent en parallèle sur les mêmes données
+        results, timings = CriteriaScheduler(criteria_workers).run({
+            'critere_0': self._analyze_critere_0,
+            'critere_2': self._analyze_critere_2,
+            'critere_3': self._analyze_critere_3,
+            'critere_4': self._analyze_critere_4,
+            'critere_5': self._analyze_critere_5
+        })
+        results['timings'] = timings
+
+        # Calculer le résumé
+        results['summary'] = self._calculate_summary(results)
+
+        return results
+
     def _analyze_critere_0(self) -> Dict[str, Any]:
         """
         Critère 0: Incohérence entre fichier Résultats QGis et suivi commune.
@@ -2885,50 +2837,30 @@ class QualityControlModule:
                 'AD RAS', 'OK', 'NOK', 'UPR RAS', 'UPR OK', 'UPR NOK', 'AD IMPORT OK'
             ]
 
+            context = self._get_analysis_context()
+
             # Extraire les motifs du fichier QGis (colonne J - index 9)
-            qgis_motifs = []
-            if len(self.qgis_data.columns) > 9:
-                qgis_motifs_column = self.qgis_data.iloc[:, 9]  # Colonne J (import fantome)
-                qgis_motifs = [str(motif).strip().upper() for motif in qgis_motifs_column if pd.notna(motif) and str(motif).strip()]
+            qgis_motifs = pd.Series([], dtype=object)
+            if context.has_column(QGIS_SOURCE, 9):
+                qgis_motifs = context.qgis_motifs()  # Colonne J (import fantome)
 
             # Extraire les motifs du fichier suivi commune (colonne I - index 8) depuis la PAGE 2
-            suivi_motifs = []
-            try:
-                # Lire spécifiquement la page 2 (index 1) pour les motifs
-                pd = get_pandas()
-                if hasattr(self, 'current_suivi_file_path') and self.current_suivi_file_path:
-                    suivi_page2_df = pd.read_excel(self.current_suivi_file_path, sheet_name=1, date_format=None)  # Page 2
-                    if len(suivi_page2_df.columns) > 8:
-                        suivi_motifs_column = suivi_page2_df.iloc[:, 8]  # Colonne I (Motif)
-                        suivi_motifs = [str(motif).strip().upper() for motif in suivi_motifs_column if pd.notna(motif) and str(motif).strip()]
-                        self.logger.info(f"Motifs extraits de la page 2, colonne I: {len(suivi_motifs)} motifs trouvés")
-                else:
-                    self.logger.warning("Chemin du fichier suivi non disponible, impossible de lire la page 2")
-            except Exception as e:
-                self.logger.error(f"Erreur lors de la lecture de la page 2 pour les motifs: {e}")
+            suivi_motifs = pd.Series([], dtype=object)
+            if context.page(1) is not None:
+                if context.has_column(1, 8):
+                    suivi_motifs = context.suivi_motifs()  # Colonne I (Motif)
+                    self.logger.info(f"Motifs extraits de la page 2, colonne I: {int(suivi_motifs.ne('').sum())} motifs trouvés")
+            else:
+                self.logger.error("Page 2 du fichier suivi non disponible pour les motifs")
                 # Fallback: essayer avec les données actuelles (page 3)
-                if len(self.suivi_data.columns) > 8:
-                    suivi_motifs_column = self.suivi_data.iloc[:, 8]  # Colonne I (Motif)
-                    suivi_motifs = [str(motif).strip().upper() for motif in suivi_motifs_column if pd.notna(motif) and str(motif).strip()]
-
-            # Compter les occurrences de chaque motif spécifique
-            qgis_counts = {}
-            suivi_counts = {}
-
-            # Initialiser tous les motifs à 0
-            for motif in motifs_plan_adressage:
-                qgis_counts[motif] = 0
-                suivi_counts[motif] = 0
+                if context.has_column(2, 8):
+                    suivi_motifs = context.text_column(2, 8, upper=True)  # Colonne I (Motif)
 
-            # Compter les motifs QGis
-            for motif in qgis_motifs:
-                if motif in motifs_plan_adressage:
-                    qgis_counts[motif] += 1
-
-            # Compter les motifs Suivi
-            for motif in suivi_motifs:
-                if motif in motifs_plan_adressage:
-                    suivi_counts[motif] += 1
+            # Compter les occurrences de chaque motif spécifique (motifs vides exclus)
+            qgis_value_counts = qgis_motifs.value_counts()
+            suivi_value_counts = suivi_motifs.value_counts()
+            qgis_counts = {motif: int(qgis_value_counts.get(motif, 0)) for motif in motifs_plan_adressage}
+            suivi_counts = {motif: int(suivi_value_counts.get(motif, 0)) for motif in motifs_plan_adressage}
 
             # Détecter les incohérences pour les motifs Plan Adressage
             incoherences = []
@@ -2996,33 +2928,21 @@ class QualityControlModule:
         2. Création/Modification Voie (page 1, col E) OU OK (page 2, col I) -> doit avoir ticket 501/511 (page 3, col Q)
         """
         try:
-            pd = get_pandas()
-
             # Initialiser les résultats
             ticket_upr_status = "N/A"
             ticket_501_511_status = "N/A"
             errors = []
 
-            # Variables pour stocker les données des différentes pages
-            page1_data = None
-            page2_data = None
-            page3_data = self.suivi_data  # Page 3 déjà chargée
-
-            # Lire les pages 1 et 2 du fichier suivi commune
+            # Pages 1 (colonne E, Motif Voie), 2 (colonne I, Motif) et 3 (tickets) du fichier suivi commune
             if hasattr(self, 'current_suivi_file_path') and self.current_suivi_file_path:
-                try:
-                    # Page 1 pour vérifier colonne E (Motif Voie)
-                    page1_data = pd.read_excel(self.current_suivi_file_path, sheet_name=0, date_format=None)
-                    # Page 2 pour vérifier colonne I (Motif) - déjà utilisée dans critère 0
-                    page2_data = pd.read_excel(self.current_suivi_file_path, sheet_name=1, date_format=None)
-
-                    self.logger.info("Pages 1, 2 et 3 du fichier suivi chargées pour analyse critère 2")
+                context = self._get_analysis_context()
 
-                except Exception as e:
-                    self.logger.error(f"Erreur lecture pages suivi pour critère 2: {e}")
+                missing_pages = [str(index + 1) for index in (0, 1) if context.page(index) is None]
+                if missing_pages:
+                    self.logger.error(f"Pages suivi manquantes pour critère 2: {', '.join(missing_pages)}")
                     return {
                         'status': 'ERROR',
-                        'error': f'Impossible de lire les pages du fichier suivi: {e}',
+                        'error': f"Impossible de lire les pages du fichier suivi: page(s) {', '.join(missing_pages)} introuvable(s)",
                         'ticket_upr_status': 'ERROR',
                         'ticket_501_511_status': 'ERROR',
                         'errors': []
@@ -3039,22 +2959,15 @@ class QualityControlModule:
             # VÉRIFICATION 1: Ticket UPR
             # Si UPR OK dans page 2, colonne I -> doit avoir ID dans page 3, colonne T
             upr_ok_found = False
-            if page2_data is not None and len(page2_data.columns) > 8:
-                motifs_page2 = page2_data.iloc[:, 8]  # Colonne I
-                for motif in motifs_page2:
-                    if pd.notna(motif) and str(motif).strip().upper() == 'UPR OK':
-                        upr_ok_found = True
-                        break
+            if context.has_column(1, 8):
+                upr_ok_found = bool(context.suivi_motifs().eq('UPR OK').any())  # Colonne I
 
             if upr_ok_found:
                 # Vérifier si ticket UPR déposé (page 3, colonne T - index 19)
                 ticket_upr_deposited = False
-                if len(page3_data.columns) > 19:
-                    id_upr_column = page3_data.iloc[:, 19]  # Colonne T
-                    for id_upr in id_upr_column:
-                        if pd.notna(id_upr) and str(id_upr).strip() and str(id_upr).strip() not in ['', 'nan', 'ID UPR', 'Ticket UPR']:
-                            ticket_upr_deposited = True
-                            break
+                if context.has_column(2, 19):
+                    id_upr_column = context.text_column(2, 19)  # Colonne T
+                    ticket_upr_deposited = bool((~id_upr_column.isin(['', 'nan', 'ID UPR', 'Ticket UPR'])).any())
 
                 ticket_upr_status = "OK" if ticket_upr_deposited else "NOK"
                 if not ticket_upr_deposited:
@@ -3072,32 +2985,20 @@ class QualityControlModule:
             ticket_501_511_required = False
 
             # Vérifier page 1, colonne E (Motif Voie)
-            if page1_data is not None and len(page1_data.columns) > 4:
-                motifs_voie = page1_data.iloc[:, 4]  # Colonne E
-                for motif in motifs_voie:
-                    if pd.notna(motif):
-                        motif_str = str(motif).strip()
-                        if motif_str in ['Création Voie', 'Modification Voie']:
-                            ticket_501_511_required = True
-                            break
+            if context.has_column(0, 4):
+                motifs_voie = context.voie_motifs()  # Colonne E
+                ticket_501_511_required = bool(motifs_voie.isin(['Création Voie', 'Modification Voie']).any())
 
             # Vérifier page 2, colonne I (motif OK)
-            if not ticket_501_511_required and page2_data is not None and len(page2_data.columns) > 8:
-                motifs_page2 = page2_data.iloc[:, 8]  # Colonne I
-                for motif in motifs_page2:
-                    if pd.notna(motif) and str(motif).strip().upper() == 'OK':
-                        ticket_501_511_required = True
-                        break
+            if not ticket_501_511_required and context.has_column(1, 8):
+                ticket_501_511_required = bool(context.suivi_motifs().eq('OK').any())  # Colonne I
 
             if ticket_501_511_required:
                 # Vérifier si ticket 501/511 déposé (page 3, colonne Q - index 16)
                 ticket_501_511_deposited = False
-                if len(page3_data.columns) > 16:
-                    id_501_511_column = page3_data.iloc[:, 16]  # Colonne Q
-                    for id_ticket in id_501_511_column:
-                        if pd.notna(id_ticket) and str(id_ticket).strip() and str(id_ticket).strip() not in ['', 'nan', 'ID 501/511', 'Ticket 501/511']:
-                            ticket_501_511_deposited = True
-                            break
+                if context.has_column(2, 16):
+                    id_501_511_column = context.text_column(2, 16)  # Colonne Q
+                    ticket_501_511_deposited = bool((~id_501_511_column.isin(['', 'nan', 'ID 501/511', 'Ticket 501/511'])).any())
 
                 ticket_501_511_status = "OK" if ticket_501_511_deposited else "NOK"
                 if not ticket_501_511_deposited:
@@ -3149,78 +3050,12 @@ class QualityControlModule:
             pd = get_pandas()
 
             # Vérifier que les colonnes requises existent
-            required_columns = ['A', 'B', 'C', 'D', 'J', 'U']  # Colonnes A, B, C, D, J, U
             if len(self.qgis_data.columns) < 21:  # Au moins 21 colonnes (A-U)
                 raise ValueError("Le fichier QGis ne contient pas assez de colonnes (minimum A-U requis)")
 
-            # Extraire les données des colonnes requises
-            df = self.qgis_data.copy()
-
-            # Renommer les colonnes pour faciliter le travail
-            df_work = pd.DataFrame({
-                'imb_code': df.iloc[:, 0],  # Colonne A - Num Dossier Site
-                'numero_voie': df.iloc[:, 1],  # Colonne B - Numero Voie Site
-                'repondant_voie': df.iloc[:, 2],  # Colonne C - Repondant Voie Site
-                'libelle_voie': df.iloc[:, 3],  # Colonne D - Libelle Voie Site
-                'motif': df.iloc[:, 9],  # Colonne J - Import Fantome
-                'adresse_ban': df.iloc[:, 20]  # Colonne U - Adresse BAN
-            })
-
-            # Nettoyer les données
-            df_work = df_work.dropna(subset=['imb_code'])  # Supprimer les lignes sans code IMB
-            df_work['imb_code'] = df_work['imb_code'].astype(str).str.strip()
-            df_work['motif'] = df_work['motif'].astype(str).str.strip().str.upper()
-            df_work['adresse_ban'] = df_work['adresse_ban'].astype(str).str.strip()
-
-            # Construire l'adresse optimum (B + C + D) en gérant les valeurs vides
-            def construct_adresse_optimum(row):
-                """Construit l'adresse optimum en gérant les valeurs vides et numériques."""
-                # Nettoyer et convertir les valeurs
-                numero = str(row['numero_voie']).strip() if pd.notna(row['numero_voie']) else ''
-                repondant = str(row['repondant_voie']).strip() if pd.notna(row['repondant_voie']) else ''
-                libelle = str(row['libelle_voie']).strip() if pd.notna(row['libelle_voie']) else ''
-
-                # Nettoyer les valeurs numériques (enlever .0)
-                if numero and numero != 'nan':
-                    try:
-                        # Si c'est un nombre entier, enlever les décimales
-                        if '.' in numero and numero.replace('.', '').replace('-', '').isdigit():
-                            numero = str(int(float(numero)))
-                    except:
-                        pass
-
-                # Construire l'adresse selon les règles :
-                # - Si C est vide : B + D uniquement
-                # - Si B ou C est vide : D uniquement
-                # - Sinon : B + C + D
-
-                parts = []
-
-                if numero and numero != 'nan':
-                    parts.append(numero)
-
-                if repondant and repondant != 'nan':
-                    parts.append(repondant)
-
-                if libelle and libelle != 'nan':
-                    parts.append(libelle)
-
-                # Appliquer les règles spécifiques
-                if not repondant or repondant == 'nan':
-                    # Si C est vide : B + D uniquement (ou D si B est vide)
-                    if numero and numero != 'nan' and libelle and libelle != 'nan':
-                        return f"{numero} {libelle}".strip()
-                    elif libelle and libelle != 'nan':
-                        return libelle.strip()
-                    elif numero and numero != 'nan':
-                        return numero.strip()
-                    else:
-                        return ''
-                else:
-                    # Cas normal : B + C + D
-                    return ' '.join(parts).strip()
-
-            df_work['adresse_optimum'] = df_work.apply(construct_adresse_optimum, axis=1)
+            # Colonnes nettoyées et adresse optimum (B + C + D), partagées avec les critères 4 et 5
+            address_index = self._get_analysis_context().address_index()
+            df_work = address_index.rows(with_imb_only=True)  # Lignes avec code IMB
 
             # Identifier les doublons IMB
             imb_counts = df_work['imb_code'].value_counts()
@@ -3229,79 +3064,82 @@ class QualityControlModule:
             doublons_suspects = []
             doublons_details = []
             erreurs_motif_ok = []
-            ad_a_analyser = []
-            lignes_deja_ajoutees = set()  # Pour éviter les doublons
+
+            # Une ligne n'est signalée qu'une fois par (IMB, adresse optimum, adresse BAN, motif)
+            ligne_codes = address_index.group_codes('imb_code', 'adresse_optimum', 'adresse_ban', 'motif')[df_work.index]
+            lignes_deja_ajoutees = set()
+            lignes = df_work[['imb_code', 'adresse_optimum', 'motif', 'adresse_ban']].to_numpy()
 
             # ÉTAPE 1: Détecter les erreurs de motif "OK" avec adresses identiques (tous les IMB)
-            for index, row in df_work.iterrows():
-                motif = str(row['motif']).strip().upper()
-                adresse_optimum = str(row['adresse_optimum']).strip()
-                adresse_ban = str(row['adresse_ban']).strip()
-
-                # Debug: Log pour vérifier les comparaisons
-                self.logger.debug(f"Vérification motif OK - IMB: {row['imb_code']}, Motif: '{motif}', Adresse Opt: '{adresse_optimum}', Adresse BAN: '{adresse_ban}'")
-
-                # Vérifier si motif = "OK" et adresses identiques
-                if (motif == 'OK' and
-                    adresse_optimum and adresse_optimum != '' and adresse_optimum != 'nan' and
-                    adresse_ban and adresse_ban != '' and adresse_ban != 'nan' and
-                    adresse_optimum == adresse_ban):
-
-                    # Créer une clé unique pour cette ligne
-                    ligne_key = f"{row['imb_code']}_{adresse_optimum}_{adresse_ban}_{motif}"
-
-                    if ligne_key not in lignes_deja_ajoutees:
-                        erreur_info = {
-                            'imb_code': row['imb_code'],
-                            'adresse_optimum': adresse_optimum,
-                            'motif_initial': motif,
-                            'adresse_ban': adresse_ban,
-                            'type': 'ERREUR_MOTIF_OK_ADRESSE_IDENTIQUE',
-                            'description': f"IMB {row['imb_code']} - Motif 'OK' mais adresse optimum = adresse BAN (erreur de saisie)"
-                        }
-                        erreurs_motif_ok.append(erreur_info)
-                        doublons_details.append(erreur_info)
-                        lignes_deja_ajoutees.add(ligne_key)
-
-                        # Log pour confirmer la détection
-                        self.logger.info(f"ERREUR MOTIF OK DÉTECTÉE - IMB: {row['imb_code']}, Adresse: '{adresse_optimum}'")
-
-            # ÉTAPE 2: Analyser chaque groupe de doublons IMB
-            for imb_code in doublons_imb:
-                groupe_doublons = df_work[df_work['imb_code'] == imb_code].copy()
-
-                # Vérifier s'il y a des motifs identiques avec des adresses BAN différentes
-                for motif in groupe_doublons['motif'].unique():
-                    if pd.isna(motif) or motif == '' or motif.upper() == 'NAN':
-                        continue
-
-                    lignes_meme_motif = groupe_doublons[groupe_doublons['motif'] == motif]
-
-                    if len(lignes_meme_motif) > 1:
-                        # Vérifier si les adresses BAN sont différentes
-                        adresses_ban_uniques = lignes_meme_motif['adresse_ban'].unique()
-                        adresses_ban_uniques = [addr for addr in adresses_ban_uniques
-                                              if pd.notna(addr) and str(addr).strip() != '' and str(addr).upper() != 'NAN']
-
-                        if len(adresses_ban_uniques) > 1:
-                            # Doublon suspect détecté !
-                            for _, ligne in lignes_meme_motif.iterrows():
-                                # Créer une clé unique pour cette ligne
-                                ligne_key = f"{ligne['imb_code']}_{ligne['adresse_optimum']}_{ligne['adresse_ban']}_{ligne['motif']}"
-
-                                # Ajouter seulement si pas déjà ajoutée
-                                if ligne_key not in lignes_deja_ajoutees:
-                                    doublon_info = {
-                                        'imb_code': ligne['imb_code'],
-                                        'adresse_optimum': ligne['adresse_optimum'],
-                                        'motif_initial': ligne['motif'],
-                                        'adresse_ban': ligne['adresse_ban'],
-                                        'type': 'DOUBLON_IMB_SUSPECT',
-                                        'description': f"IMB {ligne['imb_code']} - Motif '{ligne['motif']}' avec adresses BAN différentes"
-                                    }
-                                    doublons_suspects.append(doublon_info)
-                                    doublons_details.append(doublon_info)
-                                    lignes_deja_ajoutees.add(ligne_key)
+            adresse_optimum = df_work['adresse_optimum']
+            adresse_ban = df_work['adresse_ban']
+            motif_ok_identique = (
+                df_work['motif'].eq('OK')
+                & adresse_optimum.ne('') & adresse_optimum.ne('nan')
+                & adresse_ban.ne('') & adresse_ban.ne('nan')
+                & adresse_optimum.eq(adresse_ban)
+            ).to_numpy()
+
+            for position in motif_ok_identique.nonzero()[0]:
+                if ligne_codes[position] in lignes_deja_ajoutees:
+                    continue
+                imb_code, adresse, motif, adresse_ban_ligne = lignes[position]
+                erreur_info = {
+                    'imb_code': imb_code,
+                    'adresse_optimum': adresse,
+                    'motif_initial': motif,
+                    'adresse_ban': adresse_ban_ligne,
+                    'type': 'ERREUR_MOTIF_OK_ADRESSE_IDENTIQUE',
+                    'description': f"IMB {imb_code} - Motif 'OK' mais adresse optimum = adresse BAN (erreur de saisie)"
+                }
+                erreurs_motif_ok.append(erreur_info)
+                doublons_details.append(erreur_info)
+                lignes_deja_ajoutees.add(ligne_codes[position])
+
+                # Log pour confirmer la détection
+                self.logger.info(f"ERREUR MOTIF OK DÉTECTÉE - IMB: {imb_code}, Adresse: '{adresse}'")
+
+            # ÉTAPE 2: Doublons IMB avec un même motif et des adresses BAN différentes
+            motif_valide = df_work['motif'].ne('') & df_work['motif'].ne('NAN')
+            adresse_ban_valide = adresse_ban.ne('') & adresse_ban.str.upper().ne('NAN')
+            groupes = address_index.group_codes('imb_code', 'motif')[df_work.index]
+
+            candidats = pd.DataFrame({
+                'groupe': groupes,
+                'adresse_ban': adresse_ban.where(adresse_ban_valide),
+                'position': range(len(df_work))
+            })[motif_valide.to_numpy()]
+            stats_groupes = candidats.groupby('groupe', sort=False).agg(
+                lignes=('position', 'size'),
+                adresses_ban=('adresse_ban', 'nunique'),
+                premiere_ligne=('position', 'min')
+            )
+            groupes_suspects = stats_groupes[(stats_groupes['lignes'] > 1) & (stats_groupes['adresses_ban'] > 1)]
+
+            # Ordre de restitution: IMB (ordre des doublons), puis motif (première apparition), puis ligne
+            suspects = candidats[candidats['groupe'].isin(groupes_suspects.index)].copy()
+            rang_imb = {imb_code: rank for rank, imb_code in enumerate(doublons_imb)}
+            suspects['rang_imb'] = df_work['imb_code'].to_numpy()[suspects['position'].to_numpy()]
+            suspects['rang_imb'] = suspects['rang_imb'].map(rang_imb)
+            suspects['premiere_ligne'] = suspects['groupe'].map(groupes_suspects['premiere_ligne'])
+            suspects = suspects.sort_values(['rang_imb', 'premiere_ligne', 'position'])
+
+            for position in suspects['position']:
+                # Ajouter seulement si pas déjà ajoutée
+                if ligne_codes[position] in lignes_deja_ajoutees:
+                    continue
+                imb_code, adresse, motif, adresse_ban_ligne = lignes[position]
+                doublon_info = {
+                    'imb_code': imb_code,
+                    'adresse_optimum': adresse,
+                    'motif_initial': motif,
+                    'adresse_ban': adresse_ban_ligne,
+                    'type': 'DOUBLON_IMB_SUSPECT',
+                    'description': f"IMB {imb_code} - Motif '{motif}' avec adresses BAN différentes"
+                }
+                doublons_suspects.append(doublon_info)
+                doublons_details.append(doublon_info)
+                lignes_deja_ajoutees.add(ligne_codes[position])
 
             # Calculer les statistiques
             total_doublons_imb = len(doublons_imb)
@@ -3350,90 +3188,36 @@ class QualityControlModule:
         - U: Adresse BAN
         """
         try:
-            pd = get_pandas()
-
             # Vérifier que les colonnes requises existent
             if len(self.qgis_data.columns) < 21:  # Au moins 21 colonnes (A-U)
                 raise ValueError("Le fichier QGis ne contient pas assez de colonnes (minimum A-U requis)")
 
-            # Extraire les données des colonnes requises
-            df = self.qgis_data.copy()
-
-            # Renommer les colonnes pour faciliter le travail
-            df_work = pd.DataFrame({
-                'imb_code': df.iloc[:, 0],  # Colonne A - Num Dossier Site
-                'numero_voie': df.iloc[:, 1],  # Colonne B - Numero Voie Site
-                'repondant_voie': df.iloc[:, 2],  # Colonne C - Repondant Voie Site
-                'libelle_voie': df.iloc[:, 3],  # Colonne D - Libelle Voie Site
-                'motif': df.iloc[:, 9],  # Colonne J - Import Fantome
-                'adresse_ban': df.iloc[:, 20]  # Colonne U - Adresse BAN
-            })
-
-            # Nettoyer les données
-            df_work['imb_code'] = df_work['imb_code'].astype(str).str.strip()
-            df_work['motif'] = df_work['motif'].astype(str).str.strip().str.upper()
-            df_work['adresse_ban'] = df_work['adresse_ban'].astype(str).str.strip()
-
-            # Construire l'adresse optimum (même logique que critère 3)
-            def construct_adresse_optimum(row):
-                """Construit l'adresse optimum en gérant les valeurs vides et numériques."""
-                numero = str(row['numero_voie']).strip() if pd.notna(row['numero_voie']) else ''
-                repondant = str(row['repondant_voie']).strip() if pd.notna(row['repondant_voie']) else ''
-                libelle = str(row['libelle_voie']).strip() if pd.notna(row['libelle_voie']) else ''
-
-                # Nettoyer les valeurs numériques (enlever .0)
-                if numero and numero != 'nan':
-                    try:
-                        if '.' in numero and numero.replace('.', '').replace('-', '').isdigit():
-                            numero = str(int(float(numero)))
-                    except:
-                        pass
-
-                # Appliquer les règles de construction d'adresse
-                if not repondant or repondant == 'nan':
-                    if numero and numero != 'nan' and libelle and libelle != 'nan':
-                        return f"{numero} {libelle}".strip()
-                    elif libelle and libelle != 'nan':
-                        return libelle.strip()
-                    elif numero and numero != 'nan':
-                        return numero.strip()
-                    else:
-                        return ''
-                else:
-                    parts = []
-                    if numero and numero != 'nan':
-                        parts.append(numero)
-                    if repondant and repondant != 'nan':
-                        parts.append(repondant)
-                    if libelle and libelle != 'nan':
-                        parts.append(libelle)
-                    return ' '.join(parts).strip()
-
-            df_work['adresse_optimum'] = df_work.apply(construct_adresse_optimum, axis=1)
+            # Colonnes nettoyées et adresse optimum (même logique que critère 3), toutes les lignes
+            df_work = self._get_analysis_context().address_index().rows()
 
             # Détecter les entrées "ad à analyser" avec IMB présent
             ad_a_analyser_entries = []
 
-            for _, row in df_work.iterrows():
-                motif = str(row['motif']).strip().upper()
-                imb_code = str(row['imb_code']).strip()
-
-                # Vérifier si motif = "AD À ANALYSER" et IMB présent
-                if (motif == 'AD À ANALYSER' and
-                    imb_code and imb_code != '' and imb_code != 'nan' and imb_code.upper() != 'NAN'):
-
-                    entry_info = {
-                        'imb_code': imb_code,
-                        'adresse_optimum': row['adresse_optimum'],
-                        'motif_initial': 'ad à analyser',
-                        'adresse_ban': row['adresse_ban'],
-                        'type': 'AD_A_ANALYSER_AVEC_IMB',
-                        'description': f"IMB {imb_code} - Motif 'ad à analyser' nécessitant une analyse"
-                    }
-                    ad_a_analyser_entries.append(entry_info)
+            imb_codes = df_work['imb_code']
+            a_analyser = (
+                df_work['motif'].eq('AD À ANALYSER')
+                & imb_codes.ne('') & imb_codes.ne('nan') & imb_codes.str.upper().ne('NAN')
+            )
 
-                    # Log pour confirmer la détection
-                    self.logger.info(f"AD À ANALYSER DÉTECTÉ - IMB: {imb_code}, Adresse: '{row['adresse_optimum']}'")
+            entrees = df_work.loc[a_analyser, ['imb_code', 'adresse_optimum', 'adresse_ban']]
+            for imb_code, adresse_optimum, adresse_ban in entrees.itertuples(index=False, name=None):
+                entry_info = {
+                    'imb_code': imb_code,
+                    'adresse_optimum': adresse_optimum,
+                    'motif_initial': 'ad à analyser',
+                    'adresse_ban': adresse_ban,
+                    'type': 'AD_A_ANALYSER_AVEC_IMB',
+                    'description': f"IMB {imb_code} - Motif 'ad à analyser' nécessitant une analyse"
+                }
+                ad_a_analyser_entries.append(entry_info)
+
+                # Log pour confirmer la détection
+                self.logger.info(f"AD À ANALYSER DÉTECTÉ - IMB: {imb_code}, Adresse: '{adresse_optimum}'")
 
             # Calculer les statistiques
             total_ad_a_analyser = len(ad_a_analyser_entries)
@@ -3469,8 +3253,6 @@ class QualityControlModule:
         - U: Adresse BAN
         """
         try:
-            pd = get_pandas()
-
             # Motifs autorisés (liste de référence)
             motifs_autorises = [
                 'AD RAS', 'OK', 'NOK', 'UPR RAS', 'UPR OK', 'UPR NOK', 'AD IMPORT OK'
@@ -3480,89 +3262,29 @@ class QualityControlModule:
             if len(self.qgis_data.columns) < 21:  # Au moins 21 colonnes (A-U)
                 raise ValueError("Le fichier QGis ne contient pas assez de colonnes (minimum A-U requis)")
 
-            # Extraire les données des colonnes requises
-            df = self.qgis_data.copy()
-
-            # Renommer les colonnes pour faciliter le travail
-            df_work = pd.DataFrame({
-                'imb_code': df.iloc[:, 0],  # Colonne A - Num Dossier Site
-                'numero_voie': df.iloc[:, 1],  # Colonne B - Numero Voie Site
-                'repondant_voie': df.iloc[:, 2],  # Colonne C - Repondant Voie Site
-                'libelle_voie': df.iloc[:, 3],  # Colonne D - Libelle Voie Site
-                'motif': df.iloc[:, 9],  # Colonne J - Import Fantome (index 9 pour colonne J)
-                'adresse_ban': df.iloc[:, 20]  # Colonne U - Adresse BAN
-            })
-
-            # Nettoyer les données
-            df_work = df_work.dropna(subset=['imb_code'])  # Supprimer les lignes sans code IMB
-            df_work['imb_code'] = df_work['imb_code'].astype(str).str.strip()
-            df_work['motif'] = df_work['motif'].astype(str).str.strip().str.upper()
-            df_work['adresse_ban'] = df_work['adresse_ban'].astype(str).str.strip()
-
-            # Construire l'adresse optimum (même logique que critère 3)
-            def construct_adresse_optimum(row):
-                """Construit l'adresse optimum en gérant les valeurs vides et numériques."""
-                numero = str(row['numero_voie']).strip() if pd.notna(row['numero_voie']) else ''
-                repondant = str(row['repondant_voie']).strip() if pd.notna(row['repondant_voie']) else ''
-                libelle = str(row['libelle_voie']).strip() if pd.notna(row['libelle_voie']) else ''
-
-                # Nettoyer les valeurs numériques (enlever .0)
-                if numero and numero != 'nan':
-                    try:
-                        if '.' in numero and numero.replace('.', '').replace('-', '').isdigit():
-                            numero = str(int(float(numero)))
-                    except:
-                        pass
-
-                # Construire l'adresse selon les règles du critère 3
-                parts = []
-                if numero and numero != 'nan':
-                    parts.append(numero)
-                if repondant and repondant != 'nan':
-                    parts.append(repondant)
-                if libelle and libelle != 'nan':
-                    parts.append(libelle)
-
-                # Appliquer les règles spécifiques
-                if not repondant or repondant == 'nan':
-                    if numero and numero != 'nan' and libelle and libelle != 'nan':
-                        return f"{numero} {libelle}".strip()
-                    elif libelle and libelle != 'nan':
-                        return libelle.strip()
-                    elif numero and numero != 'nan':
-                        return numero.strip()
-                    else:
-                        return ''
-                else:
-                    return ' '.join(parts).strip()
-
-            df_work['adresse_optimum'] = df_work.apply(construct_adresse_optimum, axis=1)
+            # Colonnes nettoyées et adresse optimum (même logique que critère 3), lignes avec code IMB
+            df_work = self._get_analysis_context().address_index().rows(with_imb_only=True)
 
             motifs_incorrects_entries = []
 
-            # Analyser chaque ligne pour détecter les motifs incorrects
-            for index, row in df_work.iterrows():
-                motif = str(row['motif']).strip().upper()
-                imb_code = str(row['imb_code']).strip()
-
-                # Ignorer les lignes avec motifs vides ou NaN
-                if not motif or motif == '' or motif.upper() == 'NAN':
-                    continue
-
-                # Vérifier si le motif n'est pas dans la liste autorisée
-                if motif not in motifs_autorises:
-                    entry_info = {
-                        'imb_code': imb_code,
-                        'adresse_optimum': row['adresse_optimum'],
-                        'motif_incorrect': motif,
-                        'adresse_ban': row['adresse_ban'],
-                        'type': 'MOTIF_INCORRECT',
-                        'description': f"IMB {imb_code} - Motif '{motif}' non autorisé"
-                    }
-                    motifs_incorrects_entries.append(entry_info)
+            # Motifs non vides absents de la liste autorisée
+            motifs = df_work['motif']
+            incorrects = motifs.ne('') & motifs.ne('NAN') & ~motifs.isin(motifs_autorises)
+
+            entrees = df_work.loc[incorrects, ['imb_code', 'motif', 'adresse_optimum', 'adresse_ban']]
+            for imb_code, motif, adresse_optimum, adresse_ban in entrees.itertuples(index=False, name=None):
+                entry_info = {
+                    'imb_code': imb_code,
+                    'adresse_optimum': adresse_optimum,
+                    'motif_incorrect': motif,
+                    'adresse_ban': adresse_ban,
+                    'type': 'MOTIF_INCORRECT',
+                    'description': f"IMB {imb_code} - Motif '{motif}' non autorisé"
+                }
+                motifs_incorrects_entries.append(entry_info)
 
-                    # Log pour confirmer la détection
-                    self.logger.info(f"MOTIF INCORRECT DÉTECTÉ - IMB: {imb_code}, Motif: '{motif}'")
+                # Log pour confirmer la détection
+                self.logger.info(f"MOTIF INCORRECT DÉTECTÉ - IMB: {imb_code}, Motif: '{motif}'")
 
             # Calculer les statistiques
             total_motifs_incorrects = len(motifs_incorrects_entries)
@@ -3635,16 +3357,7 @@ class QualityControlModule:
 
         try:
             # Générer le nom de fichier depuis les informations détectées
-            commune = self.detected_info.get('commune', 'Commune')
-            insee = self.detected_info.get('insee', 'INSEE')
-            collaborateur = self.detected_info.get('collaborateur', 'Collaborateur')
-            id_tache = self.detected_info.get('id_tache', 'ID_TACHE')
-
-            # Nettoyer les noms pour le fichier (enlever caractères spéciaux)
-            commune_clean = "".join(c for c in commune if c.isalnum() or c in (' ', '-', '_')).strip()
-            collaborateur_clean = "".join(c for c in collaborateur if c.isalnum() or c in (' ', '-', '_')).strip()
-
-            filename = f"Etat_De_Lieu_{commune_clean}_{insee}_{collaborateur_clean}.xlsx"
+            commune, id_tache, insee, collaborateur, filename = self._get_report_naming()
 
             # Utiliser l'enregistrement automatique Teams
             file_path = self._get_teams_save_path(commune, id_tache, insee, collaborateur, filename)
@@ -3719,12 +3432,60 @@ class QualityControlModule:
                     update_ui()
 
             # Générer de manière asynchrone
-            run_async_task(generate_report, on_success, on_error, "Export rapport")
+            run_async_task(generate_report, on_success, on_error, "Export rapport",
+                           dedup_key=(id(self), "export"))
 
         except Exception as e:
             self.logger.error(f"Erreur lors de l'export: {e}")
             messagebox.showerror("Erreur", f"Erreur lors de l'export:\n{e}")
 
+    def _get_report_naming(self) -> Tuple[str, str, str, str, str]:
+        """
+        Récupère les informations de nommage du rapport Etat_De_Lieu.
+
+        Returns:
+            Tuple (commune, id_tache, insee, collaborateur, nom du fichier)
+        """
+        commune = self.detected_info.get('commune', 'Commune')
+        insee = self.detected_info.get('insee', 'INSEE')
+        collaborateur = self.detected_info.get('collaborateur', 'Collaborateur')
+        id_tache = self.detected_info.get('id_tache', 'ID_TACHE')
+
+        # Nettoyer les noms pour le fichier (enlever caractères spéciaux)
+        commune_clean = "".join(c for c in commune if c.isalnum() or c in (' ', '-', '_')).strip()
+        collaborateur_clean = "".join(c for c in collaborateur if c.isalnum() or c in (' ', '-', '_')).strip()
+
+        filename = f"Etat_De_Lieu_{commune_clean}_{insee}_{collaborateur_clean}.xlsx"
+        return commune, id_tache, insee, collaborateur, filename
+
+    def export_report_to_teams(self) -> str:
+        """
+        Écrit le rapport Etat_De_Lieu dans l'arborescence Contrôle Qualité, sans confirmation.
+
+        Returns:
+            Chemin du rapport écrit
+
+        Raises:
+            ValueError: Si aucune analyse n'est disponible
+            RuntimeError: Si le dossier ou le rapport n'a pas pu être créé
+        """
+        from utils.file_utils import create_quality_control_folder, get_quality_control_file_path
+
+        if not self.qc_results:
+            raise ValueError("Aucun résultat d'analyse disponible pour l'export")
+
+        commune, id_tache, insee, collaborateur, filename = self._get_report_naming()
+
+        folder_result = create_quality_control_folder(commune, id_tache, insee, collaborateur)
+        if not folder_result['success']:
+            raise RuntimeError(f"Impossible de créer le dossier: {folder_result['error']}")
+
+        file_path = get_quality_control_file_path(commune, id_tache, insee, collaborateur, filename)
+        if not self._generate_excel_report(file_path):
+            raise RuntimeError(f"Échec de la génération du rapport: {file_path}")
+
+        return file_path
+
     def _get_teams_save_path(self, commune: str, id_tache: str, insee: str, collaborateur: str, filename: str) -> str:
         """
         Génère le chemin de sauvegarde pour le contrôle qualité.
@@ -3852,6 +3613,7 @@ class QualityControlModule:
             messagebox.showerror("Erreur", f"Erreur lors de la sélection du fichier:\n{e}")
             return None
 
+    @timed_operation('qc.write_report', threshold=5.0)
     def _generate_excel_report(self, file_path: str) -> bool:
         """Génère le rapport Excel avec 2 feuilles."""
         try:
@@ -4321,6 +4083,23 @@ class QualityControlModule:
                 ['', '', '', '']
             ]
 
+    def _first_motif_per_imb(self, imb_codes, motifs):
+        """
+        Garde le premier motif de chaque code IMB renseigné.
+
+        Args:
+            imb_codes: Codes IMB nettoyés ('' pour les cellules vides)
+            motifs: Motifs nettoyés, alignés avec les codes
+
+        Returns:
+            DataFrame (imb_code, motif) avec une ligne par code IMB
+        """
+        pd = get_pandas()
+
+        rows = pd.DataFrame({'imb_code': imb_codes.to_numpy(), 'motif': motifs.to_numpy()})
+        rows = rows[~rows['imb_code'].isin(['', 'nan', 'NAN'])]
+        return rows.drop_duplicates('imb_code', keep='first')
+
     def _analyze_imb_level_gaps(self):
         """Analyse détaillée des écarts au niveau des codes IMB individuels."""
         try:
@@ -4340,37 +4119,27 @@ class QualityControlModule:
                     'error': 'Données manquantes'
                 }
 
-            # Extraire les données QGis (colonne A = IMB, colonne J = motif)
-            qgis_imb_motifs = {}
-            if len(self.qgis_data.columns) > 9:  # Au moins colonne J (index 9)
-                for index, row in self.qgis_data.iterrows():
-                    imb_code = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ''  # Colonne A
-                    motif = str(row.iloc[9]).strip().upper() if pd.notna(row.iloc[9]) else ''  # Colonne J
+            context = self._get_analysis_context()
+            empty = pd.DataFrame({'imb_code': pd.Series(dtype=object), 'motif': pd.Series(dtype=object)})
 
-                    if imb_code and imb_code not in ['', 'nan', 'NAN']:
-                        if imb_code not in qgis_imb_motifs:
-                            qgis_imb_motifs[imb_code] = []
-                        qgis_imb_motifs[imb_code].append(motif)
+            # Extraire les données QGis (colonne A = IMB, colonne J = motif)
+            qgis_imb_motifs = empty
+            if context.has_column(QGIS_SOURCE, 9):  # Au moins colonne J (index 9)
+                qgis_imb_motifs = self._first_motif_per_imb(context.qgis_imb_codes(), context.qgis_motifs())
 
             # Extraire les données Suivi Commune (page 2, colonne C = IMB, colonne I = motif)
-            suivi_imb_motifs = {}
+            suivi_imb_motifs = empty
             try:
                 # Vérifier que le chemin du fichier Suivi existe
                 if not hasattr(self, 'current_suivi_file_path') or not self.current_suivi_file_path:
                     raise FileNotFoundError("Chemin du fichier Suivi Commune non défini")
 
-                # Lire la page 2 (index 1) du fichier Suivi Commune
-                suivi_page2_df = pd.read_excel(self.current_suivi_file_path, sheet_name=1, date_format=None)
-
-                if len(suivi_page2_df.columns) > 8:  # Au moins colonne I (index 8)
-                    for index, row in suivi_page2_df.iterrows():
-                        imb_code = str(row.iloc[2]).strip() if pd.notna(row.iloc[2]) else ''  # Colonne C
-                        motif = str(row.iloc[8]).strip().upper() if pd.notna(row.iloc[8]) else ''  # Colonne I
+                # Page 2 (index 1) du fichier Suivi Commune, chargée avec le contexte
+                if context.page(1) is None:
+                    raise ValueError("Page 2 du fichier Suivi Commune introuvable")
 
-                        if imb_code and imb_code not in ['', 'nan', 'NAN']:
-                            if imb_code not in suivi_imb_motifs:
-                                suivi_imb_motifs[imb_code] = []
-                            suivi_imb_motifs[imb_code].append(motif)
+                if context.has_column(1, 8):  # Au moins colonne I (index 8)
+                    suivi_imb_motifs = self._first_motif_per_imb(context.suivi_imb_codes(), context.suivi_motifs())
 
             except Exception as e:
                 self.logger.error(f"Erreur lecture page 2 Suivi Commune: {e}")
@@ -4387,80 +4156,38 @@ class QualityControlModule:
                     'error': f'Erreur lecture Suivi: {str(e)}'
                 }
 
-            # Analyser les écarts pour chaque IMB
-            all_imb_codes = set(qgis_imb_motifs.keys()) | set(suivi_imb_motifs.keys())
-
-            matches = 0
-            mismatches = 0
-            missing_in_qgis = 0
-            missing_in_suivi = 0
-
-            for imb_code in sorted(all_imb_codes):
-                qgis_motifs = qgis_imb_motifs.get(imb_code, [])
-                suivi_motifs = suivi_imb_motifs.get(imb_code, [])
-
-                # Cas 1: IMB présent dans les deux fichiers
-                if qgis_motifs and suivi_motifs:
-                    # Comparer les motifs (prendre le premier de chaque liste pour simplifier)
-                    qgis_motif = qgis_motifs[0] if qgis_motifs else ''
-                    suivi_motif = suivi_motifs[0] if suivi_motifs else ''
-
-                    # Ignorer les motifs vides - ne pas les traiter comme des problèmes
-                    qgis_motif_vide = not qgis_motif or qgis_motif.strip() == ''
-                    suivi_motif_vide = not suivi_motif or suivi_motif.strip() == ''
-
-                    if qgis_motif_vide or suivi_motif_vide:
-                        # Motifs vides ignorés - ne pas afficher
-                        matches += 1  # Compter comme match pour les statistiques
-                        continue
-
-                    elif qgis_motif == suivi_motif:
-                        # Motifs identiques et non vides
-                        statut = 'Match'
-                        matches += 1
-
-                        # Gérer les doublons pour les MATCH (ne pas afficher les MATCH simples)
-                        if len(qgis_motifs) > 1 or len(suivi_motifs) > 1:
-                            statut = 'Match+Doublons'
-                            # Ne pas afficher les MATCH avec doublons non plus selon la demande
-                        # NE PAS AFFICHER: MATCH simples ou avec doublons
-
-                    else:
-                        # Motifs différents et non vides
-                        statut = 'Mismatch'
-                        mismatches += 1
-
-                        # AFFICHER: MISMATCH (format 4 colonnes)
-                        imb_analysis_data.append([
-                            imb_code,
-                            qgis_motif,
-                            suivi_motif,
-                            statut
-                        ])
-
-                # Cas 2: IMB présent seulement dans QGis
-                elif qgis_motifs and not suivi_motifs:
-                    qgis_motif = qgis_motifs[0] if qgis_motifs else ''
-                    # AFFICHER: Manquant dans Suivi (format 4 colonnes)
-                    imb_analysis_data.append([
-                        imb_code,
-                        qgis_motif,
-                        'ABSENT',
-                        'Manquant Suivi'
-                    ])
-                    missing_in_suivi += 1
-
-                # Cas 3: IMB présent seulement dans Suivi Commune
-                elif not qgis_motifs and suivi_motifs:
-                    suivi_motif = suivi_motifs[0] if suivi_motifs else ''
-                    # AFFICHER: Manquant dans QGis (format 4 colonnes)
-                    imb_analysis_data.append([
-                        imb_code,
-                        'ABSENT',
-                        suivi_motif,
-                        'Manquant QGIS'
-                    ])
-                    missing_in_qgis += 1
+            # Jointure externe sur le code IMB (premier motif de chaque fichier), triée par code IMB
+            gaps = qgis_imb_motifs.merge(suivi_imb_motifs, on='imb_code', how='outer',
+                                         suffixes=('_qgis', '_suivi'), indicator=True, sort=False)
+            gaps = gaps.sort_values('imb_code', kind='stable', ignore_index=True)
+
+            both = (gaps['_merge'] == 'both').to_numpy()
+            qgis_only = (gaps['_merge'] == 'left_only').to_numpy()
+            suivi_only = (gaps['_merge'] == 'right_only').to_numpy()
+            motif_qgis = gaps['motif_qgis'].fillna('')
+            motif_suivi = gaps['motif_suivi'].fillna('')
+
+            # IMB présent dans les deux fichiers: les motifs vides sont ignorés (comptés comme match)
+            motifs_renseignes = (motif_qgis.str.strip().ne('') & motif_suivi.str.strip().ne('')).to_numpy()
+            mismatch = both & motifs_renseignes & (motif_qgis != motif_suivi).to_numpy()
+
+            matches = int((both & ~mismatch).sum())
+            mismatches = int(mismatch.sum())
+            missing_in_qgis = int(suivi_only.sum())
+            missing_in_suivi = int(qgis_only.sum())
+
+            # AFFICHER uniquement les MISMATCH et les MANQUANTS (format 4 colonnes)
+            statut = pd.Series('Manquant QGIS', index=gaps.index, dtype=object)
+            statut[qgis_only] = 'Manquant Suivi'
+            statut[mismatch] = 'Mismatch'
+            affiche = mismatch | qgis_only | suivi_only
+            imb_analysis_data = pd.DataFrame({
+                'imb_code': gaps['imb_code'],
+                'motif_qgis': motif_qgis.where(~suivi_only, 'ABSENT'),
+                'motif_suivi': motif_suivi.where(~qgis_only, 'ABSENT'),
+                'statut': statut
+            })[affiche].values.tolist()
+            all_imb_codes = gaps['imb_code']
 
             # Calculer le total des écarts selon la nouvelle logique
             nb_donnees_manquantes = missing_in_qgis + missing_in_suivi
@@ -7575,7 +7302,7 @@ class QualityControlModule:
     # ==========================================
 
     def _generate_tracking_report_async(self, files_data: List[Dict[str, Any]]):
-        """Lance la génération du rapport Excel en arrière-plan."""
+        """Programme la mise à jour du rapport Excel en arrière-plan (différée et regroupée)."""
         if not files_data:
             return
 
@@ -7585,96 +7312,27 @@ class QualityControlModule:
             except Exception as e:
                 self.logger.error(f"Erreur génération rapport automatique: {e}")
 
-        # Lancer en arrière-plan pour ne pas bloquer l'UI
-        thread = threading.Thread(target=generate_report, daemon=True)
-        thread.start()
+        # Un rafraîchissement rapproché remplace la mise à jour encore en attente:
+        # le fichier synchronisé n'est écrit qu'une fois
+        if self._tracking_report_timer is not None:
+            self._tracking_report_timer.cancel()
+
+        self._tracking_report_timer = threading.Timer(TRACKING_REPORT_DEBOUNCE_SECONDS, generate_report)
+        self._tracking_report_timer.daemon = True
+        self._tracking_report_timer.start()
 
     def _generate_tracking_report(self, files_data: List[Dict[str, Any]]):
-        """Génère le rapport Excel de suivi automatique."""
+        """Met à jour le rapport Excel de suivi automatique (lignes ajoutées/modifiées uniquement)."""
         try:
             if not OPENPYXL_AVAILABLE:
                 self.logger.warning("OpenPyXL non disponible - rapport Excel non généré")
                 return
 
-            # Définir le chemin du rapport
-            report_dir = Path(r"C:\Users\welj\orange.com\BOT G2R - CM Adresses et Plan Adressage - CM Adresses et Plan Adressage\Suivis CMS Adresse_Plan Adressage\Contrôle Qualité\ZZZ_Suivi_Controle_Qualité")
-            report_file = report_dir / "Suivi Controle Qualité.xlsx"
-
-            # Créer le répertoire s'il n'existe pas
-            report_dir.mkdir(parents=True, exist_ok=True)
-
-            # Créer le workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Suivi Contrôle Qualité"
-
-            # Définir les en-têtes
-            headers = [
-                "Commune",
-                "ID Tâche PA",
-                "Code INSEE",
-                "Domaine",
-                "Affectation",
-                "Contrôleur",
-                "Score Total",
-                "Statut Commune"
-            ]
-
-            # Ajouter les en-têtes avec le style des fichiers état de lieu
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF", size=11)
-                cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-                cell.border = Border(
-                    left=Side(style="thin", color="000000"),
-                    right=Side(style="thin", color="000000"),
-                    top=Side(style="thin", color="000000"),
-                    bottom=Side(style="thin", color="000000")
-                )
-
-            # Ajouter les données
-            for row, file_info in enumerate(files_data, 2):
-                data_row = [
-                    file_info.get('commune', 'N/A'),
-                    file_info.get('id_tache', 'N/A'),
-                    file_info.get('insee', 'N/A'),
-                    file_info.get('domaine', 'N/A'),
-                    file_info.get('affectation', 'N/A'),
-                    file_info.get('controleur', 'N/A'),
-                    file_info.get('score_total', 'N/A'),
-                    file_info.get('statut_commune', 'N/A')
-                ]
-
-                for col, value in enumerate(data_row, 1):
-                    cell = ws.cell(row=row, column=col, value=value)
-                    cell.font = Font(size=10)
-                    cell.alignment = Alignment(horizontal="center", vertical="center")
-                    cell.border = Border(
-                        left=Side(style="thin", color="000000"),
-                        right=Side(style="thin", color="000000"),
-                        top=Side(style="thin", color="000000"),
-                        bottom=Side(style="thin", color="000000")
-                    )
-
-                    # Coloration conditionnelle pour le statut (style état de lieu)
-                    if col == 8:  # Colonne Statut Commune
-                        if value == "OK":
-                            cell.fill = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
-                            cell.font = Font(bold=True, color="FFFFFF", size=10)
-                        elif value in ["NOK", "NON CONFORME"]:
-                            cell.fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-                            cell.font = Font(bold=True, color="FFFFFF", size=10)
-
-            # Ajuster la largeur des colonnes (style état de lieu)
-            column_widths = [18, 14, 12, 12, 16, 14, 12, 16]
-            for col, width in enumerate(column_widths, 1):
-                ws.column_dimensions[ws.cell(row=1, column=col).column_letter].width = width
-
-            # Sauvegarder le fichier
-            wb.save(report_file)
+            tracking_report = QcTrackingReport.for_quality_control_folder(TeamsConfig.get_quality_control_teams_path())
+            if self._tracking_report is None or self._tracking_report.report_path != tracking_report.report_path:
+                self._tracking_report = tracking_report
 
-            self.logger.info(f"📊 Rapport Excel généré: {report_file}")
+            self._tracking_report.update(files_data)
 
         except Exception as e:
             self.logger.error(f"Erreur génération rapport Excel: {e}")
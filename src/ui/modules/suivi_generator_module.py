@@ -20,7 +20,7 @@ from config.constants import COLORS, UIConfig
 from core import FileProcessor, DataValidator, ExcelGenerator
 from utils.file_utils import get_icon_path
 from utils.lazy_imports import get_PIL
-from utils.performance import run_async_task
+from utils.performance import run_async_task, timed_operation
 
 from ui.styles import StyleManager
 from ui.components import (
@@ -293,7 +293,8 @@ class SuiviGeneratorModule:
             messagebox.showerror("Erreur", f"Erreur lors du traitement du fichier MOAI:\n{error}")
         
         # Process asynchronously
-        run_async_task(process, on_success, on_error, "MOAI file processing")
+        run_async_task(process, on_success, on_error, "MOAI file processing",
+                       dedup_key=(id(self), "moai", file_path))
     
     def _process_qgis_file(self, file_path: str):
         """Process QGis file."""
@@ -315,7 +316,8 @@ class SuiviGeneratorModule:
             messagebox.showerror("Erreur", f"Erreur lors du traitement du fichier QGis:\n{error}")
         
         # Process asynchronously
-        run_async_task(process, on_success, on_error, "QGis file processing")
+        run_async_task(process, on_success, on_error, "QGis file processing",
+                       dedup_key=(id(self), "qgis", file_path))
     
     def _on_project_data_changed(self):
         """Handle project data changes."""
@@ -377,6 +379,7 @@ class SuiviGeneratorModule:
             # Show progress
             self.generation_section.show_progress(True)
 
+            @timed_operation('suivi_generator.generate', threshold=5.0)
             def generate():
                 # Process MOAI data
                 moai_processed = self.data_validator.prepare_moai_data(self.moai_data)
@@ -406,7 +409,8 @@ class SuiviGeneratorModule:
                 messagebox.showerror("Erreur", f"Erreur lors de la génération:\n{error}")
 
             # Generate asynchronously
-            run_async_task(generate, on_success, on_error, "Excel generation")
+            run_async_task(generate, on_success, on_error, "Excel generation",
+                           dedup_key=(id(self), "generation"))
 
         except Exception as e:
             self.logger.error(f"Error in generate Excel: {e}")
@@ -6,6 +6,7 @@ import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
 import logging
 import os
+import queue
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 import sys
@@ -17,10 +18,13 @@ if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 from config.constants import COLORS, UIConfig
-from core import FileProcessor, DataValidator, ExcelGenerator
+from core import FileProcessor, DataValidator, ExcelGenerator, WorkbookReader, CommuneManifest
+from core.workbook_writer import StreamingWorkbookWriter, ColumnFormat, estimate_column_width
+from core import commune_extractor
+from core.commune_extractor import read_commune_sheet
 from utils.file_utils import get_icon_path, check_file_access, is_excel_file_open
 from utils.lazy_imports import get_pandas
-from utils.performance import run_async_task
+from utils.performance import run_async_task, timed_operation
 
 from ui.styles import StyleManager, create_card_frame, create_section_header
 from ui.responsive_utils import get_responsive_manager
@@ -66,11 +70,22 @@ class SuiviGlobalModule:
         self.existing_communes = {}  # Store existing commune data for comparison
         self.new_communes = []  # Track new communes found during scan
         self.updated_communes = []  # Track communes that will be updated
+        self.unchanged_communes = []  # Existing communes whose suivi file did not change
+        self.communes_to_write = []  # Communes (re)written into the global file on generation
+        self.failed_commune_files = set()  # Suivi files of communes whose pages could not be written
         # Get dynamic Teams path for current user
         from config.constants import TeamsConfig
         self.teams_folder_path = TeamsConfig.get_global_teams_path()
         self.global_excel_filename = "Suivis Global Tickets CMS Adr_PA.xlsx"
 
+        # Manifest of already aggregated commune files (incremental generation)
+        self.manifest = CommuneManifest(os.path.join(self.teams_folder_path, ".suivi_global_manifest.json"))
+        self.manifest_in_sync = False
+
+        # Progress updates posted by the scan worker, displayed on the Tk thread
+        self._progress_queue = queue.Queue()
+        self._scan_in_progress = False
+
         # UI components
         self.progress_var = None
         self.progress_bar = None
@@ -301,6 +316,8 @@ class SuiviGlobalModule:
             self.existing_communes.clear()
             self.new_communes.clear()
             self.updated_communes.clear()
+            self.unchanged_communes.clear()
+            self.communes_to_write = []
 
             if self.summary_text:
                 self.summary_text.delete(1.0, tk.END)
@@ -883,21 +900,26 @@ class SuiviGlobalModule:
             return {}
 
     def _analyze_commune_changes(self, processed_data):
-        """Analyze which communes are new vs existing."""
+        """Analyze which communes are new, changed or unchanged since the last generation."""
         self.new_communes.clear()
         self.updated_communes.clear()
+        self.unchanged_communes.clear()
 
         for commune_data in processed_data:
             commune_name = commune_data['nom_commune']
 
-            if commune_name in self.existing_communes:
+            if commune_name not in self.existing_communes:
+                # New commune
+                self.new_communes.append(commune_data)
+            elif commune_data.get('changed', True) or not self.manifest_in_sync:
                 # Existing commune - will be updated
                 self.updated_communes.append(commune_data)
             else:
-                # New commune
-                self.new_communes.append(commune_data)
+                # Existing commune already up to date in the global file
+                self.unchanged_communes.append(commune_data)
 
-        self.logger.info(f"Analysis: {len(self.new_communes)} new communes, {len(self.updated_communes)} communes to update")
+        self.logger.info(f"Analysis: {len(self.new_communes)} new communes, {len(self.updated_communes)} communes to update, "
+                         f"{len(self.unchanged_communes)} unchanged")
 
     def _scan_and_process_folders(self):
         """Automatically scan Teams folder and process commune folders in one step."""
@@ -908,10 +930,22 @@ class SuiviGlobalModule:
             self.scan_button.config(state=tk.DISABLED, text="🔄 Scan en cours...")
             self.generate_button.config(state=tk.DISABLED)
 
+            # Display progress posted by the scan worker
+            self._scan_in_progress = True
+            self._poll_progress_queue()
+
+            @timed_operation('suivi_global.scan', threshold=10.0)
             def scan_and_process():
                 # Step 1: Load existing commune data for comparison
                 self.existing_communes = self._load_existing_communes()
 
+                # Load the manifest of the last generation (incremental scan)
+                global_file_path = os.path.join(self.teams_folder_path, self.global_excel_filename)
+                self.manifest.load()
+                self.manifest_in_sync = self.manifest.is_in_sync_with(global_file_path)
+                if not self.manifest_in_sync:
+                    self.logger.info("Global file not in sync with manifest - all existing communes will be rewritten")
+
                 # Step 2: Auto-scan Teams folder
                 from config.constants import TeamsConfig
                 base_path = TeamsConfig.get_teams_base_path()
@@ -943,6 +977,7 @@ class SuiviGlobalModule:
                 return processed_data
 
             def on_success(result):
+                self._scan_in_progress = False
                 self._stop_animation()
                 self.processed_data = result
                 self._update_summary_display()
@@ -975,6 +1010,7 @@ class SuiviGlobalModule:
                 self._update_file_status_indicator()
 
             def on_error(error):
+                self._scan_in_progress = False
                 self._stop_animation()
                 self.logger.error(f"Error in scan and process: {error}")
 
@@ -989,30 +1025,28 @@ class SuiviGlobalModule:
                 messagebox.showerror("Erreur", f"Erreur lors du scan:\n{error}")
 
             # Process asynchronously
-            run_async_task(scan_and_process, on_success, on_error, "Scan and process")
+            run_async_task(scan_and_process, on_success, on_error, "Scan and process",
+                           dedup_key=(id(self), "scan"))
 
         except Exception as e:
+            self._scan_in_progress = False
             self.logger.error(f"Error initiating scan and process: {e}")
             self.scan_button.config(state=tk.NORMAL)
             messagebox.showerror("Erreur", f"Erreur lors du lancement du scan:\n{e}")
 
     def _process_commune_folders(self) -> List[Dict[str, Any]]:
-        """Process commune folders and extract data from page 3 of suivi files."""
-        processed_data = []
+        """Process commune folders and extract data from the suivi files (runs off the Tk thread)."""
+        processed_by_folder = {}  # folder index -> commune data, returned in folder order
+        extraction_tasks = []
+        task_folder_indexes = []
         total_folders = len(self.commune_folders)
 
         for i, folder_path in enumerate(self.commune_folders):
             try:
-                # Enhanced progress tracking
-                progress = 20 + (i / total_folders) * 60  # Reserve 20% for initial scan, 60% for processing
                 folder_name = os.path.basename(folder_path)
-
-                # Update enhanced progress indicators
-                status_msg = f"📁 Traitement: {folder_name} ({i+1}/{total_folders})"
-                details_msg = f"Analyse du dossier: {folder_name}\nRecherche des fichiers Excel de suivi\nExtraction des données..."
-                self._update_progress_indicators(progress, status_msg, details_msg)
-
-                self.parent.update()
+                self._post_progress(20 + (i / total_folders) * 10,
+                                    f"📁 Recherche: {folder_name} ({i+1}/{total_folders})",
+                                    f"Analyse du dossier: {folder_name}\nRecherche des fichiers Excel de suivi")
 
                 # Find Excel files in the folder
                 excel_files = []
@@ -1026,71 +1060,80 @@ class SuiviGlobalModule:
 
                 # Process the most recent suivi file
                 latest_file = max(excel_files, key=os.path.getmtime)
-                commune_data = self._extract_commune_data(latest_file, folder_path)
 
+                # Reuse the data extracted during the last generation if the file did not change
+                commune_data = self.manifest.get_unchanged_data(latest_file, CommuneManifest.get_file_signature(latest_file))
                 if commune_data:
-                    processed_data.append(commune_data)
-                    self.logger.info(f"Processed commune: {commune_data.get('nom_commune', 'Unknown')}")
+                    commune_data['changed'] = False
+                    processed_by_folder[i] = commune_data
+                    self.logger.debug(f"Unchanged commune: {commune_data.get('nom_commune', 'Unknown')}")
+                    continue
+
+                extraction_tasks.append((latest_file, folder_path))
+                task_folder_indexes.append(i)
 
             except Exception as e:
                 self.logger.error(f"Error processing folder {folder_path}: {e}")
                 continue
 
+        # Parse changed commune files concurrently; progress streams back as they complete
+        def on_result(result, done, total):
+            folder_name = os.path.basename(result['folder_path'])
+            if result['error']:
+                self.logger.error(f"Error processing folder {result['folder_path']}: {result['error']}")
+            elif result['commune_data']:
+                result['commune_data']['changed'] = True
+                self.logger.info(f"Processed commune: {result['commune_data'].get('nom_commune', 'Unknown')}")
+
+            self._post_progress(30 + (done / total) * 50,
+                                f"📁 Traitement: {folder_name} ({done}/{total})",
+                                f"Extraction des données des fichiers de suivi\n{done} fichiers traités sur {total}")
+
+        if extraction_tasks:
+            results = commune_extractor.extract_commune_workbooks(extraction_tasks, on_result=on_result)
+            for folder_index, result in zip(task_folder_indexes, results):
+                if not result['error'] and result['commune_data']:
+                    processed_by_folder[folder_index] = result['commune_data']
+
+        # Same row order as the commune folders, whatever the extraction order
+        processed_data = [processed_by_folder[index] for index in sorted(processed_by_folder)]
+
         # Enhanced analysis phase
         analysis_msg = "🔍 Analyse des nouvelles communes..."
         analysis_details = f"Comparaison avec les données existantes\nIdentification des nouvelles communes\nPréparation du résumé"
-        self._update_progress_indicators(85, analysis_msg, analysis_details)
-        self.parent.update()
+        self._post_progress(85, analysis_msg, analysis_details)
 
         return processed_data
 
-    def _extract_commune_data(self, excel_file_path: str, folder_path: str) -> Optional[Dict[str, Any]]:
-        """Extract data from page 3 of a commune suivi file and detect RIP sheet if present."""
+    def _post_progress(self, progress: float, status: str, details: str = ""):
+        """Queue a progress update from a worker thread for display on the Tk thread."""
+        self._progress_queue.put((progress, status, details))
+
+    def _poll_progress_queue(self):
+        """Drain queued progress updates on the Tk thread while a scan is running."""
+        latest = None
         try:
-            pd = get_pandas()
+            while True:
+                latest = self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
 
-            # Read page 3 of the Excel file with INSEE as string to preserve leading zeros
-            # Also prevent automatic date parsing to avoid date format issues
-            df = pd.read_excel(
-                excel_file_path,
-                sheet_name=2,
-                dtype={'Insee': str, 'insee': str, 'Code INSEE': str},
-                date_format=None  # CRITICAL: Prevent automatic date parsing
-            )  # Page 3 (0-indexed)
-
-            if df.empty:
-                self.logger.warning(f"Page 3 is empty in {excel_file_path}")
-                return None
-
-            # Check if this is a RIP commune by looking at the Domaine field
-            is_rip_commune = self._check_if_rip_commune(df)
-
-            # Extract commune information from the first row or filename
-            folder_name = os.path.basename(folder_path)
-            parts = folder_name.split('_')
-
-            commune_data = {
-                'nom_commune': parts[0] if len(parts) > 0 else 'Unknown',
-                'id_tache': parts[1] if len(parts) > 1 else 'Unknown',
-                'insee_code': self._extract_insee_from_data(df) or 'Unknown',
-                'file_path': excel_file_path,
-                'folder_path': folder_path,
-                'last_modified': os.path.getmtime(excel_file_path),
-                'data_summary': self._summarize_page3_data(df),
-                'is_rip_commune': is_rip_commune,
-                'has_rip_sheet': False,
-                'rip_data_summary': None
-            }
+        if latest is not None and self._scan_in_progress:
+            try:
+                self._update_progress_indicators(*latest)
+            except tk.TclError:
+                return  # Module UI destroyed
 
-            # If this is a RIP commune, try to read the RIP sheet (4th page)
-            if is_rip_commune:
-                rip_data = self._extract_rip_sheet_data(excel_file_path)
-                if rip_data:
-                    commune_data['has_rip_sheet'] = True
-                    commune_data['rip_data_summary'] = rip_data
-                    self.logger.info(f"RIP sheet detected and processed for {commune_data['nom_commune']}")
+        if self._scan_in_progress:
+            self.parent.after(100, self._poll_progress_queue)
 
-            return commune_data
+    def _extract_commune_data(self, excel_file_path: str, folder_path: str) -> Optional[Dict[str, Any]]:
+        """Extract data from page 3 of a commune suivi file and detect RIP sheet if present."""
+        try:
+            result = commune_extractor.extract_commune_workbooks([(excel_file_path, folder_path)], max_workers=1)[0]
+            if result['error']:
+                raise Exception(result['error'])
+            return result['commune_data']
 
         except Exception as e:
             self.logger.error(f"Error extracting data from {excel_file_path}: {e}")
@@ -1098,56 +1141,13 @@ class SuiviGlobalModule:
 
     def _check_if_rip_commune(self, df) -> bool:
         """Check if this is a RIP commune by looking at the Domaine field."""
-        try:
-            # Look for Domaine column in page 3 data
-            domaine_columns = ['Domaine', 'domaine', 'DOMAINE']
-            for col in domaine_columns:
-                if col in df.columns and not df[col].empty:
-                    domaine_value = df[col].iloc[0]
-                    if domaine_value is not None:
-                        domaine_str = str(domaine_value).strip().upper()
-                        return domaine_str == 'RIP'
-            return False
-        except:
-            return False
+        return commune_extractor.check_if_rip_commune(df)
 
     def _extract_rip_sheet_data(self, excel_file_path: str) -> Optional[Dict[str, Any]]:
         """Extract data from the RIP sheet (4th page) if it exists."""
         try:
-            pd = get_pandas()
-
-            # Try to read the 4th sheet (index 3)
-            rip_df = pd.read_excel(
-                excel_file_path,
-                sheet_name=3,
-                dtype={'Code INSEE': str, 'Insee': str},
-                date_format=None  # Prevent automatic date parsing
-            )
-
-            if rip_df.empty:
-                self.logger.warning(f"RIP sheet (page 4) is empty in {excel_file_path}")
-                return None
-
-            # Summarize RIP sheet data
-            rip_summary = {
-                'total_rows': len(rip_df),
-                'columns': list(rip_df.columns),
-                'has_duration_data': 'Durée' in rip_df.columns,
-                'total_duration': 0
-            }
-
-            # Calculate total duration if duration column exists
-            if 'Durée' in rip_df.columns:
-                try:
-                    # Convert duration values to numeric, handling empty/invalid values
-                    duration_values = pd.to_numeric(rip_df['Durée'], errors='coerce').fillna(0)
-                    rip_summary['total_duration'] = float(duration_values.sum())
-                except:
-                    rip_summary['total_duration'] = 0
-
-            self.logger.info(f"RIP sheet processed: {rip_summary['total_rows']} rows, total duration: {rip_summary['total_duration']}")
-            return rip_summary
-
+            rip_df = read_commune_sheet(excel_file_path, 3)
+            return commune_extractor.summarize_rip_sheet(rip_df, excel_file_path)
         except Exception as e:
             # This is expected for non-RIP files or files without 4th sheet
             self.logger.debug(f"No RIP sheet found in {excel_file_path}: {e}")
@@ -1155,32 +1155,11 @@ class SuiviGlobalModule:
 
     def _extract_insee_from_data(self, df) -> Optional[str]:
         """Extract INSEE code from the dataframe."""
-        try:
-            # Look for INSEE code in common column names
-            insee_columns = ['insee', 'code_insee', 'INSEE', 'Code INSEE', 'Insee']
-            for col in insee_columns:
-                if col in df.columns and not df[col].empty:
-                    insee_value = df[col].iloc[0]
-                    if insee_value is not None:
-                        # Format INSEE code to preserve leading zeros (5 digits)
-                        insee_str = str(insee_value).strip()
-                        if insee_str.isdigit() and len(insee_str) <= 5:
-                            return insee_str.zfill(5)  # Pad with leading zeros to 5 digits
-                        return insee_str
-            return None
-        except:
-            return None
+        return commune_extractor.extract_insee_from_data(df)
 
     def _summarize_page3_data(self, df) -> Dict[str, Any]:
         """Summarize the data from page 3."""
-        try:
-            return {
-                'total_rows': len(df),
-                'columns': list(df.columns),
-                'non_empty_rows': len(df.dropna(how='all'))
-            }
-        except:
-            return {'total_rows': 0, 'columns': [], 'non_empty_rows': 0}
+        return commune_extractor.summarize_page3_data(df)
 
     def _update_summary_display(self):
         """Update the summary text display with enhanced formatting and detailed analysis."""
@@ -1206,6 +1185,8 @@ class SuiviGlobalModule:
             self.summary_text.insert(tk.END, f"📊 Total communes trouvées: {total_count}\n", "info")
             self.summary_text.insert(tk.END, f"🆕 Nouvelles communes: {new_count}\n", "new_commune")
             self.summary_text.insert(tk.END, f"🔄 Communes à mettre à jour: {updated_count}\n", "update_commune")
+            if self.unchanged_communes:
+                self.summary_text.insert(tk.END, f"✔️ Communes inchangées (non relues): {len(self.unchanged_communes)}\n", "info")
 
             # Add more detailed statistics
             total_rows = sum(data['data_summary']['total_rows'] for data in self.processed_data)
@@ -1298,6 +1279,7 @@ class SuiviGlobalModule:
             self.status_label.config(text="Mise à jour du fichier Excel...")
             self.progress_var.set(0)
 
+            @timed_operation('suivi_global.write_excel', threshold=10.0)
             def update_process():
                 return self._create_or_update_global_excel_file()
 
@@ -1353,7 +1335,8 @@ class SuiviGlobalModule:
                     messagebox.showerror("Erreur", f"Erreur lors de la mise à jour:\n{error}")
 
             # Update asynchronously
-            run_async_task(update_process, on_success, on_error, "Excel update")
+            run_async_task(update_process, on_success, on_error, "Excel update",
+                           dedup_key=(id(self), "update"))
 
         except Exception as e:
             self.logger.error(f"Error initiating Excel update: {e}")
@@ -1362,8 +1345,6 @@ class SuiviGlobalModule:
     def _create_or_update_global_excel_file(self) -> tuple:
         """Create or update the global Excel file with aggregated data."""
         try:
-            pd = get_pandas()
-
             # Ensure output directory exists
             os.makedirs(self.teams_folder_path, exist_ok=True)
 
@@ -1395,10 +1376,27 @@ class SuiviGlobalModule:
                         # Other types of errors, raise with user message
                         raise Exception(access_result['user_message'])
 
+            # Only communes that are new or whose suivi file changed need to be (re)written,
+            # unless the global file cannot be trusted to hold the other ones
+            incremental = not is_new_file and self.manifest_in_sync
+            if incremental:
+                self.communes_to_write = self.new_communes + self.updated_communes
+            else:
+                self.communes_to_write = list(self.processed_data)
+
+            self.failed_commune_files = set()
+
+            if incremental and not self.communes_to_write:
+                self.logger.info("Global Excel file already up to date - no commune changed since last generation")
+                return file_path, False
+
+            self.logger.info(f"Writing {len(self.communes_to_write)} of {len(self.processed_data)} communes "
+                             f"({'incremental' if incremental else 'full'} generation)")
+
             if is_new_file:
                 # Create new file
                 self.logger.info("Creating new global Excel file")
-                with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+                with StreamingWorkbookWriter(file_path) as writer:
                     # Page 1: Aggregated data from page 3 of all communes (Suivi Tickets)
                     self._create_page1_aggregated_data(writer, None)
 
@@ -1413,74 +1411,59 @@ class SuiviGlobalModule:
             else:
                 # Update existing file
                 self.logger.info("Updating existing global Excel file")
-                # Read existing data from all sheets
-                existing_page1_df = None
-                existing_page2_df = None
-                existing_page3_df = None
-                existing_page4_df = None
-
-                try:
-                    existing_page1_df = pd.read_excel(
-                        file_path,
-                        sheet_name='Suivi Tickets',
-                        dtype={'Code INSEE': str, 'Insee': str},
-                        date_format=None  # CRITICAL: Prevent automatic date parsing
-                    )
-                    # Immediately apply date formatting to existing data
-                    if existing_page1_df is not None and not existing_page1_df.empty:
-                        existing_page1_df = self._format_date_columns(existing_page1_df)
-                        self.logger.info("Applied date formatting to existing Suivi Tickets data")
-                except:
-                    pass
-                try:
-                    existing_page2_df = pd.read_excel(
-                        file_path,
-                        sheet_name='Traitement CMS Adr',
-                        dtype={'Code INSEE': str, 'Insee': str},
-                        date_format=None  # CRITICAL: Prevent automatic date parsing
-                    )
-                    # Immediately apply date formatting to existing data
-                    if existing_page2_df is not None and not existing_page2_df.empty:
-                        existing_page2_df = self._format_date_columns(existing_page2_df)
-                        self.logger.info("Applied date formatting to existing Traitement CMS Adr data")
-                except:
-                    pass
-                try:
-                    existing_page3_df = pd.read_excel(
-                        file_path,
-                        sheet_name='Traitement PA',
-                        dtype={'Code INSEE': str, 'Insee': str},
-                        date_format=None  # CRITICAL: Prevent automatic date parsing
-                    )
-                    # Immediately apply date formatting to existing data
-                    if existing_page3_df is not None and not existing_page3_df.empty:
-                        existing_page3_df = self._format_date_columns(existing_page3_df)
-                        self.logger.info("Applied date formatting to existing Traitement PA data")
-                except:
-                    pass
+                # Read existing data from all sheets in a single pass over the workbook
+                existing_sheets = {}
                 try:
-                    existing_page4_df = pd.read_excel(
-                        file_path,
-                        sheet_name='Traitement RIP',
+                    existing_sheets = WorkbookReader(file_path, use_cache=False).read_sheets(
+                        ['Suivi Tickets', 'Traitement CMS Adr', 'Traitement PA', 'Traitement RIP'],
                         dtype={'Code INSEE': str, 'Insee': str},
                         date_format=None  # CRITICAL: Prevent automatic date parsing
                     )
-                    # Immediately apply date formatting to existing data
-                    if existing_page4_df is not None and not existing_page4_df.empty:
-                        existing_page4_df = self._format_date_columns(existing_page4_df)
-                        self.logger.info("Applied date formatting to existing Traitement RIP data")
-                except:
-                    pass
-
-                # Update with new data
-                with pd.ExcelWriter(file_path, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
+                except Exception as e:
+                    # The unchanged communes are only in the existing file: rewrite every commune
+                    self.logger.warning(f"Could not read existing global Excel file - full generation: {e}")
+                    existing_sheets = {}
+                    self.communes_to_write = list(self.processed_data)
+
+                # A sheet that is missing or failed to parse would lose the rows of the unchanged communes
+                if len(self.communes_to_write) < len(self.processed_data):
+                    required_sheets = ['Suivi Tickets', 'Traitement CMS Adr', 'Traitement PA']
+                    written = {id(data) for data in self.communes_to_write}
+                    if any(data.get('is_rip_commune', False) and data.get('has_rip_sheet', False)
+                           for data in self.processed_data if id(data) not in written):
+                        required_sheets.append('Traitement RIP')
+                    missing_sheets = [name for name in required_sheets if existing_sheets.get(name) is None]
+                    if missing_sheets:
+                        self.logger.warning(f"Existing global Excel file lacks {', '.join(missing_sheets)} - "
+                                            f"full generation")
+                        self.communes_to_write = list(self.processed_data)
+
+                # Immediately apply date formatting to existing data
+                for sheet_name, sheet_df in existing_sheets.items():
+                    if sheet_df is not None and not sheet_df.empty:
+                        existing_sheets[sheet_name] = self._format_date_columns(sheet_df)
+                        self.logger.info(f"Applied date formatting to existing {sheet_name} data")
+
+                existing_page1_df = existing_sheets.get('Suivi Tickets')
+                existing_page2_df = existing_sheets.get('Traitement CMS Adr')
+                existing_page3_df = existing_sheets.get('Traitement PA')
+                existing_page4_df = existing_sheets.get('Traitement RIP')
+
+                # Sheets added by users to the global file are carried over (values only)
+                extra_sheets = self._read_extra_global_sheets(file_path)
+
+                # Rewrite the workbook with the updated data
+                with StreamingWorkbookWriter(file_path) as writer:
                     self._create_page1_aggregated_data(writer, existing_page1_df)
                     self._create_page2_cm_adresse_data(writer, existing_page2_df)
                     self._create_page3_plan_adressage_data(writer, existing_page3_df)
                     self._create_page4_rip_data(writer, existing_page4_df)
 
-            # Apply formatting similar to individual suivi files
-            self._format_global_excel(file_path)
+                    for sheet_name, rows in extra_sheets:
+                        writer.write_rows(sheet_name, rows)
+
+            # Record what the global file now contains for the next incremental run
+            self._update_manifest(file_path)
 
             self.logger.info(f"Global Excel file {'created' if is_new_file else 'updated'}: {file_path}")
             return file_path, is_new_file
@@ -1489,6 +1472,30 @@ class SuiviGlobalModule:
             self.logger.error(f"Error creating/updating global Excel file: {e}")
             raise
 
+    def _update_manifest(self, file_path: str):
+        """
+        Record the aggregated commune files and the written global file in the manifest.
+
+        Communes with a page that could not be written are left out so that
+        the next generation writes them again.
+        """
+        try:
+            for commune_data in self.processed_data:
+                if commune_data['file_path'] in self.failed_commune_files:
+                    self.manifest.forget(commune_data['file_path'])
+                    continue
+                self.manifest.record(commune_data['file_path'], commune_data)
+                commune_data['changed'] = False
+
+            if self.failed_commune_files:
+                self.logger.warning(f"{len(self.failed_commune_files)} commune(s) not fully written - "
+                                    f"retried on next generation")
+
+            self.manifest.mark_workbook_written(file_path)
+            self.manifest_in_sync = self.manifest.save()
+        except Exception as e:
+            self.logger.warning(f"Could not update Suivi Global manifest: {e}")
+
     def _format_date_columns(self, df):
         """Keep date columns exactly as they are in the source files."""
         try:
@@ -1538,30 +1545,14 @@ class SuiviGlobalModule:
         try:
             pd = get_pandas()
 
-            # Get the structure from the first commune's page 3 to maintain consistency
-            template_structure = None
-            if self.processed_data:
-                try:
-                    first_commune = self.processed_data[0]
-                    template_df = pd.read_excel(first_commune['file_path'], sheet_name=2)
-                    if not template_df.empty:
-                        template_structure = list(template_df.columns)
-                except Exception as e:
-                    self.logger.warning(f"Could not get template structure: {e}")
-
             # Prepare aggregated data maintaining original structure
             aggregated_rows = []
 
-            for commune_data in self.processed_data:
+            for commune_data in self.communes_to_write:
                 try:
                     # Read the original page 3 data with INSEE as string to preserve leading zeros
                     # Also ensure date columns are read as strings to prevent automatic date conversion
-                    original_df = pd.read_excel(
-                        commune_data['file_path'],
-                        sheet_name=2,
-                        dtype={'Insee': str, 'insee': str, 'Code INSEE': str},
-                        date_format=None  # Prevent automatic date parsing
-                    )
+                    original_df = read_commune_sheet(commune_data['file_path'], 2)
 
                     if not original_df.empty:
                         # Format date columns to remove time component
@@ -1586,19 +1577,21 @@ class SuiviGlobalModule:
 
                 except Exception as e:
                     self.logger.error(f"Error processing commune {commune_data['nom_commune']}: {e}")
+                    self.failed_commune_files.add(commune_data['file_path'])
                     continue
 
             # Create DataFrame
-            if aggregated_rows:
+            has_existing = existing_df is not None and not existing_df.empty
+            if aggregated_rows or has_existing:
                 new_df = pd.DataFrame(aggregated_rows)
 
                 # If we have existing data, merge it
-                if existing_df is not None and not existing_df.empty:
+                if has_existing:
                     # Format date columns in existing data
                     existing_df = self._format_date_columns(existing_df)
 
                     # Remove existing entries for communes that are being updated
-                    commune_names = [data['nom_commune'] for data in self.processed_data]
+                    commune_names = [data['nom_commune'] for data in self.communes_to_write]
                     if 'Nom Commune' in existing_df.columns:
                         existing_df = existing_df[~existing_df['Nom Commune'].isin(commune_names)]
 
@@ -1631,17 +1624,11 @@ class SuiviGlobalModule:
                 combined_df = self._validate_and_format_dates_before_writing(combined_df, 'Suivi Tickets')
 
                 # Write to Excel with the correct sheet name
-                combined_df.to_excel(writer, sheet_name='Suivi Tickets', index=False)
-
-                # Format INSEE columns as text to preserve leading zeros
-                self._format_insee_columns_as_text(writer, 'Suivi Tickets', combined_df)
-
-                # Format date columns as text to prevent Excel auto-formatting
-                self._format_date_columns_as_text(writer, 'Suivi Tickets', combined_df)
+                self._write_global_sheet(writer, 'Suivi Tickets', combined_df)
             else:
                 # Create empty DataFrame with basic headers
                 empty_df = pd.DataFrame(columns=['Nom Commune', 'Code INSEE'])
-                empty_df.to_excel(writer, sheet_name='Suivi Tickets', index=False)
+                self._write_global_sheet(writer, 'Suivi Tickets', empty_df)
 
         except Exception as e:
             self.logger.error(f"Error creating page 1 data: {e}")
@@ -1655,16 +1642,11 @@ class SuiviGlobalModule:
             # Prepare aggregated data from CM Adresse sheets (page 1)
             aggregated_rows = []
 
-            for commune_data in self.processed_data:
+            for commune_data in self.communes_to_write:
                 try:
                     # Read the CM Adresse sheet (page 1) data with INSEE as string to preserve leading zeros
                     # Also ensure date columns are read as strings to prevent automatic date conversion
-                    cm_df = pd.read_excel(
-                        commune_data['file_path'],
-                        sheet_name=0,
-                        dtype={'Insee': str, 'insee': str, 'Code INSEE': str},
-                        date_format=None  # Prevent automatic date parsing
-                    )  # First sheet
+                    cm_df = read_commune_sheet(commune_data['file_path'], 0)  # First sheet
 
                     # Debug: Log the actual columns found
                     self.logger.info(f"CM Adresse columns in {commune_data['nom_commune']}: {list(cm_df.columns)}")
@@ -1702,10 +1684,12 @@ class SuiviGlobalModule:
 
                 except Exception as e:
                     self.logger.error(f"Error processing CM Adresse data for commune {commune_data['nom_commune']}: {e}")
+                    self.failed_commune_files.add(commune_data['file_path'])
                     continue
 
             # Create DataFrame
-            if aggregated_rows:
+            has_existing = existing_df is not None and not existing_df.empty
+            if aggregated_rows or has_existing:
                 new_df = pd.DataFrame(aggregated_rows)
 
                 # Apply comprehensive date formatting to the new DataFrame
@@ -1713,12 +1697,12 @@ class SuiviGlobalModule:
                 self.logger.info(f"Applied date formatting to new CM Adresse data: {len(new_df)} rows")
 
                 # If we have existing data, merge it
-                if existing_df is not None and not existing_df.empty:
+                if has_existing:
                     # Format date columns in existing data
                     existing_df = self._format_date_columns(existing_df)
 
                     # Remove existing entries for communes that are being updated
-                    commune_names = [data['nom_commune'] for data in self.processed_data]
+                    commune_names = [data['nom_commune'] for data in self.communes_to_write]
                     if 'Nom commune' in existing_df.columns:
                         existing_df = existing_df[~existing_df['Nom commune'].isin(commune_names)]
 
@@ -1749,18 +1733,12 @@ class SuiviGlobalModule:
                 combined_df = self._validate_and_format_dates_before_writing(combined_df, 'Traitement CMS Adr')
 
                 # Write to Excel with the correct sheet name
-                combined_df.to_excel(writer, sheet_name='Traitement CMS Adr', index=False)
-
-                # Format INSEE columns as text to preserve leading zeros
-                self._format_insee_columns_as_text(writer, 'Traitement CMS Adr', combined_df)
-
-                # Format date columns as text to prevent Excel auto-formatting
-                self._format_date_columns_as_text(writer, 'Traitement CMS Adr', combined_df)
+                self._write_global_sheet(writer, 'Traitement CMS Adr', combined_df)
             else:
                 # Create empty DataFrame with headers including new Motif Voie and Durée columns
                 empty_df = pd.DataFrame(columns=['Nom commune', 'Insee', 'ID Tache', 'Motif Voie', 'Collaborateur',
                                                'Date affectation', 'Date traitement', 'Date livraison', 'STATUT Ticket', 'Durée'])
-                empty_df.to_excel(writer, sheet_name='Traitement CMS Adr', index=False)
+                self._write_global_sheet(writer, 'Traitement CMS Adr', empty_df)
 
         except Exception as e:
             self.logger.error(f"Error creating page 2 CM Adresse data: {e}")
@@ -1774,16 +1752,11 @@ class SuiviGlobalModule:
             # Prepare aggregated data from Plan Adressage sheets (page 2)
             aggregated_rows = []
 
-            for commune_data in self.processed_data:
+            for commune_data in self.communes_to_write:
                 try:
                     # Read the Plan Adressage sheet (page 2) data with INSEE as string to preserve leading zeros
                     # Also ensure date columns are read as strings to prevent automatic date conversion
-                    plan_df = pd.read_excel(
-                        commune_data['file_path'],
-                        sheet_name=1,
-                        dtype={'Insee': str, 'insee': str, 'Code INSEE': str},
-                        date_format=None  # Prevent automatic date parsing
-                    )  # Second sheet
+                    plan_df = read_commune_sheet(commune_data['file_path'], 1)  # Second sheet
 
                     # Debug: Log the actual columns found
                     self.logger.info(f"Plan Adressage columns in {commune_data['nom_commune']}: {list(plan_df.columns)}")
@@ -1819,10 +1792,12 @@ class SuiviGlobalModule:
 
                 except Exception as e:
                     self.logger.error(f"Error processing Plan Adressage data for commune {commune_data['nom_commune']}: {e}")
+                    self.failed_commune_files.add(commune_data['file_path'])
                     continue
 
             # Create DataFrame
-            if aggregated_rows:
+            has_existing = existing_df is not None and not existing_df.empty
+            if aggregated_rows or has_existing:
                 new_df = pd.DataFrame(aggregated_rows)
 
                 # Apply comprehensive date formatting to the new DataFrame
@@ -1830,12 +1805,12 @@ class SuiviGlobalModule:
                 self.logger.info(f"Applied date formatting to new Plan Adressage data: {len(new_df)} rows")
 
                 # If we have existing data, merge it
-                if existing_df is not None and not existing_df.empty:
+                if has_existing:
                     # Format date columns in existing data
                     existing_df = self._format_date_columns(existing_df)
 
                     # Remove existing entries for communes that are being updated
-                    commune_names = [data['nom_commune'] for data in self.processed_data]
+                    commune_names = [data['nom_commune'] for data in self.communes_to_write]
                     if 'Nom commune' in existing_df.columns:
                         existing_df = existing_df[~existing_df['Nom commune'].isin(commune_names)]
 
@@ -1873,18 +1848,12 @@ class SuiviGlobalModule:
                 combined_df = self._validate_and_format_dates_before_writing(combined_df, 'Traitement PA')
 
                 # Write to Excel with the correct sheet name
-                combined_df.to_excel(writer, sheet_name='Traitement PA', index=False)
-
-                # Format INSEE columns as text to preserve leading zeros
-                self._format_insee_columns_as_text(writer, 'Traitement PA', combined_df)
-
-                # Format date columns as text to prevent Excel auto-formatting
-                self._format_date_columns_as_text(writer, 'Traitement PA', combined_df)
+                self._write_global_sheet(writer, 'Traitement PA', combined_df)
             else:
                 # Create empty DataFrame with headers for Plan Adressage
                 empty_df = pd.DataFrame(columns=['Nom commune', 'Insee', 'Num Dossier Site', 'Motif', 'Adresse BAN',
                                                'Collaborateur', 'Date traitement', 'Durée'])
-                empty_df.to_excel(writer, sheet_name='Traitement PA', index=False)
+                self._write_global_sheet(writer, 'Traitement PA', empty_df)
 
         except Exception as e:
             self.logger.error(f"Error creating page 3 Plan Adressage data: {e}")
@@ -1896,14 +1865,15 @@ class SuiviGlobalModule:
             pd = get_pandas()
 
             # Check if we have any RIP communes
-            rip_communes = [data for data in self.processed_data if data.get('is_rip_commune', False) and data.get('has_rip_sheet', False)]
+            rip_communes = [data for data in self.communes_to_write if data.get('is_rip_commune', False) and data.get('has_rip_sheet', False)]
+            has_existing = existing_df is not None and not existing_df.empty
 
-            if not rip_communes:
+            if not rip_communes and not has_existing:
                 # No RIP communes, create empty sheet
                 empty_df = pd.DataFrame(columns=['Nom commune', 'Code INSEE', 'ID tâche', 'Type', 'Acte de traitement',
                                                'Commentaire', 'Date d\'affectation', 'Date de traitement', 'Date de livraison',
                                                'Collaborateur', 'Durée'])
-                empty_df.to_excel(writer, sheet_name='Traitement RIP', index=False)
+                self._write_global_sheet(writer, 'Traitement RIP', empty_df)
                 self.logger.info("Created empty RIP sheet - no RIP communes found")
                 return
 
@@ -1913,12 +1883,7 @@ class SuiviGlobalModule:
             for commune_data in rip_communes:
                 try:
                     # Read the RIP sheet (page 4) data with INSEE as string to preserve leading zeros
-                    rip_df = pd.read_excel(
-                        commune_data['file_path'],
-                        sheet_name=3,
-                        dtype={'Code INSEE': str, 'Insee': str},
-                        date_format=None  # Prevent automatic date parsing
-                    )  # Fourth sheet (0-indexed)
+                    rip_df = read_commune_sheet(commune_data['file_path'], 3)  # Fourth sheet (0-indexed)
 
                     self.logger.info(f"RIP sheet columns in {commune_data['nom_commune']}: {list(rip_df.columns)}")
 
@@ -1955,19 +1920,20 @@ class SuiviGlobalModule:
 
                 except Exception as e:
                     self.logger.error(f"Error processing RIP sheet for commune {commune_data['nom_commune']}: {e}")
+                    self.failed_commune_files.add(commune_data['file_path'])
                     continue
 
             # Create DataFrame
-            if aggregated_rows:
+            if aggregated_rows or has_existing:
                 new_df = pd.DataFrame(aggregated_rows)
 
                 # If we have existing data, merge it
-                if existing_df is not None and not existing_df.empty:
+                if has_existing:
                     # Format date columns in existing data
                     existing_df = self._format_date_columns(existing_df)
 
                     # Remove existing entries for communes that are being updated
-                    commune_names = [data['nom_commune'] for data in rip_communes]
+                    commune_names = [data['nom_commune'] for data in self.communes_to_write]
                     if 'Nom commune' in existing_df.columns:
                         existing_df = existing_df[~existing_df['Nom commune'].isin(commune_names)]
 
@@ -1992,13 +1958,7 @@ class SuiviGlobalModule:
                 combined_df = self._format_date_columns(combined_df)
 
                 # Write to Excel with the correct sheet name
-                combined_df.to_excel(writer, sheet_name='Traitement RIP', index=False)
-
-                # Format INSEE columns as text to preserve leading zeros
-                self._format_insee_columns_as_text(writer, 'Traitement RIP', combined_df)
-
-                # Format date columns as text to prevent Excel auto-formatting
-                self._format_date_columns_as_text(writer, 'Traitement RIP', combined_df)
+                self._write_global_sheet(writer, 'Traitement RIP', combined_df)
 
                 self.logger.info(f"Created RIP sheet with {len(aggregated_rows)} rows from {len(rip_communes)} RIP communes")
             else:
@@ -2006,7 +1966,7 @@ class SuiviGlobalModule:
                 empty_df = pd.DataFrame(columns=['Nom commune', 'Code INSEE', 'ID tâche', 'Type', 'Acte de traitement',
                                                'Commentaire', 'Date d\'affectation', 'Date de traitement', 'Date de livraison',
                                                'Collaborateur', 'Durée'])
-                empty_df.to_excel(writer, sheet_name='Traitement RIP', index=False)
+                self._write_global_sheet(writer, 'Traitement RIP', empty_df)
 
         except Exception as e:
             self.logger.error(f"Error creating page 4 RIP data: {e}")
@@ -2048,269 +2008,148 @@ class SuiviGlobalModule:
             self.logger.warning(f"Error getting column value for {possible_names}: {e}")
             return default_value
 
-    def _format_insee_columns_as_text(self, writer, sheet_name: str, df):
-        """Format INSEE columns as text to preserve leading zeros."""
-        try:
-            # Get the worksheet
-            worksheet = writer.sheets[sheet_name]
-
-            # Find INSEE columns
-            insee_columns = []
-            for i, col_name in enumerate(df.columns):
-                if any(insee_keyword in col_name.lower() for insee_keyword in ['insee', 'code insee']):
-                    insee_columns.append(i + 1)  # Excel columns are 1-indexed
-
-            # Format INSEE columns as text
-            for col_idx in insee_columns:
-                col_letter = chr(64 + col_idx)  # Convert to Excel column letter (A, B, C, etc.)
-
-                # Set the entire column format to text
-                for row_idx in range(2, len(df) + 2):  # Start from row 2 (skip header)
-                    cell = worksheet.cell(row=row_idx, column=col_idx)
-                    if cell.value is not None:
-                        # Ensure the value is formatted as text with leading zeros
-                        insee_str = str(cell.value).strip()
-                        if insee_str.isdigit() and len(insee_str) <= 5:
-                            cell.value = insee_str.zfill(5)  # Pad with leading zeros
-                        cell.number_format = '@'  # Text format
-
-            self.logger.info(f"Formatted INSEE columns as text in sheet: {sheet_name}")
-
-        except Exception as e:
-            self.logger.warning(f"Error formatting INSEE columns in {sheet_name}: {e}")
-
-    def _format_date_columns_as_text(self, writer, sheet_name: str, df):
-        """Format date columns as text to prevent Excel auto-formatting."""
-        try:
-            # Define date columns for each sheet
-            date_columns_map = {
-                'Suivi Tickets': {
-                    'columns': ['Date d\'affectation', 'Date Livraison', 'Date Dépose Ticket', 'Date traitement', 'Date livraison'],
-                    'excel_columns': ['I', 'O', 'R']  # Colonnes I, O, R
-                },
-                'Traitement CMS Adr': {
-                    'columns': ['Date affectation', 'Date traitement', 'Date livraison'],
-                    'excel_columns': ['F', 'G', 'H']  # Colonnes F, G, H (décalées à cause de la nouvelle colonne Motif Voie en D)
-                },
-                'Traitement PA': {
-                    'columns': ['Date traitement'],
-                    'excel_columns': ['G']  # Colonne G
-                }
-            }
+    def _write_global_sheet(self, writer, sheet_name: str, df):
+        """Stream a sheet of the global file with its header, text/date formats and column widths."""
+        df, column_formats = self._prepare_global_sheet(sheet_name, df)
+        writer.write_sheet(sheet_name, df, column_formats)
 
-            # Get the worksheet
-            workbook = writer.book
-            worksheet = writer.sheets[sheet_name]
+    def _prepare_global_sheet(self, sheet_name: str, df):
+        """
+        Compute the cell values and column formats of a global file sheet.
 
-            # Get date column configuration for this sheet
-            sheet_config = None
-            for sheet_type, config in date_columns_map.items():
-                if sheet_type.lower() in sheet_name.lower():
-                    sheet_config = config
-                    break
+        INSEE columns are written as text with leading zeros, date columns as
+        text (YYYY-MM-DD display format), and widths follow the longest value.
 
-            if not sheet_config:
-                self.logger.warning(f"No date column configuration found for sheet: {sheet_name}")
-                return
+        Args:
+            sheet_name: Sheet name
+            df: Sheet data
 
-            # Find actual date columns in the dataframe
-            date_columns_to_format = []
-
-            # Method 1: Use exact column names
-            for col_name in sheet_config['columns']:
-                if col_name in df.columns:
-                    col_idx = df.columns.get_loc(col_name) + 1  # +1 for Excel 1-based indexing
-                    date_columns_to_format.append(col_idx)
-                    self.logger.info(f"Found date column '{col_name}' at index {col_idx} in {sheet_name}")
-
-            # Method 2: Use Excel column letters if available
-            if not date_columns_to_format:
-                for excel_col in sheet_config['excel_columns']:
-                    col_idx = ord(excel_col.upper()) - ord('A') + 1  # Convert A=1, B=2, etc.
-                    if col_idx <= len(df.columns):
-                        date_columns_to_format.append(col_idx)
-                        self.logger.info(f"Using Excel column {excel_col} (index {col_idx}) as date column in {sheet_name}")
-
-            # Method 3: Search for columns containing date keywords
-            if not date_columns_to_format:
-                date_keywords = ['date', 'livraison', 'affectation', 'dépose', 'traitement']
-                duration_keywords = ['durée', 'duration', 'temps', 'time', 'optimum', 'motif']
-
-                for i, column in enumerate(df.columns):
-                    column_lower = str(column).lower()
-
-                    # Skip duration columns
-                    is_duration = any(keyword in column_lower for keyword in duration_keywords)
-                    if is_duration:
-                        continue
-
-                    # Check if it's a date column
-                    is_date_column = any(keyword in column_lower for keyword in date_keywords)
-                    if is_date_column:
-                        col_idx = i + 1  # +1 for Excel 1-based indexing
-                        date_columns_to_format.append(col_idx)
-                        self.logger.info(f"Found date column by keyword '{column}' at index {col_idx} in {sheet_name}")
-
-            # Apply text formatting to date columns
-            if date_columns_to_format:
-                self.logger.info(f"Formatting {len(date_columns_to_format)} date columns as text in {sheet_name}: {date_columns_to_format}")
-
-                for col_idx in date_columns_to_format:
-                    col_letter = chr(64 + col_idx)  # Convert to Excel column letter (A, B, C, etc.)
-
-                    # Set the entire column format to text
-                    for row_idx in range(1, len(df) + 2):  # Include header row
-                        cell = worksheet.cell(row=row_idx, column=col_idx)
-                        cell.number_format = '@'  # Text format
-
-                        # Ensure the value is stored as text
-                        if cell.value is not None:
-                            cell.value = str(cell.value)
-
-                    self.logger.debug(f"Applied text format to column {col_letter} (index {col_idx}) in {sheet_name}")
+        Returns:
+            Tuple (DataFrame to write, column formats keyed by column name)
+        """
+        df = df.copy()
+        text_date_columns = self._get_text_date_columns(sheet_name, df)
+        column_formats = {}
+
+        for column in df.columns:
+            values = df[column]
+            header_text = str(column).lower()
+            is_insee = any(insee_keyword in header_text for insee_keyword in ['insee', 'code insee'])
+            is_text_date = column in text_date_columns
+
+            # Format INSEE codes with leading zeros (5 digits)
+            if is_insee:
+                insee_str = values.astype(str).str.strip()
+                padded = values.notna() & insee_str.str.isdigit() & (insee_str.str.len() <= 5)
+                values = values.where(~padded, insee_str.str.zfill(5))
+
+            # Store date columns as text to prevent Excel auto-formatting
+            if is_text_date:
+                values = values.where(values.isna(), values.astype(str))
+
+            df[column] = values
+
+            if self._is_date_header(header_text):
+                number_format = 'YYYY-MM-DD'
+            elif is_insee or is_text_date:
+                number_format = '@'
             else:
-                self.logger.warning(f"No date columns found to format in {sheet_name}")
-
-        except Exception as e:
-            self.logger.error(f"Error formatting date columns as text in {sheet_name}: {e}")
-
-    def _format_global_excel(self, file_path: str):
-        """Apply formatting to the global Excel file similar to individual suivi files."""
-        try:
-            from openpyxl import load_workbook
-            from openpyxl.styles import Font, PatternFill, Alignment
+                number_format = None
 
-            # Load workbook
-            wb = load_workbook(file_path)
+            column_formats[column] = ColumnFormat(
+                number_format=number_format,
+                empty_number_format='@' if is_insee or is_text_date else None,
+                header_number_format='@' if is_text_date else None,
+                width=estimate_column_width(values, column, max_width=50)
+            )
 
-            # Format all sheets with consistent styling
-            sheets_to_format = ['Suivi Tickets', 'Traitement CMS Adr', 'Traitement PA', 'Traitement RIP']
+        if text_date_columns:
+            self.logger.info(f"Date columns written as text in {sheet_name}: {text_date_columns}")
 
-            for sheet_name in sheets_to_format:
-                if sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-                    self._format_sheet(ws, sheet_name)
-                    # Apply additional date formatting to ensure consistency
-                    self._apply_comprehensive_date_formatting(ws, sheet_name)
+        return df, column_formats
 
-            # Save changes
-            wb.save(file_path)
-            self.logger.info(f"Global Excel file formatted successfully: {file_path}")
+    def _is_date_header(self, header_text: str) -> bool:
+        """Check whether a (lowercase) header is a date column, excluding duration columns."""
+        duration_keywords = ['durée', 'duration', 'temps', 'time', 'traitement optimum', 'finale', 'motif']
+        if any(keyword in header_text for keyword in duration_keywords):
+            return False
 
-        except Exception as e:
-            self.logger.error(f"Error formatting Excel file: {e}")
-            # Don't raise - formatting is optional
+        date_keywords = ['date', 'livraison', 'affectation', 'dépose', 'traitement']
+        return any(keyword in header_text for keyword in date_keywords)
+
+    def _get_text_date_columns(self, sheet_name: str, df) -> List[str]:
+        """Get the date columns of a sheet that are stored as text."""
+        # Define date columns for each sheet
+        date_columns_map = {
+            'Suivi Tickets': {
+                'columns': ['Date d\'affectation', 'Date Livraison', 'Date Dépose Ticket', 'Date traitement', 'Date livraison'],
+                'excel_columns': ['I', 'O', 'R']  # Colonnes I, O, R
+            },
+            'Traitement CMS Adr': {
+                'columns': ['Date affectation', 'Date traitement', 'Date livraison'],
+                'excel_columns': ['F', 'G', 'H']  # Colonnes F, G, H (décalées à cause de la nouvelle colonne Motif Voie en D)
+            },
+            'Traitement PA': {
+                'columns': ['Date traitement'],
+                'excel_columns': ['G']  # Colonne G
+            }
+        }
 
-    def _format_sheet(self, ws, sheet_name):
-        """Apply consistent formatting to a worksheet."""
-        try:
-            from openpyxl.styles import Font, PatternFill, Alignment
-
-            # Header formatting (blue background, centered, frozen)
-            header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-            header_font = Font(color='FFFFFF', bold=True)
-            center_alignment = Alignment(horizontal='center', vertical='center')
-
-            # Apply header formatting
-            if ws.max_row > 0:
-                for cell in ws[1]:
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = center_alignment
-
-                # Freeze header row
-                ws.freeze_panes = 'A2'
-
-            # Center all content and apply date formatting
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value is not None:
-                        cell.alignment = center_alignment
-
-                        # Apply date formatting to date columns
-                        if cell.row > 1:  # Skip header row
-                            column_letter = cell.column_letter
-                            header_cell = ws[f'{column_letter}1']
-                            header_value = str(header_cell.value).lower() if header_cell.value else ""
-
-                            # First check if it's a duration column - if so, skip date formatting
-                            duration_keywords = ['durée', 'duration', 'temps', 'time', 'traitement optimum', 'finale', 'motif']
-                            is_duration = any(keyword in header_value for keyword in duration_keywords)
-
-                            # Only apply date formatting if it's not a duration column
-                            if not is_duration:
-                                date_keywords = ['date', 'livraison', 'affectation', 'dépose', 'traitement']
-                                is_date = any(keyword in header_value for keyword in date_keywords)
-                                if is_date and cell.value is not None and str(cell.value).strip() != '':
-                                    # Apply YYYY-MM-DD format
-                                    cell.number_format = 'YYYY-MM-DD'
-
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-            self.logger.info(f"Formatting applied to sheet: {sheet_name}")
+        sheet_config = None
+        for sheet_type, config in date_columns_map.items():
+            if sheet_type.lower() in sheet_name.lower():
+                sheet_config = config
+                break
 
-        except Exception as e:
-            self.logger.error(f"Error formatting sheet {sheet_name}: {e}")
+        if not sheet_config:
+            self.logger.debug(f"No text date column configuration for sheet: {sheet_name}")
+            return []
 
-    def _apply_comprehensive_date_formatting(self, ws, sheet_name):
-        """Apply comprehensive date formatting to ensure all date columns use YYYY-MM-DD format."""
-        try:
-            # Define date column patterns for each sheet type
-            date_patterns = {
-                'Suivi Tickets': ['date', 'livraison', 'affectation', 'dépose'],
-                'Traitement CMS Adr': ['date', 'livraison', 'affectation', 'traitement'],
-                'Traitement PA': ['date', 'traitement']
-            }
+        columns = list(df.columns)
 
-            # Get patterns for this sheet
-            patterns = []
-            for sheet_type, sheet_patterns in date_patterns.items():
-                if sheet_type.lower() in sheet_name.lower():
-                    patterns = sheet_patterns
-                    break
+        # Method 1: Use exact column names
+        date_columns = [col for col in sheet_config['columns'] if col in columns]
 
-            # If no specific patterns, use general date patterns
-            if not patterns:
-                patterns = ['date', 'livraison', 'affectation', 'dépose', 'traitement']
+        # Method 2: Use Excel column letters if available
+        if not date_columns:
+            for excel_col in sheet_config['excel_columns']:
+                col_idx = ord(excel_col.upper()) - ord('A')
+                if col_idx < len(columns):
+                    date_columns.append(columns[col_idx])
 
-            # Duration columns to exclude
-            duration_keywords = ['durée', 'duration', 'temps', 'time', 'traitement optimum', 'finale', 'motif']
+        # Method 3: Search for columns containing date keywords
+        if not date_columns:
+            date_keywords = ['date', 'livraison', 'affectation', 'dépose', 'traitement']
+            duration_keywords = ['durée', 'duration', 'temps', 'time', 'optimum', 'motif']
+            for col in columns:
+                column_lower = str(col).lower()
+                if any(keyword in column_lower for keyword in duration_keywords):
+                    continue
+                if any(keyword in column_lower for keyword in date_keywords):
+                    date_columns.append(col)
 
-            # Check each column
-            for col in range(1, ws.max_column + 1):
-                header_cell = ws.cell(row=1, column=col)
-                if header_cell.value:
-                    header_text = str(header_cell.value).lower()
+        return date_columns
 
-                    # Skip duration columns
-                    is_duration = any(keyword in header_text for keyword in duration_keywords)
-                    if is_duration:
-                        continue
+    def _read_extra_global_sheets(self, file_path: str) -> list:
+        """Read the values of the sheets of the global file that the module doesn't generate."""
+        generated = {'Suivi Tickets', 'Traitement CMS Adr', 'Traitement PA', 'Traitement RIP'}
+        try:
+            from openpyxl import load_workbook
 
-                    # Check if it's a date column
-                    is_date = any(pattern in header_text for pattern in patterns)
-                    if is_date:
-                        # Apply date formatting to all cells in this column
-                        for row in range(2, ws.max_row + 1):
-                            cell = ws.cell(row=row, column=col)
-                            if cell.value is not None and str(cell.value).strip() != '':
-                                cell.number_format = 'YYYY-MM-DD'
+            wb = load_workbook(file_path, read_only=True)
+            try:
+                extra_sheets = [(ws.title, [list(row) for row in ws.iter_rows(values_only=True)])
+                                for ws in wb.worksheets if ws.title not in generated]
+            finally:
+                wb.close()
 
-                        self.logger.debug(f"Applied date formatting to column {header_text} in {sheet_name}")
+            for sheet_name, rows in extra_sheets:
+                self.logger.info(f"Keeping additional sheet '{sheet_name}' of the global file ({len(rows)} rows, values only)")
+            return extra_sheets
 
         except Exception as e:
-            self.logger.warning(f"Error applying comprehensive date formatting to {sheet_name}: {e}")
+            self.logger.warning(f"Could not read additional sheets of the global file: {e}")
+            return []
 
     def _normalize_date_value(self, value, column_name=''):
         """Convert all dates to ISO format YYYY-MM-DD."""
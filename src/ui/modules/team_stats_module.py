@@ -18,10 +18,15 @@ if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 from config.constants import COLORS, UIConfig, TeamsConfig, AccessControl
-from core import FileProcessor, DataValidator, ExcelGenerator
-from utils.file_utils import get_icon_path, check_file_access, is_excel_file_open
+from core import FileProcessor, DataValidator, ExcelGenerator, WorkbookReader, TeamKpiEngine, AnomalyEngine
+from core.team_kpi_engine import calculate_duration_sum
+from core.suivi_normalizer import NormalizedSuiviData
+from core.activity_cube import ActivityCube, CTJ_PA, CTJ_CM
+from core.date_range_index import DASHBOARD_DATE_COLUMNS
+from core.cell_probe import get_sheet_names
+from utils.file_utils import get_icon_path, check_file_access, is_excel_file_open, FileChangeTracker
 from utils.lazy_imports import get_pandas
-from utils.performance import run_async_task
+from utils.performance import run_async_task, timed_operation, measure_operation
 
 from ui.styles import StyleManager, create_card_frame, create_section_header
 from ui.responsive_utils import get_responsive_manager
@@ -73,7 +78,8 @@ class TeamStatsModule:
         self.responsive_manager = get_responsive_manager()
 
         # Check password protection for Statistics Team module
-        if not self._verify_password_access():
+        self.access_granted = self._verify_password_access()
+        if not self.access_granted:
             self._create_access_denied_ui()
             return
 
@@ -91,6 +97,9 @@ class TeamStatsModule:
 
         # Module data
         self.global_suivi_data = None
+        self.normalized_data = None  # Parsed date/duration columns of global_suivi_data
+        self.activity_cube = None  # Daily activity/motif aggregates of global_suivi_data
+        self._activity_cube_source = None
         self.team_statistics = {}
         self.collaborator_stats = {}
         self.ticket_status_breakdown = {}
@@ -142,6 +151,9 @@ class TeamStatsModule:
         # Keyboard shortcuts (optional)
         self.keyboard_manager = None
 
+        # State of the global file when last loaded (stale check on refresh)
+        self.global_file_tracker = FileChangeTracker(os.path.join(self.teams_folder_path, self.global_excel_filename))
+
         # Create UI first
         self._create_module_ui()
 
@@ -704,6 +716,9 @@ class TeamStatsModule:
         """Reset the module to initial state."""
         try:
             self.global_suivi_data = None
+            self.normalized_data = None
+            self.activity_cube = None
+            self._activity_cube_source = None
             self.team_statistics.clear()
             self.collaborator_stats.clear()
             self.ticket_status_breakdown.clear()
@@ -1713,6 +1728,7 @@ class TeamStatsModule:
 
             # Store the excel path for stats injection functionality
             self.excel_path = global_file_path
+            self.global_file_tracker.mark_loaded()
 
             if not os.path.exists(global_file_path):
                 messagebox.showerror(
@@ -1761,24 +1777,32 @@ class TeamStatsModule:
             # Load Excel data using pandas
             pd = get_pandas()
 
-            # Read all sheets
-            excel_data = {}
+            # Read all sheets in a single pass over the workbook
             sheet_names = ['Suivi Tickets', 'Traitement CMS Adr', 'Traitement PA']
+            self.status_label.config(text="Lecture des pages du fichier global...")
+            self.progress_var.set(40)
 
-            for i, sheet_name in enumerate(sheet_names):
-                try:
-                    self.status_label.config(text=f"Lecture de la page '{sheet_name}'...")
-                    self.progress_var.set(30 + (i * 20))
+            with measure_operation('team_stats.load', threshold=5.0):
+                loaded_sheets = WorkbookReader(global_file_path).read_sheets(sheet_names, date_format=None)
 
-                    df = pd.read_excel(global_file_path, sheet_name=sheet_name, date_format=None)
-                    excel_data[sheet_name] = df
-                    self.logger.info(f"Loaded sheet '{sheet_name}' with {len(df)} rows")
+                excel_data = {}
+                for sheet_name in sheet_names:
+                    excel_data[sheet_name] = loaded_sheets.get(sheet_name, pd.DataFrame())
 
-                except Exception as e:
-                    self.logger.warning(f"Could not load sheet '{sheet_name}': {e}")
-                    excel_data[sheet_name] = pd.DataFrame()
+                self.global_suivi_data = excel_data
+
+                # Parse date and duration columns once for every statistic, export and check
+                self.normalized_data = NormalizedSuiviData(excel_data)
+                self.normalized_data.normalize_all()
+                for (sheet_name, column), rejected in self.normalized_data.get_rejected_report().items():
+                    self.logger.warning(f"{rejected['count']} unreadable value(s) in '{sheet_name}' / '{column}' "
+                                        f"(e.g. {rejected['samples'][0]!r}, row {rejected['rows'][0]})")
 
-            self.global_suivi_data = excel_data
+                # Pre-aggregate daily activity per collaborator/motif for the monthly exports
+                self._get_activity_cube()
+
+                # Sort the dashboard date columns by day for the date range queries
+                self._build_dashboard_date_indexes()
 
             self.status_label.config(text="Analyse des statistiques...")
             self.progress_var.set(80)
@@ -2467,6 +2491,7 @@ class TeamStatsModule:
         except Exception as e:
             self.logger.error(f"Error updating file status indicator: {e}")
 
+    @timed_operation('team_stats.analyze', threshold=5.0)
     def _analyze_team_statistics(self):
         """Analyze team statistics from the loaded data."""
         try:
@@ -2498,6 +2523,8 @@ class TeamStatsModule:
             self.ticket_status_breakdown = {}
             self.overall_averages = {}
 
+            kpi_engine = TeamKpiEngine(self.global_suivi_data, normalized=self._get_normalized_data())
+
             # Analyze Page 1 (Suivi Tickets) - Main data source
             if 'Suivi Tickets' in self.global_suivi_data:
                 df_tickets = self.global_suivi_data['Suivi Tickets']
@@ -2515,7 +2542,7 @@ class TeamStatsModule:
                         self.team_statistics['communes'].update(communes)
 
                     # Analyze communes by status and date
-                    self._analyze_commune_status_by_date(df_tickets, pd, datetime)
+                    self._analyze_commune_status_by_date(df_tickets, pd, datetime, kpi_engine)
 
                     # Analyze ticket status breakdown (keep existing logic for compatibility)
                     if 'STATUT Ticket' in df_tickets.columns:
@@ -2530,41 +2557,8 @@ class TeamStatsModule:
                         finale_duration = self._calculate_duration_sum(df_tickets['Durée Finale'])
                         self.team_statistics['total_duration_finale'] = finale_duration
 
-                    # Analyze by collaborator
-                    if 'Collaborateur' in df_tickets.columns:
-                        for collaborator in df_tickets['Collaborateur'].dropna().unique():
-                            collab_data = df_tickets[df_tickets['Collaborateur'] == collaborator]
-                            collab_communes = set(collab_data['Nom Commune'].dropna().unique()) if 'Nom Commune' in collab_data.columns else set()
-
-                            # Calculate DMT (Durée Moyenne de Traitement) for this collaborator
-                            # Only for communes with status "Traité"
-                            dmt_collaborator = self._calculate_dmt_for_treated_communes(collab_data, pd)
-
-                            # Calculate CTJ (Capacité de Traitement Journalier) for today
-                            # From page 3 (Traitement PA) column G
-                            ctj_today = self._calculate_ctj_from_page3(collaborator, pd, datetime)
-
-                            # Calculate CTJ CM (Capacité de Traitement Journalier CM) for today
-                            # From page 2 (Traitement CMS Adr) column F
-                            ctj_cm_today = self._calculate_ctj_cm_from_page2(collaborator, pd, datetime)
-
-                            self.collaborator_stats[collaborator] = {
-                                'tickets_count': len(collab_data),
-                                'cms_records': 0,
-                                'pa_records': 0,
-                                'cms_duration': 0,
-                                'pa_duration': 0,
-                                'avg_cms_duration': 0,
-                                'avg_pa_duration': 0,
-                                'avg_finale_duration': dmt_collaborator,  # This is now the DMT
-                                'communes': collab_communes,
-                                'commune_count': len(collab_communes),
-                                # New KPI metrics
-                                'dmt': dmt_collaborator,  # DMT - Average Treatment Duration
-                                'ctj_today': ctj_today,   # CTJ PA - Daily Treatment Capacity for today (PA)
-                                'ctj_cm_today': ctj_cm_today,  # CTJ CM - Daily Treatment Capacity for today (CM)
-                                'elements_today': ctj_today  # Elements processed today (same as CTJ for now)
-                            }
+                    # Per-collaborator KPIs (DMT, CTJ PA/CM, CMS/PA durations) in one columnar pass
+                    self.collaborator_stats = kpi_engine.compute_collaborator_stats()
 
             # Analyze Page 2 (Traitement CMS Adr) - Duration data
             if 'Traitement CMS Adr' in self.global_suivi_data:
@@ -2578,22 +2572,6 @@ class TeamStatsModule:
                         duration_sum = self._calculate_duration_sum(df_cms['Durée'])
                         self.team_statistics['total_duration_cms'] = duration_sum
 
-                    # Add CMS data to collaborator stats
-                    if 'Collaborateur' in df_cms.columns:
-                        for collaborator in df_cms['Collaborateur'].dropna().unique():
-                            if collaborator in self.collaborator_stats:
-                                collab_cms = df_cms[df_cms['Collaborateur'] == collaborator]
-                                self.collaborator_stats[collaborator]['cms_records'] = len(collab_cms)
-
-                                if 'Durée' in collab_cms.columns:
-                                    duration_sum = self._calculate_duration_sum(collab_cms['Durée'])
-                                    self.collaborator_stats[collaborator]['cms_duration'] = duration_sum
-
-                                    # Calculate average CMS duration per commune
-                                    commune_count = self.collaborator_stats[collaborator]['commune_count']
-                                    if commune_count > 0:
-                                        self.collaborator_stats[collaborator]['avg_cms_duration'] = duration_sum / commune_count
-
             # Analyze Page 3 (Traitement PA) - Duration data
             if 'Traitement PA' in self.global_suivi_data:
                 df_pa = self.global_suivi_data['Traitement PA']
@@ -2606,22 +2584,6 @@ class TeamStatsModule:
                         duration_sum = self._calculate_duration_sum(df_pa['Durée'])
                         self.team_statistics['total_duration_pa'] = duration_sum
 
-                    # Add PA data to collaborator stats
-                    if 'Collaborateur' in df_pa.columns:
-                        for collaborator in df_pa['Collaborateur'].dropna().unique():
-                            if collaborator in self.collaborator_stats:
-                                collab_pa = df_pa[df_pa['Collaborateur'] == collaborator]
-                                self.collaborator_stats[collaborator]['pa_records'] = len(collab_pa)
-
-                                if 'Durée' in collab_pa.columns:
-                                    duration_sum = self._calculate_duration_sum(collab_pa['Durée'])
-                                    self.collaborator_stats[collaborator]['pa_duration'] = duration_sum
-
-                                    # Calculate average PA duration per commune
-                                    commune_count = self.collaborator_stats[collaborator]['commune_count']
-                                    if commune_count > 0:
-                                        self.collaborator_stats[collaborator]['avg_pa_duration'] = duration_sum / commune_count
-
             # Calculate overall team averages and KPIs
             self._calculate_overall_averages()
             self._calculate_team_kpis()
@@ -2632,213 +2594,53 @@ class TeamStatsModule:
             self.logger.error(f"Error analyzing team statistics: {e}")
             raise
 
+    def _get_normalized_data(self):
+        """Get the normalized date/duration columns of the loaded global data."""
+        if self.normalized_data is None or self.normalized_data.data is not self.global_suivi_data:
+            self.normalized_data = NormalizedSuiviData(self.global_suivi_data)
+        return self.normalized_data
+
+    def _get_activity_cube(self):
+        """Get the activity cube of the loaded global data (built once per load)."""
+        if self.activity_cube is None or self._activity_cube_source is not self.global_suivi_data:
+            self.activity_cube = ActivityCube.build(self.global_suivi_data, self._get_normalized_data())
+            self._activity_cube_source = self.global_suivi_data
+        return self.activity_cube
+
+    def _get_normalized_sheet(self, sheet_name, df):
+        """Get the normalized columns of a sheet (shared cache when df is the loaded sheet)."""
+        if self.global_suivi_data and self.global_suivi_data.get(sheet_name) is df:
+            return self._get_normalized_data()
+        return NormalizedSuiviData({sheet_name: df})
+
+    def _build_dashboard_date_indexes(self):
+        """Sort the date columns filtered by the dashboard extracts, once per load."""
+        normalized = self._get_normalized_data()
+        for sheet_name, positions in DASHBOARD_DATE_COLUMNS.items():
+            df = self.global_suivi_data.get(sheet_name)
+            if df is None or df.empty:
+                continue
+            for position in positions:
+                if len(df.columns) > position:
+                    normalized.date_index(sheet_name, df.columns[position])
+
+    def _get_dashboard_rows(self, sheet_name, date_column):
+        """Get the row positions of a sheet whose date is within the selected date range."""
+        date_index = self._get_normalized_data().date_index(sheet_name, date_column)
+        return date_index.slice(self.date_from_selected, self.date_to_selected)
+
+    def _count_values(self, values):
+        """Count the values of a Series, keyed in order of first appearance."""
+        return {key: int(count) for key, count in values.value_counts(sort=False).items()}
+
     def _calculate_duration_sum(self, duration_series):
         """Calculate sum of duration values, handling different formats."""
         try:
-            total_minutes = 0
-
-            for duration in duration_series.dropna():
-                if isinstance(duration, (int, float)):
-                    # Assume it's already in minutes
-                    total_minutes += duration
-                elif isinstance(duration, str):
-                    # Try to parse time format (HH:MM or MM)
-                    duration = duration.strip()
-                    if ':' in duration:
-                        parts = duration.split(':')
-                        if len(parts) == 2:
-                            hours = int(parts[0])
-                            minutes = int(parts[1])
-                            total_minutes += (hours * 60) + minutes
-                    else:
-                        # Assume it's minutes
-                        try:
-                            total_minutes += float(duration)
-                        except ValueError:
-                            continue
-
-            return total_minutes
-
+            return calculate_duration_sum(duration_series)
         except Exception as e:
             self.logger.error(f"Error calculating duration sum: {e}")
             return 0
 
-    def _calculate_dmt_for_treated_communes(self, collab_data, pd):
-        """Calculate DMT only for communes with status 'Traité'."""
-        try:
-            # Find the correct status column (handle variations)
-            status_column = None
-            for col in collab_data.columns:
-                if 'etat ticket pa' in col.lower().strip():
-                    status_column = col
-                    break
-
-            if status_column is None:
-                # Fallback to other possible status columns
-                for col in collab_data.columns:
-                    if any(keyword in col.lower() for keyword in ['etat', 'statut', 'status']):
-                        status_column = col
-                        break
-
-            if status_column is None or 'Durée Finale' not in collab_data.columns:
-                self.logger.warning(f"Status column or Durée Finale not found. Available columns: {list(collab_data.columns)}")
-                return 0
-
-            # Filter data for communes with status "Traité"
-            treated_data = collab_data[collab_data[status_column].astype(str).str.strip() == 'Traité']
-
-            if treated_data.empty:
-                return 0
-
-            # Calculate total duration for treated communes
-            total_duration = self._calculate_duration_sum(treated_data['Durée Finale'])
-            treated_count = len(treated_data)
-
-            # Return average duration per treated commune
-            return total_duration / treated_count if treated_count > 0 else 0
-
-        except Exception as e:
-            self.logger.error(f"Error calculating DMT for treated communes: {e}")
-            return 0
-
-    def _calculate_ctj_from_page3(self, collaborator, pd, datetime):
-        """Calculate CTJ from page 3 (Traitement PA) for this collaborator - count ONLY lines with positive duration."""
-        try:
-            # Check if we have page 3 data
-            if 'Traitement PA' not in self.global_suivi_data:
-                return 0
-
-            df_pa = self.global_suivi_data['Traitement PA']
-            if df_pa.empty:
-                return 0
-
-            # Filter data for this collaborator
-            collab_pa_data = df_pa[df_pa.get('Collaborateur', '') == collaborator]
-            if collab_pa_data.empty:
-                return 0
-
-            today = datetime.now().date()
-            elements_today = 0
-
-            # Check date column for today's work
-            if 'Date traitement' in collab_pa_data.columns:
-                for index, row in collab_pa_data.iterrows():
-                    date_value = row.get('Date traitement', None)
-                    duree_value = row.get('Durée', None)
-
-                    # Skip if date is completely missing
-                    if pd.isna(date_value) or date_value == '':
-                        continue
-
-                    # Skip if duration is 0, empty, or invalid
-                    if pd.isna(duree_value) or duree_value == '' or duree_value == 'nan':
-                        continue
-
-                    try:
-                        # Convert duration to number and check if positive
-                        duree_num = float(str(duree_value).replace(',', '.'))
-                        if duree_num <= 0:
-                            continue  # Skip lines with duration 0 or negative
-                    except (ValueError, TypeError):
-                        continue  # Skip lines with invalid duration
-
-                    try:
-                        # Convert date to datetime if it's not already
-                        if isinstance(date_value, str):
-                            # Try different date formats
-                            for date_format in ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']:
-                                try:
-                                    date_obj = datetime.strptime(date_value, date_format).date()
-                                    break
-                                except ValueError:
-                                    continue
-                            else:
-                                continue  # Skip if no format matches
-                        else:
-                            date_obj = pd.to_datetime(date_value).date()
-
-                        # Check if date is today
-                        if date_obj == today:
-                            # Count this element only if duration is positive
-                            elements_today += 1
-                            self.logger.debug(f"CTJ: Counted element for {collaborator} on {date_obj} (duration: {duree_value})")
-
-                    except Exception as e:
-                        self.logger.debug(f"Error parsing date {date_value}: {e}")
-                        continue
-
-            self.logger.info(f"CTJ calculation for {collaborator}: {elements_today} elements today (ONLY with positive duration)")
-            return elements_today
-
-        except Exception as e:
-            self.logger.error(f"Error calculating CTJ from page 3: {e}")
-            return 0
-
-    def _calculate_ctj_cm_from_page2(self, collaborator, pd, datetime):
-        """Calculate CTJ CM from page 2 (Traitement CMS Adr) for this collaborator - count lines with today's date in column F (now G due to Motif Voie)."""
-        try:
-            # Check if we have page 2 data
-            if 'Traitement CMS Adr' not in self.global_suivi_data:
-                return 0
-
-            df_cms = self.global_suivi_data['Traitement CMS Adr']
-            if df_cms.empty:
-                return 0
-
-            # Filter data for this collaborator
-            collab_cms_data = df_cms[df_cms.get('Collaborateur', '') == collaborator]
-            if collab_cms_data.empty:
-                return 0
-
-            today = datetime.now().date()
-            elements_today = 0
-
-            # Find column F (6th column, now index 6 due to new Motif Voie column in D) - this contains dates in ISO format
-            if len(df_cms.columns) < 7:
-                self.logger.warning(f"CTJ CM: Not enough columns in Traitement CMS Adr sheet (found {len(df_cms.columns)}, need at least 7)")
-                return 0
-
-            date_column_f = df_cms.columns[6]  # Column F (now index 6) - contains dates (shifted due to Motif Voie in D)
-            self.logger.debug(f"CTJ CM: Using column F '{date_column_f}' for date filtering (ISO format)")
-
-            for index, row in collab_cms_data.iterrows():
-                date_value_f = row.get(date_column_f, None)
-
-                # Skip if date is completely missing
-                if pd.isna(date_value_f) or date_value_f == '':
-                    continue
-
-                try:
-                    # Convert date from column F to datetime
-                    if isinstance(date_value_f, str):
-                        # Try ISO format first (YYYY-MM-DD), then other formats
-                        for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                            try:
-                                date_obj = datetime.strptime(date_value_f, date_format).date()
-                                break
-                            except ValueError:
-                                continue
-                        else:
-                            continue  # Skip if no format matches
-                    else:
-                        date_obj = pd.to_datetime(date_value_f).date()
-
-                    # Check if date in column F is today
-                    if date_obj == today:
-                        elements_today += 1
-                        self.logger.debug(f"CTJ CM: Counted element for {collaborator} on {date_obj} (date from column F)")
-
-                except Exception as e:
-                    self.logger.debug(f"Error parsing date {date_value_f} from column F: {e}")
-                    continue
-
-            self.logger.info(f"CTJ CM calculation for {collaborator}: {elements_today} elements today (based on column F dates)")
-            return elements_today
-
-        except Exception as e:
-            self.logger.error(f"Error calculating CTJ CM from page 2: {e}")
-            return 0
-
     def _calculate_team_kpis(self):
         """Calculate team-wide KPIs (DMT, CTJ PA and CTJ CM) using corrected logic."""
         try:
@@ -2881,102 +2683,30 @@ class TeamStatsModule:
         except Exception as e:
             self.logger.error(f"Error calculating team KPIs: {e}")
 
-    def _analyze_commune_status_by_date(self, df_tickets, pd, datetime):
+    def _analyze_commune_status_by_date(self, df_tickets, pd, datetime, kpi_engine=None):
         """Analyze communes by status and delivery date for current month filtering."""
         try:
-            current_month = datetime.now().month
-            current_year = datetime.now().year
-
             # Debug: Show available columns
             self.logger.info(f"Available columns in Suivi Tickets: {list(df_tickets.columns)}")
             self.logger.info(f"DataFrame shape: {df_tickets.shape}")
 
-            # Initialize counters
-            communes_traitees_mois_courant = 0
-            communes_autres_statuts = {
-                'En Cours': 0,
-                'En Attente': 0,
-                'Rejeté': 0,
-                'Autres': 0
-            }
-
-            # Check if required columns exist (handle column name variations)
-            etat_column = None
-            for col in df_tickets.columns:
-                if 'etat ticket pa' in col.lower().strip():
-                    etat_column = col
-                    break
-
-            has_etat_ticket_pa = etat_column is not None
-            has_date_livraison = 'Date Livraison' in df_tickets.columns
+            if kpi_engine is None:
+                kpi_engine = TeamKpiEngine(self.global_suivi_data, normalized=self._get_normalized_data())
 
-            self.logger.info(f"Found status column: '{etat_column}' (exists: {has_etat_ticket_pa})")
-            self.logger.info(f"Has 'Date Livraison' column: {has_date_livraison}")
-
-            if not has_etat_ticket_pa:
+            commune_status = kpi_engine.compute_commune_status()
+            if commune_status is None:
                 self.logger.warning("Column 'Etat Ticket PA' not found in Suivi Tickets sheet")
                 # Try alternative column names
-                alt_columns = [col for col in df_tickets.columns if 'etat' in col.lower() or 'statut' in col.lower()]
+                alt_columns = [col for col in df_tickets.columns if 'etat' in str(col).lower() or 'statut' in str(col).lower()]
                 self.logger.info(f"Alternative status columns found: {alt_columns}")
                 return
 
-            # Initialize counters
-            current_month = datetime.now().month
-            current_year = datetime.now().year
-            communes_traitees_mois_courant = 0
-            communes_autres_statuts = {}
-
-            for index, row in df_tickets.iterrows():
-                etat_ticket_pa = row.get(etat_column, '')
-                date_livraison = row.get('Date Livraison', None)
-
-                # Skip empty rows
-                if pd.isna(etat_ticket_pa) or etat_ticket_pa == '':
-                    continue
-
-                # Check if commune is treated in current month
-                if etat_ticket_pa == 'Traité' and has_date_livraison and not pd.isna(date_livraison):
-                    try:
-                        # Convertir la date en datetime si ce n'est pas déjà fait
-                        if isinstance(date_livraison, str):
-                            # Essayer plusieurs formats, y compris ISO
-                            date_obj = None
-                            for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%Y/%m/%d', '%d-%m-%Y', '%Y.%m.%d']:
-                                try:
-                                    date_obj = datetime.strptime(date_livraison, date_format)
-                                    break
-                                except ValueError:
-                                    continue
-                            if date_obj is None:
-                                # Fallback universel
-                                try:
-                                    date_obj = pd.to_datetime(date_livraison)
-                                except Exception:
-                                    continue
-                        else:
-                            date_obj = pd.to_datetime(date_livraison)
-
-                        # Vérifier si la date est dans le mois courant
-                        if date_obj.month == current_month and date_obj.year == current_year:
-                            communes_traitees_mois_courant += 1
-                    except Exception as e:
-                        self.logger.debug(f"Error parsing date {date_livraison}: {e}")
-                        continue
-
-                # Count other statuses (not treated)
-                elif etat_ticket_pa.strip() != 'Traité':
-                    status_clean = etat_ticket_pa.strip()
-                    if status_clean in communes_autres_statuts:
-                        communes_autres_statuts[status_clean] += 1
-                    else:
-                        communes_autres_statuts[status_clean] = 1
-
             # Store results
-            self.team_statistics['communes_traitees_mois_courant'] = communes_traitees_mois_courant
-            self.team_statistics['communes_autres_statuts'] = communes_autres_statuts
+            self.team_statistics['communes_traitees_mois_courant'] = commune_status['communes_traitees_mois_courant']
+            self.team_statistics['communes_autres_statuts'] = commune_status['communes_autres_statuts']
 
-            self.logger.info(f"Communes traitées ce mois: {communes_traitees_mois_courant}")
-            self.logger.info(f"Communes autres statuts: {communes_autres_statuts}")
+            self.logger.info(f"Communes traitées ce mois: {commune_status['communes_traitees_mois_courant']}")
+            self.logger.info(f"Communes autres statuts: {commune_status['communes_autres_statuts']}")
 
         except Exception as e:
             self.logger.error(f"Error analyzing commune status by date: {e}")
@@ -3473,20 +3203,12 @@ class TeamStatsModule:
     def _calculate_daily_duration_total(self, collaborator):
         """Calculate total daily duration for a collaborator (optimized version)."""
         try:
-            # Check if we should use direct calculation or cache
             if not hasattr(self, '_daily_durations_cache'):
                 self._build_daily_durations_cache()
 
-            # Use direct calculation for small datasets
-            if hasattr(self, '_use_direct_calculation') and self._use_direct_calculation:
-                return self._calculate_daily_duration_direct(collaborator)
-
-            # Use cache for large datasets
-            cache_key = collaborator
-            if cache_key in self._daily_durations_cache:
-                cached_data = self._daily_durations_cache[cache_key]
-                total = cached_data['pa'] + cached_data['cm'] + cached_data['qgis'] + cached_data['optimum']
-                return total
+            cached_data = self._daily_durations_cache.get(collaborator)
+            if cached_data:
+                return cached_data['pa'] + cached_data['cm'] + cached_data['qgis'] + cached_data['optimum']
 
             return 0
 
@@ -3497,20 +3219,11 @@ class TeamStatsModule:
     def _calculate_daily_duration_pa(self, collaborator):
         """Calculate daily PA duration for a collaborator (optimized version)."""
         try:
-            # Check if we should use direct calculation or cache
             if not hasattr(self, '_daily_durations_cache'):
                 self._build_daily_durations_cache()
 
-            # Use direct calculation for small datasets
-            if hasattr(self, '_use_direct_calculation') and self._use_direct_calculation:
-                return self._calculate_daily_duration_pa_direct(collaborator)
-
-            # Use cache for large datasets
-            cache_key = collaborator
-            if cache_key in self._daily_durations_cache:
-                return self._daily_durations_cache[cache_key]['pa']
-
-            return 0
+            cached_data = self._daily_durations_cache.get(collaborator)
+            return cached_data['pa'] if cached_data else 0
 
         except Exception as e:
             self.logger.error(f"Error calculating daily PA duration for {collaborator}: {e}")
@@ -3519,31 +3232,21 @@ class TeamStatsModule:
     def _calculate_daily_duration_cm(self, collaborator):
         """Calculate daily CM duration for a collaborator (optimized version)."""
         try:
-            # Check if we should use direct calculation or cache
             if not hasattr(self, '_daily_durations_cache'):
                 self._build_daily_durations_cache()
 
-            # Use direct calculation for small datasets
-            if hasattr(self, '_use_direct_calculation') and self._use_direct_calculation:
-                return self._calculate_daily_duration_cm_direct(collaborator)
-
-            # Use cache for large datasets
-            cache_key = collaborator
-            if cache_key in self._daily_durations_cache:
-                return self._daily_durations_cache[cache_key]['cm']
-
-            return 0
+            cached_data = self._daily_durations_cache.get(collaborator)
+            return cached_data['cm'] if cached_data else 0
 
         except Exception as e:
             self.logger.error(f"Error calculating daily CM duration for {collaborator}: {e}")
             return 0
 
     def _build_daily_durations_cache(self):
-        """Build optimized cache for all daily duration calculations."""
+        """Build the cache of today's durations (PA, CM, QGIS prep, Optimum) per collaborator."""
         try:
             from datetime import datetime
-            pd = get_pandas()
-            today = datetime.now().strftime('%Y-%m-%d')
+            today = datetime.now().date()
 
             self._daily_durations_cache = {}
 
@@ -3551,24 +3254,6 @@ class TeamStatsModule:
             if not hasattr(self, 'collaborator_stats') or not self.collaborator_stats:
                 return
 
-            # Check if we should use cache based on data size
-            total_records = 0
-            if 'Traitement PA' in self.global_suivi_data:
-                total_records += len(self.global_suivi_data['Traitement PA'])
-            if 'Traitement CMS Adr' in self.global_suivi_data:
-                total_records += len(self.global_suivi_data['Traitement CMS Adr'])
-            if 'Suivi Tickets' in self.global_suivi_data:
-                total_records += len(self.global_suivi_data['Suivi Tickets'])
-
-            # If dataset is small, use direct calculation instead of cache
-            if total_records < 1000:
-                self.logger.debug(f"Small dataset ({total_records} records), using direct calculation")
-                self._use_direct_calculation = True
-                return
-
-            self._use_direct_calculation = False
-            self.logger.debug(f"Large dataset ({total_records} records), building cache")
-
             for collaborator in self.collaborator_stats.keys():
                 self._daily_durations_cache[collaborator] = {
                     'pa': 0,
@@ -3577,106 +3262,22 @@ class TeamStatsModule:
                     'optimum': 0
                 }
 
-            # Process PA data (Traitement PA)
-            if 'Traitement PA' in self.global_suivi_data:
-                df_pa = self.global_suivi_data['Traitement PA']
-                if not df_pa.empty and 'Collaborateur' in df_pa.columns:
-                    # Find date column
-                    date_column = None
-                    for col in df_pa.columns:
-                        if 'date' in col.lower() and 'traitement' in col.lower():
-                            date_column = col
-                            break
-
-                    if date_column:
-                        # Filter for today and sum by collaborator
-                        for _, row in df_pa.iterrows():
-                            try:
-                                collaborator = row.get('Collaborateur')
-                                if collaborator and collaborator in self._daily_durations_cache:
-                                    date_value = row.get(date_column)
-                                    if pd.notna(date_value):
-                                        try:
-                                            parsed_date = pd.to_datetime(date_value).strftime('%Y-%m-%d')
-                                            if parsed_date == today:
-                                                duration = self._parse_duration_value(row.get('Durée', 0))
-                                                self._daily_durations_cache[collaborator]['pa'] += duration
-                                        except:
-                                            continue
-                            except:
-                                continue
-
-            # Process CM data (Traitement CMS Adr)
-            if 'Traitement CMS Adr' in self.global_suivi_data:
-                df_cm = self.global_suivi_data['Traitement CMS Adr']
-                if not df_cm.empty and 'Collaborateur' in df_cm.columns:
-                    # Find date column
-                    date_column = None
-                    for col in df_cm.columns:
-                        if 'date' in col.lower() and 'traitement' in col.lower():
-                            date_column = col
-                            break
+            def is_treatment_date(col):
+                return 'date' in col.lower() and 'traitement' in col.lower()
 
-                    if date_column:
-                        # Filter for today and sum by collaborator
-                        for _, row in df_cm.iterrows():
-                            try:
-                                collaborator = row.get('Collaborateur')
-                                if collaborator and collaborator in self._daily_durations_cache:
-                                    date_value = row.get(date_column)
-                                    if pd.notna(date_value):
-                                        try:
-                                            parsed_date = pd.to_datetime(date_value).strftime('%Y-%m-%d')
-                                            if parsed_date == today:
-                                                duration = self._parse_duration_value(row.get('Durée', 0))
-                                                self._daily_durations_cache[collaborator]['cm'] += duration
-                                        except:
-                                            continue
-                            except:
-                                continue
+            # (sheet, date column matcher, duration column, cache key)
+            sources = [
+                ('Traitement PA', is_treatment_date, 'Durée', 'pa'),
+                ('Traitement CMS Adr', is_treatment_date, 'Durée', 'cm'),
+                ('Suivi Tickets', lambda col: 'affectation' in col.lower(), 'Temps préparation QGis', 'qgis'),
+                ('Suivi Tickets', lambda col: 'livraison' in col.lower(), 'Traitement Optimum', 'optimum')
+            ]
 
-            # Process Suivi Tickets data for QGIS and Optimum
-            if 'Suivi Tickets' in self.global_suivi_data:
-                df_tickets = self.global_suivi_data['Suivi Tickets']
-                if not df_tickets.empty and 'Collaborateur' in df_tickets.columns:
-                    # Find date columns
-                    affectation_column = None
-                    livraison_column = None
-                    for col in df_tickets.columns:
-                        if 'affectation' in col.lower():
-                            affectation_column = col
-                        elif 'livraison' in col.lower():
-                            livraison_column = col
-
-                    for _, row in df_tickets.iterrows():
-                        try:
-                            collaborator = row.get('Collaborateur')
-                            if collaborator and collaborator in self._daily_durations_cache:
-                                # Check QGIS prep for affectations today
-                                if affectation_column:
-                                    affectation_date = row.get(affectation_column)
-                                    if pd.notna(affectation_date):
-                                        try:
-                                            parsed_date = pd.to_datetime(affectation_date).strftime('%Y-%m-%d')
-                                            if parsed_date == today:
-                                                qgis_duration = self._parse_duration_value(row.get('Temps préparation QGis', 0))
-                                                self._daily_durations_cache[collaborator]['qgis'] += qgis_duration
-                                        except:
-                                            pass
-
-                                # Check Optimum for deliveries today
-                                if livraison_column:
-                                    livraison_date = row.get(livraison_column)
-                                    if pd.notna(livraison_date):
-                                        try:
-                                            parsed_date = pd.to_datetime(livraison_date).strftime('%Y-%m-%d')
-                                            if parsed_date == today:
-                                                optimum_duration = self._parse_duration_value(row.get('Traitement Optimum', 0))
-                                                self._daily_durations_cache[collaborator]['optimum'] += optimum_duration
-                                        except:
-                                            pass
-                        except:
-                            continue
+            for sheet_name, date_matcher, duration_column, cache_key in sources:
+                totals = self._sum_durations_for_day(sheet_name, date_matcher, duration_column, today)
+                for collaborator, total in totals.items():
+                    if collaborator in self._daily_durations_cache:
+                        self._daily_durations_cache[collaborator][cache_key] = float(total)
 
             self.logger.info(f"Built daily durations cache for {len(self._daily_durations_cache)} collaborators")
 
@@ -3684,176 +3285,24 @@ class TeamStatsModule:
             self.logger.error(f"Error building daily durations cache: {e}")
             self._daily_durations_cache = {}
 
-    def _parse_duration_value(self, duration_value):
-        """Parse duration value from various formats to minutes."""
-        try:
-            pd = get_pandas()
-            if pd.notna(duration_value) and duration_value != '':
-                if isinstance(duration_value, (int, float)):
-                    return float(duration_value)
-                elif isinstance(duration_value, str):
-                    duration_str = duration_value.strip()
-                    if ':' in duration_str:
-                        parts = duration_str.split(':')
-                        if len(parts) == 2:
-                            hours = int(parts[0])
-                            minutes = int(parts[1])
-                            return (hours * 60) + minutes
-                    else:
-                        return float(duration_str)
-            return 0
-        except:
-            return 0
-
-    def _calculate_daily_duration_direct(self, collaborator):
-        """Direct calculation for small datasets (no cache overhead)."""
-        try:
-            from datetime import datetime
-            pd = get_pandas()
-            today = datetime.now().strftime('%Y-%m-%d')
-
-            total_duration = 0
-
-            # PA duration
-            if 'Traitement PA' in self.global_suivi_data:
-                df_pa = self.global_suivi_data['Traitement PA']
-                if not df_pa.empty and 'Collaborateur' in df_pa.columns:
-                    pa_today = df_pa[(df_pa['Collaborateur'] == collaborator)]
-                    for _, row in pa_today.iterrows():
-                        try:
-                            date_col = None
-                            for col in df_pa.columns:
-                                if 'date' in col.lower() and 'traitement' in col.lower():
-                                    date_col = col
-                                    break
-                            if date_col and pd.notna(row.get(date_col)):
-                                parsed_date = pd.to_datetime(row[date_col]).strftime('%Y-%m-%d')
-                                if parsed_date == today:
-                                    total_duration += self._parse_duration_value(row.get('Durée', 0))
-                        except:
-                            continue
-
-            # CM duration
-            if 'Traitement CMS Adr' in self.global_suivi_data:
-                df_cm = self.global_suivi_data['Traitement CMS Adr']
-                if not df_cm.empty and 'Collaborateur' in df_cm.columns:
-                    cm_today = df_cm[(df_cm['Collaborateur'] == collaborator)]
-                    for _, row in cm_today.iterrows():
-                        try:
-                            date_col = None
-                            for col in df_cm.columns:
-                                if 'date' in col.lower() and 'traitement' in col.lower():
-                                    date_col = col
-                                    break
-                            if date_col and pd.notna(row.get(date_col)):
-                                parsed_date = pd.to_datetime(row[date_col]).strftime('%Y-%m-%d')
-                                if parsed_date == today:
-                                    total_duration += self._parse_duration_value(row.get('Durée', 0))
-                        except:
-                            continue
-
-            # QGIS and Optimum from Suivi Tickets
-            if 'Suivi Tickets' in self.global_suivi_data:
-                df_tickets = self.global_suivi_data['Suivi Tickets']
-                if not df_tickets.empty and 'Collaborateur' in df_tickets.columns:
-                    tickets_collab = df_tickets[(df_tickets['Collaborateur'] == collaborator)]
-                    for _, row in tickets_collab.iterrows():
-                        try:
-                            # QGIS prep for affectations today
-                            affectation_col = None
-                            for col in df_tickets.columns:
-                                if 'affectation' in col.lower():
-                                    affectation_col = col
-                                    break
-                            if affectation_col and pd.notna(row.get(affectation_col)):
-                                parsed_date = pd.to_datetime(row[affectation_col]).strftime('%Y-%m-%d')
-                                if parsed_date == today:
-                                    total_duration += self._parse_duration_value(row.get('Temps préparation QGis', 0))
-
-                            # Optimum for deliveries today
-                            livraison_col = None
-                            for col in df_tickets.columns:
-                                if 'livraison' in col.lower():
-                                    livraison_col = col
-                                    break
-                            if livraison_col and pd.notna(row.get(livraison_col)):
-                                parsed_date = pd.to_datetime(row[livraison_col]).strftime('%Y-%m-%d')
-                                if parsed_date == today:
-                                    total_duration += self._parse_duration_value(row.get('Traitement Optimum', 0))
-                        except:
-                            continue
-
-            return total_duration
-
-        except Exception as e:
-            self.logger.error(f"Error in direct calculation for {collaborator}: {e}")
-            return 0
-
-    def _calculate_daily_duration_pa_direct(self, collaborator):
-        """Direct PA calculation for small datasets."""
-        try:
-            from datetime import datetime
-            pd = get_pandas()
-            today = datetime.now().strftime('%Y-%m-%d')
-
-            total_duration = 0
-
-            if 'Traitement PA' in self.global_suivi_data:
-                df_pa = self.global_suivi_data['Traitement PA']
-                if not df_pa.empty and 'Collaborateur' in df_pa.columns:
-                    pa_today = df_pa[(df_pa['Collaborateur'] == collaborator)]
-                    for _, row in pa_today.iterrows():
-                        try:
-                            date_col = None
-                            for col in df_pa.columns:
-                                if 'date' in col.lower() and 'traitement' in col.lower():
-                                    date_col = col
-                                    break
-                            if date_col and pd.notna(row.get(date_col)):
-                                parsed_date = pd.to_datetime(row[date_col]).strftime('%Y-%m-%d')
-                                if parsed_date == today:
-                                    total_duration += self._parse_duration_value(row.get('Durée', 0))
-                        except:
-                            continue
-
-            return total_duration
-
-        except Exception as e:
-            self.logger.error(f"Error in direct PA calculation for {collaborator}: {e}")
-            return 0
-
-    def _calculate_daily_duration_cm_direct(self, collaborator):
-        """Direct CM calculation for small datasets."""
-        try:
-            from datetime import datetime
-            pd = get_pandas()
-            today = datetime.now().strftime('%Y-%m-%d')
-
-            total_duration = 0
+    def _sum_durations_for_day(self, sheet_name, date_matcher, duration_column, day):
+        """Sum a duration column per collaborator over the rows dated on the given day."""
+        df = self.global_suivi_data.get(sheet_name) if self.global_suivi_data else None
+        if df is None or df.empty or 'Collaborateur' not in df.columns:
+            return {}
 
-            if 'Traitement CMS Adr' in self.global_suivi_data:
-                df_cm = self.global_suivi_data['Traitement CMS Adr']
-                if not df_cm.empty and 'Collaborateur' in df_cm.columns:
-                    cm_today = df_cm[(df_cm['Collaborateur'] == collaborator)]
-                    for _, row in cm_today.iterrows():
-                        try:
-                            date_col = None
-                            for col in df_cm.columns:
-                                if 'date' in col.lower() and 'traitement' in col.lower():
-                                    date_col = col
-                                    break
-                            if date_col and pd.notna(row.get(date_col)):
-                                parsed_date = pd.to_datetime(row[date_col]).strftime('%Y-%m-%d')
-                                if parsed_date == today:
-                                    total_duration += self._parse_duration_value(row.get('Durée', 0))
-                        except:
-                            continue
+        date_column = next((col for col in df.columns if date_matcher(str(col))), None)
+        if date_column is None:
+            return {}
 
-            return total_duration
+        normalized = self._get_normalized_data()
+        dates = normalized.dates(sheet_name, date_column)
+        minutes = normalized.minutes(sheet_name, duration_column)
+        if minutes is None:
+            return {}
 
-        except Exception as e:
-            self.logger.error(f"Error in direct CM calculation for {collaborator}: {e}")
-            return 0
+        on_day = dates.dt.date == day
+        return minutes[on_day].fillna(0).groupby(df.loc[on_day, 'Collaborateur']).sum().to_dict()
 
     def _refresh_statistics(self):
         """Refresh the statistics by reloading data."""
@@ -3870,6 +3319,28 @@ class TeamStatsModule:
 
 
 
+    def can_keep_alive(self) -> bool:
+        """Only an unlocked module is kept by the navigation cache (the password is asked again otherwise)."""
+        return getattr(self, 'access_granted', False)
+
+    def verify_access(self) -> bool:
+        """
+        Ask the password again before the cached module is shown.
+
+        Returns:
+            True if access is granted; otherwise the module shows its access denied screen
+        """
+        self.access_granted = self._verify_password_access()
+        if not self.access_granted:
+            self._create_access_denied_ui()
+        return self.access_granted
+
+    def refresh(self, **kwargs):
+        """Rebind the module shortcuts and reload the statistics if the global file changed."""
+        if self.keyboard_manager:
+            self._setup_module_shortcuts()
+        self.global_file_tracker.reload_if_changed(self._load_global_data)
+
     def cleanup(self):
         """Clean up resources when module is destroyed."""
         try:
@@ -3931,7 +3402,8 @@ class TeamStatsModule:
                 return
 
             # Calculate CTJ data for the selected filters
-            ctj_data = self._calculate_monthly_ctj(selected_collaborator, selected_month, selected_year)
+            with measure_operation('team_stats.export_ctj', threshold=5.0):
+                ctj_data = self._calculate_monthly_ctj(selected_collaborator, selected_month, selected_year)
 
             if not ctj_data:
                 # Provide more specific error message for team vs individual
@@ -4127,16 +3599,6 @@ class TeamStatsModule:
     def _calculate_monthly_ctj(self, collaborator, month_name, year):
         """Calculate CTJ data for a specific collaborator and month."""
         try:
-            from datetime import datetime
-            import calendar
-            from utils.lazy_imports import get_pandas
-
-            # Convert month name to number
-            month_names = ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin",
-                          "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"]
-            month_num = month_names.index(month_name) + 1
-            year_num = int(year)
-
             # Get page 3 data (Traitement PA)
             if 'Traitement PA' not in self.global_suivi_data:
                 self.logger.warning("No 'Traitement PA' data found in global suivi data")
@@ -4155,212 +3617,16 @@ class TeamStatsModule:
                 self.logger.info(f"Available columns: {list(df_pa.columns)}")
                 return []
 
-            # Filter data for this collaborator (or all if "Toute l'équipe")
-            if collaborator == "Toute l'équipe":
-                collab_data = df_pa
-                self.logger.info(f"Team export: Total PA data rows: {len(collab_data)}")
-            else:
-                collab_data = df_pa[df_pa.get('Collaborateur', '') == collaborator]
-                if collab_data.empty:
-                    self.logger.warning(f"No data found for collaborator: {collaborator}")
-                    return []
-                self.logger.info(f"Individual export: Found {len(collab_data)} rows for {collaborator}")
-
-            pd = get_pandas()
-            # Get number of days in the month
-            days_in_month = calendar.monthrange(year_num, month_num)[1]
-
-            if collaborator == "Toute l'équipe":
-                # For team export, create data by collaborator and day
-                team_ctj = {}
+            # Elements processed each day, ONLY lines with positive duration
+            return self._build_monthly_ctj_rows(CTJ_PA, 'CTJ', collaborator, month_name, year)
 
-                # Check if 'Collaborateur' column exists
-                if 'Collaborateur' not in collab_data.columns:
-                    self.logger.warning("No 'Collaborateur' column found in PA data")
-                    return []
-
-                collaborators_in_data = collab_data['Collaborateur'].unique()
-                valid_collaborators = [str(collab).strip() for collab in collaborators_in_data
-                                     if pd.notna(collab) and str(collab).strip()]
-
-                self.logger.info(f"Team export: Found collaborators: {valid_collaborators}")
-
-                if not valid_collaborators:
-                    self.logger.warning("No valid collaborators found in PA data")
-                    return []
-
-                # Initialize structure for all collaborators and days
-                for collab in valid_collaborators:
-                    team_ctj[collab] = {}
-                    for day in range(1, days_in_month + 1):
-                        team_ctj[collab][day] = 0
-
-                # Count elements processed each day by each collaborator (ONLY with positive duration)
-                processed_rows = 0
-                valid_dates = 0
-
-                for index, row in collab_data.iterrows():
-                    date_value = row.get('Date traitement', None)
-                    collab_name = row.get('Collaborateur', '')
-                    duree_value = row.get('Durée', None)
-
-                    if pd.isna(date_value) or date_value == '' or pd.isna(collab_name) or str(collab_name).strip() == '':
-                        continue
-
-                    collab_name = str(collab_name).strip()
-                    if collab_name not in team_ctj:
-                        continue
-
-                    # Skip if duration is 0, empty, or invalid
-                    if pd.isna(duree_value) or duree_value == '' or duree_value == 'nan':
-                        continue
-
-                    try:
-                        # Convert duration to number and check if positive
-                        duree_num = float(str(duree_value).replace(',', '.'))
-                        if duree_num <= 0:
-                            continue  # Skip lines with duration 0 or negative
-                    except (ValueError, TypeError):
-                        continue  # Skip lines with invalid duration
-
-                    processed_rows += 1
-
-                    try:
-                        # Convert date to datetime
-                        if isinstance(date_value, str):
-                            for date_format in ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']:
-                                try:
-                                    date_obj = datetime.strptime(date_value, date_format)
-                                    break
-                                except ValueError:
-                                    continue
-                            else:
-                                continue
-                        else:
-                            date_obj = pd.to_datetime(date_value)
-
-                        # Check if date is in the selected month/year
-                        if date_obj.month == month_num and date_obj.year == year_num:
-                            day = date_obj.day
-                            team_ctj[collab_name][day] += 1
-                            valid_dates += 1
-
-                    except Exception as e:
-                        self.logger.debug(f"Error parsing date {date_value}: {e}")
-                        continue
-
-                self.logger.info(f"Team export: Processed {processed_rows} rows, found {valid_dates} valid dates for {month_name} {year}")
-
-                # Convert to list format for Excel export (team format)
-                ctj_data = []
-                total_team_ctj = 0
-
-                for day in range(1, days_in_month + 1):
-                    date_str = f"{day:02d}/{month_num:02d}/{year_num}"
-                    row_data = {'Date': date_str}
-
-                    # Add each collaborator's CTJ for this day
-                    total_day = 0
-                    for collab in sorted(team_ctj.keys()):
-                        ctj_value = team_ctj[collab][day]
-                        row_data[collab] = ctj_value
-                        total_day += ctj_value
-
-                    row_data['Total'] = total_day
-                    total_team_ctj += total_day
-                    ctj_data.append(row_data)
-
-                self.logger.info(f"Team export: Generated {len(ctj_data)} days of data, total CTJ: {total_team_ctj}")
-
-                # If no data was found, create a minimal structure for the export to work
-                if total_team_ctj == 0 and not team_ctj:
-                    self.logger.warning("No CTJ data found for team export, creating minimal structure")
-                    # Create a minimal structure with at least one dummy collaborator
-                    for day in range(1, days_in_month + 1):
-                        date_str = f"{day:02d}/{month_num:02d}/{year_num}"
-                        ctj_data[day-1] = {'Date': date_str, 'Aucune donnée': 0, 'Total': 0}
-
-                return ctj_data
-
-            else:
-                # Individual collaborator export
-                daily_ctj = {}
-
-                # Initialize all days with 0
-                for day in range(1, days_in_month + 1):
-                    daily_ctj[day] = 0
-
-                # Count elements processed each day (ONLY with positive duration)
-                for index, row in collab_data.iterrows():
-                    date_value = row.get('Date traitement', None)
-                    duree_value = row.get('Durée', None)
-
-                    if pd.isna(date_value) or date_value == '':
-                        continue
-
-                    # Skip if duration is 0, empty, or invalid
-                    if pd.isna(duree_value) or duree_value == '' or duree_value == 'nan':
-                        continue
-
-                    try:
-                        # Convert duration to number and check if positive
-                        duree_num = float(str(duree_value).replace(',', '.'))
-                        if duree_num <= 0:
-                            continue  # Skip lines with duration 0 or negative
-                    except (ValueError, TypeError):
-                        continue  # Skip lines with invalid duration
-
-                    try:
-                        # Convert date to datetime
-                        if isinstance(date_value, str):
-                            for date_format in ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']:
-                                try:
-                                    date_obj = datetime.strptime(date_value, date_format)
-                                    break
-                                except ValueError:
-                                    continue
-                            else:
-                                continue
-                        else:
-                            date_obj = pd.to_datetime(date_value)
-
-                        # Check if date is in the selected month/year
-                        if date_obj.month == month_num and date_obj.year == year_num:
-                            day = date_obj.day
-                            daily_ctj[day] += 1
-
-                    except Exception as e:
-                        self.logger.debug(f"Error parsing date {date_value}: {e}")
-                        continue
-
-                # Convert to list format for Excel export
-                ctj_data = []
-                for day in range(1, days_in_month + 1):
-                    date_str = f"{day:02d}/{month_num:02d}/{year_num}"
-                    ctj_data.append({
-                        'Date': date_str,
-                        'CTJ': daily_ctj[day]
-                    })
-
-                return ctj_data
-
-        except Exception as e:
-            self.logger.error(f"Error calculating monthly CTJ: {e}")
-            return []
+        except Exception as e:
+            self.logger.error(f"Error calculating monthly CTJ: {e}")
+            return []
 
     def _calculate_monthly_ctj_cm(self, collaborator, month_name, year):
         """Calculate CTJ CM data for a specific collaborator and month from Traitement CMS Adr sheet (column F now G due to Motif Voie)."""
         try:
-            from datetime import datetime
-            import calendar
-            from utils.lazy_imports import get_pandas
-
-            # Convert month name to number
-            month_names = ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin",
-                          "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"]
-            month_num = month_names.index(month_name) + 1
-            year_num = int(year)
-
             # Get page 2 data (Traitement CMS Adr)
             if 'Traitement CMS Adr' not in self.global_suivi_data:
                 self.logger.warning("No 'Traitement CMS Adr' data found in global suivi data")
@@ -4372,189 +3638,90 @@ class TeamStatsModule:
                 return []
 
             # Check for required columns
-            required_columns = ['Collaborateur']
-            missing_columns = [col for col in required_columns if col not in df_cms.columns]
-            if missing_columns:
-                self.logger.warning(f"Missing required columns in CMS data: {missing_columns}")
+            if 'Collaborateur' not in df_cms.columns:
+                self.logger.warning("Missing required columns in CMS data: ['Collaborateur']")
                 self.logger.info(f"Available columns: {list(df_cms.columns)}")
                 return []
 
-            # Find column F (6th column, now index 6 due to new Motif Voie column in D) - this contains dates in ISO format
+            # Column F (now index 6 due to new Motif Voie column in D) contains the treatment dates
             if len(df_cms.columns) < 7:
                 self.logger.warning(f"CTJ CM: Not enough columns in Traitement CMS Adr sheet (found {len(df_cms.columns)}, need at least 7)")
                 return []
 
-            date_column_f = df_cms.columns[6]  # Column F (now index 6) - contains dates (shifted due to Motif Voie in D)
-            self.logger.info(f"CTJ CM: Using column F '{date_column_f}' for date filtering (ISO format)")
-
-            # Filter data for this collaborator (or all if "Toute l'équipe")
-            if collaborator == "Toute l'équipe":
-                collab_data = df_cms
-                self.logger.info(f"Team export: Total CMS data rows: {len(collab_data)}")
-            else:
-                collab_data = df_cms[df_cms.get('Collaborateur', '') == collaborator]
-                self.logger.info(f"Individual export: Filtered CMS data for {collaborator}: {len(collab_data)} rows")
-
-            if collab_data.empty:
-                self.logger.warning(f"No CMS data found for collaborator: {collaborator}")
-                return []
-
-            pd = get_pandas()
-
-            # Get number of days in the month
-            days_in_month = calendar.monthrange(year_num, month_num)[1]
-
-            if collaborator == "Toute l'équipe":
-                # For team export, create data by collaborator and day
-                team_ctj_cm = {}
-
-                # Check if 'Collaborateur' column exists
-                if 'Collaborateur' not in collab_data.columns:
-                    self.logger.warning("No 'Collaborateur' column found in CMS data")
-                    return []
-
-                collaborators_in_data = collab_data['Collaborateur'].unique()
-                valid_collaborators = [str(collab).strip() for collab in collaborators_in_data
-                                     if pd.notna(collab) and str(collab).strip()]
-
-                if not valid_collaborators:
-                    self.logger.warning("No valid collaborators found in CMS data")
-                    return []
-
-                # Initialize structure for all collaborators and days
-                for collab in valid_collaborators:
-                    team_ctj_cm[collab] = {}
-                    for day in range(1, days_in_month + 1):
-                        team_ctj_cm[collab][day] = 0
-
-                # Count elements processed each day by each collaborator (ONLY with positive duration)
-                processed_rows = 0
-                valid_dates = 0
+            # Elements processed each day, based on the dates in column F
+            return self._build_monthly_ctj_rows(CTJ_CM, 'CTJ_CM', collaborator, month_name, year)
 
-                for index, row in collab_data.iterrows():
-                    date_value_f = row.get(date_column_f, None)
-                    collab_name = row.get('Collaborateur', '')
-
-                    if pd.isna(date_value_f) or date_value_f == '' or pd.isna(collab_name) or str(collab_name).strip() == '':
-                        continue
-
-                    collab_name = str(collab_name).strip()
-                    if collab_name not in team_ctj_cm:
-                        continue
-
-                    processed_rows += 1
-
-                    try:
-                        # Convert date from column F to datetime
-                        if isinstance(date_value_f, str):
-                            # Try ISO format first (YYYY-MM-DD), then other formats
-                            for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                                try:
-                                    date_obj = datetime.strptime(date_value_f, date_format)
-                                    break
-                                except ValueError:
-                                    continue
-                            else:
-                                continue  # Skip if no format matches
-                        else:
-                            date_obj = pd.to_datetime(date_value_f)
-
-                        # Check if date is in the selected month/year
-                        if date_obj.month == month_num and date_obj.year == year_num:
-                            day = date_obj.day
-                            team_ctj_cm[collab_name][day] += 1
-                            valid_dates += 1
-
-                    except Exception as e:
-                        self.logger.debug(f"Error parsing date {date_value_f} from column F in CMS data: {e}")
-                        continue
-
-                self.logger.info(f"Team CTJ CM export: Processed {processed_rows} rows, found {valid_dates} valid dates for {month_name} {year}")
-
-                # Convert to list format for Excel export (team format)
-                ctj_cm_data = []
-                total_team_ctj_cm = 0
-
-                for day in range(1, days_in_month + 1):
-                    date_str = f"{day:02d}/{month_num:02d}/{year_num}"
-                    row_data = {'Date': date_str}
-
-                    # Add each collaborator's CTJ CM for this day
-                    total_day = 0
-                    for collab in sorted(team_ctj_cm.keys()):
-                        ctj_cm_value = team_ctj_cm[collab][day]
-                        row_data[collab] = ctj_cm_value
-                        total_day += ctj_cm_value
-
-                    row_data['Total'] = total_day
-                    total_team_ctj_cm += total_day
-                    ctj_cm_data.append(row_data)
-
-                self.logger.info(f"Team CTJ CM export: Generated {len(ctj_cm_data)} days of data, total CTJ CM: {total_team_ctj_cm}")
-
-                # If no data was found, create a minimal structure for the export to work
-                if total_team_ctj_cm == 0 and not team_ctj_cm:
-                    self.logger.warning("No CTJ CM data found for team export, creating minimal structure")
-                    # Create a minimal structure with at least one dummy collaborator
-                    for day in range(1, days_in_month + 1):
-                        date_str = f"{day:02d}/{month_num:02d}/{year_num}"
-                        ctj_cm_data[day-1] = {'Date': date_str, 'Aucune donnée': 0, 'Total': 0}
-
-                return ctj_cm_data
+        except Exception as e:
+            self.logger.error(f"Error calculating monthly CTJ CM: {e}")
+            return []
 
-            else:
-                # Individual collaborator export
-                daily_ctj_cm = {}
+    def _build_monthly_ctj_rows(self, activity, value_key, collaborator, month_name, year):
+        """
+        Build the daily CTJ rows of a month from the activity cube.
 
-                # Initialize all days with 0
-                for day in range(1, days_in_month + 1):
-                    daily_ctj_cm[day] = 0
+        Args:
+            activity: Cube activity (CTJ_PA or CTJ_CM)
+            value_key: Value column of individual exports ('CTJ' or 'CTJ_CM')
+            collaborator: Collaborator name, or "Toute l'équipe"
+            month_name: French month name
+            year: Year
 
-                # Count elements processed each day (based on dates in column F)
-                for index, row in collab_data.iterrows():
-                    date_value_f = row.get(date_column_f, None)
+        Returns:
+            One row per day: {'Date', value_key} for a collaborator, or
+            {'Date', <collaborator>..., 'Total'} for the whole team
+        """
+        import calendar
+
+        month_names = ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin",
+                      "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"]
+        month_num = month_names.index(month_name) + 1
+        year_num = int(year)
+        days_in_month = calendar.monthrange(year_num, month_num)[1]
+        dates = [f"{day:02d}/{month_num:02d}/{year_num}" for day in range(1, days_in_month + 1)]
+
+        cube = self._get_activity_cube()
+        source_collaborators = cube.get_source_collaborators(activity)
+        daily_counts = cube.daily_counts(activity, year_num, month_num)
+        no_days = [0] * days_in_month
+
+        if collaborator != "Toute l'équipe":
+            if collaborator not in source_collaborators:
+                self.logger.warning(f"No data found for collaborator: {collaborator}")
+                return []
 
-                    if pd.isna(date_value_f) or date_value_f == '':
-                        continue
+            counts = daily_counts.get(collaborator, no_days)
+            return [{'Date': date_str, value_key: counts[day]} for day, date_str in enumerate(dates)]
 
-                    try:
-                        # Convert date from column F to datetime
-                        if isinstance(date_value_f, str):
-                            # Try ISO format first (YYYY-MM-DD), then other formats
-                            for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                                try:
-                                    date_obj = datetime.strptime(date_value_f, date_format)
-                                    break
-                                except ValueError:
-                                    continue
-                            else:
-                                continue  # Skip if no format matches
-                        else:
-                            date_obj = pd.to_datetime(date_value_f)
+        # Team export: one column per collaborator (names trimmed), zero-filled
+        team_counts = {}
+        for collab in source_collaborators:
+            collab_name = str(collab).strip()
+            if collab_name:
+                team_counts.setdefault(collab_name, list(no_days))
 
-                        # Check if date is in the selected month/year
-                        if date_obj.month == month_num and date_obj.year == year_num:
-                            day = date_obj.day
-                            daily_ctj_cm[day] += 1
+        if not team_counts:
+            self.logger.warning(f"No valid collaborators found for {activity}")
+            return []
 
-                    except Exception as e:
-                        self.logger.debug(f"Error parsing date {date_value_f} from column F: {e}")
-                        continue
+        for collab, counts in daily_counts.items():
+            collab_name = str(collab).strip()
+            if collab_name in team_counts:
+                team_counts[collab_name] = [total + count for total, count in zip(team_counts[collab_name], counts)]
 
-                # Convert to list format for Excel export
-                ctj_cm_data = []
-                for day in range(1, days_in_month + 1):
-                    date_str = f"{day:02d}/{month_num:02d}/{year_num}"
-                    ctj_cm_data.append({
-                        'Date': date_str,
-                        'CTJ_CM': daily_ctj_cm[day]
-                    })
+        self.logger.info(f"Team export: Found collaborators: {sorted(team_counts.keys())}")
 
-                return ctj_cm_data
+        ctj_data = []
+        for day, date_str in enumerate(dates):
+            row_data = {'Date': date_str}
+            total_day = 0
+            for collab in sorted(team_counts.keys()):
+                row_data[collab] = team_counts[collab][day]
+                total_day += team_counts[collab][day]
+            row_data['Total'] = total_day
+            ctj_data.append(row_data)
 
-        except Exception as e:
-            self.logger.error(f"Error calculating monthly CTJ CM: {e}")
-            return []
+        self.logger.info(f"Team export: Generated {len(ctj_data)} days of data for {month_name} {year}")
+        return ctj_data
 
     def _create_ctj_excel_file(self, ctj_data, collaborator, month_name, year):
         """Create Excel file with CTJ data in horizontal date format."""
@@ -4581,7 +3748,8 @@ class TeamStatsModule:
                 return
 
             # Create the new format Excel file
-            self._create_horizontal_ctj_excel(file_path, ctj_data, collaborator, month_name, year)
+            with measure_operation('team_stats.write_ctj', threshold=5.0):
+                self._create_horizontal_ctj_excel(file_path, ctj_data, collaborator, month_name, year)
 
             messagebox.showinfo("Export réussi", f"Fichier CTJ exporté avec succès:\n{file_path}")
             self.logger.info(f"CTJ Excel file created: {file_path}")
@@ -5553,10 +4721,6 @@ class TeamStatsModule:
     def _extract_monthly_motifs_data(self, month_name, year):
         """Extract monthly motifs data from CM, PA and RIP sheets for statistics."""
         try:
-            from datetime import datetime
-            import calendar
-            from utils.lazy_imports import get_pandas
-
             # Convert month name to number
             month_names = ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin",
                           "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"]
@@ -5565,23 +4729,10 @@ class TeamStatsModule:
 
             motifs_data = []
 
-            # 1. Extract CM motifs from "Traitement CMS Adr" sheet
-            if 'Traitement CMS Adr' in self.global_suivi_data:
-                df_cms = self.global_suivi_data['Traitement CMS Adr']
-                if not df_cms.empty:
-                    motifs_data.extend(self._extract_motifs_from_cms(df_cms, month_num, year_num))
-
-            # 2. Extract PA motifs from "Traitement PA" sheet
-            if 'Traitement PA' in self.global_suivi_data:
-                df_pa = self.global_suivi_data['Traitement PA']
-                if not df_pa.empty:
-                    motifs_data.extend(self._extract_motifs_from_pa(df_pa, month_num, year_num))
-
-            # 3. Extract RIP motifs from "Traitement RIP" sheet
-            if 'Traitement RIP' in self.global_suivi_data:
-                df_rip = self.global_suivi_data['Traitement RIP']
-                if not df_rip.empty:
-                    motifs_data.extend(self._extract_motifs_from_rip(df_rip, month_num, year_num))
+            # 1. CM motifs ("Traitement CMS Adr"), 2. PA motifs ("Traitement PA"), 3. RIP motifs ("Traitement RIP")
+            motifs_data.extend(self._extract_motifs_from_cms(month_num, year_num))
+            motifs_data.extend(self._extract_motifs_from_pa(month_num, year_num))
+            motifs_data.extend(self._extract_motifs_from_rip(month_num, year_num))
 
             self.logger.info(f"Extracted {len(motifs_data)} motifs records for {month_name} {year}")
             return motifs_data
@@ -5590,208 +4741,27 @@ class TeamStatsModule:
             self.logger.error(f"Error extracting monthly motifs data: {e}")
             return []
 
-    def _extract_motifs_from_cms(self, df_cms, month_num, year_num):
+    def _extract_motifs_from_cms(self, month_num, year_num):
         """Extract motifs data from CM (Traitement CMS Adr) sheet."""
-        try:
-            from datetime import datetime
+        return self._extract_motifs_from_cube('CM', month_num, year_num)
 
-            motifs_data = []
-
-            # Check if required columns exist
-            if len(df_cms.columns) < 8:  # Need at least 8 columns (A-H)
-                self.logger.warning(f"CM sheet: Not enough columns (found {len(df_cms.columns)}, need at least 8)")
-                return motifs_data
-
-            # Column D: Motif Voie, Column G: Date traitement (index 3 and 6)
-            motif_column = df_cms.columns[3]  # Column D (Motif Voie)
-            date_column = df_cms.columns[6]   # Column G (Date traitement) - shifted due to Motif Voie in D
-            collaborator_column = 'Collaborateur' if 'Collaborateur' in df_cms.columns else None
-
-            self.logger.debug(f"CM motifs extraction: Using columns '{motif_column}' and '{date_column}'")
-
-            for index, row in df_cms.iterrows():
-                try:
-                    # Get motif value and normalize to uppercase
-                    motif_value = row.get(motif_column, '')
-                    if not motif_value or str(motif_value).strip() == '' or str(motif_value).lower() == 'nan':
-                        continue
-                    motif_value = str(motif_value).strip().upper()  # Normalize to uppercase
-
-                    # Get date value
-                    date_value = row.get(date_column, '')
-                    if not date_value or str(date_value).strip() == '' or str(date_value).lower() == 'nan':
-                        continue
-
-                    # Parse date (try multiple formats)
-                    date_obj = None
-                    for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                        try:
-                            date_obj = datetime.strptime(str(date_value), date_format)
-                            break
-                        except ValueError:
-                            continue
-
-                    if not date_obj:
-                        continue
-
-                    # Check if date is in selected month/year
-                    if date_obj.month == month_num and date_obj.year == year_num:
-                        collaborator = row.get(collaborator_column, 'Non spécifié') if collaborator_column else 'Non spécifié'
-
-                        motifs_data.append({
-                            'Type': 'CM',
-                            'Motif': motif_value,  # Already normalized to uppercase
-                            'Date': date_obj.strftime('%Y-%m-%d'),
-                            'Collaborateur': str(collaborator).strip(),
-                            'Mois': month_num,
-                            'Année': year_num
-                        })
-
-                except Exception as e:
-                    self.logger.debug(f"Error processing CM row {index}: {e}")
-                    continue
-
-            self.logger.info(f"Extracted {len(motifs_data)} CM motifs for {month_num}/{year_num}")
-            return motifs_data
-
-        except Exception as e:
-            self.logger.error(f"Error extracting CM motifs: {e}")
-            return []
-
-    def _extract_motifs_from_pa(self, df_pa, month_num, year_num):
+    def _extract_motifs_from_pa(self, month_num, year_num):
         """Extract motifs data from PA (Traitement PA) sheet."""
-        try:
-            from datetime import datetime
+        return self._extract_motifs_from_cube('PA', month_num, year_num)
 
-            motifs_data = []
-
-            # Check if required columns exist
-            if len(df_pa.columns) < 8:  # Need at least 8 columns (A-H)
-                self.logger.warning(f"PA sheet: Not enough columns (found {len(df_pa.columns)}, need at least 8)")
-                return motifs_data
-
-            # Column D: Motif, Column G: Date traitement (index 3 and 6)
-            motif_column = df_pa.columns[3]  # Column D (Motif)
-            date_column = df_pa.columns[6]   # Column G (Date traitement)
-            collaborator_column = 'Collaborateur' if 'Collaborateur' in df_pa.columns else None
-
-            self.logger.debug(f"PA motifs extraction: Using columns '{motif_column}' and '{date_column}'")
-
-            for index, row in df_pa.iterrows():
-                try:
-                    # Get motif value and normalize to uppercase
-                    motif_value = row.get(motif_column, '')
-                    if not motif_value or str(motif_value).strip() == '' or str(motif_value).lower() == 'nan':
-                        continue
-                    motif_value = str(motif_value).strip().upper()  # Normalize to uppercase
-
-                    # Get date value
-                    date_value = row.get(date_column, '')
-                    if not date_value or str(date_value).strip() == '' or str(date_value).lower() == 'nan':
-                        continue
-
-                    # Parse date (try multiple formats)
-                    date_obj = None
-                    for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                        try:
-                            date_obj = datetime.strptime(str(date_value), date_format)
-                            break
-                        except ValueError:
-                            continue
-
-                    if not date_obj:
-                        continue
-
-                    # Check if date is in selected month/year
-                    if date_obj.month == month_num and date_obj.year == year_num:
-                        collaborator = row.get(collaborator_column, 'Non spécifié') if collaborator_column else 'Non spécifié'
-
-                        motifs_data.append({
-                            'Type': 'PA',
-                            'Motif': motif_value,  # Already normalized to uppercase
-                            'Date': date_obj.strftime('%Y-%m-%d'),
-                            'Collaborateur': str(collaborator).strip(),
-                            'Mois': month_num,
-                            'Année': year_num
-                        })
-
-                except Exception as e:
-                    self.logger.debug(f"Error processing PA row {index}: {e}")
-                    continue
-
-            self.logger.info(f"Extracted {len(motifs_data)} PA motifs for {month_num}/{year_num}")
-            return motifs_data
-
-        except Exception as e:
-            self.logger.error(f"Error extracting PA motifs: {e}")
-            return []
-
-    def _extract_motifs_from_rip(self, df_rip, month_num, year_num):
+    def _extract_motifs_from_rip(self, month_num, year_num):
         """Extract motifs data from RIP (Traitement RIP) sheet."""
-        try:
-            from datetime import datetime
+        return self._extract_motifs_from_cube('RIP', month_num, year_num)
 
-            motifs_data = []
-
-            # Check if required columns exist
-            if len(df_rip.columns) < 9:  # Need at least 9 columns (A-I)
-                self.logger.warning(f"RIP sheet: Not enough columns (found {len(df_rip.columns)}, need at least 9)")
-                return motifs_data
-
-            # Column E: Acte de traitement, Column H: Date de traitement (index 4 and 7)
-            motif_column = df_rip.columns[4]  # Column E (Acte de traitement)
-            date_column = df_rip.columns[7]   # Column H (Date de traitement)
-            collaborator_column = 'Collaborateur' if 'Collaborateur' in df_rip.columns else None
-
-            self.logger.debug(f"RIP motifs extraction: Using columns '{motif_column}' and '{date_column}'")
-
-            for index, row in df_rip.iterrows():
-                try:
-                    # Get motif value and normalize to uppercase
-                    motif_value = row.get(motif_column, '')
-                    if not motif_value or str(motif_value).strip() == '' or str(motif_value).lower() == 'nan':
-                        continue
-                    motif_value = str(motif_value).strip().upper()  # Normalize to uppercase
-
-                    # Get date value
-                    date_value = row.get(date_column, '')
-                    if not date_value or str(date_value).strip() == '' or str(date_value).lower() == 'nan':
-                        continue
-
-                    # Parse date (try multiple formats)
-                    date_obj = None
-                    for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                        try:
-                            date_obj = datetime.strptime(str(date_value), date_format)
-                            break
-                        except ValueError:
-                            continue
-
-                    if not date_obj:
-                        continue
-
-                    # Check if date is in selected month/year
-                    if date_obj.month == month_num and date_obj.year == year_num:
-                        collaborator = row.get(collaborator_column, 'Non spécifié') if collaborator_column else 'Non spécifié'
-
-                        motifs_data.append({
-                            'Type': 'RIP',
-                            'Motif': motif_value,  # Already normalized to uppercase
-                            'Date': date_obj.strftime('%Y-%m-%d'),
-                            'Collaborateur': str(collaborator).strip(),
-                            'Mois': month_num,
-                            'Année': year_num
-                        })
-
-                except Exception as e:
-                    self.logger.debug(f"Error processing RIP row {index}: {e}")
-                    continue
-
-            self.logger.info(f"Extracted {len(motifs_data)} RIP motifs for {month_num}/{year_num}")
+    def _extract_motifs_from_cube(self, motif_type, month_num, year_num):
+        """Get the motif records of one month from the activity cube."""
+        try:
+            motifs_data = self._get_activity_cube().motif_records(motif_type, year_num, month_num)
+            self.logger.info(f"Extracted {len(motifs_data)} {motif_type} motifs for {month_num}/{year_num}")
             return motifs_data
 
         except Exception as e:
-            self.logger.error(f"Error extracting RIP motifs: {e}")
+            self.logger.error(f"Error extracting {motif_type} motifs: {e}")
             return []
 
     def _create_motifs_statistics_sheet(self, workbook, motifs_data, month_name, year):
@@ -7418,613 +6388,146 @@ class TeamStatsModule:
                 from datetime import datetime
                 current_month = datetime.now().month
                 month_names = ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin",
-                              "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"]
-                if hasattr(self, 'month_var') and self.month_var is not None:
-                    self.month_var.set(month_names[current_month - 1])
-                    self.logger.debug(f"Set default month selection to {month_names[current_month - 1]}")
-            except Exception as e:
-                self.logger.warning(f"Could not set default month selection: {e}")
-
-            self.logger.info(f"Export filters updated with {len(collaborators)} collaborators (including 'Toute l'équipe')")
-
-        except Exception as e:
-            self.logger.error(f"Error updating export filters: {e}")
-            # Additional error details for debugging
-            self.logger.error(f"collaborator_stats exists: {bool(self.collaborator_stats)}")
-            self.logger.error(f"collab_combo exists: {hasattr(self, 'collab_combo')}")
-            self.logger.error(f"collab_var exists: {hasattr(self, 'collab_var')}")
-            self.logger.error(f"month_var exists: {hasattr(self, 'month_var')}")
-            if hasattr(self, 'export_filters'):
-                self.logger.error(f"export_filters content: {self.export_filters}")
-
-    def _enable_export_buttons(self):
-        """Enable export buttons and filters when data is loaded."""
-        try:
-            self.logger.debug("Attempting to enable export buttons...")
-
-            # Enable export buttons
-            if hasattr(self, 'export_buttons') and self.export_buttons:
-                self.logger.debug(f"Found export_buttons: {list(self.export_buttons.keys())}")
-                for button_name, button in self.export_buttons.items():
-                    if button is not None:
-                        try:
-                            button.config(state=tk.NORMAL)
-                            self.logger.debug(f"Enabled button: {button_name}")
-                        except Exception as e:
-                            self.logger.warning(f"Could not enable button {button_name}: {e}")
-            else:
-                self.logger.warning("export_buttons not found or empty")
-
-            # Enable export filters
-            if hasattr(self, 'export_filters') and self.export_filters:
-                self.logger.debug(f"Found export_filters: {list(self.export_filters.keys())}")
-                for filter_name, filter_widget in self.export_filters.items():
-                    if filter_widget is not None:
-                        try:
-                            filter_widget.config(state="readonly")
-                            self.logger.debug(f"Enabled filter: {filter_name}")
-                        except Exception as e:
-                            self.logger.warning(f"Could not enable filter {filter_name}: {e}")
-            else:
-                self.logger.warning("export_filters not found or empty")
-
-            self.logger.info("Export buttons and filters enabled successfully")
-
-        except Exception as e:
-            self.logger.error(f"Error enabling export buttons: {e}")
-            # Additional debugging information
-            self.logger.error(f"Has export_buttons: {hasattr(self, 'export_buttons')}")
-            self.logger.error(f"Has export_filters: {hasattr(self, 'export_filters')}")
-            if hasattr(self, 'export_buttons'):
-                self.logger.error(f"export_buttons content: {self.export_buttons}")
-            if hasattr(self, 'export_filters'):
-                self.logger.error(f"export_filters content: {self.export_filters}")
-
-    def _disable_export_buttons(self):
-        """Disable export buttons and filters when no data is available."""
-        try:
-            if hasattr(self, 'export_buttons') and self.export_buttons:
-                for button_name, button in self.export_buttons.items():
-                    if button is not None:
-                        try:
-                            button.config(state=tk.DISABLED)
-                        except Exception as e:
-                            self.logger.warning(f"Could not disable button {button_name}: {e}")
-
-            if hasattr(self, 'export_filters') and self.export_filters:
-                for filter_name, filter_widget in self.export_filters.items():
-                    if filter_widget is not None:
-                        try:
-                            filter_widget.config(state=tk.DISABLED)
-                        except Exception as e:
-                            self.logger.warning(f"Could not disable filter {filter_name}: {e}")
-
-        except Exception as e:
-            self.logger.error(f"Error disabling export buttons: {e}")
-
-    def _export_anomalies(self):
-        """Export anomalies from Suivis Global Tickets CMS Adr_PA file."""
-        try:
-            from tkinter import filedialog
-            from datetime import datetime
-            import os
-
-            # Check if global data is loaded
-            if not self.global_suivi_data:
-                messagebox.showwarning("Données manquantes", "Veuillez d'abord charger les données globales.")
-                return
-
-            self.logger.info("Starting anomalies export...")
-
-            # Find anomalies
-            anomalies = self._detect_anomalies()
-
-            if not anomalies:
-                messagebox.showinfo("Aucune anomalie", "Aucune anomalie détectée dans les données.")
-                return
-
-            # Ask user for save location
-            current_date = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"Anomalies_Export_{current_date}.xlsx"
-
-            file_path = filedialog.asksaveasfilename(
-                title="Enregistrer l'export des anomalies",
-                defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
-                initialfile=filename
-            )
-
-            if not file_path:
-                return
-
-            # Create Excel file with anomalies
-            self._create_anomalies_excel(file_path, anomalies)
-
-            messagebox.showinfo("Export réussi", f"Export des anomalies terminé avec succès !\n\n{len(anomalies)} anomalie(s) détectée(s)\n\nFichier : {file_path}")
-            self.logger.info(f"Anomalies export completed: {file_path}")
-
-        except Exception as e:
-            self.logger.error(f"Error exporting anomalies: {e}")
-            messagebox.showerror("Erreur Export", f"Erreur lors de l'export des anomalies :\n{str(e)}")
-
-    def _detect_anomalies(self):
-        """Detect anomalies in the global data according to specified criteria."""
-        try:
-            from utils.lazy_imports import get_pandas
-            from datetime import datetime
-
-            pd = get_pandas()
-            anomalies = []
-            today = datetime.now().date()
-
-            self.logger.info("Detecting anomalies in global data...")
-
-            # Check each sheet
-            for sheet_name, df in self.global_suivi_data.items():
-                if df.empty:
-                    continue
-
-                self.logger.info(f"Checking anomalies in sheet: {sheet_name}")
-
-                if sheet_name == 'Suivi Tickets':
-                    # Feuille 1: Vérifier cases vides colonnes A à U (sauf O, Q, R, T)
-                    anomalies.extend(self._check_empty_cells_sheet1(df, pd))
-                    # Vérifier dates futures
-                    anomalies.extend(self._check_future_dates_sheet1(df, pd, today))
-                    # Vérifier incohérence dates affectation/livraison
-                    anomalies.extend(self._check_assignment_delivery_dates_sheet1(df, pd))
-
-                elif sheet_name == 'Traitement CMS Adr':
-                    # Feuille 2: Vérifier dates futures
-                    anomalies.extend(self._check_future_dates_sheet2(df, pd, today))
-                    # Vérifier tickets CM traités sans motif voie
-                    anomalies.extend(self._check_cm_treated_without_motif_sheet2(df, pd))
-
-                elif sheet_name == 'Traitement PA':
-                    # Feuille 3: Vérifier dates futures
-                    anomalies.extend(self._check_future_dates_sheet3(df, pd, today))
-                    # Vérifier adresses non jointes avec temps de traitement
-                    anomalies.extend(self._check_unjoined_address_with_time_sheet3(df, pd))
-
-            self.logger.info(f"Total anomalies detected: {len(anomalies)}")
-            return anomalies
-
-        except Exception as e:
-            self.logger.error(f"Error detecting anomalies: {e}")
-            return []
-
-    def _check_empty_cells_sheet1(self, df, pd):
-        """Check for empty cells in sheet 1 (columns A to U except O, Q, R, T)."""
-        anomalies = []
-        try:
-            # Colonnes à vérifier (A à U sauf O, Q, R, T)
-            columns_to_check = []
-            excluded_cols = ['O', 'Q', 'R', 'T']  # Colonnes exclues
-
-            # Générer les lettres de colonnes A à U
-            for i in range(ord('A'), ord('U') + 1):
-                col_letter = chr(i)
-                if col_letter not in excluded_cols:
-                    columns_to_check.append(col_letter)
-
-            # Mapper les lettres aux noms de colonnes réels
-            actual_columns = []
-            for i, col_name in enumerate(df.columns):
-                col_letter = chr(ord('A') + i)
-                if col_letter in columns_to_check:
-                    actual_columns.append(col_name)
-
-            self.logger.info(f"Checking empty cells in columns: {actual_columns}")
-
-            # Vérifier chaque ligne
-            for index, row in df.iterrows():
-                insee_code = row.get(df.columns[2], '') if len(df.columns) > 2 else ''  # Colonne C
-
-                # Vérifier les cellules vides dans les colonnes requises
-                empty_columns = []
-                for col_name in actual_columns:
-                    if col_name in row.index:
-                        value = row[col_name]
-                        if pd.isna(value) or value == '' or str(value).strip() == '':
-                            empty_columns.append(col_name)
-
-                if empty_columns:
-                    anomalies.append({
-                        'type': 'Cases vides',
-                        'feuille': 'Suivi Tickets',
-                        'ligne': index + 2,  # +2 car Excel commence à 1 et il y a un header
-                        'code_insee': str(insee_code),
-                        'colonnes_vides': ', '.join(empty_columns),
-                        'commentaire': f'Cases vides dans colonnes: {", ".join(empty_columns)}'
-                    })
-
-            self.logger.info(f"Found {len([a for a in anomalies if a['type'] == 'Cases vides'])} empty cell anomalies in sheet 1")
-
-        except Exception as e:
-            self.logger.error(f"Error checking empty cells in sheet 1: {e}")
-
-        return anomalies
-
-    def _check_future_dates_sheet1(self, df, pd, today):
-        """Check for future dates in sheet 1."""
-        anomalies = []
-        try:
-            # Colonnes de dates à vérifier dans la feuille 1
-            date_columns = []
-            for col_name in df.columns:
-                if 'date' in col_name.lower():
-                    date_columns.append(col_name)
-
-            self.logger.info(f"Checking future dates in sheet 1 columns: {date_columns}")
-
-            for index, row in df.iterrows():
-                insee_code = row.get(df.columns[2], '') if len(df.columns) > 2 else ''  # Colonne C
-
-                for col_name in date_columns:
-                    if col_name in row.index:
-                        date_value = row[col_name]
-
-                        if pd.isna(date_value) or date_value == '':
-                            continue
-
-                        try:
-                            # Essayer de parser la date
-                            if isinstance(date_value, str):
-                                for date_format in ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']:
-                                    try:
-                                        date_obj = datetime.strptime(date_value, date_format).date()
-                                        break
-                                    except ValueError:
-                                        continue
-                                else:
-                                    continue
-                            else:
-                                date_obj = pd.to_datetime(date_value).date()
-
-                            # Vérifier si la date est dans le futur
-                            if date_obj > today:
-                                anomalies.append({
-                                    'type': 'Date future',
-                                    'feuille': 'Suivi Tickets',
-                                    'ligne': index + 2,
-                                    'code_insee': str(insee_code),
-                                    'colonne': col_name,
-                                    'date': str(date_value),
-                                    'commentaire': 'Incohérence date'
-                                })
-
-                        except Exception as e:
-                            self.logger.debug(f"Error parsing date {date_value} in sheet 1: {e}")
-                            continue
-
-            future_dates_count = len([a for a in anomalies if a['type'] == 'Date future' and a['feuille'] == 'Suivi Tickets'])
-            self.logger.info(f"Found {future_dates_count} future date anomalies in sheet 1")
-
-        except Exception as e:
-            self.logger.error(f"Error checking future dates in sheet 1: {e}")
-
-        return anomalies
-
-    def _check_assignment_delivery_dates_sheet1(self, df, pd):
-        """Check for assignment dates posterior to delivery dates in sheet 1."""
-        anomalies = []
-        try:
-            self.logger.info("Checking assignment/delivery date inconsistencies in sheet 1")
-
-            # Colonnes I (date d'affectation) et O (date de livraison)
-            assignment_col = None
-            delivery_col = None
-
-            # Trouver les colonnes par index (I = index 8, O = index 14)
-            if len(df.columns) > 8:
-                assignment_col = df.columns[8]  # Colonne I
-            if len(df.columns) > 14:
-                delivery_col = df.columns[14]  # Colonne O
-
-            if not assignment_col or not delivery_col:
-                self.logger.warning("Assignment or delivery columns not found in sheet 1")
-                return anomalies
-
-            self.logger.info(f"Checking assignment column: {assignment_col}, delivery column: {delivery_col}")
-
-            for index, row in df.iterrows():
-                insee_code = row.get(df.columns[2], '') if len(df.columns) > 2 else ''  # Colonne C
-
-                assignment_value = row.get(assignment_col, '')
-                delivery_value = row.get(delivery_col, '')
-
-                # Ignorer si l'une des dates est vide
-                if pd.isna(assignment_value) or assignment_value == '' or pd.isna(delivery_value) or delivery_value == '':
-                    continue
-
-                try:
-                    # Parser les dates
-                    assignment_date = None
-                    delivery_date = None
-
-                    # Parser date d'affectation
-                    if isinstance(assignment_value, str):
-                        for date_format in ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']:
-                            try:
-                                assignment_date = datetime.strptime(assignment_value, date_format).date()
-                                break
-                            except ValueError:
-                                continue
-                    else:
-                        assignment_date = pd.to_datetime(assignment_value).date()
-
-                    # Parser date de livraison
-                    if isinstance(delivery_value, str):
-                        for date_format in ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']:
-                            try:
-                                delivery_date = datetime.strptime(delivery_value, date_format).date()
-                                break
-                            except ValueError:
-                                continue
-                    else:
-                        delivery_date = pd.to_datetime(delivery_value).date()
-
-                    # Vérifier si date d'affectation > date de livraison
-                    if assignment_date and delivery_date and assignment_date > delivery_date:
-                        anomalies.append({
-                            'type': 'Incohérence dates affectation/livraison',
-                            'feuille': 'Suivi Tickets',
-                            'ligne': index + 2,
-                            'code_insee': str(insee_code),
-                            'colonnes_concernees': f'{assignment_col}, {delivery_col}',
-                            'valeurs_problematiques': f'Affectation: {assignment_value}, Livraison: {delivery_value}',
-                            'commentaire': f'Date d\'affectation ({assignment_value}) postérieure à la date de livraison ({delivery_value})'
-                        })
-
-                except Exception as e:
-                    self.logger.debug(f"Error parsing assignment/delivery dates {assignment_value}/{delivery_value}: {e}")
-                    continue
-
-            inconsistency_count = len([a for a in anomalies if a['type'] == 'Incohérence dates affectation/livraison'])
-            self.logger.info(f"Found {inconsistency_count} assignment/delivery date inconsistencies in sheet 1")
-
-        except Exception as e:
-            self.logger.error(f"Error checking assignment/delivery dates in sheet 1: {e}")
-
-        return anomalies
-
-    def _check_future_dates_sheet2(self, df, pd, today):
-        """Check for future dates in sheet 2 (Traitement CMS Adr)."""
-        anomalies = []
-        try:
-            from datetime import datetime
-
-            # Colonnes de dates à vérifier dans la feuille 2
-            date_columns = []
-            for col_name in df.columns:
-                if 'date' in col_name.lower():
-                    date_columns.append(col_name)
-
-            self.logger.info(f"Checking future dates in sheet 2 columns: {date_columns}")
-
-            for index, row in df.iterrows():
-                insee_code = row.get(df.columns[1], '') if len(df.columns) > 1 else ''  # Colonne B
-
-                for col_name in date_columns:
-                    if col_name in row.index:
-                        date_value = row[col_name]
-
-                        if pd.isna(date_value) or date_value == '':
-                            continue
-
-                        try:
-                            # Essayer de parser la date
-                            if isinstance(date_value, str):
-                                for date_format in ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']:
-                                    try:
-                                        date_obj = datetime.strptime(date_value, date_format).date()
-                                        break
-                                    except ValueError:
-                                        continue
-                                else:
-                                    continue
-                            else:
-                                date_obj = pd.to_datetime(date_value).date()
-
-                            # Vérifier si la date est dans le futur
-                            if date_obj > today:
-                                anomalies.append({
-                                    'type': 'Date future',
-                                    'feuille': 'Traitement CMS Adr',
-                                    'ligne': index + 2,
-                                    'code_insee': str(insee_code),
-                                    'colonne': col_name,
-                                    'date': str(date_value),
-                                    'commentaire': 'Incohérence date'
-                                })
-
-                        except Exception as e:
-                            self.logger.debug(f"Error parsing date {date_value} in sheet 2: {e}")
-                            continue
-
-            future_dates_count = len([a for a in anomalies if a['type'] == 'Date future' and a['feuille'] == 'Traitement CMS Adr'])
-            self.logger.info(f"Found {future_dates_count} future date anomalies in sheet 2")
-
-        except Exception as e:
-            self.logger.error(f"Error checking future dates in sheet 2: {e}")
-
-        return anomalies
-
-    def _check_cm_treated_without_motif_sheet2(self, df, pd):
-        """Check for CM tickets treated without motif voie in sheet 2."""
-        anomalies = []
-        try:
-            self.logger.info("Checking CM tickets treated without motif voie in sheet 2")
-
-            # Colonnes D (motif voie) et I (date de traitement ou statut traité)
-            motif_col = None
-            treatment_col = None
-
-            # Trouver les colonnes par index (D = index 3, I = index 8)
-            if len(df.columns) > 3:
-                motif_col = df.columns[3]  # Colonne D
-            if len(df.columns) > 8:
-                treatment_col = df.columns[8]  # Colonne I
-
-            if not motif_col or not treatment_col:
-                self.logger.warning("Motif or treatment columns not found in sheet 2")
-                return anomalies
-
-            self.logger.info(f"Checking motif column: {motif_col}, treatment column: {treatment_col}")
-
-            for index, row in df.iterrows():
-                insee_code = row.get(df.columns[1], '') if len(df.columns) > 1 else ''  # Colonne B
-
-                motif_value = row.get(motif_col, '')
-                treatment_value = row.get(treatment_col, '')
-
-                # Vérifier si le ticket est traité (colonne I non vide) mais motif voie vide (colonne D)
-                is_treated = not (pd.isna(treatment_value) or treatment_value == '' or str(treatment_value).strip() == '')
-                is_motif_empty = pd.isna(motif_value) or motif_value == '' or str(motif_value).strip() == ''
-
-                if is_treated and is_motif_empty:
-                    anomalies.append({
-                        'type': 'Ticket CM traité sans motif voie',
-                        'feuille': 'Traitement CMS Adr',
-                        'ligne': index + 2,
-                        'code_insee': str(insee_code),
-                        'colonnes_concernees': f'{motif_col}, {treatment_col}',
-                        'valeurs_problematiques': f'Motif: {motif_value}, Traitement: {treatment_value}',
-                        'commentaire': f'Ticket marqué comme traité (colonne {treatment_col}: {treatment_value}) mais motif voie vide (colonne {motif_col})'
-                    })
+                              "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"]
+                if hasattr(self, 'month_var') and self.month_var is not None:
+                    self.month_var.set(month_names[current_month - 1])
+                    self.logger.debug(f"Set default month selection to {month_names[current_month - 1]}")
+            except Exception as e:
+                self.logger.warning(f"Could not set default month selection: {e}")
 
-            cm_without_motif_count = len([a for a in anomalies if a['type'] == 'Ticket CM traité sans motif voie'])
-            self.logger.info(f"Found {cm_without_motif_count} CM tickets treated without motif voie in sheet 2")
+            self.logger.info(f"Export filters updated with {len(collaborators)} collaborators (including 'Toute l'équipe')")
 
         except Exception as e:
-            self.logger.error(f"Error checking CM tickets treated without motif voie in sheet 2: {e}")
-
-        return anomalies
+            self.logger.error(f"Error updating export filters: {e}")
+            # Additional error details for debugging
+            self.logger.error(f"collaborator_stats exists: {bool(self.collaborator_stats)}")
+            self.logger.error(f"collab_combo exists: {hasattr(self, 'collab_combo')}")
+            self.logger.error(f"collab_var exists: {hasattr(self, 'collab_var')}")
+            self.logger.error(f"month_var exists: {hasattr(self, 'month_var')}")
+            if hasattr(self, 'export_filters'):
+                self.logger.error(f"export_filters content: {self.export_filters}")
 
-    def _check_future_dates_sheet3(self, df, pd, today):
-        """Check for future dates in sheet 3 (Traitement PA)."""
-        anomalies = []
+    def _enable_export_buttons(self):
+        """Enable export buttons and filters when data is loaded."""
         try:
-            from datetime import datetime
-
-            # Colonnes de dates à vérifier dans la feuille 3
-            date_columns = []
-            for col_name in df.columns:
-                if 'date' in col_name.lower():
-                    date_columns.append(col_name)
+            self.logger.debug("Attempting to enable export buttons...")
 
-            self.logger.info(f"Checking future dates in sheet 3 columns: {date_columns}")
+            # Enable export buttons
+            if hasattr(self, 'export_buttons') and self.export_buttons:
+                self.logger.debug(f"Found export_buttons: {list(self.export_buttons.keys())}")
+                for button_name, button in self.export_buttons.items():
+                    if button is not None:
+                        try:
+                            button.config(state=tk.NORMAL)
+                            self.logger.debug(f"Enabled button: {button_name}")
+                        except Exception as e:
+                            self.logger.warning(f"Could not enable button {button_name}: {e}")
+            else:
+                self.logger.warning("export_buttons not found or empty")
 
-            for index, row in df.iterrows():
-                insee_code = row.get(df.columns[1], '') if len(df.columns) > 1 else ''  # Colonne B
+            # Enable export filters
+            if hasattr(self, 'export_filters') and self.export_filters:
+                self.logger.debug(f"Found export_filters: {list(self.export_filters.keys())}")
+                for filter_name, filter_widget in self.export_filters.items():
+                    if filter_widget is not None:
+                        try:
+                            filter_widget.config(state="readonly")
+                            self.logger.debug(f"Enabled filter: {filter_name}")
+                        except Exception as e:
+                            self.logger.warning(f"Could not enable filter {filter_name}: {e}")
+            else:
+                self.logger.warning("export_filters not found or empty")
 
-                for col_name in date_columns:
-                    if col_name in row.index:
-                        date_value = row[col_name]
+            self.logger.info("Export buttons and filters enabled successfully")
 
-                        if pd.isna(date_value) or date_value == '':
-                            continue
+        except Exception as e:
+            self.logger.error(f"Error enabling export buttons: {e}")
+            # Additional debugging information
+            self.logger.error(f"Has export_buttons: {hasattr(self, 'export_buttons')}")
+            self.logger.error(f"Has export_filters: {hasattr(self, 'export_filters')}")
+            if hasattr(self, 'export_buttons'):
+                self.logger.error(f"export_buttons content: {self.export_buttons}")
+            if hasattr(self, 'export_filters'):
+                self.logger.error(f"export_filters content: {self.export_filters}")
 
+    def _disable_export_buttons(self):
+        """Disable export buttons and filters when no data is available."""
+        try:
+            if hasattr(self, 'export_buttons') and self.export_buttons:
+                for button_name, button in self.export_buttons.items():
+                    if button is not None:
                         try:
-                            # Essayer de parser la date
-                            if isinstance(date_value, str):
-                                for date_format in ['%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y']:
-                                    try:
-                                        date_obj = datetime.strptime(date_value, date_format).date()
-                                        break
-                                    except ValueError:
-                                        continue
-                                else:
-                                    continue
-                            else:
-                                date_obj = pd.to_datetime(date_value).date()
-
-                            # Vérifier si la date est dans le futur
-                            if date_obj > today:
-                                anomalies.append({
-                                    'type': 'Date future',
-                                    'feuille': 'Traitement PA',
-                                    'ligne': index + 2,
-                                    'code_insee': str(insee_code),
-                                    'colonne': col_name,
-                                    'date': str(date_value),
-                                    'commentaire': 'Incohérence date'
-                                })
-
+                            button.config(state=tk.DISABLED)
                         except Exception as e:
-                            self.logger.debug(f"Error parsing date {date_value} in sheet 3: {e}")
-                            continue
+                            self.logger.warning(f"Could not disable button {button_name}: {e}")
 
-            future_dates_count = len([a for a in anomalies if a['type'] == 'Date future' and a['feuille'] == 'Traitement PA'])
-            self.logger.info(f"Found {future_dates_count} future date anomalies in sheet 3")
+            if hasattr(self, 'export_filters') and self.export_filters:
+                for filter_name, filter_widget in self.export_filters.items():
+                    if filter_widget is not None:
+                        try:
+                            filter_widget.config(state=tk.DISABLED)
+                        except Exception as e:
+                            self.logger.warning(f"Could not disable filter {filter_name}: {e}")
 
         except Exception as e:
-            self.logger.error(f"Error checking future dates in sheet 3: {e}")
-
-        return anomalies
+            self.logger.error(f"Error disabling export buttons: {e}")
 
-    def _check_unjoined_address_with_time_sheet3(self, df, pd):
-        """Check for unjoined addresses with processing time > 0 in sheet 3."""
-        anomalies = []
+    def _export_anomalies(self):
+        """Export anomalies from Suivis Global Tickets CMS Adr_PA file."""
         try:
-            self.logger.info("Checking unjoined addresses with processing time in sheet 3")
+            from tkinter import filedialog
+            from datetime import datetime
+            import os
 
-            # Colonnes D (statut adresse jointe) et H (temps de traitement)
-            address_status_col = None
-            processing_time_col = None
+            # Check if global data is loaded
+            if not self.global_suivi_data:
+                messagebox.showwarning("Données manquantes", "Veuillez d'abord charger les données globales.")
+                return
 
-            # Trouver les colonnes par index (D = index 3, H = index 7)
-            if len(df.columns) > 3:
-                address_status_col = df.columns[3]  # Colonne D
-            if len(df.columns) > 7:
-                processing_time_col = df.columns[7]  # Colonne H
+            self.logger.info("Starting anomalies export...")
 
-            if not address_status_col or not processing_time_col:
-                self.logger.warning("Address status or processing time columns not found in sheet 3")
-                return anomalies
+            # Find anomalies
+            with measure_operation('team_stats.detect_anomalies', threshold=5.0):
+                anomalies = self._detect_anomalies()
 
-            self.logger.info(f"Checking address status column: {address_status_col}, processing time column: {processing_time_col}")
+            if not anomalies:
+                messagebox.showinfo("Aucune anomalie", "Aucune anomalie détectée dans les données.")
+                return
 
-            for index, row in df.iterrows():
-                insee_code = row.get(df.columns[1], '') if len(df.columns) > 1 else ''  # Colonne B
+            # Ask user for save location
+            current_date = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"Anomalies_Export_{current_date}.xlsx"
 
-                address_status_value = row.get(address_status_col, '')
-                processing_time_value = row.get(processing_time_col, '')
+            file_path = filedialog.asksaveasfilename(
+                title="Enregistrer l'export des anomalies",
+                defaultextension=".xlsx",
+                filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+                initialfile=filename
+            )
 
-                # Vérifier si l'adresse n'est pas jointe (colonne D = "Non" ou vide)
-                is_address_not_joined = (
-                    pd.isna(address_status_value) or
-                    address_status_value == '' or
-                    str(address_status_value).strip().lower() in ['non', 'no', '']
-                )
+            if not file_path:
+                return
 
-                # Vérifier si le temps de traitement > 0
-                processing_time_numeric = 0
-                try:
-                    if not (pd.isna(processing_time_value) or processing_time_value == ''):
-                        processing_time_numeric = float(str(processing_time_value).replace(',', '.'))
-                except (ValueError, TypeError):
-                    processing_time_numeric = 0
-
-                # Détecter l'anomalie : adresse non jointe mais temps de traitement > 0
-                if is_address_not_joined and processing_time_numeric > 0:
-                    anomalies.append({
-                        'type': 'Adresse non jointe avec temps de traitement',
-                        'feuille': 'Traitement PA',
-                        'ligne': index + 2,
-                        'code_insee': str(insee_code),
-                        'colonnes_concernees': f'{address_status_col}, {processing_time_col}',
-                        'valeurs_problematiques': f'Statut adresse: {address_status_value}, Temps: {processing_time_value}',
-                        'commentaire': f'Adresse non jointe (colonne {address_status_col}: {address_status_value}) mais temps de traitement > 0 (colonne {processing_time_col}: {processing_time_value})'
-                    })
+            # Create Excel file with anomalies
+            with measure_operation('team_stats.write_anomalies', threshold=5.0):
+                self._create_anomalies_excel(file_path, anomalies)
 
-            unjoined_with_time_count = len([a for a in anomalies if a['type'] == 'Adresse non jointe avec temps de traitement'])
-            self.logger.info(f"Found {unjoined_with_time_count} unjoined addresses with processing time in sheet 3")
+            messagebox.showinfo("Export réussi", f"Export des anomalies terminé avec succès !\n\n{len(anomalies)} anomalie(s) détectée(s)\n\nFichier : {file_path}")
+            self.logger.info(f"Anomalies export completed: {file_path}")
 
         except Exception as e:
-            self.logger.error(f"Error checking unjoined addresses with processing time in sheet 3: {e}")
+            self.logger.error(f"Error exporting anomalies: {e}")
+            messagebox.showerror("Erreur Export", f"Erreur lors de l'export des anomalies :\n{str(e)}")
+
+    def _detect_anomalies(self):
+        """Detect anomalies in the global data according to specified criteria."""
+        try:
+            self.logger.info("Detecting anomalies in global data...")
+            return AnomalyEngine().detect(self.global_suivi_data, normalized=self._get_normalized_data())
 
-        return anomalies
+        except Exception as e:
+            self.logger.error(f"Error detecting anomalies: {e}")
+            return []
 
     def _create_anomalies_excel(self, file_path, anomalies):
         """Create Excel file with detected anomalies using global tickets styling."""
@@ -9406,6 +7909,7 @@ class TeamStatsModule:
             self.generate_stats_button.config(state=tk.DISABLED)
 
             # Use async task for heavy computation
+            @timed_operation('team_stats.filtered_statistics', threshold=5.0)
             def generate_stats():
                 try:
                     # Filter data by date range
@@ -9482,7 +7986,8 @@ class TeamStatsModule:
                 generate_stats,
                 callback=on_success,
                 error_callback=on_error,
-                task_name="Génération des statistiques filtrées"
+                task_name="Génération des statistiques filtrées",
+                dedup_key=(id(self), "filtered_statistics")
             )
 
         except Exception as e:
@@ -9953,6 +8458,7 @@ class TeamStatsModule:
             self.logger.debug(f"Error extracting date from filename: {e}")
             return None
 
+    @timed_operation('team_stats.inject', threshold=5.0)
     def _inject_statistics_to_stats_index(self):
         """Inject the generated statistics into the stats folder index file.
 
@@ -10414,11 +8920,8 @@ class TeamStatsModule:
     def _examine_excel_structure(self, excel_path):
         """Examine Excel file structure for injection points."""
         try:
-            pd = get_pandas()
-
-            # Read Excel file to understand its structure
-            excel_file = pd.ExcelFile(excel_path)
-            sheet_names = excel_file.sheet_names
+            # Only the workbook part is read to list the sheets
+            sheet_names = get_sheet_names(excel_path)
 
             structure = {
                 'file_path': excel_path,
@@ -11436,7 +9939,6 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
     def _extract_cm_data_for_dashboard(self):
         """Extract CM data from Sheet 2 (Traitement CMS Adr) for dashboard population."""
         try:
-            from datetime import datetime
             # Check if we have the required data
             if not hasattr(self, 'global_suivi_data') or not self.global_suivi_data:
                 self.logger.warning("No global_suivi_data available for CM extraction")
@@ -11483,45 +9985,18 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
             self.logger.info(f"CM extraction: Using motif column '{motif_column}' and date column '{delivery_date_column}'")
 
             # Extract and count motifs within the date range
-            motif_counts = {}
-            total_processed = 0
-
-            for index, row in df_cms.iterrows():
-                try:
-                    # Get motif value
-                    motif_value = row.get(motif_column, '')
-                    if not motif_value or str(motif_value).strip() == '' or str(motif_value).lower() == 'nan':
-                        continue
-                    motif_value = str(motif_value).strip().upper()  # Normalize to uppercase
-
-                    # Get date value
-                    date_value = row.get(delivery_date_column, '')
-                    if not date_value or str(date_value).strip() == '' or str(date_value).lower() == 'nan':
-                        continue
-
-                    # Parse date (try multiple formats)
-                    date_obj = None
-                    for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                        try:
-                            date_obj = datetime.strptime(str(date_value), date_format).date()
-                            break
-                        except ValueError:
-                            continue
+            rows = self._get_dashboard_rows('Traitement CMS Adr', delivery_date_column)
+            raw_motifs = df_cms[motif_column].iloc[rows]
+            motifs = raw_motifs.astype(str).str.strip()
+            has_motif = raw_motifs.astype(bool) & (motifs != '') & (motifs.str.lower() != 'nan')
 
-                    if not date_obj:
-                        continue
-
-                    # Check if date is within selected range
-                    if self.date_from_selected <= date_obj <= self.date_to_selected:
-                        # Count this motif
-                        if motif_value not in motif_counts:
-                            motif_counts[motif_value] = 0
-                        motif_counts[motif_value] += 1
-                        total_processed += 1
+            # Delivery dates typed as datetime in the sheet are not counted,
+            # only the text dates (AAAA-MM-JJ, JJ/MM/AAAA, JJ-MM-AAAA) are
+            raw_dates = df_cms[delivery_date_column].iloc[rows]
+            has_motif &= ~raw_dates.map(lambda value: isinstance(value, datetime)).astype(bool)
 
-                except Exception as e:
-                    self.logger.debug(f"Error processing CM row {index}: {e}")
-                    continue
+            motif_counts = self._count_values(motifs[has_motif].str.upper())
+            total_processed = int(has_motif.sum())
 
             self.logger.info(f"CM extraction completed: {total_processed} records processed, {len(motif_counts)} unique motifs found")
 
@@ -11548,8 +10023,6 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
     def _extract_communes_data_for_dashboard(self):
         """Extract Communes data from Sheet 1 (Suivi Tickets) for dashboard population."""
         try:
-            from datetime import datetime
-
             # Check if we have the required data
             if not hasattr(self, 'global_suivi_data') or not self.global_suivi_data:
                 self.logger.warning("No global_suivi_data available for Communes extraction")
@@ -11587,64 +10060,14 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
             self.logger.info(f"Communes extraction: Using commune type column '{commune_type_column}' and delivery date column '{delivery_date_column}'")
 
             # Extract and count commune types within the date range
-            commune_counts = {'Orange': 0, 'RIP': 0}
-            total_processed = 0
-
-            for index, row in df_tickets.iterrows():
-                try:
-                    # Get commune type value
-                    commune_type = row.get(commune_type_column, '')
-                    if not commune_type or str(commune_type).strip() == '' or str(commune_type).lower() == 'nan':
-                        continue
-                    commune_type = str(commune_type).strip()
-
-                    # Normalize commune type (case-insensitive)
-                    commune_type_upper = commune_type.upper()
-                    if commune_type_upper not in ['ORANGE', 'RIP']:
-                        continue  # Skip if not Orange or RIP
-
-                    # Get delivery date value
-                    delivery_date = row.get(delivery_date_column, '')
-                    if not delivery_date or str(delivery_date).strip() == '' or str(delivery_date).lower() == 'nan':
-                        continue
-
-                    # Parse delivery date (handle datetime format: "2025-05-22 00:00:00")
-                    date_obj = None
-                    delivery_date_str = str(delivery_date).strip()
-
-                    # Try multiple datetime formats
-                    date_formats = [
-                        '%Y-%m-%d %H:%M:%S',  # "2025-05-22 00:00:00"
-                        '%Y-%m-%d',           # "2025-05-22"
-                        '%d/%m/%Y %H:%M:%S',  # "22/05/2025 00:00:00"
-                        '%d/%m/%Y',           # "22/05/2025"
-                        '%d-%m-%Y %H:%M:%S',  # "22-05-2025 00:00:00"
-                        '%d-%m-%Y'            # "22-05-2025"
-                    ]
-
-                    for date_format in date_formats:
-                        try:
-                            date_obj = datetime.strptime(delivery_date_str, date_format).date()
-                            break
-                        except ValueError:
-                            continue
-
-                    if not date_obj:
-                        continue
-
-                    # Check if date is within selected range
-                    if self.date_from_selected <= date_obj <= self.date_to_selected:
-                        # Count this commune type
-                        if commune_type_upper == 'ORANGE':
-                            commune_counts['Orange'] += 1
-                        elif commune_type_upper == 'RIP':
-                            commune_counts['RIP'] += 1
+            rows = self._get_dashboard_rows('Suivi Tickets', delivery_date_column)
+            commune_types = df_tickets[commune_type_column].iloc[rows].astype(str).str.strip().str.upper()
 
-                        total_processed += 1
-
-                except Exception as e:
-                    self.logger.debug(f"Error processing Communes row {index}: {e}")
-                    continue
+            commune_counts = {
+                'Orange': int((commune_types == 'ORANGE').sum()),
+                'RIP': int((commune_types == 'RIP').sum())
+            }
+            total_processed = commune_counts['Orange'] + commune_counts['RIP']
 
             self.logger.info(f"Communes extraction completed: {total_processed} records processed")
             self.logger.info(f"  Orange: {commune_counts['Orange']}")
@@ -11666,8 +10089,6 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
     def _extract_acts_data_for_dashboard(self):
         """Extract Acts data from Sheet 3 (Traitement PA) for dashboard population."""
         try:
-            from datetime import datetime
-
             # Check if we have the required data
             if not hasattr(self, 'global_suivi_data') or not self.global_suivi_data:
                 self.logger.warning("No global_suivi_data available for Acts extraction")
@@ -11706,79 +10127,25 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
             self.logger.info(f"Acts extraction: Using motif column '{motif_column}', date column '{processing_date_column}', duration column '{duration_column}'")
 
             # Extract and count motifs within the date range
-            motif_counts = {}
-            total_processed = 0
-
-            for index, row in df_acts.iterrows():
-                try:
-                    # Get motif value
-                    motif = row.get(motif_column, '')
-                    if not motif or str(motif).strip() == '' or str(motif).lower() == 'nan':
-                        continue
-                    motif = str(motif).strip()
-
-                    # Get processing date value
-                    processing_date = row.get(processing_date_column, '')
-                    if not processing_date or str(processing_date).strip() == '' or str(processing_date).lower() == 'nan':
-                        continue
-
-                    # Parse processing date (handle date format: "2025-07-02")
-                    date_obj = None
-                    processing_date_str = str(processing_date).strip()
-
-                    # Try multiple date formats
-                    date_formats = [
-                        '%Y-%m-%d',           # "2025-07-02"
-                        '%Y-%m-%d %H:%M:%S',  # "2025-07-02 00:00:00"
-                        '%d/%m/%Y',           # "02/07/2025"
-                        '%d/%m/%Y %H:%M:%S',  # "02/07/2025 00:00:00"
-                        '%d-%m-%Y',           # "02-07-2025"
-                        '%d-%m-%Y %H:%M:%S'   # "02-07-2025 00:00:00"
-                    ]
-
-                    for date_format in date_formats:
-                        try:
-                            date_obj = datetime.strptime(processing_date_str, date_format).date()
-                            break
-                        except ValueError:
-                            continue
-
-                    if not date_obj:
-                        continue
-
-                    # Check if date is within selected range
-                    if self.date_from_selected <= date_obj <= self.date_to_selected:
-                        # Get duration for special Ad Ras handling
-                        duration = row.get(duration_column, 0)
-                        try:
-                            duration_val = float(duration) if duration is not None else 0
-                        except (ValueError, TypeError):
-                            duration_val = 0
-
-                        # Normalize motif for categorization
-                        motif_normalized = motif.upper().strip()
-
-                        # Special handling for Ad Ras motifs
-                        if 'AD' in motif_normalized and 'RAS' in motif_normalized:
-                            if duration_val > 0:
-                                category = 'AD RAS avec temps'
-                            else:
-                                category = 'AD RAS sans temps'
-                        else:
-                            # Map other motifs to standard categories
-                            category = self._normalize_acts_motif(motif_normalized)
+            pd = get_pandas()
+            rows = self._get_dashboard_rows('Traitement PA', processing_date_column)
+            df_range = df_acts.iloc[rows]
+            motifs = df_range[motif_column].astype(str).str.strip()
+            has_motif = df_range[motif_column].astype(bool) & (motifs != '') & (motifs.str.lower() != 'nan')
+            df_range = df_range[has_motif.to_numpy()]
+            motifs = motifs[has_motif.to_numpy()].str.upper().str.strip()
 
-                        # Count this motif category
-                        if category in motif_counts:
-                            motif_counts[category] += 1
-                        else:
-                            motif_counts[category] = 1
+            # Special handling for Ad Ras motifs: split on the duration (column H)
+            durations = pd.to_numeric(df_range[duration_column].astype(str).str.strip(), errors='coerce')
+            ad_ras = motifs.str.contains('AD', regex=False) & motifs.str.contains('RAS', regex=False)
+            ad_ras_categories = durations.gt(0).map({True: 'AD RAS avec temps', False: 'AD RAS sans temps'})
 
-                        total_processed += 1
+            # Map other motifs to standard categories (once per distinct motif)
+            categories = {motif: self._normalize_acts_motif(motif) for motif in motifs[~ad_ras].unique()}
+            motif_categories = motifs.map(categories).where(~ad_ras, ad_ras_categories.to_numpy())
 
-                except Exception as e:
-                    self.logger.debug(f"Error processing Acts row {index}: {e}")
-                    continue
+            motif_counts = self._count_values(motif_categories)
+            total_processed = len(motif_categories)
 
             self.logger.info(f"Acts extraction completed: {total_processed} records processed")
             self.logger.info(f"  Unique motif categories found: {len(motif_counts)}")
@@ -11911,8 +10278,6 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
     def _extract_upr_data_for_dashboard(self):
         """Extract UPR tickets data from Sheet 1 (Suivi Tickets) for dashboard population."""
         try:
-            from datetime import datetime
-
             # Check if we have the required data
             if not hasattr(self, 'global_suivi_data') or not self.global_suivi_data:
                 self.logger.warning("No global_suivi_data available for UPR extraction")
@@ -11950,63 +10315,15 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
             self.logger.info(f"UPR extraction: Using motif column '{upr_motif_column}', date column '{delivery_date_column}'")
 
             # Extract and count UPR tickets within the date range
-            upr_counts = {'Créé': 0, 'Non': 0}
-            total_processed = 0
-
-            for index, row in df_tickets.iterrows():
-                try:
-                    # Get UPR motif value
-                    upr_motif = row.get(upr_motif_column, '')
-                    if not upr_motif or str(upr_motif).strip() == '' or str(upr_motif).lower() == 'nan':
-                        continue
-                    upr_motif = str(upr_motif).strip()
-
-                    # Get delivery date value
-                    delivery_date = row.get(delivery_date_column, '')
-                    if not delivery_date or str(delivery_date).strip() == '' or str(delivery_date).lower() == 'nan':
-                        continue
-
-                    # Parse delivery date (handle format: "2025-05-22 00:00:00")
-                    date_obj = None
-                    delivery_date_str = str(delivery_date).strip()
-
-                    # Try multiple date formats
-                    date_formats = [
-                        '%Y-%m-%d %H:%M:%S',  # "2025-05-22 00:00:00"
-                        '%Y-%m-%d',           # "2025-05-22"
-                        '%d/%m/%Y %H:%M:%S',  # "22/05/2025 00:00:00"
-                        '%d/%m/%Y',           # "22/05/2025"
-                        '%d-%m-%Y %H:%M:%S',  # "22-05-2025 00:00:00"
-                        '%d-%m-%Y'            # "22-05-2025"
-                    ]
-
-                    for date_format in date_formats:
-                        try:
-                            date_obj = datetime.strptime(delivery_date_str, date_format).date()
-                            break
-                        except ValueError:
-                            continue
-
-                    if not date_obj:
-                        continue
-
-                    # Check if date is within selected range
-                    if self.date_from_selected <= date_obj <= self.date_to_selected:
-                        # Normalize UPR motif
-                        upr_motif_normalized = upr_motif.strip()
-
-                        # Count UPR tickets by status
-                        if upr_motif_normalized in upr_counts:
-                            upr_counts[upr_motif_normalized] += 1
-                        else:
-                            # Handle unexpected values
-                            upr_counts[upr_motif_normalized] = 1
+            rows = self._get_dashboard_rows('Suivi Tickets', delivery_date_column)
+            raw_motifs = df_tickets[upr_motif_column].iloc[rows]
+            motifs = raw_motifs.astype(str).str.strip()
+            has_motif = raw_motifs.astype(bool) & (motifs != '') & (motifs.str.lower() != 'nan')
 
-                        total_processed += 1
-
-                except Exception as e:
-                    self.logger.debug(f"Error processing UPR row {index}: {e}")
-                    continue
+            # Count UPR tickets by status, unexpected values included
+            upr_counts = {'Créé': 0, 'Non': 0}
+            upr_counts.update(self._count_values(motifs[has_motif]))
+            total_processed = int(has_motif.sum())
 
             self.logger.info(f"UPR extraction completed: {total_processed} records processed")
             self.logger.info(f"  UPR ticket counts: {upr_counts}")
@@ -12041,8 +10358,6 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
     def _extract_501511_data_for_dashboard(self):
         """Extract 501/511 tickets data from Sheet 1 (Suivi Tickets) for dashboard population."""
         try:
-            from datetime import datetime
-
             # Check if we have the required data
             if not hasattr(self, 'global_suivi_data') or not self.global_suivi_data:
                 self.logger.warning("No global_suivi_data available for 501/511 extraction")
@@ -12079,48 +10394,8 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
             self.logger.info(f"501/511 extraction: Using deposit date column '{deposit_date_column}'")
 
             # Extract and count 501/511 tickets within the date range
-            tickets_501511_count = 0
-            total_processed = 0
-
-            for index, row in df_tickets.iterrows():
-                try:
-                    # Get deposit date value
-                    deposit_date = row.get(deposit_date_column, '')
-                    if not deposit_date or str(deposit_date).strip() == '' or str(deposit_date).lower() == 'nan':
-                        continue
-
-                    # Parse deposit date (handle format: "2025-07-02")
-                    date_obj = None
-                    deposit_date_str = str(deposit_date).strip()
-
-                    # Try multiple date formats
-                    date_formats = [
-                        '%Y-%m-%d',           # "2025-07-02"
-                        '%Y-%m-%d %H:%M:%S',  # "2025-07-02 00:00:00"
-                        '%d/%m/%Y',           # "02/07/2025"
-                        '%d/%m/%Y %H:%M:%S',  # "02/07/2025 00:00:00"
-                        '%d-%m-%Y',           # "02-07-2025"
-                        '%d-%m-%Y %H:%M:%S'   # "02-07-2025 00:00:00"
-                    ]
-
-                    for date_format in date_formats:
-                        try:
-                            date_obj = datetime.strptime(deposit_date_str, date_format).date()
-                            break
-                        except ValueError:
-                            continue
-
-                    if not date_obj:
-                        continue
-
-                    # Check if date is within selected range
-                    if self.date_from_selected <= date_obj <= self.date_to_selected:
-                        tickets_501511_count += 1
-                        total_processed += 1
-
-                except Exception as e:
-                    self.logger.debug(f"Error processing 501/511 row {index}: {e}")
-                    continue
+            tickets_501511_count = len(self._get_dashboard_rows('Suivi Tickets', deposit_date_column))
+            total_processed = tickets_501511_count
 
             self.logger.info(f"501/511 extraction completed: {total_processed} records processed")
             self.logger.info(f"  501/511 tickets count: {tickets_501511_count}")
@@ -12144,8 +10419,6 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
     def _extract_rip_data_for_dashboard(self):
         """Extract RIP (P0 P1) data from Sheet 4 (Traitement RIP) for dashboard population."""
         try:
-            from datetime import datetime
-
             # Check if we have the required data
             if not hasattr(self, 'global_suivi_data') or not self.global_suivi_data:
                 self.logger.warning("No global_suivi_data available for RIP extraction")
@@ -12184,71 +10457,22 @@ if (typeof detailedBillingCalculator !== 'undefined' && detailedBillingCalculato
             self.logger.info(f"RIP extraction: Using type column '{type_column}', motif column '{motif_column}', date column '{delivery_date_column}'")
 
             # Extract and count RIP motifs within the date range for P0/P1 types
-            rip_motif_counts = {}
-            total_processed = 0
-
-            for index, row in df_rip.iterrows():
-                try:
-                    # Get type value and filter for P0/P1
-                    type_value = row.get(type_column, '')
-                    if not type_value or str(type_value).strip() == '' or str(type_value).lower() == 'nan':
-                        continue
-
-                    type_str = str(type_value).upper().strip()
-                    if 'P0' not in type_str and 'P1' not in type_str:
-                        continue  # Skip non-P0/P1 records
-
-                    # Get motif value
-                    motif_value = row.get(motif_column, '')
-                    if not motif_value or str(motif_value).strip() == '' or str(motif_value).lower() == 'nan':
-                        continue
-                    motif_value = str(motif_value).strip()
-
-                    # Get delivery date value
-                    delivery_date = row.get(delivery_date_column, '')
-                    if not delivery_date or str(delivery_date).strip() == '' or str(delivery_date).lower() == 'nan':
-                        continue
-
-                    # Parse delivery date
-                    date_obj = None
-                    delivery_date_str = str(delivery_date).strip()
-
-                    # Try multiple date formats
-                    date_formats = [
-                        '%Y-%m-%d %H:%M:%S',  # "2025-05-22 00:00:00"
-                        '%Y-%m-%d',           # "2025-05-22"
-                        '%d/%m/%Y %H:%M:%S',  # "22/05/2025 00:00:00"
-                        '%d/%m/%Y',           # "22/05/2025"
-                        '%d-%m-%Y %H:%M:%S',  # "22-05-2025 00:00:00"
-                        '%d-%m-%Y'            # "22-05-2025"
-                    ]
-
-                    for date_format in date_formats:
-                        try:
-                            date_obj = datetime.strptime(delivery_date_str, date_format).date()
-                            break
-                        except ValueError:
-                            continue
-
-                    if not date_obj:
-                        continue
-
-                    # Check if date is within selected range
-                    if self.date_from_selected <= date_obj <= self.date_to_selected:
-                        # Normalize RIP motif
-                        motif_normalized = self._normalize_rip_motif(motif_value.upper().strip())
-
-                        # Count RIP motifs
-                        if motif_normalized in rip_motif_counts:
-                            rip_motif_counts[motif_normalized] += 1
-                        else:
-                            rip_motif_counts[motif_normalized] = 1
-
-                        total_processed += 1
-
-                except Exception as e:
-                    self.logger.debug(f"Error processing RIP row {index}: {e}")
-                    continue
+            rows = self._get_dashboard_rows('Traitement RIP', delivery_date_column)
+            df_range = df_rip.iloc[rows]
+            types = df_range[type_column].astype(str).str.upper().str.strip()
+            is_p0_p1 = types.str.contains('P0', regex=False) | types.str.contains('P1', regex=False)
+
+            raw_motifs = df_range[motif_column]
+            motifs = raw_motifs.astype(str).str.strip()
+            has_motif = raw_motifs.astype(bool) & (motifs != '') & (motifs.str.lower() != 'nan')
+            selected = (df_range[type_column].astype(bool) & is_p0_p1 & has_motif).to_numpy()
+
+            # Normalize RIP motifs (once per distinct motif)
+            motifs = motifs[selected].str.upper().str.strip()
+            categories = {motif: self._normalize_rip_motif(motif) for motif in motifs.unique()}
+
+            rip_motif_counts = self._count_values(motifs.map(categories))
+            total_processed = int(selected.sum())
 
             self.logger.info(f"RIP extraction completed: {total_processed} records processed")
             self.logger.info(f"  RIP motif counts: {rip_motif_counts}")
@@ -2,14 +2,17 @@
 Navigation system for the multi-feature Suivi Generator platform.
 """
 
+import gc
 import tkinter as tk
 from tkinter import ttk
 import logging
+from collections import OrderedDict
 from typing import Dict, Callable, Optional, Any
 from enum import Enum
 
-from config.constants import COLORS, UIConfig, AppInfo
+from config.constants import COLORS, UIConfig, AppInfo, ModuleCacheConfig
 from ui.styles import create_card_frame
+from utils.performance import performance_monitor, get_process_memory_mb
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,19 @@ class NavigationState(Enum):
 
 
 class NavigationManager:
-    """Manages navigation between different application modules."""
+    """
+    Manages navigation between different application modules.
+
+    Modules registered with keep_alive are built once in their own frame,
+    which is hidden instead of destroyed when navigating away. Before being
+    shown again, an instance defining verify_access() re-checks its access
+    (it leaves the cache when refused); it then gets refresh(**kwargs) (if
+    defined) to re-arm its shortcuts and reload stale data. An instance can
+    decline the cache with can_keep_alive().
+    Hidden instances are evicted (cleanup() then destroyed), least recently
+    shown first, beyond ModuleCacheConfig.MAX_CACHED_MODULES or while the
+    process memory exceeds ModuleCacheConfig.MEMORY_BUDGET_MB.
+    """
     
     def __init__(self, root: tk.Tk):
         """
@@ -42,6 +57,9 @@ class NavigationManager:
         self.modules = {}
         self.callbacks = {}
         self.logger = logging.getLogger(__name__)
+
+        # Kept-alive module states, least recently shown first
+        self._cached_modules = OrderedDict()
         
         # Navigation frame (always visible)
         self.nav_frame = None
@@ -176,7 +194,8 @@ class NavigationManager:
 
         # Back button removed - redundant with Home button
     
-    def register_module(self, state: NavigationState, module_class, title: str, description: str = ""):
+    def register_module(self, state: NavigationState, module_class, title: str, description: str = "",
+                        keep_alive: bool = False):
         """
         Register a module for navigation.
         
@@ -185,12 +204,15 @@ class NavigationManager:
             module_class: Class to instantiate for this module
             title: Display title for the module
             description: Description of the module
+            keep_alive: Keep the instance when navigating away and show it again on return
         """
         self.modules[state] = {
             'class': module_class,
             'title': title,
             'description': description,
-            'instance': None
+            'instance': None,
+            'keep_alive': keep_alive,
+            'host': None  # frame of a kept-alive instance
         }
         self.logger.info(f"Registered module: {title} ({state.value})")
     
@@ -222,12 +244,15 @@ class NavigationManager:
 
             self.current_state = state
 
-            # Clear content frame completely
+            # Clear content frame completely (kept-alive modules are only hidden)
             self.logger.debug("Clearing content frame...")
             try:
                 if hasattr(self, 'content_frame') and self.content_frame and self.content_frame.winfo_exists():
+                    cached_hosts = {str(info['host']) for info in self.modules.values() if info['host'] is not None}
                     for widget in self.content_frame.winfo_children():
-                        if widget.winfo_exists():
+                        if str(widget) in cached_hosts:
+                            widget.pack_forget()
+                        elif widget.winfo_exists():
                             widget.destroy()
                     # Force update to ensure clearing is complete
                     self.content_frame.update()
@@ -254,6 +279,10 @@ class NavigationManager:
             self.content_frame.update()
             self.root.update()
 
+            # Track the memory held by each loaded module
+            performance_monitor.snapshot_memory(f"navigation.{state.value}")
+            self._evict_cached_modules()
+
             self.logger.info(f"Successfully navigated to: {state.value}")
 
         except Exception as e:
@@ -286,8 +315,10 @@ class NavigationManager:
         try:
             self.logger.info(f"Loading module: {state.value} ({module_info['title']})")
 
-            # Always create a new instance for simplicity and reliability
-            # This ensures we don't have stale state issues
+            if self._show_cached_module(state, **kwargs):
+                return
+
+            # Create a new instance (kept-alive modules get their own frame)
             self.logger.debug(f"Creating new instance of {module_info['class'].__name__}")
 
             # Clean up old instance if it exists
@@ -298,14 +329,26 @@ class NavigationManager:
                 except Exception as cleanup_error:
                     self.logger.warning(f"Error during module cleanup: {cleanup_error}")
                 module_info['instance'] = None
+            self._forget_cached_module(state)
+
+            parent = self.content_frame
+            if module_info['keep_alive'] and ModuleCacheConfig.ENABLE_MODULE_CACHE:
+                parent = tk.Frame(self.content_frame, bg=COLORS['BG'])
+                parent.pack(fill=tk.BOTH, expand=True)
 
             # Create new instance
             module_info['instance'] = module_info['class'](
-                self.content_frame,
+                parent,
                 navigation_manager=self,
                 **kwargs
             )
 
+            if parent is not self.content_frame:
+                instance = module_info['instance']
+                if getattr(instance, 'can_keep_alive', lambda: True)():
+                    module_info['host'] = parent
+                    self._cached_modules[state] = None
+
             # Update window title
             self.set_window_title(module_info['title'])
 
@@ -330,6 +373,90 @@ class NavigationManager:
             # Show detailed error message
             self._show_detailed_error_message(f"Erreur lors du chargement du module {module_info['title']}", str(e))
     
+    def _show_cached_module(self, state: NavigationState, **kwargs) -> bool:
+        """
+        Show the kept-alive instance of a module again.
+
+        Args:
+            state: Module navigation state
+            **kwargs: Navigation arguments passed to refresh()
+
+        Returns:
+            True if a cached instance was shown, False if the module must be created
+        """
+        module_info = self.modules[state]
+        host = module_info['host']
+        instance = module_info['instance']
+        if host is None or instance is None:
+            return False
+        if not host.winfo_exists():
+            self._forget_cached_module(state)
+            return False
+
+        # Access checks run again on each entry, as for a new instance
+        if hasattr(instance, 'verify_access') and not instance.verify_access():
+            # The instance now shows its access denied screen: displayed once, no longer cached
+            self._cached_modules.pop(state, None)
+            module_info['host'] = None
+            host.pack(fill=tk.BOTH, expand=True)
+            self.set_window_title(module_info['title'])
+            self.logger.info(f"Access to cached module {state.value} refused - removed from cache")
+            return True
+
+        host.pack(fill=tk.BOTH, expand=True)
+        self._cached_modules.move_to_end(state)
+        self.set_window_title(module_info['title'])
+
+        if hasattr(instance, 'refresh'):
+            try:
+                instance.refresh(**kwargs)
+            except Exception as e:
+                self.logger.warning(f"Error refreshing cached module {state.value}: {e}")
+
+        self.logger.info(f"Module {state.value} shown from cache")
+        return True
+
+    def _forget_cached_module(self, state: NavigationState):
+        """Drop a module from the keep-alive cache, destroying its frame."""
+        module_info = self.modules[state]
+        self._cached_modules.pop(state, None)
+        host = module_info['host']
+        module_info['host'] = None
+        if host is not None:
+            try:
+                if host.winfo_exists():
+                    host.destroy()
+            except tk.TclError:
+                pass
+
+    def _evict_cached_modules(self):
+        """Evict hidden modules beyond the cache size, and one more when over the memory budget."""
+        hidden = [state for state in self._cached_modules if state != self.current_state]
+        if not hidden:
+            return
+
+        def evict(state, reason):
+            module_info = self.modules[state]
+            instance = module_info['instance']
+            try:
+                if hasattr(instance, 'cleanup'):
+                    instance.cleanup()
+            except Exception as cleanup_error:
+                self.logger.warning(f"Error during module cleanup: {cleanup_error}")
+            module_info['instance'] = None
+            self._forget_cached_module(state)
+            self.logger.info(f"Cached module {state.value} evicted ({reason})")
+
+        while len(self._cached_modules) > ModuleCacheConfig.MAX_CACHED_MODULES and hidden:
+            evict(hidden.pop(0), "cache size")
+
+        # The process RSS rarely drops after an eviction, so only the least
+        # recently used hidden module is evicted per navigation
+        memory_mb = get_process_memory_mb()
+        if hidden and memory_mb is not None and memory_mb > ModuleCacheConfig.MEMORY_BUDGET_MB:
+            evict(hidden.pop(0), f"{memory_mb:.0f} MB used")
+            gc.collect()
+
     def _update_breadcrumbs(self):
         """Update the breadcrumb display."""
         try:
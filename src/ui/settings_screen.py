@@ -11,6 +11,7 @@ from config.constants import COLORS, UIConfig, AppInfo
 from ui.styles import create_card_frame, create_section_header
 from core.update_manager import UpdateManager
 from ui.components.update_dialog import UpdateDialog
+from ui.components.performance_panel import show_performance_panel
 
 logger = logging.getLogger(__name__)
 
@@ -144,6 +145,15 @@ class SettingsScreen:
         )
         update_btn.pack(side=tk.LEFT)
 
+        # Performance panel button
+        performance_btn = ttk.Button(
+            action_frame,
+            text="📈 Performance",
+            command=lambda: show_performance_panel(self.parent.winfo_toplevel()),
+            style='Secondary.TButton'
+        )
+        performance_btn.pack(side=tk.LEFT, padx=(10, 0))
+
         # Back button
         back_btn = ttk.Button(
             action_frame,
@@ -5,7 +5,7 @@ File handling utilities for the Suivi Generator application.
 import os
 import sys
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -421,6 +421,48 @@ def is_excel_file_open(file_path: str) -> bool:
         return False  # Other errors, assume not locked
 
 
+class FileChangeTracker:
+    """Remembers the modification time of a loaded file to reload it only when it changed."""
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the tracker.
+
+        Args:
+            file_path: Path of the tracked file
+        """
+        self.file_path = file_path
+        self.loaded_mtime = None
+
+    def _get_mtime(self) -> Optional[float]:
+        """Get the modification time of the file (None if missing)."""
+        try:
+            return os.path.getmtime(self.file_path)
+        except OSError:
+            return None
+
+    def mark_loaded(self):
+        """Record the current state of the file as loaded."""
+        self.loaded_mtime = self._get_mtime()
+
+    def reload_if_changed(self, reload: Callable[[], Any]) -> bool:
+        """
+        Call reload if the file exists and changed since it was marked loaded.
+
+        Args:
+            reload: Loading function (expected to call mark_loaded)
+
+        Returns:
+            True if reload was called
+        """
+        mtime = self._get_mtime()
+        if mtime is None or mtime == self.loaded_mtime:
+            return False
+        logger.info(f"{os.path.basename(self.file_path)} modified since last load - reloading")
+        reload()
+        return True
+
+
 def truncate_filename(filename: str, max_length: int = 50) -> str:
     """
     Truncate a filename for display purposes.
@@ -1,55 +1,269 @@
 """
 Performance optimization utilities.
+Telemetry of the application operations (durations, counters, memory) and
+bounded execution of the background tasks of the UI.
 """
 
+import os
+import sys
+import json
+import math
 import time
+import queue
+import atexit
+import itertools
 import threading
 import logging
-from typing import Callable, Any, Optional
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Any, Optional, Dict
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
 
+def get_process_memory_mb() -> Optional[float]:
+    """
+    Get the resident memory of the current process.
+    
+    Returns:
+        Resident set size (working set on Windows) in MB, or None if unavailable
+    """
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+    except Exception:
+        pass
+    
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            from ctypes import wintypes
+            
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                            ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                            ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+            
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize / (1024 * 1024)
+        except Exception:
+            pass
+        return None
+    
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class OperationStats:
+    """Bounded duration histogram and counts of one operation."""
+    
+    def __init__(self, max_samples: int):
+        """
+        Initialize the statistics.
+        
+        Args:
+            max_samples: Number of most recent durations kept for the percentiles
+        """
+        self.samples = deque(maxlen=max_samples)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.last = None
+        self.memory_mb = None
+        self.memory_delta_mb = None
+    
+    def add(self, duration: float, failed: bool = False,
+            memory_mb: Optional[float] = None, memory_delta_mb: Optional[float] = None):
+        """Record one run of the operation."""
+        self.samples.append(duration)
+        self.count += 1
+        self.errors += 1 if failed else 0
+        self.total += duration
+        self.min = duration if self.min is None else min(self.min, duration)
+        self.max = duration if self.max is None else max(self.max, duration)
+        self.last = duration
+        if memory_mb is not None:
+            self.memory_mb = memory_mb
+            self.memory_delta_mb = memory_delta_mb
+    
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Get a percentile of the recent durations (nearest rank).
+        
+        Args:
+            percent: Percentile between 0 and 100
+            
+        Returns:
+            Duration in seconds, or None without samples
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the statistics as a JSON-serializable dictionary."""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'average': self.total / self.count if self.count else None,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'min': self.min,
+            'max': self.max,
+            'last': self.last,
+            'memory_mb': self.memory_mb,
+            'memory_delta_mb': self.memory_delta_mb
+        }
+
+
 class PerformanceMonitor:
-    """Monitor and optimize application performance."""
+    """
+    Monitor and optimize application performance.
     
-    def __init__(self):
-        """Initialize the performance monitor."""
-        self.metrics = {}
+    Keeps per operation a bounded histogram of durations (percentiles over the
+    most recent runs), error counts and the process memory after the last
+    run, plus named counters and memory snapshots. The whole state can be
+    dumped to JSON next to the log files, periodically or on demand.
+    """
+    
+    def __init__(self, max_samples: Optional[int] = None):
+        """
+        Initialize the performance monitor.
+        
+        Args:
+            max_samples: Durations kept per operation (defaults to LoggingConfig.PERFORMANCE_SAMPLES)
+        """
+        from config.constants import LoggingConfig
+        
+        self.max_samples = max_samples or LoggingConfig.PERFORMANCE_SAMPLES
+        self.operations: Dict[str, OperationStats] = {}
+        self.counters: Dict[str, int] = {}
+        self.memory_snapshots = deque(maxlen=LoggingConfig.PERFORMANCE_MEMORY_SNAPSHOTS)
         self.thresholds = {
             'file_read': 2.0,      # seconds
             'data_process': 1.0,   # seconds
             'ui_update': 0.1,      # seconds
             'excel_generate': 5.0  # seconds
         }
+        self.started_at = datetime.now()
+        
+        self._lock = threading.Lock()
+        self._changes = 0
+        self._dumped_changes = 0
+        self._dump_thread = None
+        self._dump_stop = threading.Event()
     
-    def time_operation(self, operation_name: str):
-        """Decorator to time operations."""
+    def time_operation(self, operation_name: str, threshold: Optional[float] = None):
+        """
+        Decorator to time operations.
+        
+        Args:
+            operation_name: Operation name, '<module>.<step>' (e.g. 'qc.analyze')
+            threshold: Duration in seconds above which a run is logged as slow
+        """
         def decorator(func):
             @wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
-                try:
-                    result = func(*args, **kwargs)
-                    duration = time.time() - start_time
-                    
-                    # Log performance
-                    self._log_performance(operation_name, duration)
-                    
-                    # Store metrics
-                    if operation_name not in self.metrics:
-                        self.metrics[operation_name] = []
-                    self.metrics[operation_name].append(duration)
-                    
-                    return result
-                except Exception as e:
-                    duration = time.time() - start_time
-                    logger.error(f"Operation '{operation_name}' failed after {duration:.2f}s: {e}")
-                    raise
+                with self.measure(operation_name, threshold):
+                    return func(*args, **kwargs)
             return wrapper
         return decorator
     
+    @contextmanager
+    def measure(self, operation_name: str, threshold: Optional[float] = None):
+        """
+        Context manager timing the enclosed block as one run of an operation.
+        
+        Args:
+            operation_name: Operation name, '<module>.<step>' (e.g. 'qc.analyze')
+            threshold: Duration in seconds above which a run is logged as slow
+        """
+        if threshold is not None:
+            self.thresholds[operation_name] = threshold
+        
+        memory_before = get_process_memory_mb()
+        start_time = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            duration = time.perf_counter() - start_time
+            logger.error(f"Operation '{operation_name}' failed after {duration:.2f}s: {e}")
+            self.record(operation_name, duration, failed=True, memory_before=memory_before)
+            raise
+        else:
+            duration = time.perf_counter() - start_time
+            self._log_performance(operation_name, duration)
+            self.record(operation_name, duration, memory_before=memory_before)
+    
+    def record(self, operation_name: str, duration: float, failed: bool = False,
+               memory_before: Optional[float] = None):
+        """
+        Record a run of an operation timed elsewhere.
+        
+        Args:
+            operation_name: Operation name
+            duration: Duration in seconds
+            failed: Whether the run failed
+            memory_before: Process memory (MB) before the run, to record the memory delta
+        """
+        memory_mb = get_process_memory_mb() if memory_before is not None else None
+        memory_delta = memory_mb - memory_before if memory_mb is not None else None
+        
+        with self._lock:
+            stats = self.operations.get(operation_name)
+            if stats is None:
+                stats = self.operations[operation_name] = OperationStats(self.max_samples)
+            stats.add(duration, failed, memory_mb, memory_delta)
+            self._changes += 1
+    
+    def increment(self, counter_name: str, value: int = 1):
+        """
+        Increment a named counter.
+        
+        Args:
+            counter_name: Counter name (e.g. 'sheet_cache.hits')
+            value: Increment
+        """
+        with self._lock:
+            self.counters[counter_name] = self.counters.get(counter_name, 0) + value
+            self._changes += 1
+    
+    def snapshot_memory(self, label: str) -> Optional[float]:
+        """
+        Record the current process memory.
+        
+        Args:
+            label: What the application was doing (e.g. 'qc.analyze')
+            
+        Returns:
+            Resident memory in MB, or None if unavailable
+        """
+        memory_mb = get_process_memory_mb()
+        with self._lock:
+            self.memory_snapshots.append({
+                'time': datetime.now().isoformat(timespec='seconds'),
+                'label': label,
+                'memory_mb': memory_mb
+            })
+            self._changes += 1
+        return memory_mb
+    
     def _log_performance(self, operation: str, duration: float):
         """Log performance information."""
         threshold = self.thresholds.get(operation, 1.0)
@@ -61,24 +275,191 @@ class PerformanceMonitor:
     
     def get_average_time(self, operation_name: str) -> Optional[float]:
         """Get average time for an operation."""
-        if operation_name in self.metrics and self.metrics[operation_name]:
-            return sum(self.metrics[operation_name]) / len(self.metrics[operation_name])
+        stats = self.operations.get(operation_name)
+        if stats and stats.count:
+            return stats.total / stats.count
         return None
+    
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Get the current telemetry.
+        
+        Returns:
+            Dictionary with session information, 'operations' (statistics per
+            operation), 'counters' and 'memory_snapshots'
+        """
+        with self._lock:
+            return {
+                'generated_at': datetime.now().isoformat(timespec='seconds'),
+                'session_start': self.started_at.isoformat(timespec='seconds'),
+                'pid': os.getpid(),
+                'user': os.environ.get('USERNAME') or os.environ.get('USER'),
+                'platform': sys.platform,
+                'memory_mb': get_process_memory_mb(),
+                'operations': {name: stats.to_dict() for name, stats in sorted(self.operations.items())},
+                'counters': dict(sorted(self.counters.items())),
+                'memory_snapshots': list(self.memory_snapshots)
+            }
+    
+    def get_dump_path(self) -> str:
+        """
+        Get the JSON dump path of the session, in the log file directory.
+        
+        Returns:
+            Path of the dump file
+        """
+        logs_dir = "logs"
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.FileHandler):
+                logs_dir = os.path.dirname(handler.baseFilename)
+                break
+        
+        timestamp = self.started_at.strftime("%Y%m%d_%H%M%S")
+        return os.path.join(logs_dir, f"performance_{timestamp}_{os.getpid()}.json")
+    
+    def dump_json(self, file_path: Optional[str] = None) -> Optional[str]:
+        """
+        Write the telemetry to a JSON file.
+        
+        Args:
+            file_path: Destination (defaults to get_dump_path)
+            
+        Returns:
+            Path written, or None on failure
+        """
+        file_path = file_path or self.get_dump_path()
+        changes = self._changes
+        tmp_path = file_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.get_report(), f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, file_path)
+            self._dumped_changes = changes
+            return file_path
+        except Exception as e:
+            logger.warning(f"Could not write performance telemetry: {e}")
+            return None
+    
+    def start_periodic_dump(self, interval: Optional[float] = None):
+        """
+        Dump the telemetry periodically (when it changed) and at exit.
+        
+        Args:
+            interval: Seconds between dumps (defaults to LoggingConfig.PERFORMANCE_DUMP_INTERVAL)
+        """
+        from config.constants import LoggingConfig
+        
+        if self._dump_thread is not None:
+            return
+        interval = interval or LoggingConfig.PERFORMANCE_DUMP_INTERVAL
+        
+        def dump_loop():
+            while not self._dump_stop.wait(interval):
+                if self._changes != self._dumped_changes:
+                    self.dump_json()
+        
+        self._dump_thread = threading.Thread(target=dump_loop, name="performance-dump", daemon=True)
+        self._dump_thread.start()
+        atexit.register(self.stop_periodic_dump)
+    
+    def stop_periodic_dump(self):
+        """Stop the periodic dumps, writing the last changes."""
+        self._dump_stop.set()
+        if self._changes != self._dumped_changes:
+            self.dump_json()
 
 
-class AsyncTaskManager:
-    """Manage asynchronous tasks for better UI responsiveness."""
+# Task priorities (lower values run first)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+
+class TaskCancelledError(Exception):
+    """Raised by a task that stops because it was cancelled."""
+
+
+class CancellationToken:
+    """Cooperative cancellation flag of an asynchronous task."""
     
     def __init__(self):
-        """Initialize the task manager."""
-        self.active_tasks = {}
-        self.task_counter = 0
+        """Initialize the token."""
+        self._event = threading.Event()
+    
+    def cancel(self):
+        """Request the cancellation of the task."""
+        self._event.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether the cancellation was requested."""
+        return self._event.is_set()
+    
+    def raise_if_cancelled(self):
+        """
+        Stop the task if its cancellation was requested.
+        
+        Raises:
+            TaskCancelledError: If the task was cancelled
+        """
+        if self._event.is_set():
+            raise TaskCancelledError()
+
+
+_task_context = threading.local()
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """
+    Get the cancellation token of the task running in the current thread.
+    
+    Returns:
+        Token of the running task, or None outside of an asynchronous task
+    """
+    return getattr(_task_context, 'token', None)
+
+
+class AsyncTaskManager:
+    """
+    Manage asynchronous tasks for better UI responsiveness.
+    
+    Tasks run on a bounded pool of worker threads, by priority then
+    submission order. Once a Tk root is attached, callbacks are delivered
+    on the Tk thread by a single after() pump; without Tk they run on the
+    worker thread.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the task manager.
+        
+        Args:
+            max_workers: Worker thread count (defaults to ParallelConfig.ASYNC_TASK_WORKERS)
+        """
+        from config.constants import ParallelConfig
+        
+        self.max_workers = max_workers or ParallelConfig.ASYNC_TASK_WORKERS
+        self.pump_interval_ms = ParallelConfig.ASYNC_CALLBACK_PUMP_MS
+        self.active_tasks = {}  # task_id -> task info (pending and running tasks)
+        
+        self._lock = threading.Lock()
+        self._counter = itertools.count(1)
+        self._pending = queue.PriorityQueue()  # (priority, sequence, task_id)
+        self._workers = []
+        self._idle_workers = 0  # workers waiting for a task and not yet claimed by a submitted one
+        self._unclaimed_tasks = 0  # queued tasks submitted while every worker was busy
+        self._dedup_keys = {}  # dedup key -> task_id
+        self._callbacks = queue.Queue()  # (callback, value) waiting for the Tk thread
+        self._tk_root = None
     
     def run_async(self, 
                   task_func: Callable,
                   callback: Optional[Callable] = None,
                   error_callback: Optional[Callable] = None,
-                  task_name: str = None) -> str:
+                  task_name: str = None,
+                  priority: int = PRIORITY_NORMAL,
+                  dedup_key: Optional[Any] = None) -> str:
         """
         Run a task asynchronously.
         
@@ -87,56 +468,176 @@ class AsyncTaskManager:
             callback: Function to call when task completes successfully
             error_callback: Function to call when task fails
             task_name: Name for the task (for logging)
+            priority: Queue priority (PRIORITY_HIGH runs before PRIORITY_NORMAL and PRIORITY_LOW)
+            dedup_key: Key of identical tasks: while a task with the same key is pending or
+                running, the call is ignored and the id of that task is returned
             
         Returns:
             Task ID
         """
-        self.task_counter += 1
-        task_id = f"task_{self.task_counter}"
+        with self._lock:
+            if dedup_key is not None and dedup_key in self._dedup_keys:
+                task_id = self._dedup_keys[dedup_key]
+                logger.debug(f"Async task already in progress, ignored: {task_name or dedup_key}")
+                return task_id
+            
+            sequence = next(self._counter)
+            task_id = f"task_{sequence}"
+            self.active_tasks[task_id] = {
+                'name': task_name or task_id,
+                'func': task_func,
+                'callback': callback,
+                'error_callback': error_callback,
+                'token': CancellationToken(),
+                'dedup_key': dedup_key,
+                'status': 'pending',
+                'start_time': time.time()
+            }
+            if dedup_key is not None:
+                self._dedup_keys[dedup_key] = task_id
+            
+            self._pending.put((priority, sequence, task_id))
+            
+            # Claim an idle worker for this task, or start one up to the pool size
+            # (claimed here so that tasks submitted back to back never count on the same worker)
+            if self._idle_workers:
+                self._idle_workers -= 1
+            elif len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._worker_loop, name=f"async-task-{len(self._workers) + 1}",
+                                          daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            else:
+                self._unclaimed_tasks += 1
+        
+        return task_id
+    
+    def cancel(self, task_id: str) -> bool:
+        """
+        Cancel a task.
         
-        if task_name is None:
-            task_name = task_id
+        A pending task never starts; a running task sees its token cancelled
+        (see current_cancellation_token). Callbacks of a cancelled task are
+        not called.
         
-        def worker():
-            try:
-                logger.debug(f"Starting async task: {task_name}")
-                result = task_func()
-                
-                if callback:
-                    callback(result)
-                
-                logger.debug(f"Async task completed: {task_name}")
-                
-            except Exception as e:
-                logger.error(f"Async task failed: {task_name} - {e}")
-                
-                if error_callback:
-                    error_callback(e)
+        Args:
+            task_id: Task ID returned by run_async
             
-            finally:
-                # Clean up
-                if task_id in self.active_tasks:
-                    del self.active_tasks[task_id]
-        
-        # Start the task
-        thread = threading.Thread(target=worker, daemon=True)
-        self.active_tasks[task_id] = {
-            'thread': thread,
-            'name': task_name,
-            'start_time': time.time()
-        }
+        Returns:
+            True if the task was pending or running
+        """
+        with self._lock:
+            task = self.active_tasks.get(task_id)
+            if task is None:
+                return False
+            
+            task['token'].cancel()
+            if task['status'] == 'pending':
+                self._release(task_id, task)
         
-        thread.start()
-        return task_id
+        logger.debug(f"Async task cancelled: {task['name']}")
+        return True
+    
+    def cancel_all(self):
+        """Cancel every pending and running task."""
+        for task_id in list(self.active_tasks):
+            self.cancel(task_id)
+    
+    def attach_tk(self, root):
+        """
+        Deliver the task callbacks on the Tk thread.
+        
+        Args:
+            root: Tk root window (its after() loop runs the callback pump)
+        """
+        self._tk_root = root
+        root.after(self.pump_interval_ms, self._pump_callbacks)
     
     def is_task_running(self, task_id: str) -> bool:
-        """Check if a task is still running."""
-        return task_id in self.active_tasks and self.active_tasks[task_id]['thread'].is_alive()
+        """Check if a task is still pending or running."""
+        return task_id in self.active_tasks
     
     def get_active_tasks(self) -> list:
         """Get list of active task names."""
-        return [task['name'] for task in self.active_tasks.values() 
-                if task['thread'].is_alive()]
+        with self._lock:
+            return [task['name'] for task in self.active_tasks.values()]
+    
+    def _worker_loop(self):
+        """Run the pending tasks, highest priority first."""
+        claimed = True  # a new worker is started for the task just queued
+        while True:
+            if not claimed:
+                with self._lock:
+                    if self._unclaimed_tasks:
+                        self._unclaimed_tasks -= 1
+                    else:
+                        self._idle_workers += 1
+            claimed = False
+            _, _, task_id = self._pending.get()
+            with self._lock:
+                task = self.active_tasks.get(task_id)
+                if task is None or task['token'].cancelled:
+                    continue
+                task['status'] = 'running'
+                task['start_time'] = time.time()
+            
+            _task_context.token = task['token']
+            try:
+                logger.debug(f"Starting async task: {task['name']}")
+                outcome = (task['callback'], task['func']())
+                logger.debug(f"Async task completed: {task['name']}")
+            except TaskCancelledError:
+                outcome = (None, None)
+            except Exception as e:
+                logger.error(f"Async task failed: {task['name']} - {e}")
+                outcome = (task['error_callback'], e)
+            finally:
+                _task_context.token = None
+                with self._lock:
+                    self._release(task_id, task)
+            
+            callback, value = outcome
+            if task['token'].cancelled:
+                logger.debug(f"Async task result dropped (cancelled): {task['name']}")
+            elif callback:
+                self._deliver(callback, value)
+    
+    def _release(self, task_id: str, task: dict):
+        """Forget a finished or cancelled task (caller holds the lock)."""
+        self.active_tasks.pop(task_id, None)
+        if task['dedup_key'] is not None and self._dedup_keys.get(task['dedup_key']) == task_id:
+            del self._dedup_keys[task['dedup_key']]
+    
+    def _deliver(self, callback: Callable, value: Any):
+        """Hand a callback over to the Tk pump, or call it here without Tk."""
+        if self._tk_root is not None:
+            self._callbacks.put((callback, value))
+            return
+        self._run_callback(callback, value)
+    
+    def _pump_callbacks(self):
+        """Run the callbacks of the finished tasks on the Tk thread, then reschedule."""
+        while True:
+            try:
+                callback, value = self._callbacks.get_nowait()
+            except queue.Empty:
+                break
+            self._run_callback(callback, value)
+        
+        try:
+            self._tk_root.after(self.pump_interval_ms, self._pump_callbacks)
+        except Exception:
+            # Root destroyed: later callbacks run on the worker threads
+            logger.debug("Tk root gone, async callbacks no longer pumped")
+            self._tk_root = None
+    
+    @staticmethod
+    def _run_callback(callback: Callable, value: Any):
+        """Call a task callback, logging its errors."""
+        try:
+            callback(value)
+        except Exception as e:
+            logger.error(f"Async task callback failed: {e}")
 
 
 class MemoryOptimizer:
@@ -175,17 +676,34 @@ async_task_manager = AsyncTaskManager()
 memory_optimizer = MemoryOptimizer()
 
 
-def timed_operation(operation_name: str):
+def timed_operation(operation_name: str, threshold: Optional[float] = None):
     """Decorator for timing operations."""
-    return performance_monitor.time_operation(operation_name)
+    return performance_monitor.time_operation(operation_name, threshold)
+
+
+def measure_operation(operation_name: str, threshold: Optional[float] = None):
+    """Context manager for timing a block of code."""
+    return performance_monitor.measure(operation_name, threshold)
+
+
+def increment_counter(counter_name: str, value: int = 1):
+    """Increment a telemetry counter."""
+    performance_monitor.increment(counter_name, value)
 
 
 def run_async_task(task_func: Callable, 
                    callback: Optional[Callable] = None,
                    error_callback: Optional[Callable] = None,
-                   task_name: str = None) -> str:
+                   task_name: str = None,
+                   priority: int = PRIORITY_NORMAL,
+                   dedup_key: Optional[Any] = None) -> str:
     """Run a task asynchronously."""
-    return async_task_manager.run_async(task_func, callback, error_callback, task_name)
+    return async_task_manager.run_async(task_func, callback, error_callback, task_name, priority, dedup_key)
+
+
+def cancel_async_task(task_id: str) -> bool:
+    """Cancel an asynchronous task."""
+    return async_task_manager.cancel(task_id)
 
 
 def optimize_dataframe_memory(df):